@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+달력 달 넘기기 벤치마크 - 프레임 시간과 달마다 새로 만든 위젯 수
+(직접 그리는 달력은 달을 넘길 때 모델만 다시 채우므로 새 위젯이 없어야 함)
+"""
+
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+from datetime import date, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import qInstallMessageHandler
+from PySide6.QtWidgets import QApplication, QWidget
+
+from src.models import Student
+from src.data_manager import DataManager
+from src.schedule_generator import generate_schedules
+from src.calendar_view import CalendarView
+
+STUDENTS = [0, 20, 100]
+SESSIONS = 24
+FLIPS = 12
+
+
+def _data_manager(tmp, count) -> DataManager:
+    data_manager = DataManager(Path(tmp) / f"{count}.env")
+    students = [Student(name=f"수강생{i}", total_weeks=SESSIONS, weekdays=[["월요일", "목요일"], ["화요일", "금요일"]][i % 2],
+                        start_date=date(2024, 1, 1) + timedelta(days=i % 7)) for i in range(count)]
+    # 잠금 상태라 저장은 생략되고 화면 갱신만 측정됨
+    data_manager.data.students.extend(students)
+    data_manager.schedule_store.add_many(generate_schedules(students))
+    return data_manager
+
+
+def measure(app, view) -> tuple:
+    """달 넘기기 1회 평균 프레임 시간(ms)과 1회 평균 새 위젯 수"""
+    # 앞뒤로 한 번씩 훑어 재사용할 위젯을 미리 만들어 둠 (정상 상태 측정)
+    view.current_date = date(2024, 1, 1)
+    view.update_calendar()
+    for flip in range(FLIPS):
+        view.next_month()
+    view.current_date = date(2024, 1, 1)
+    view.update_calendar()
+    app.processEvents()
+
+    created = 0
+    start = time.perf_counter()
+    for flip in range(FLIPS):
+        before = view.findChildren(QWidget)
+        known = {id(w) for w in before}
+        view.next_month()
+        view.repaint()
+        app.processEvents()
+        created += sum(1 for w in view.findChildren(QWidget) if id(w) not in known)
+    elapsed = time.perf_counter() - start
+    return elapsed / FLIPS * 1000, created / FLIPS
+
+
+def main():
+    qInstallMessageHandler(lambda *args: None)  # 스타일시트 경고 출력 생략
+    app = QApplication.instance() or QApplication([])
+
+    print(f"=== 달 넘기기 1회 ms / 새 위젯 수 (수강생당 {SESSIONS}강, {FLIPS}개월 평균) ===\n")
+    print(f"{'수강생':>6} | {'달 넘기기':>16}")
+    print("-" * 26)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in STUDENTS:
+            data_manager = _data_manager(tmp, count)
+            view = CalendarView(data_manager)
+            view.resize(1100, 800)
+            view.show()
+            ms, created = measure(app, view)
+            print(f"{count:>6} | {ms:>8.2f} / {created:>5.1f}")
+            view.close()
+            view.deleteLater()
+            app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+달력 그리기 벤치마크 - 한 달에 보이는 수업 수에 따른 달 표시/다시 그리기/스크롤 1프레임 시간
+(QPainter로 직접 그리는 달력, 60fps 기준 16.7ms)
+"""
+
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+from datetime import date
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import qInstallMessageHandler
+from PySide6.QtWidgets import QApplication, QAbstractScrollArea
+
+from src.models import Student
+from src.data_manager import DataManager
+from src.schedule_generator import generate_schedules
+from src.calendar_view import CalendarView
+
+SESSIONS = [300, 1_000, 3_000]
+FRAMES = 30
+MONTH = date(2024, 1, 1)
+WEEKDAYS = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
+
+
+def _data_manager(tmp, sessions) -> DataManager:
+    """1월에 sessions개 수업이 고르게 퍼지도록 수강생 생성 (수강생당 주 2회 8강)"""
+    data_manager = DataManager(Path(tmp) / f"{sessions}.env")
+    students = [Student(name=f"수강생{i}", total_weeks=8, weekdays=[WEEKDAYS[i % 7], WEEKDAYS[(i + 3) % 7]],
+                        start_date=MONTH) for i in range(sessions // 8)]
+    # 잠금 상태라 저장은 생략되고 화면 갱신만 측정됨
+    data_manager.data.students.extend(students)
+    data_manager.schedule_store.add_many(generate_schedules(students))
+    return data_manager
+
+
+def _timed(action, repeat=1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def measure(app, data_manager):
+    """(달 표시 ms, 다시 그리기 1프레임 ms, 스크롤 1프레임 ms)"""
+    view = CalendarView(data_manager)
+    view.resize(1280, 900)
+    view.show()
+    app.processEvents()
+
+    def show_month():
+        view.current_date = MONTH
+        view.update_calendar()
+        view.repaint()
+        app.processEvents()
+
+    show_ms = _timed(show_month)
+    repaint_ms = _timed(view.repaint, FRAMES)
+
+    scroll_bar = view.findChild(QAbstractScrollArea).verticalScrollBar()
+
+    def scroll():
+        value = scroll_bar.value() + 120
+        scroll_bar.setValue(value if value <= scroll_bar.maximum() else 0)
+        view.repaint()
+
+    scroll_ms = _timed(scroll, FRAMES)
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return show_ms, repaint_ms, scroll_ms
+
+
+def main():
+    qInstallMessageHandler(lambda *args: None)  # 스타일시트 경고 출력 생략
+    app = QApplication.instance() or QApplication([])
+
+    print(f"=== 달력 그리기 시간 (ms, 1280x900, {FRAMES}프레임 평균) ===\n")
+    print(f"{'수업 수':>6} | {'달 표시':>10} | {'다시 그리기':>10} | {'스크롤':>8} | {'스크롤 fps':>10}")
+    print("-" * 59)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for sessions in SESSIONS:
+            data_manager = _data_manager(tmp, sessions)
+            show_ms, repaint_ms, scroll_ms = measure(app, data_manager)
+            print(f"{sessions:>6} | {show_ms:>10.1f} | {repaint_ms:>10.2f} | "
+                  f"{scroll_ms:>8.2f} | {1000 / scroll_ms:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+저장 처리량 벤치마크 - 매 저장마다 PBKDF2 vs 세션 키 재사용
+"""
+
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.crypto_utils import CryptoManager
+from src.models import AppData, Schedule
+
+SCHEDULE_COUNT = 1_000
+DURATION = 3.0
+PASSWORD = "benchmark"
+
+
+def saves_per_second(save) -> float:
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        save()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    app_data = AppData()
+    base = date(2024, 1, 1)
+    app_data.schedules = [
+        Schedule(student_id=f"student-{i % 20}", week_number=i // 20 + 1,
+                 scheduled_date=base + timedelta(days=i % 365))
+        for i in range(SCHEDULE_COUNT)
+    ]
+    data = app_data.to_dict()
+
+    crypto_manager = CryptoManager()
+    before = saves_per_second(lambda: crypto_manager.encrypt_data(data, PASSWORD))
+
+    crypto_manager.unlock(PASSWORD)
+    after = saves_per_second(lambda: crypto_manager.encrypt_data(data))
+
+    print(f"=== 저장 처리량 ({SCHEDULE_COUNT:,}개 스케줄) ===\n")
+    print(f"저장마다 PBKDF2 : {before:8.1f} saves/sec")
+    print(f"세션 키 재사용  : {after:8.1f} saves/sec")
+    print(f"개선 배율       : {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+구글 시트 동기화 벤치마크 - 전체 업로드(full_sync)와 델타 업로드(delta_sync)의
+요청 크기와 소요 시간 비교 (로컬 스텁 서버 사용, 실제 네트워크 지연 제외)
+"""
+
+import sys
+import os
+import time
+from datetime import date, datetime
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, AppData
+from src.delta_sync import acknowledge
+from src.schedule_generator import generate_schedules
+from src.google_sheets_api import GoogleSheetsAPI
+from sheets_stub_server import SheetsStubServer
+
+STUDENT_COUNTS = [100, 1_000]
+SESSIONS = 24
+ROUNDS = 5
+
+
+def build_data(count: int) -> AppData:
+    app_data = AppData()
+    app_data.students = [Student(name=f"수강생{i}", total_weeks=SESSIONS, weekdays=["월요일", "목요일"],
+                                 start_date=date(2024, 1, 1)) for i in range(count)]
+    app_data.schedules = generate_schedules(app_data.students)
+    return app_data
+
+
+def edit_one_memo(app_data: AppData, round_number: int):
+    schedule = app_data.schedules[round_number]
+    schedule.memo = f"메모 {round_number}"
+    schedule.updated_at = datetime.now()
+
+
+def measure(server, upload) -> tuple:
+    """메모 하나를 고친 뒤 업로드하는 과정을 ROUNDS번 반복 - (평균 요청 바이트, 평균 ms)"""
+    sent, elapsed = 0, 0.0
+    for round_number in range(ROUNDS):
+        edit_one_memo(upload.app_data, round_number)
+        start = time.perf_counter()
+        upload()
+        elapsed += time.perf_counter() - start
+        sent += server.state.requests[-1]["request_bytes"]
+    return sent / ROUNDS, elapsed / ROUNDS * 1000
+
+
+class FullUpload:
+    def __init__(self, api, app_data):
+        self.api, self.app_data = api, app_data
+
+    def __call__(self):
+        success, message = self.api.full_sync(self.app_data)
+        assert success, message
+
+
+class DeltaUpload(FullUpload):
+    def __call__(self):
+        success, message, ack = self.api.upload_changes(self.app_data, datetime.now())
+        assert success, message
+        acknowledge(self.app_data.metadata, ack["watermark"], ack["deleted"])
+
+
+def main():
+    print(f"=== 메모 1건 수정 후 업로드 (수강생당 {SESSIONS}강, {ROUNDS}회 평균) ===\n")
+    print(f"{'수강생':>8} | {'전체 KB':>10} | {'델타 KB':>8} | {'전체 ms':>9} | {'델타 ms':>8}")
+    print("-" * 56)
+
+    for count in STUDENT_COUNTS:
+        with SheetsStubServer() as server:
+            api = GoogleSheetsAPI(server.url)
+            full_bytes, full_ms = measure(server, FullUpload(api, build_data(count)))
+
+            delta = DeltaUpload(api, build_data(count))
+            delta()  # 첫 업로드는 전체 전송 - 이후 변경분만 측정
+            delta_bytes, delta_ms = measure(server, delta)
+
+        print(f"{count:>8,} | {full_bytes / 1024:>10,.1f} | {delta_bytes / 1024:>8.2f} | "
+              f"{full_ms:>9.1f} | {delta_ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
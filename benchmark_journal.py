@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+수정 1회당 저장 지연 벤치마크 - 전체 스냅샷 저장 vs 저널 추가
+"""
+
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, Schedule
+from src.data_manager import DataManager
+
+SIZES = [1_000, 10_000, 50_000]
+EDITS = 20
+PASSWORD = "benchmark"
+
+
+def build_data_manager(path: Path, count: int) -> DataManager:
+    data_manager = DataManager(path)
+    data_manager.set_password(PASSWORD)
+    student_count = max(1, count // 50)
+    students = [Student(name=f"수강생{i}", total_weeks=50, weekdays=["월요일"]) for i in range(student_count)]
+    data_manager.data.students = students
+    base = date(2024, 1, 1)
+    data_manager.data.schedules = [
+        Schedule(student_id=students[i % student_count].id, week_number=i // student_count + 1,
+                 scheduled_date=base + timedelta(days=i % 730))
+        for i in range(count)
+    ]
+    data_manager.save_data()
+    return data_manager
+
+
+def main():
+    print("=== 수정 1회당 저장 지연 (ms) ===\n")
+    print(f"{'스케줄 수':>10} | {'전체 저장':>10} | {'저널 추가':>10}")
+    print("-" * 38)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            data_manager = build_data_manager(Path(tmp) / f".env{size}", size)
+            data_manager.JOURNAL_COMPACT_THRESHOLD = EDITS * 2
+            schedule_ids = [s.id for s in data_manager.get_schedules()[:EDITS]]
+
+            start = time.perf_counter()
+            for i, schedule_id in enumerate(schedule_ids):
+                data_manager.get_schedule_by_id(schedule_id).memo = f"memo {i}"
+                data_manager.save_data()
+            full_ms = (time.perf_counter() - start) / EDITS * 1000
+
+            start = time.perf_counter()
+            for i, schedule_id in enumerate(schedule_ids):
+                data_manager.update_schedule_memo(schedule_id, f"journal {i}")
+            journal_ms = (time.perf_counter() - start) / EDITS * 1000
+
+            print(f"{size:>10,} | {full_ms:>10.2f} | {journal_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
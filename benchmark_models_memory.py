@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+모델 메모리 벤치마크 - 스케줄 1개당 바이트 (tracemalloc)
+"""
+
+import sys
+import os
+import gc
+import uuid
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Schedule
+
+SCHEDULE_COUNT = 100_000
+STUDENT_COUNT = 2_000
+
+
+@dataclass
+class PlainSchedule:
+    """비교용 - 이전 방식의 일반 dataclass"""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    student_id: str = ""
+    week_number: int = 1
+    scheduled_date: date = field(default_factory=date.today)
+    is_completed: bool = False
+    memo: str = ""
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            id=data["id"], student_id=data["student_id"], week_number=data["week_number"],
+            scheduled_date=date.fromisoformat(data["scheduled_date"]),
+            is_completed=data["is_completed"], memo=data["memo"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"])
+        )
+
+
+def build_dicts():
+    # 파일에서 읽은 것처럼 매번 새 문자열을 만들어 둠
+    student_ids = [str(uuid.uuid4()) for _ in range(STUDENT_COUNT)]
+    created = datetime(2024, 1, 1, 9, 0).isoformat()
+    base = date(2024, 1, 1)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "student_id": "".join(student_ids[i % STUDENT_COUNT]),
+            "week_number": i // STUDENT_COUNT + 1,
+            "scheduled_date": (base + timedelta(days=i % 365)).isoformat(),
+            "is_completed": False,
+            "memo": "",
+            "created_at": created,
+            "updated_at": created,
+        }
+        for i in range(SCHEDULE_COUNT)
+    ]
+
+
+def bytes_per_schedule(factory, dicts) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(d) for d in dicts]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(objects) == len(dicts)
+    return (after - before) / len(dicts)
+
+
+def main():
+    dicts = build_dicts()
+    plain = bytes_per_schedule(PlainSchedule.from_dict, dicts)
+    slotted = bytes_per_schedule(Schedule.from_dict, dicts)
+
+    print(f"=== 스케줄 메모리 ({SCHEDULE_COUNT:,}개, 수강생 {STUDENT_COUNT:,}명) ===\n")
+    print(f"일반 dataclass     : {plain:8.1f} bytes/schedule")
+    print(f"__slots__ + 공유값 : {slotted:8.1f} bytes/schedule")
+    print(f"절감률             : {(1 - slotted / plain) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
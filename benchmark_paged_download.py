@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+구글 시트 다운로드 벤치마크 - 한 번에 받기와 페이지 단위로 받기의 클라이언트
+최대 메모리(tracemalloc)와 소요 시간 비교
+
+스텁 서버는 별도 프로세스로 실행해 서버 쪽 메모리가 측정에 섞이지 않게 한다.
+"""
+
+import sys
+import os
+import time
+import socket
+import subprocess
+import tracemalloc
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, AppData
+from src.schedule_generator import generate_schedules
+from src.google_sheets_api import GoogleSheetsAPI
+
+STUDENT_COUNTS = [500, 2_000]
+SESSIONS = 24
+PAGE_SIZES = [10 ** 9, 5_000, 2_000, 500]  # 첫 값은 전체를 한 페이지로
+
+
+def build_data(count: int) -> AppData:
+    app_data = AppData()
+    app_data.students = [Student(name=f"수강생{i}", total_weeks=SESSIONS, weekdays=["월요일", "목요일"],
+                                 start_date=date(2024, 1, 1)) for i in range(count)]
+    app_data.schedules = generate_schedules(app_data.students)
+    return app_data
+
+
+def start_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sheets_stub_server.py")
+    process = subprocess.Popen([sys.executable, script, "--port", str(port)], stdout=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return process, f"http://127.0.0.1:{port}/exec"
+
+
+def measure(api: GoogleSheetsAPI, page_size: int) -> tuple:
+    """(최대 메모리 MB, 소요 ms, 요청 수)"""
+    api.DOWNLOAD_PAGE_SIZE = page_size
+    attempts = api.get_metrics()["attempts"]
+    start = time.perf_counter()
+    success, message, app_data = api.sync_from_sheets_to_local()
+    elapsed = time.perf_counter() - start
+    assert success, message
+    requests = api.get_metrics()["attempts"] - attempts
+    del app_data
+
+    # tracemalloc은 느리므로 시간과 따로 측정
+    tracemalloc.start()
+    success, message, app_data = api.sync_from_sheets_to_local()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert success, message
+    return peak / 1024 / 1024, elapsed * 1000, requests
+
+
+def main():
+    process, url = start_server()
+    try:
+        print(f"=== 구글 시트 → 로컬 다운로드 (수강생당 {SESSIONS}강) ===\n")
+        print(f"{'수강생':>8} | {'페이지 크기':>10} | {'요청':>4} | {'최대 MB':>8} | {'ms':>8}")
+        print("-" * 52)
+
+        for count in STUDENT_COUNTS:
+            api = GoogleSheetsAPI(url)
+            success, message = api.full_sync(build_data(count))
+            assert success, message
+            for page_size in PAGE_SIZES:
+                peak_mb, elapsed_ms, requests = measure(api, page_size)
+                label = "전체" if page_size >= 10 ** 9 else f"{page_size:,}"
+                print(f"{count:>8,} | {label:>10} | {requests:>4} | {peak_mb:>8.1f} | {elapsed_ms:>8.1f}")
+            api.close()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
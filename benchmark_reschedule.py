@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+드래그 이동 지연 벤치마크 - 다른 수강생 수에 따른 이후 수업 재배치 시간
+(저장 비용은 제외 - benchmark_journal.py 참고)
+"""
+
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student
+from src.data_manager import DataManager
+from src.schedule_generator import generate_schedules
+
+OTHER_STUDENTS = [0, 1_000, 10_000]
+SESSIONS = 50
+MOVES = 20
+
+
+def move_by_scan(data_manager, schedule_id, new_date):
+    """이전 구현 - 전체 목록을 순회하며 찾고 이후 수업마다 다시 전체 순회"""
+    weekday_map = {"월요일": 0, "화요일": 1, "수요일": 2, "목요일": 3, "금요일": 4, "토요일": 5, "일요일": 6}
+    schedules = data_manager.data.schedules
+    for moved in schedules:
+        if moved.id == schedule_id:
+            break
+    moved.scheduled_date = new_date
+    student = next(s for s in data_manager.data.students if s.id == moved.student_id)
+    weekday_indices = [weekday_map[d] for d in student.weekdays]
+    following = sorted([s for s in schedules if s.student_id == student.id and s.week_number > moved.week_number],
+                       key=lambda x: x.week_number)
+    current_date = moved.scheduled_date
+    idx = student.weekdays.index([k for k, v in weekday_map.items() if v == current_date.weekday()][0]) \
+        if current_date.weekday() in weekday_indices else 0
+    for schedule in following:
+        idx = (idx + 1) % len(weekday_indices)
+        days_ahead = weekday_indices[idx] - current_date.weekday()
+        if days_ahead <= 0:
+            days_ahead += 7
+        new = current_date + timedelta(days=days_ahead)
+        for i, s in enumerate(schedules):
+            if s.id == schedule.id:
+                schedules[i].scheduled_date = new
+                schedules[i].updated_at = datetime.now()
+                break
+        current_date = new
+
+
+def measure(move, data_manager, first_id) -> float:
+    start = time.perf_counter()
+    for i in range(MOVES):
+        move(data_manager, first_id, date(2024, 1, 1) + timedelta(days=7 * (i % 4)))
+    return (time.perf_counter() - start) / MOVES * 1000
+
+
+def main():
+    print(f"=== 드래그 이동 1회 지연 (ms, 수강생당 {SESSIONS}강) ===\n")
+    print(f"{'다른 수강생':>10} | {'전체 순회':>10} | {'인덱스':>10}")
+    print("-" * 38)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in OTHER_STUDENTS:
+            data_manager = DataManager(Path(tmp) / ".env")
+            students = [Student(name=f"수강생{i}", total_weeks=SESSIONS, weekdays=["화요일", "금요일"],
+                                start_date=date(2024, 1, 1)) for i in range(count)]
+            target = Student(name="대상", total_weeks=SESSIONS, weekdays=["월요일", "목요일"],
+                             start_date=date(2024, 1, 1))
+            data_manager.data.students.extend(students + [target])
+            data_manager.schedule_store.add_many(generate_schedules(students + [target]))
+            first_id = min(data_manager.get_schedules_for_student(target.id), key=lambda s: s.week_number).id
+
+            # 잠금 상태라 저장은 생략되고 메모리 내 재배치만 측정됨
+            indexed = measure(lambda dm, sid, d: dm.move_schedule(sid, d), data_manager, first_id)
+            scan = measure(move_by_scan, data_manager, first_id) if count <= 1_000 else float("nan")
+            print(f"{count:>10,} | {scan:>10.2f} | {indexed:>10.3f}")
+
+    print("\n(전체 순회 방식은 수강생 1만 명에서 너무 느려 생략)")
+
+
+if __name__ == "__main__":
+    main()
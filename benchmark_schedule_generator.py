@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+스케줄 일괄 생성 벤치마크 - 수강생 1만 명 x 50강
+"""
+
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, Schedule, WEEKDAY_NAMES, WEEKDAY_INDEX
+from src.schedule_generator import generate_schedules
+
+STUDENT_COUNT = 10_000
+SESSIONS = 50
+
+
+def generate_by_loop(students):
+    """이전 방식 - 수강생마다 주 단위 while 반복문과 timedelta 계산"""
+    schedules = []
+    for student in students:
+        weekday_indices = sorted(WEEKDAY_INDEX[d] for d in student.weekdays if d in WEEKDAY_INDEX)
+        week_start = student.start_date - timedelta(days=student.start_date.weekday())
+        count = 0
+        week_num = 0
+        while count < student.total_weeks:
+            current_week_start = week_start + timedelta(weeks=week_num)
+            for idx in weekday_indices:
+                if count >= student.total_weeks:
+                    break
+                schedule_date = current_week_start + timedelta(days=idx)
+                if schedule_date < student.start_date:
+                    continue
+                count += 1
+                schedules.append(Schedule(student_id=student.id, week_number=count,
+                                          scheduled_date=schedule_date))
+            week_num += 1
+    return schedules
+
+
+def main():
+    students = [
+        Student(name=f"수강생{i}", total_weeks=SESSIONS,
+                weekdays=[WEEKDAY_NAMES[i % 7], WEEKDAY_NAMES[(i * 3 + 2) % 7]],
+                start_date=date(2024, 1, 1) + timedelta(days=i % 120))
+        for i in range(STUDENT_COUNT)
+    ]
+
+    start = time.perf_counter()
+    legacy = generate_by_loop(students)
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = generate_schedules(students)
+    batch_s = time.perf_counter() - start
+
+    assert [s.scheduled_date for s in legacy] == [s.scheduled_date for s in batch]
+    print(f"=== 스케줄 생성 ({STUDENT_COUNT:,}명 x {SESSIONS}강 = {len(batch):,}개) ===\n")
+    print(f"수강생별 반복문 : {loop_s:6.2f} s")
+    print(f"일괄 생성       : {batch_s:6.2f} s")
+    print(f"개선 배율       : {loop_s / batch_s:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
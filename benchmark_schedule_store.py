@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+스케줄 조회 성능 벤치마크 - 전체 스캔 vs 인덱스 저장소
+"""
+
+import sys
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Schedule
+from src.data_manager import DataManager
+
+SIZES = [1_000, 10_000, 100_000]
+LOOKUPS = 1_000
+
+
+def build_schedules(count: int):
+    base = date(2024, 1, 1)
+    student_count = max(1, count // 50)
+    return [
+        Schedule(student_id=f"student-{i % student_count}", week_number=i // student_count + 1,
+                 scheduled_date=base + timedelta(days=i % 730))
+        for i in range(count)
+    ]
+
+
+def time_per_call(func, args_list) -> float:
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    return (time.perf_counter() - start) / len(args_list) * 1e6
+
+
+def main():
+    print("=== 스케줄 조회 벤치마크 (호출당 μs) ===\n")
+    print(f"{'스케줄 수':>10} | {'조회':<12} | {'전체 스캔':>10} | {'인덱스':>10}")
+    print("-" * 52)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            data_manager = DataManager(Path(tmp) / f".env{size}")
+            schedules = build_schedules(size)
+            data_manager.data.schedules = schedules
+
+            samples = random.sample(schedules, min(LOOKUPS, size))
+            id_args = [(s.id,) for s in samples]
+            student_args = [(s.student_id,) for s in samples]
+            date_args = [(s.scheduled_date,) for s in samples]
+
+            # 인덱스 생성 비용은 첫 조회에서 한 번만 발생
+            data_manager.get_schedule_by_id(samples[0].id)
+
+            cases = [
+                ("id", lambda i: next((s for s in schedules if s.id == i), None),
+                 data_manager.get_schedule_by_id, id_args),
+                ("student_id", lambda i: [s for s in schedules if s.student_id == i],
+                 data_manager.get_schedules_for_student, student_args),
+                ("date", lambda d: [s for s in schedules if s.scheduled_date == d],
+                 data_manager.get_schedules_for_date, date_args),
+            ]
+            for name, scan, indexed, args in cases:
+                scan_args = args[:50]  # 전체 스캔은 느리므로 표본 축소
+                scan_us = time_per_call(scan, scan_args)
+                indexed_us = time_per_call(indexed, args)
+                print(f"{size:>10,} | {name:<12} | {scan_us:>10.2f} | {indexed_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
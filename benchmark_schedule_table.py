@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+열 기반 테이블 벤치마크 - Schedule 객체 순회 vs 열 단위 처리
+"""
+
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Schedule
+from src.schedule_table import ScheduleTable, np
+
+SCHEDULE_COUNT = 200_000
+STUDENT_COUNT = 4_000
+REPEAT = 5
+
+
+def best_of(func) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def completed_by_loop(schedules):
+    counts = {}
+    for s in schedules:
+        if s.is_completed:
+            counts[s.student_id] = counts.get(s.student_id, 0) + 1
+    return counts
+
+
+def main():
+    base = date(2024, 1, 1)
+    schedules = [
+        Schedule(student_id=f"student-{i % STUDENT_COUNT}", week_number=i // STUDENT_COUNT + 1,
+                 scheduled_date=base + timedelta(days=i % 365), is_completed=i % 3 == 0)
+        for i in range(SCHEDULE_COUNT)
+    ]
+    table = ScheduleTable.from_schedules(schedules)
+    assert table.completed_per_student() == completed_by_loop(schedules)
+
+    march_start, march_end = date(2024, 3, 1), date(2024, 3, 31)
+    rows = [
+        ("완료 수 집계", lambda: completed_by_loop(schedules), table.completed_per_student),
+        ("3월 스케줄 조회",
+         lambda: [s for s in schedules if march_start <= s.scheduled_date <= march_end],
+         lambda: table.rows_in_month(2024, 3)),
+    ]
+
+    print(f"=== 열 기반 테이블 ({SCHEDULE_COUNT:,}개, NumPy {'사용' if np is not None else '없음'}) ===\n")
+    print(f"{'작업':<14} | {'객체 순회(ms)':>12} | {'열 처리(ms)':>12}")
+    print("-" * 46)
+    for name, loop, columnar in rows:
+        print(f"{name:<14} | {best_of(loop):>12.2f} | {best_of(columnar):>12.2f}")
+    print(f"\n테이블 생성: {best_of(lambda: ScheduleTable.from_schedules(schedules)):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
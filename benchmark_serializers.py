@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+직렬화 코덱 벤치마크 - 스케줄 1만 개당 크기와 인코딩/디코딩 시간
+"""
+
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import AppData, Student, Schedule
+from src.serializers import SERIALIZERS
+
+SCHEDULE_COUNT = 10_000
+STUDENT_COUNT = 200
+REPEAT = 5
+
+
+def build_data() -> AppData:
+    app_data = AppData()
+    app_data.students = [
+        Student(name=f"수강생{i}", total_weeks=SCHEDULE_COUNT // STUDENT_COUNT, weekdays=["월요일", "목요일"])
+        for i in range(STUDENT_COUNT)
+    ]
+    base = date(2024, 1, 1)
+    app_data.schedules = [
+        Schedule(student_id=app_data.students[i % STUDENT_COUNT].id, week_number=i // STUDENT_COUNT + 1,
+                 scheduled_date=base + timedelta(days=i % 365), memo="숙제" if i % 10 == 0 else "")
+        for i in range(SCHEDULE_COUNT)
+    ]
+    return app_data
+
+
+def best_of(func) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    app_data = build_data()
+    print(f"=== 직렬화 코덱 (스케줄 {SCHEDULE_COUNT:,}개, 수강생 {STUDENT_COUNT}명) ===\n")
+    print(f"{'코덱':>8} | {'크기(KB)':>10} | {'인코딩(ms)':>10} | {'디코딩(ms)':>10}")
+    print("-" * 50)
+
+    for serializer in SERIALIZERS.values():
+        payload = b"".join(serializer.encode(app_data))
+        encode_ms = best_of(lambda: b"".join(serializer.encode(app_data)))
+        decode_ms = best_of(lambda: serializer.decode(payload))
+        print(f"{serializer.name:>8} | {len(payload) / 1024:>10.1f} | {encode_ms:>10.1f} | {decode_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
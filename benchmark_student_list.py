@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+수강생 목록 벤치마크 - 수강생 수에 따른 목록 새로고침/한 명 수정 반영 시간
+(모든 수강생을 QLabel 하나의 문구로 이어 붙이던 방식과 보이는 행만 그리는 모델 목록 비교)
+"""
+
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+from datetime import date, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import qInstallMessageHandler
+from PySide6.QtWidgets import QApplication, QLabel, QScrollArea
+
+from src.models import Student
+from src.data_manager import DataManager
+from src.schedule_generator import generate_schedules
+from src.change_events import STUDENT_UPDATED, DataChange
+from src.student_form import StudentForm
+
+STUDENTS = [100, 1_000, 5_000]
+REPEAT = 5
+WEEKDAYS = ["월요일", "화요일", "수요일", "목요일", "금요일"]
+
+
+def _data_manager(tmp, count) -> DataManager:
+    data_manager = DataManager(Path(tmp) / f"{count}.env")
+    start = date.today() - timedelta(days=30)
+    students = [Student(name=f"수강생{i}", total_weeks=12, weekdays=[WEEKDAYS[i % 5]], start_date=start)
+                for i in range(count)]
+    data_manager.data.students.extend(students)
+    data_manager.schedule_store.add_many(generate_schedules(students))
+    return data_manager
+
+
+def _timed(action, repeat=REPEAT) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def _label_text(data_manager) -> str:
+    """이전 방식 - 수강생마다 스케줄 목록을 복사해 진도를 세고 전체 문구를 다시 만듦"""
+    today = date.today()
+    texts = []
+    for student in data_manager.get_students():
+        schedules = data_manager.get_schedules_for_student(student.id)
+        completed_lessons = len([s for s in schedules if s.scheduled_date <= today])
+        texts.append(f"• {student.name} ({student.total_weeks}강)\n"
+                     f"  요일: {', '.join(student.weekdays)}\n"
+                     f"  진도: {completed_lessons}강 완료")
+    return "\n\n".join(texts)
+
+
+def measure_label(app, data_manager):
+    """(새로고침 ms, 한 명 수정 ms) - 한 명만 바뀌어도 전체를 다시 만듦"""
+    scroll_area = QScrollArea()
+    scroll_area.setWidgetResizable(True)
+    label = QLabel()
+    label.setWordWrap(True)
+    scroll_area.setWidget(label)
+    scroll_area.resize(400, 250)
+    scroll_area.show()
+
+    def refresh():
+        label.setText(_label_text(data_manager))
+        scroll_area.repaint()
+        app.processEvents()
+
+    refresh_ms = _timed(refresh)
+    scroll_area.close()
+    return refresh_ms, refresh_ms
+
+
+def measure_model(app, data_manager):
+    """(새로고침 ms, 한 명 수정 ms)"""
+    form = StudentForm(data_manager)
+    form.resize(400, 900)
+    form.show()
+
+    def refresh():
+        form.refresh_students_list()
+        form.students_view.repaint()
+        app.processEvents()
+
+    student = data_manager.get_students()[0]
+    change = DataChange.of(STUDENT_UPDATED, [student.id])
+
+    def update_one():
+        form.apply_change(change)
+        form.students_view.repaint()
+        app.processEvents()
+
+    refresh_ms = _timed(refresh)
+    app.processEvents()
+    update_ms = _timed(update_one)
+    form.close()
+    return refresh_ms, update_ms
+
+
+def main():
+    qInstallMessageHandler(lambda *args: None)  # 스타일시트 경고 출력 생략
+    app = QApplication.instance() or QApplication([])
+
+    print(f"=== 수강생 목록 갱신 시간 (ms, {REPEAT}회 평균) ===\n")
+    print(f"{'수강생 수':>8} | {'방식':>8} | {'새로고침':>10} | {'한 명 수정':>10}")
+    print("-" * 48)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in STUDENTS:
+            data_manager = _data_manager(tmp, count)
+            for label, measure in (("QLabel", measure_label), ("모델 목록", measure_model)):
+                refresh_ms, update_ms = measure(app, data_manager)
+                print(f"{count:>8} | {label:>8} | {refresh_ms:>10.2f} | {update_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
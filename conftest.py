@@ -0,0 +1,55 @@
+"""
+테스트 공용 fixture - QApplication, 이벤트 대기, 임시 폴더의 DataManager
+"""
+
+import sys
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtWidgets import QApplication
+
+from src.data_manager import DataManager
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """모든 테스트가 함께 쓰는 QApplication (화면 없는 테스트도 이벤트 처리에 사용)"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def wait_until(qapp):
+    """조건이 참이 될 때까지 이벤트를 처리하며 대기하는 함수"""
+    def wait(condition, timeout=10.0):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        return condition()
+    return wait
+
+
+@pytest.fixture
+def make_data_manager(tmp_path):
+    """tmp_path/.env를 쓰는 DataManager를 만드는 함수
+
+    password가 있으면 잠금을 해제하고, save면 수강생을 넣기 전에 스냅샷을 한 번
+    저장해 이후 변경이 저널에 기록되게 한다. 수강생은 한 번에 등록한다.
+    """
+    def make(students=(), password=None, save=False) -> DataManager:
+        data_manager = DataManager(tmp_path / ".env")
+        if password is not None:
+            data_manager.set_password(password)
+            if save:
+                data_manager.save_data()
+        if students:
+            data_manager.add_students(list(students))
+        return data_manager
+    return make
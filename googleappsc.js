@@ -5,35 +5,93 @@
 
 const SHEET_ID = '1vmMqkGpcaQUGK7YAXDhYNZro2ZwJut6-LSpXYY-4YXE';
 
+const STUDENT_HEADERS = ['ID', '이름', '총 주차', '수업 요일', '시작일', '생성일', '활성 상태', '색상', '수정일'];
+const SCHEDULE_HEADERS = ['ID', '학생 ID', '주차', '예정일', '완료 여부', '메모', '생성일', '수정일'];
+
 /**
  * 웹앱 진입점 - HTTP 요청 처리
  */
 function doPost(e) {
   try {
-    const request = JSON.parse(e.postData.contents);
-    const action = request.action;
-
-    switch (action) {
-      case 'sync_students':
-        return syncStudents(request.data);
-      case 'sync_schedules':
-        return syncSchedules(request.data);
-      case 'get_students':
-        return getStudents();
-      case 'get_schedules':
-        return getSchedules();
-      case 'full_sync':
-        return fullSync(request.data);
-      case 'test_simple_sync':
-        return testSimpleSync(request.data);
-      default:
-        return createResponse(false, 'Unknown action');
+    const request = decodeRequest(JSON.parse(e.postData.contents));
+    if (request.action === 'batch') {
+      return batch(request.data);
     }
+    return handleAction(request.action, request.data);
   } catch (error) {
     return createResponse(false, error.toString());
   }
 }
 
+/**
+ * 압축 봉투 해제 - 큰 요청은 {action, encoding: 'gzip', payload: base64(gzip(JSON))}로 옴
+ */
+function decodeRequest(request) {
+  if (request.encoding !== 'gzip') {
+    return request;
+  }
+  const blob = Utilities.newBlob(Utilities.base64Decode(request.payload), 'application/x-gzip');
+  return JSON.parse(Utilities.ungzip(blob).getDataAsString('UTF-8'));
+}
+
+/**
+ * action 하나 처리
+ */
+function handleAction(action, data) {
+  switch (action) {
+    case 'sync_students':
+      return syncStudents(data);
+    case 'sync_schedules':
+      return syncSchedules(data);
+    case 'get_students':
+      return getStudents(data);
+    case 'get_schedules':
+      return getSchedules(data);
+    case 'get_metadata':
+      return getMetadata();
+    case 'full_sync':
+      return fullSync(data);
+    case 'delta_sync':
+      return deltaSync(data);
+    case 'update_student':
+      return updateStudent(data);
+    case 'update_schedule':
+      return updateSchedule(data);
+    case 'delete_student':
+      return deleteStudent(data.student_id);
+    case 'test_simple_sync':
+      return testSimpleSync(data);
+    default:
+      return createResponse(false, 'Unknown action');
+  }
+}
+
+/**
+ * 여러 action을 순서대로 처리하고 action별 결과를 한 번에 응답
+ *
+ * operations: [{ action, data }, ...]
+ * 응답 data.results는 같은 순서의 { success, message, data } 목록이며, 하나가
+ * 실패해도 나머지는 계속 처리한다 (전체 success는 모두 성공했을 때만 true).
+ */
+function batch(operations) {
+  const results = (operations || []).map(operation => {
+    try {
+      if (operation.action === 'batch') {
+        return { success: false, message: 'Nested batch is not allowed' };
+      }
+      return JSON.parse(handleAction(operation.action, operation.data).getContent());
+    } catch (error) {
+      return { success: false, message: error.toString() };
+    }
+  });
+
+  const failed = results.filter(result => !result.success).length;
+  const message = failed
+    ? `${results.length}개 중 ${failed}개 요청 실패`
+    : `${results.length}개 요청 처리 완료`;
+  return createResponse(failed === 0, message, { results: results });
+}
+
 /**
  * 학생 데이터를 구글 시트에 동기화
  */
@@ -132,18 +190,48 @@ function syncSchedules(schedulesData) {
 }
 
 /**
- * 구글 시트에서 학생 데이터 가져오기
+ * 페이지 범위 계산
+ *
+ * paging: { offset, limit } - offset은 헤더를 뺀 0부터의 행 위치.
+ * paging이 없으면 전체 행을 한 번에 반환한다 (이전 클라이언트 호환).
+ * 응답의 paging.next_offset이 null이면 마지막 페이지이고, watermark가 페이지마다
+ * 다르면 그 사이에 시트가 다시 업로드된 것이다.
  */
-function getStudents() {
+function pageRange(sheet, paging) {
+  const total = sheet ? Math.max(0, sheet.getLastRow() - 1) : 0;
+  if (!paging || !paging.limit) {
+    return { offset: 0, count: total, info: null };
+  }
+
+  const offset = Math.min(Math.max(0, paging.offset || 0), total);
+  const count = Math.min(paging.limit, total - offset);
+  return {
+    offset: offset,
+    count: count,
+    info: {
+      offset: offset,
+      limit: paging.limit,
+      total: total,
+      next_offset: offset + count < total ? offset + count : null,
+      watermark: getMetadataValue('sync_watermark')
+    }
+  };
+}
+
+/**
+ * 구글 시트에서 학생 데이터 가져오기 (paging이 있으면 해당 페이지만)
+ */
+function getStudents(paging) {
   try {
     const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
     const sheet = spreadsheet.getSheetByName('Students');
+    const page = pageRange(sheet, paging);
 
-    if (!sheet || sheet.getLastRow() <= 1) {
-      return createResponse(true, '학생 데이터가 없습니다.', []);
+    if (page.count === 0) {
+      return createResponse(true, '학생 데이터가 없습니다.', [], page.info);
     }
 
-    const data = sheet.getRange(2, 1, sheet.getLastRow() - 1, 8).getValues();
+    const data = sheet.getRange(2 + page.offset, 1, page.count, STUDENT_HEADERS.length).getValues();
     const students = data.map(row => {
       const originalDate = row[4];
       const formattedDate = formatDateUltraSafe(originalDate);
@@ -158,29 +246,31 @@ function getStudents() {
         start_date: formattedDate,
         created_at: formatDateTime(row[5]),
         is_active: row[6] === '활성',
-        color: row[7]
+        color: row[7],
+        updated_at: formatDateTime(row[8] || row[5])
       };
     });
 
-    return createResponse(true, `${students.length}명의 학생 데이터를 가져왔습니다.`, students);
+    return createResponse(true, `${students.length}명의 학생 데이터를 가져왔습니다.`, students, page.info);
   } catch (error) {
     return createResponse(false, error.toString());
   }
 }
 
 /**
- * 구글 시트에서 스케줄 데이터 가져오기
+ * 구글 시트에서 스케줄 데이터 가져오기 (paging이 있으면 해당 페이지만)
  */
-function getSchedules() {
+function getSchedules(paging) {
   try {
     const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
     const sheet = spreadsheet.getSheetByName('Schedules');
+    const page = pageRange(sheet, paging);
 
-    if (!sheet || sheet.getLastRow() <= 1) {
-      return createResponse(true, '스케줄 데이터가 없습니다.', []);
+    if (page.count === 0) {
+      return createResponse(true, '스케줄 데이터가 없습니다.', [], page.info);
     }
 
-    const data = sheet.getRange(2, 1, sheet.getLastRow() - 1, 8).getValues();
+    const data = sheet.getRange(2 + page.offset, 1, page.count, SCHEDULE_HEADERS.length).getValues();
     const schedules = data.map(row => {
       const originalDate = row[3];
       const formattedDate = formatDateUltraSafe(originalDate);
@@ -199,7 +289,29 @@ function getSchedules() {
       };
     });
 
-    return createResponse(true, `${schedules.length}개의 스케줄을 가져왔습니다.`, schedules);
+    return createResponse(true, `${schedules.length}개의 스케줄을 가져왔습니다.`, schedules, page.info);
+  } catch (error) {
+    return createResponse(false, error.toString());
+  }
+}
+
+/**
+ * 메타데이터 시트의 키/값 가져오기 (값은 문자열)
+ */
+function getMetadata() {
+  try {
+    const sheet = SpreadsheetApp.openById(SHEET_ID).getSheetByName('Metadata');
+    const metadata = {};
+
+    if (sheet && sheet.getLastRow() > 1) {
+      sheet.getRange(2, 1, sheet.getLastRow() - 1, 2).getValues().forEach(row => {
+        if (row[0]) {
+          metadata[row[0]] = String(row[1]);
+        }
+      });
+    }
+
+    return createResponse(true, '메타데이터를 가져왔습니다.', metadata);
   } catch (error) {
     return createResponse(false, error.toString());
   }
@@ -334,35 +446,17 @@ function fullSync(appData) {
  */
 function syncStudentsData(studentsData) {
   const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
-  let sheet = spreadsheet.getSheetByName('Students');
-
-  if (!sheet) {
-    sheet = spreadsheet.insertSheet('Students');
-    sheet.getRange(1, 1, 1, 8).setValues([[
-      'ID', '이름', '총 주차', '수업 요일', '시작일', '생성일', '활성 상태', '색상'
-    ]]);
-    sheet.getRange(1, 1, 1, 8).setFontWeight('bold');
-  }
+  const sheet = getOrCreateSheet(spreadsheet, 'Students', STUDENT_HEADERS);
 
   if (sheet.getLastRow() > 1) {
     sheet.deleteRows(2, sheet.getLastRow() - 1);
   }
 
   if (studentsData && studentsData.length > 0) {
-    const values = studentsData.map(student => [
-      student.id,
-      student.name,
-      student.total_weeks,
-      student.weekdays.join(', '),
-      student.start_date,
-      student.created_at,
-      student.is_active ? '활성' : '비활성',
-      student.color
-    ]);
+    const values = studentsData.map(studentToRow);
 
-    sheet.getRange(2, 1, values.length, 8).setValues(values);
-    sheet.getRange(2, 5, values.length, 1).setNumberFormat('yyyy-mm-dd');
-    sheet.getRange(2, 6, values.length, 1).setNumberFormat('yyyy-mm-dd hh:mm:ss');
+    sheet.getRange(2, 1, values.length, STUDENT_HEADERS.length).setValues(values);
+    formatStudentRows(sheet, 2, values.length);
 
     return { success: true, message: `${studentsData.length}명의 학생 데이터가 동기화되었습니다.` };
   } else {
@@ -375,36 +469,17 @@ function syncStudentsData(studentsData) {
  */
 function syncSchedulesData(schedulesData) {
   const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
-  let sheet = spreadsheet.getSheetByName('Schedules');
-
-  if (!sheet) {
-    sheet = spreadsheet.insertSheet('Schedules');
-    sheet.getRange(1, 1, 1, 8).setValues([[
-      'ID', '학생 ID', '주차', '예정일', '완료 여부', '메모', '생성일', '수정일'
-    ]]);
-    sheet.getRange(1, 1, 1, 8).setFontWeight('bold');
-  }
+  const sheet = getOrCreateSheet(spreadsheet, 'Schedules', SCHEDULE_HEADERS);
 
   if (sheet.getLastRow() > 1) {
     sheet.deleteRows(2, sheet.getLastRow() - 1);
   }
 
   if (schedulesData && schedulesData.length > 0) {
-    const values = schedulesData.map(schedule => [
-      schedule.id,
-      schedule.student_id,
-      schedule.week_number,
-      schedule.scheduled_date,
-      schedule.is_completed ? '완료' : '미완료',
-      schedule.memo || '',
-      schedule.created_at,
-      schedule.updated_at
-    ]);
+    const values = schedulesData.map(scheduleToRow);
 
-    sheet.getRange(2, 1, values.length, 8).setValues(values);
-    sheet.getRange(2, 4, values.length, 1).setNumberFormat('yyyy-mm-dd');
-    sheet.getRange(2, 7, values.length, 1).setNumberFormat('yyyy-mm-dd hh:mm:ss');
-    sheet.getRange(2, 8, values.length, 1).setNumberFormat('yyyy-mm-dd hh:mm:ss');
+    sheet.getRange(2, 1, values.length, SCHEDULE_HEADERS.length).setValues(values);
+    formatScheduleRows(sheet, 2, values.length);
 
     return { success: true, message: `${schedulesData.length}개의 스케줄이 동기화되었습니다.` };
   } else {
@@ -412,6 +487,199 @@ function syncSchedulesData(schedulesData) {
   }
 }
 
+/**
+ * 델타 동기화 - 변경된 레코드만 ID로 upsert 하고 삭제 목록의 행을 제거
+ *
+ * delta: { full, since, until, students, schedules, deleted: { students, schedules } }
+ * 저장된 워터마크(sync_watermark)가 since와 같을 때만 변경분을 적용하고, 다르면
+ * resync를 요청한다. full이면 기존처럼 시트를 새로 쓴다. 적용 후 until을 새
+ * 워터마크로 기록해 응답한다.
+ */
+function deltaSync(delta) {
+  const lock = LockService.getScriptLock();
+  lock.waitLock(30000);
+
+  try {
+    const stored = getMetadataValue('sync_watermark');
+    if (!delta.full && stored !== delta.since) {
+      return createResponse(false, '서버의 동기화 기준 시각이 다릅니다. 전체 동기화가 필요합니다.', {
+        resync: true,
+        watermark: stored
+      });
+    }
+
+    const students = delta.students || [];
+    const schedules = delta.schedules || [];
+    let message;
+
+    if (delta.full) {
+      syncStudentsData(students);
+      syncSchedulesData(schedules);
+      message = `전체 동기화 완료: ${students.length}명 학생, ${schedules.length}개 스케줄`;
+    } else {
+      const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
+      const studentSheet = getOrCreateSheet(spreadsheet, 'Students', STUDENT_HEADERS);
+      const scheduleSheet = getOrCreateSheet(spreadsheet, 'Schedules', SCHEDULE_HEADERS);
+      const deleted = delta.deleted || {};
+
+      // 삭제를 먼저 처리해야 upsert에서 읽은 행 번호가 유지됨
+      const removed = deleteRowsById(studentSheet, deleted.students || [])
+        + deleteRowsById(scheduleSheet, deleted.schedules || []);
+      upsertRows(studentSheet, students, studentToRow, formatStudentRows);
+      upsertRows(scheduleSheet, schedules, scheduleToRow, formatScheduleRows);
+
+      message = `변경분 동기화 완료: 학생 ${students.length}건, 스케줄 ${schedules.length}건 반영, ${removed}건 삭제`;
+    }
+
+    setMetadataValue('sync_watermark', delta.until);
+    return createResponse(true, message, { watermark: delta.until });
+  } catch (error) {
+    return createResponse(false, error.toString());
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+/**
+ * ID 열을 한 번 읽어 기존 행은 덮어쓰고, 없는 행은 마지막에 한 번에 추가
+ */
+function upsertRows(sheet, records, toRow, formatRows) {
+  if (!records.length) return 0;
+
+  const lastRow = sheet.getLastRow();
+  const rowById = {};
+  if (lastRow > 1) {
+    sheet.getRange(2, 1, lastRow - 1, 1).getValues().forEach((row, i) => {
+      rowById[row[0]] = i + 2;
+    });
+  }
+
+  const appended = [];
+  records.forEach(record => {
+    const values = toRow(record);
+    const rowNumber = rowById[record.id];
+    if (rowNumber) {
+      sheet.getRange(rowNumber, 1, 1, values.length).setValues([values]);
+    } else {
+      appended.push(values);
+    }
+  });
+
+  if (appended.length) {
+    sheet.getRange(lastRow + 1, 1, appended.length, appended[0].length).setValues(appended);
+    formatRows(sheet, lastRow + 1, appended.length);
+  }
+  return records.length;
+}
+
+/**
+ * ID가 목록에 있는 행 삭제 (아래쪽부터 연속된 행을 묶어서 삭제)
+ */
+function deleteRowsById(sheet, ids) {
+  if (!ids.length || sheet.getLastRow() <= 1) return 0;
+
+  const targets = new Set(ids);
+  const rows = [];
+  sheet.getRange(2, 1, sheet.getLastRow() - 1, 1).getValues().forEach((row, i) => {
+    if (targets.has(row[0])) rows.push(i + 2);
+  });
+
+  let i = rows.length - 1;
+  while (i >= 0) {
+    let start = rows[i];
+    let count = 1;
+    while (i - count >= 0 && rows[i - count] === start - 1) {
+      start--;
+      count++;
+    }
+    sheet.deleteRows(start, count);
+    i -= count;
+  }
+  return rows.length;
+}
+
+function getOrCreateSheet(spreadsheet, name, headers) {
+  let sheet = spreadsheet.getSheetByName(name);
+  if (!sheet) {
+    sheet = spreadsheet.insertSheet(name);
+  }
+  // 새 시트이거나 열이 추가된 경우 (예: 수강생 수정일) 헤더 갱신
+  if (sheet.getLastRow() === 0 || sheet.getLastColumn() < headers.length) {
+    sheet.getRange(1, 1, 1, headers.length).setValues([headers]);
+    sheet.getRange(1, 1, 1, headers.length).setFontWeight('bold');
+  }
+  return sheet;
+}
+
+function studentToRow(student) {
+  return [
+    student.id,
+    student.name,
+    student.total_weeks,
+    student.weekdays.join(', '),
+    student.start_date,
+    student.created_at,
+    student.is_active ? '활성' : '비활성',
+    student.color,
+    student.updated_at || student.created_at
+  ];
+}
+
+function scheduleToRow(schedule) {
+  return [
+    schedule.id,
+    schedule.student_id,
+    schedule.week_number,
+    schedule.scheduled_date,
+    schedule.is_completed ? '완료' : '미완료',
+    schedule.memo || '',
+    schedule.created_at,
+    schedule.updated_at
+  ];
+}
+
+function formatStudentRows(sheet, startRow, count) {
+  sheet.getRange(startRow, 5, count, 1).setNumberFormat('yyyy-mm-dd');
+  sheet.getRange(startRow, 6, count, 1).setNumberFormat('yyyy-mm-dd hh:mm:ss');
+  sheet.getRange(startRow, 9, count, 1).setNumberFormat('yyyy-mm-dd hh:mm:ss');
+}
+
+function formatScheduleRows(sheet, startRow, count) {
+  sheet.getRange(startRow, 4, count, 1).setNumberFormat('yyyy-mm-dd');
+  sheet.getRange(startRow, 7, count, 1).setNumberFormat('yyyy-mm-dd hh:mm:ss');
+  sheet.getRange(startRow, 8, count, 1).setNumberFormat('yyyy-mm-dd hh:mm:ss');
+}
+
+/**
+ * 메타데이터 값 하나 조회/기록 (워터마크는 날짜로 변환되지 않도록 텍스트로 저장)
+ */
+function getMetadataValue(key) {
+  const sheet = SpreadsheetApp.openById(SHEET_ID).getSheetByName('Metadata');
+  if (!sheet || sheet.getLastRow() <= 1) return null;
+
+  const values = sheet.getRange(2, 1, sheet.getLastRow() - 1, 2).getValues();
+  for (let i = values.length - 1; i >= 0; i--) {
+    if (values[i][0] === key) return String(values[i][1]);
+  }
+  return null;
+}
+
+function setMetadataValue(key, value) {
+  const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
+  const sheet = getOrCreateSheet(spreadsheet, 'Metadata', ['Key', 'Value']);
+
+  const lastRow = sheet.getLastRow();
+  let rowNumber = lastRow + 1;
+  if (lastRow > 1) {
+    const index = sheet.getRange(2, 1, lastRow - 1, 1).getValues().findIndex(row => row[0] === key);
+    if (index !== -1) rowNumber = index + 2;
+  }
+
+  const range = sheet.getRange(rowNumber, 1, 1, 2);
+  range.setNumberFormat('@');
+  range.setValues([[key, value]]);
+}
+
 /**
  * 메타데이터 시트 업데이트
  */
@@ -449,47 +717,13 @@ function updateMetadata(metadata) {
 }
 
 /**
- * 개별 학생 업데이트
+ * 개별 학생 업데이트 (없으면 추가)
  */
 function updateStudent(studentData) {
   try {
     const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
-    const sheet = spreadsheet.getSheetByName('Students');
-
-    if (!sheet) {
-      return createResponse(false, 'Students 시트가 없습니다.');
-    }
-
-    const data = sheet.getRange(2, 1, sheet.getLastRow() - 1, 8).getValues();
-    const rowIndex = data.findIndex(row => row[0] === studentData.id);
-
-    if (rowIndex === -1) {
-      // 새 학생 추가
-      const newRow = [
-        studentData.id,
-        studentData.name,
-        studentData.total_weeks,
-        studentData.weekdays.join(', '),
-        studentData.start_date,
-        studentData.created_at,
-        studentData.is_active ? '활성' : '비활성',
-        studentData.color
-      ];
-      sheet.getRange(sheet.getLastRow() + 1, 1, 1, 8).setValues([newRow]);
-    } else {
-      // 기존 학생 업데이트
-      const updatedRow = [
-        studentData.id,
-        studentData.name,
-        studentData.total_weeks,
-        studentData.weekdays.join(', '),
-        studentData.start_date,
-        studentData.created_at,
-        studentData.is_active ? '활성' : '비활성',
-        studentData.color
-      ];
-      sheet.getRange(rowIndex + 2, 1, 1, 8).setValues([updatedRow]);
-    }
+    const sheet = getOrCreateSheet(spreadsheet, 'Students', STUDENT_HEADERS);
+    upsertRows(sheet, [studentData], studentToRow, formatStudentRows);
 
     return createResponse(true, '학생 정보가 업데이트되었습니다.');
   } catch (error) {
@@ -498,47 +732,13 @@ function updateStudent(studentData) {
 }
 
 /**
- * 개별 스케줄 업데이트
+ * 개별 스케줄 업데이트 (없으면 추가)
  */
 function updateSchedule(scheduleData) {
   try {
     const spreadsheet = SpreadsheetApp.openById(SHEET_ID);
-    const sheet = spreadsheet.getSheetByName('Schedules');
-
-    if (!sheet) {
-      return createResponse(false, 'Schedules 시트가 없습니다.');
-    }
-
-    const data = sheet.getRange(2, 1, sheet.getLastRow() - 1, 8).getValues();
-    const rowIndex = data.findIndex(row => row[0] === scheduleData.id);
-
-    if (rowIndex === -1) {
-      // 새 스케줄 추가
-      const newRow = [
-        scheduleData.id,
-        scheduleData.student_id,
-        scheduleData.week_number,
-        scheduleData.scheduled_date,
-        scheduleData.is_completed ? '완료' : '미완료',
-        scheduleData.memo || '',
-        scheduleData.created_at,
-        scheduleData.updated_at
-      ];
-      sheet.getRange(sheet.getLastRow() + 1, 1, 1, 8).setValues([newRow]);
-    } else {
-      // 기존 스케줄 업데이트
-      const updatedRow = [
-        scheduleData.id,
-        scheduleData.student_id,
-        scheduleData.week_number,
-        scheduleData.scheduled_date,
-        scheduleData.is_completed ? '완료' : '미완료',
-        scheduleData.memo || '',
-        scheduleData.created_at,
-        scheduleData.updated_at
-      ];
-      sheet.getRange(rowIndex + 2, 1, 1, 8).setValues([updatedRow]);
-    }
+    const sheet = getOrCreateSheet(spreadsheet, 'Schedules', SCHEDULE_HEADERS);
+    upsertRows(sheet, [scheduleData], scheduleToRow, formatScheduleRows);
 
     return createResponse(true, '스케줄이 업데이트되었습니다.');
   } catch (error) {
@@ -625,7 +825,7 @@ function getDataStats() {
 /**
  * 응답 객체 생성
  */
-function createResponse(success, message, data = null) {
+function createResponse(success, message, data = null, paging = null) {
   const response = {
     success: success,
     message: message,
@@ -636,6 +836,10 @@ function createResponse(success, message, data = null) {
     response.data = data;
   }
 
+  if (paging !== null) {
+    response.paging = paging;
+  }
+
   return ContentService
     .createTextOutput(JSON.stringify(response))
     .setMimeType(ContentService.MimeType.JSON);
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+구글 앱스 스크립트(googleappsc.js) 대역 HTTP 서버 - 테스트/벤치마크용
+
+doPost의 action 처리를 메모리 안의 시트로 흉내 낸다. 단독으로 실행하면
+지정한 포트에서 대기하므로 GoogleSheetsAPI의 webapp_url을 바꿔 수동으로도
+확인할 수 있다.
+
+    python sheets_stub_server.py --port 8765
+"""
+
+import sys
+import gzip
+import json
+import base64
+import time
+import argparse
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+class SheetsState:
+    """스텁 서버의 시트 내용 (ID -> 행, 추가된 순서 유지)"""
+
+    def __init__(self):
+        self.students: Dict[str, Dict[str, Any]] = {}
+        self.schedules: Dict[str, Dict[str, Any]] = {}
+        self.metadata: Dict[str, Any] = {}
+        # {"action", "request_bytes", "response_bytes", "encoding", "client_port"}
+        self.requests: List[Dict[str, Any]] = []
+        self.delay = 0.0  # 응답 전 대기 시간 (초)
+        self.fail_statuses: List[int] = []  # 앞에서부터 하나씩 꺼내 처리 대신 이 상태 코드로 응답
+        self.supports_batch = True  # False면 batch를 모르는 이전 스크립트처럼 동작
+        self.supports_paging = True  # False면 페이지 요청을 무시하고 전체 행을 주는 이전 스크립트처럼 동작
+        self.disabled_actions = set()  # 이전 스크립트에 없는 action을 흉내 낼 때 (Unknown action 응답)
+        self.active = 0       # 처리 중인 요청 수
+        self.max_active = 0   # 동시에 처리한 최대 요청 수
+        self.lock = threading.RLock()
+
+    @property
+    def actions(self) -> List[str]:
+        return [r["action"] for r in self.requests]
+
+    @property
+    def client_ports(self) -> List[int]:
+        """요청별 클라이언트 포트 - 같으면 같은 연결(keep-alive)을 재사용한 것"""
+        return [r["client_port"] for r in self.requests]
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        action = request.get("action")
+        handler = getattr(self, f"_action_{action}", None)
+        if (handler is None or action in self.disabled_actions
+                or (action == "batch" and not self.supports_batch)):
+            return _response(False, "Unknown action")
+        with self.lock:
+            return handler(request.get("data"))
+
+    # ---- doPost action 대응 ----
+
+    def _action_get_students(self, paging):
+        rows, info = self._page(list(self.students.values()), paging)
+        rows = [dict(row, start_date=_sheet_date(row["start_date"])) for row in rows]
+        return _response(True, f"{len(rows)}명의 학생 데이터를 가져왔습니다.", rows, info)
+
+    def _action_get_schedules(self, paging):
+        rows, info = self._page(list(self.schedules.values()), paging)
+        rows = [dict(row, scheduled_date=_sheet_date(row["scheduled_date"])) for row in rows]
+        return _response(True, f"{len(rows)}개의 스케줄을 가져왔습니다.", rows, info)
+
+    def _page(self, rows, paging):
+        """googleappsc.js의 pageRange와 같은 페이지 나누기 (paging이 없으면 전체)"""
+        if not self.supports_paging or not paging or not paging.get("limit"):
+            return rows, None
+        total = len(rows)
+        offset = min(max(0, paging.get("offset") or 0), total)
+        count = min(paging["limit"], total - offset)
+        return rows[offset:offset + count], {
+            "offset": offset,
+            "limit": paging["limit"],
+            "total": total,
+            "next_offset": offset + count if offset + count < total else None,
+            "watermark": self.metadata.get("sync_watermark"),
+        }
+
+    def _action_get_metadata(self, _data):
+        metadata = {key: str(value) for key, value in self.metadata.items()}
+        return _response(True, "메타데이터를 가져왔습니다.", metadata)
+
+    def _action_batch(self, operations):
+        results = []
+        for operation in operations or []:
+            if operation.get("action") == "batch":
+                results.append(_response(False, "Nested batch is not allowed"))
+            else:
+                results.append(self.handle(operation))
+        failed = sum(1 for result in results if not result["success"])
+        message = f"{len(results)}개 중 {failed}개 요청 실패" if failed else f"{len(results)}개 요청 처리 완료"
+        return _response(failed == 0, message, {"results": results})
+
+    def _action_update_student(self, student):
+        self.students[student["id"]] = student
+        return _response(True, "학생 정보가 업데이트되었습니다.")
+
+    def _action_update_schedule(self, schedule):
+        self.schedules[schedule["id"]] = schedule
+        return _response(True, "스케줄이 업데이트되었습니다.")
+
+    def _action_delete_student(self, data):
+        if self.students.pop(data["student_id"], None) is None:
+            return _response(False, "학생을 찾을 수 없습니다.")
+        return _response(True, "학생이 삭제되었습니다.")
+
+    def _action_full_sync(self, app_data):
+        app_data = app_data or {}
+        self._replace(app_data.get("students", []), app_data.get("schedules", []))
+        # updateMetadata는 기존 메타데이터를 모두 지우고 다시 씀
+        self.metadata = dict(app_data.get("metadata", {}))
+        return _response(True, f"전체 동기화 완료: {len(self.students)}명 학생, {len(self.schedules)}개 스케줄")
+
+    def _action_delta_sync(self, delta):
+        stored = self.metadata.get("sync_watermark")
+        if not delta.get("full") and stored != delta.get("since"):
+            return _response(False, "서버의 동기화 기준 시각이 다릅니다. 전체 동기화가 필요합니다.",
+                             {"resync": True, "watermark": stored})
+
+        students = delta.get("students", [])
+        schedules = delta.get("schedules", [])
+        if delta.get("full"):
+            self._replace(students, schedules)
+            message = f"전체 동기화 완료: {len(students)}명 학생, {len(schedules)}개 스케줄"
+        else:
+            deleted = delta.get("deleted", {})
+            removed = 0
+            for table, ids in ((self.students, deleted.get("students", [])),
+                               (self.schedules, deleted.get("schedules", []))):
+                for item_id in ids:
+                    removed += table.pop(item_id, None) is not None
+            for table, rows in ((self.students, students), (self.schedules, schedules)):
+                for row in rows:
+                    table[row["id"]] = row
+            message = f"변경분 동기화 완료: 학생 {len(students)}건, 스케줄 {len(schedules)}건 반영, {removed}건 삭제"
+
+        self.metadata["sync_watermark"] = delta["until"]
+        return _response(True, message, {"watermark": delta["until"]})
+
+    def _replace(self, students, schedules):
+        self.students = {row["id"]: row for row in students}
+        self.schedules = {row["id"]: row for row in schedules}
+
+
+def _decode_request(body: bytes) -> Dict[str, Any]:
+    """googleappsc.js의 decodeRequest와 같이 gzip 봉투 해제"""
+    request = json.loads(body)
+    if request.get("encoding") == "gzip":
+        request = json.loads(gzip.decompress(base64.b64decode(request["payload"])))
+        request["encoding"] = "gzip"
+    return request
+
+
+def _sheet_date(text: str) -> str:
+    """시트의 날짜 셀을 UTC 기준으로 읽는 formatDateUltraSafe와 같이 하루 앞선 날짜로 반환"""
+    try:
+        return (date.fromisoformat(text) - timedelta(days=1)).isoformat()
+    except (TypeError, ValueError):
+        return text
+
+
+def _response(success: bool, message: str, data: Any = None, paging: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    response = {"success": success, "message": message}
+    if data is not None:
+        response["data"] = data
+    if paging is not None:
+        response["paging"] = paging
+    return response
+
+
+class _Handler(BaseHTTPRequestHandler):
+    state: SheetsState = None
+    protocol_version = "HTTP/1.1"  # keep-alive 연결 재사용
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        request = _decode_request(body)
+        entry = {
+            "action": request.get("action"),
+            "request_bytes": len(body),
+            "response_bytes": 0,
+            "encoding": request.get("encoding"),
+            "client_port": self.client_address[1],
+        }
+        with self.state.lock:
+            self.state.requests.append(entry)
+            self.state.active += 1
+            self.state.max_active = max(self.state.max_active, self.state.active)
+        try:
+            if self.state.delay:
+                time.sleep(self.state.delay)
+
+            status = 200
+            with self.state.lock:
+                if self.state.fail_statuses:
+                    status = self.state.fail_statuses.pop(0)
+            if status == 200:
+                response = self.state.handle(request)
+            else:
+                response = _response(False, f"injected HTTP {status}")
+        finally:
+            with self.state.lock:
+                self.state.active -= 1
+        payload = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        entry["response_bytes"] = len(payload)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class SheetsStubServer:
+    """백그라운드 스레드에서 동작하는 스텁 서버 (with 문으로 사용)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, state: Optional[SheetsState] = None):
+        self.state = state or SheetsState()
+        handler = type("Handler", (_Handler,), {"state": self.state})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/exec"
+
+    def start(self) -> 'SheetsStubServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'SheetsStubServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구글 앱스 스크립트 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = SheetsStubServer(args.host, args.port)
+    print(f"스텁 서버 실행 중: {server.url} (Ctrl+C로 종료)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
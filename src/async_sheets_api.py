@@ -0,0 +1,253 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .models import Student, Schedule, AppData
+from .google_sheets_api import (
+    GoogleSheetsAPI, SheetsRequestError, SHEET_CHANGED_MESSAGE, downloaded_app_data
+)
+from .sheets_transport import ProgressCallback, SyncCancelled
+
+
+async def _gather(*aws: Awaitable) -> List[Any]:
+    """모두 끝날 때까지 기다리고, 하나라도 실패하면 아직 시작하지 않은 요청은 취소"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class AsyncGoogleSheetsAPI:
+    """GoogleSheetsAPI와 같은 메서드를 코루틴으로 제공하는 비동기 API
+
+    요청은 감싼 GoogleSheetsAPI의 전송 계층(연결 풀, 재시도, 차단기, 지표)을
+    그대로 쓰며 max_concurrency개의 작업 스레드에서 동시에 보낸다. 다운로드는
+    학생/스케줄 첫 페이지와 메타데이터를 동시에 받은 뒤 나머지 페이지를 모두
+    동시에 요청하므로, 순차 왕복 시간의 합 대신 가장 느린 요청 두 번 정도가 걸린다.
+
+    나머지 페이지는 순서대로 결과 목록에 합치며, 요청했지만 아직 합치지 않은
+    페이지는 max_pending_pages개(기본은 동시 요청 수의 2배)까지만 둔다. 동기 API의
+    순차 페이지 다운로드와 달리 메모리 상한은 응답 하나가 아니라 이 페이지 수만큼이며,
+    병합에 필요하므로 변환한 레코드는 어느 쪽이든 모두 모은다.
+    """
+
+    DEFAULT_CONCURRENCY = 4  # 전송 계층의 연결 풀 크기와 같게
+
+    def __init__(self, api: GoogleSheetsAPI, max_concurrency: int = DEFAULT_CONCURRENCY,
+                 max_pending_pages: Optional[int] = None):
+        self.api = api
+        self.max_concurrency = max_concurrency
+        self.max_pending_pages = max_pending_pages or 2 * max_concurrency
+        # 작업 스레드 수가 곧 동시 요청 수 상한 (나머지는 대기열에서 기다림)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="sheets")
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    async def _call(self, func: Callable, *args):
+        """동기 API 호출 하나를 작업 스레드에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # ---- GoogleSheetsAPI와 같은 메서드 ----
+
+    async def test_connection(self) -> Tuple[bool, str]:
+        return await self._call(self.api.test_connection)
+
+    async def sync_students(self, students: List[Student]) -> Tuple[bool, str]:
+        return await self._call(self.api.sync_students, students)
+
+    async def sync_schedules(self, schedules: List[Schedule]) -> Tuple[bool, str]:
+        return await self._call(self.api.sync_schedules, schedules)
+
+    async def full_sync(self, app_data: AppData, progress: Optional[ProgressCallback] = None,
+                        cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
+        return await self._call(self.api.full_sync, app_data, progress, cancel_event)
+
+    async def upload_changes(self, app_data: AppData, until: datetime, progress: Optional[ProgressCallback] = None,
+                             cancel_event: Optional[threading.Event] = None
+                             ) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        return await self._call(self.api.upload_changes, app_data, until, progress, cancel_event)
+
+    async def send_delta(self, delta: Dict[str, Any], progress: Optional[ProgressCallback] = None,
+                         cancel_event: Optional[threading.Event] = None
+                         ) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        return await self._call(self.api.send_delta, delta, progress, cancel_event)
+
+    async def sync_from_local_to_sheets(self, app_data: AppData, progress: Optional[ProgressCallback] = None,
+                                        cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
+        return await self._call(self.api.sync_from_local_to_sheets, app_data, progress, cancel_event)
+
+    async def get_metadata(self, cancel_event: Optional[threading.Event] = None
+                           ) -> Tuple[bool, str, Dict[str, str]]:
+        return await self._call(self.api.get_metadata, cancel_event)
+
+    async def batch(self, operations: List[Tuple[str, Any]], progress: Optional[ProgressCallback] = None,
+                    cancel_event: Optional[threading.Event] = None) -> List[Dict[str, Any]]:
+        return await self._call(self.api.batch, operations, progress, cancel_event)
+
+    async def update_student(self, student: Student) -> Tuple[bool, str]:
+        return await self._call(self.api.update_student, student)
+
+    async def update_schedule(self, schedule: Schedule) -> Tuple[bool, str]:
+        return await self._call(self.api.update_schedule, schedule)
+
+    async def delete_student(self, student_id: str) -> Tuple[bool, str]:
+        return await self._call(self.api.delete_student, student_id)
+
+    async def get_students_from_sheets(self, progress: Optional[ProgressCallback] = None,
+                                       cancel_event: Optional[threading.Event] = None
+                                       ) -> Tuple[bool, str, List[Student]]:
+        """구글 시트에서 학생 데이터 가져오기 (페이지 동시 요청)"""
+        try:
+            students, = await self._read_tables(('get_students',), progress, cancel_event)
+            return True, f"{len(students)}명의 학생 데이터를 가져왔습니다.", students
+
+        except SyncCancelled:
+            return False, "사용자가 동기화를 취소했습니다.", []
+        except Exception as e:
+            return False, f"학생 데이터 가져오기 실패: {str(e)}", []
+
+    async def get_schedules_from_sheets(self, progress: Optional[ProgressCallback] = None,
+                                        cancel_event: Optional[threading.Event] = None
+                                        ) -> Tuple[bool, str, List[Schedule]]:
+        """구글 시트에서 스케줄 데이터 가져오기 (페이지 동시 요청)"""
+        try:
+            schedules, = await self._read_tables(('get_schedules',), progress, cancel_event)
+            return True, f"{len(schedules)}개의 스케줄을 가져왔습니다.", schedules
+
+        except SyncCancelled:
+            return False, "사용자가 동기화를 취소했습니다.", []
+        except Exception as e:
+            return False, f"스케줄 데이터 가져오기 실패: {str(e)}", []
+
+    async def sync_from_sheets_to_local(self, progress: Optional[ProgressCallback] = None,
+                                        cancel_event: Optional[threading.Event] = None
+                                        ) -> Tuple[bool, str, Optional[AppData]]:
+        """구글 시트에서 로컬로 데이터 다운로드 (학생/스케줄/메타데이터 동시 요청)"""
+        try:
+            students, schedules, watermark = await self._read_tables(
+                ('get_students', 'get_schedules'), progress, cancel_event, with_metadata=True)
+            return downloaded_app_data(students, schedules, watermark)
+
+        except SyncCancelled:
+            return False, "사용자가 동기화를 취소했습니다.", None
+        except Exception as e:
+            return False, f"구글 시트에서 로컬로 동기화 실패: {str(e)}", None
+
+    # ---- 페이지 동시 요청 ----
+
+    async def _read_tables(self, actions: Tuple[str, ...], progress: Optional[ProgressCallback],
+                           cancel_event: Optional[threading.Event], with_metadata: bool = False) -> List[list]:
+        """actions 각각의 전체 행을 페이지 동시 요청으로 가져와 action 순서대로 반환
+
+        1단계에서 각 첫 페이지(와 메타데이터)를, 2단계에서 첫 페이지의 전체 행 수로
+        계산한 나머지 페이지를 max_pending_pages개씩 앞서 요청하며 순서대로 합친다.
+        페이지마다 기록된 워터마크가 서로 (또는 메타데이터와) 다르면 다운로드 중에
+        업로드된 것이므로 실패한다. with_metadata면 마지막 항목으로 서버 워터마크
+        (없으면 None)를 덧붙인다.
+        """
+        first = [self._call(self.api.fetch_page, action, 0, cancel_event) for action in actions]
+        if with_metadata:
+            first.append(self._call(self.api.fetch_metadata, cancel_event))
+        results = await _gather(*first)
+        metadata = results.pop() if with_metadata else None
+
+        tables = [items for items, _ in results]
+        watermarks = {paging.get('watermark') for _, paging in results if paging is not None}
+        total = sum((paging or {}).get('total', len(items)) for items, paging in results)
+        received = sum(len(items) for items in tables)
+        if progress:
+            progress("rows_received", received, total)
+
+        # 나머지 페이지 (표 번호, 오프셋) - 앞 페이지부터 합치므로 행 순서가 유지됨
+        remaining = deque()
+        for index, (_, paging) in enumerate(results):
+            if paging and paging.get('next_offset') is not None:
+                remaining.extend((index, offset)
+                                 for offset in range(paging['next_offset'], paging['total'], paging['limit']))
+        del results
+
+        pending = deque()
+        try:
+            while remaining or pending:
+                while remaining and len(pending) < self.max_pending_pages:
+                    index, offset = remaining.popleft()
+                    pending.append((index, asyncio.ensure_future(
+                        self._call(self.api.fetch_page, actions[index], offset, cancel_event))))
+                index, task = pending.popleft()
+                items, paging = await task
+                if paging is not None:
+                    watermarks.add(paging.get('watermark'))
+                    if len(watermarks) > 1:
+                        raise SheetsRequestError(SHEET_CHANGED_MESSAGE)
+                tables[index].extend(items)
+                received += len(items)
+                if progress:
+                    progress("rows_received", received, total)
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+        if metadata is not None and watermarks:
+            watermarks.add(metadata.get('sync_watermark'))
+        if len(watermarks) > 1:
+            raise SheetsRequestError(SHEET_CHANGED_MESSAGE)
+        watermark = (metadata or {}).get('sync_watermark') or next(iter(watermarks), None)
+
+        if with_metadata:
+            tables.append(watermark)
+        return tables
+
+
+class AsyncLoopThread:
+    """asyncio 이벤트 루프를 돌리는 전용 스레드
+
+    Qt 이벤트 루프와 따로 돌며, 다른 스레드(메인 스레드나 QThreadPool 작업)에서
+    submit()으로 코루틴을 넘기고 concurrent.futures.Future로 결과를 받는다.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._lock:
+            if self.is_running:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, name="sheets-loop", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def submit(self, coro) -> Future:
+        """코루틴을 루프 스레드에서 실행 (필요하면 스레드 시작)"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """코루틴 결과를 기다려 반환 (루프 스레드가 아닌 곳에서 호출)"""
+        return self.submit(coro).result(timeout)
+
+    def stop(self, timeout: float = 5.0):
+        with self._lock:
+            if not self.is_running:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
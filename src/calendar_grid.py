@@ -0,0 +1,506 @@
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtWidgets import QTableView, QStyledItemDelegate, QHeaderView, QAbstractItemView, QStyle
+from PySide6.QtCore import Signal, Qt, QAbstractTableModel, QModelIndex, QMimeData, QPoint, QRect, QSize
+from PySide6.QtGui import (
+    QBrush, QColor, QDrag, QFont, QFontMetrics, QLinearGradient, QPainter, QPen, QPixmap, QStaticText, QTransform
+)
+
+from .data_manager import DataManager
+from .models import Schedule, Student
+from .styles import CALENDAR_COLORS, lighten_color, darken_color
+
+WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+
+# CalendarModel.data 역할
+DATE_ROLE = Qt.UserRole + 1       # 칸의 날짜
+ENTRIES_ROLE = Qt.UserRole + 2    # 칸의 [(일정, 수강생)]
+IN_MONTH_ROLE = Qt.UserRole + 3   # 표시 중인 달의 날짜인지
+
+Entry = Tuple[Schedule, Student]
+
+
+def month_grid(month_start: date) -> Tuple[date, int]:
+    """달력 첫 칸의 날짜(월요일)와 그 달을 표시하는 데 필요한 주 수"""
+    month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    calendar_start = month_start - timedelta(days=month_start.weekday())
+    calendar_end = month_end + timedelta(days=6 - month_end.weekday())
+    return calendar_start, ((calendar_end - calendar_start).days + 1) // 7
+
+
+def schedule_label(schedule: Schedule, student: Student) -> str:
+    """달력에 표시할 일정 문구 (완료/메모 표시 포함)"""
+    text = f"{student.name} {schedule.week_number}강"
+    if schedule.is_completed:
+        text += " ✓"
+    # 메모가 존재하고 비어있지 않으면 아이콘 표시
+    if schedule.memo and schedule.memo.strip():
+        text += " 📝"
+    return text
+
+
+class CalendarModel(QAbstractTableModel):
+    """한 달 달력 모델 - 행은 주, 열은 요일, 각 칸은 그 날짜의 (일정, 수강생) 목록"""
+
+    def __init__(self, data_manager: DataManager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.month_start = date.today().replace(day=1)
+        self.calendar_start, self.weeks = month_grid(self.month_start)
+        self._entries: Dict[date, List[Entry]] = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.weeks
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 7
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsDropEnabled
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return WEEKDAY_NAMES[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cell_date = self.date_at(index)
+        if role == Qt.DisplayRole:
+            return str(cell_date.day)
+        if role == DATE_ROLE:
+            return cell_date
+        if role == ENTRIES_ROLE:
+            return self.entries_for(cell_date)
+        if role == IN_MONTH_ROLE:
+            return cell_date.month == self.month_start.month
+        return None
+
+    @property
+    def date_range(self) -> Tuple[date, date]:
+        return self.calendar_start, self.calendar_start + timedelta(days=self.weeks * 7 - 1)
+
+    def date_at(self, index: QModelIndex) -> date:
+        return self.calendar_start + timedelta(days=index.row() * 7 + index.column())
+
+    def index_for_date(self, cell_date: date) -> QModelIndex:
+        offset = (cell_date - self.calendar_start).days
+        if 0 <= offset < self.weeks * 7:
+            return self.index(offset // 7, offset % 7)
+        return QModelIndex()
+
+    def entries_for(self, cell_date: date) -> List[Entry]:
+        """그 날짜의 (일정, 수강생) 목록 - 델리게이트는 QVariant 변환 없이 이 메서드로 직접 읽음"""
+        return self._entries.get(cell_date, [])
+
+    def set_month(self, month_start: date):
+        """표시할 달 변경 (주 수가 달라질 수 있으므로 모델 리셋)"""
+        self.beginResetModel()
+        self.month_start = month_start
+        self.calendar_start, self.weeks = month_grid(month_start)
+        self._load()
+        self.endResetModel()
+
+    def load_schedules(self):
+        """같은 달의 일정을 다시 읽고 모든 칸 갱신 알림"""
+        self._load()
+        self.dataChanged.emit(self.index(0, 0), self.index(self.weeks - 1, 6))
+
+    def refresh_dates(self, dates: Iterable[date]):
+        """바뀐 날짜 중 화면에 보이는 칸만 다시 읽고 그 칸만 갱신 알림"""
+        start, end = self.date_range
+        visible = sorted(d for d in dates if start <= d <= end)
+        if not visible:
+            return
+        get_student = self.data_manager.get_student_by_id
+        for cell_date in visible:
+            entries = []
+            for schedule in self.data_manager.get_schedules_for_date(cell_date):
+                student = get_student(schedule.student_id)
+                if student:
+                    entries.append((schedule, student))
+            if entries:
+                self._entries[cell_date] = entries
+            else:
+                self._entries.pop(cell_date, None)
+            index = self.index_for_date(cell_date)
+            self.dataChanged.emit(index, index)
+
+    def _load(self):
+        # 화면에 보이는 날짜 범위의 스케줄만 날짜별로 조회
+        start, end = self.date_range
+        schedules_by_date = self.data_manager.get_schedules_in_range(start, end)
+        students_dict = {s.id: s for s in self.data_manager.get_students()}
+
+        self._entries = {}
+        for cell_date, schedules in schedules_by_date.items():
+            entries = [(s, students_dict[s.student_id]) for s in schedules if s.student_id in students_dict]
+            if entries:
+                self._entries[cell_date] = entries
+
+
+class ScheduleChipDelegate(QStyledItemDelegate):
+    """달력 칸을 직접 그리는 델리게이트 - 일정마다 위젯을 만들지 않고 둥근 칩을 QPainter로 그림
+
+    칸 높이는 일정 수에 맞춰 늘어나고, 화면에 보이는 칩만 그린다.
+    칩과 글자 배경은 (색상, 완료, 호버, 크기) 조합마다 한 번만 그려 둔 픽스맵을 복사하고,
+    문구는 배치를 미리 계산해 둔 QStaticText로 그린다.
+    """
+
+    MIN_HEIGHT = 100
+    MIN_WIDTH = 140
+    DATE_HEIGHT = 24
+    CHIP_HEIGHT = 30
+    CHIP_SPACING = 2
+    PADDING = 3
+    CACHE_LIMIT = 4096
+    COLORS = {name: QColor(value) for name, value in CALENDAR_COLORS.items()}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hover_id: Optional[str] = None   # 마우스가 올라간 칩의 일정 ID
+        self.drop_date: Optional[date] = None  # 드래그 중인 일정을 놓을 칸
+        self._chip_pixmaps: Dict[tuple, QPixmap] = {}
+        self._label_pixmaps: Dict[tuple, QPixmap] = {}
+        self._texts: Dict[Tuple[str, int], Tuple[QStaticText, int]] = {}
+        self.date_font = QFont()
+        self.date_font.setBold(True)
+        self.chip_font = QFont()
+        self.chip_font.setBold(True)
+        self.chip_font.setPixelSize(11)
+        self._metrics = QFontMetrics(self.chip_font)
+
+    @classmethod
+    def cell_height(cls, count: int) -> int:
+        return max(cls.MIN_HEIGHT, cls.DATE_HEIGHT + count * (cls.CHIP_HEIGHT + cls.CHIP_SPACING) + cls.PADDING)
+
+    @classmethod
+    def chip_rect(cls, cell_rect: QRect, slot: int) -> QRect:
+        top = cell_rect.top() + cls.DATE_HEIGHT + slot * (cls.CHIP_HEIGHT + cls.CHIP_SPACING)
+        return QRect(cell_rect.left() + cls.PADDING, top, cell_rect.width() - 2 * cls.PADDING, cls.CHIP_HEIGHT)
+
+    @classmethod
+    def chip_at(cls, cell_rect: QRect, pos: QPoint, count: int) -> int:
+        """pos에 있는 칩의 순번 (없으면 -1)"""
+        if not (cell_rect.left() + cls.PADDING <= pos.x() < cell_rect.right() - cls.PADDING):
+            return -1
+        offset = pos.y() - cell_rect.top() - cls.DATE_HEIGHT
+        step = cls.CHIP_HEIGHT + cls.CHIP_SPACING
+        if offset < 0 or offset % step >= cls.CHIP_HEIGHT:
+            return -1
+        slot = offset // step
+        return slot if slot < count else -1
+
+    def sizeHint(self, option, index) -> QSize:
+        model = index.model()
+        return QSize(self.MIN_WIDTH, self.cell_height(len(model.entries_for(model.date_at(index)))))
+
+    def paint(self, painter: QPainter, option, index):
+        model = index.model()
+        cell_date = model.date_at(index)
+        rect = option.rect
+        today = date.today()
+
+        painter.save()
+        # 칸 배경과 테두리 (드래그 중: 과거 날짜는 주황색, 오늘 이후는 초록색)
+        colors = self.COLORS
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        if cell_date == self.drop_date:
+            border, width = colors["drop_past" if cell_date < today else "drop_future"], 2
+            background = colors["cell_hover"]
+        else:
+            border, width = (colors["today"], 2) if cell_date == today else (colors["cell_border"], 1)
+            background = colors["cell_hover" if hovered else "cell_background"]
+        painter.fillRect(rect, background)
+        painter.setPen(QPen(border, width))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(rect.adjusted(width // 2, width // 2, -1, -1))
+
+        # 날짜
+        if cell_date.month != model.month_start.month:
+            painter.setFont(option.font)
+            painter.setPen(colors["other_month_date"])
+        else:
+            painter.setFont(self.date_font)
+            painter.setPen(colors["today" if cell_date == today else "date_text"])
+        painter.drawText(rect.adjusted(5, 3, -5, 0), Qt.AlignTop | Qt.AlignLeft, str(cell_date.day))
+
+        # 화면에 보이는 칩만 그림
+        entries = model.entries_for(cell_date)
+        if entries:
+            visible = rect
+            if option.widget is not None:
+                visible = rect.intersected(option.widget.viewport().rect())
+            step = self.CHIP_HEIGHT + self.CHIP_SPACING
+            first = max(0, (visible.top() - rect.top() - self.DATE_HEIGHT) // step)
+            last = min(len(entries), (visible.bottom() - rect.top() - self.DATE_HEIGHT) // step + 1)
+            ratio = option.widget.devicePixelRatioF() if option.widget is not None else 1.0
+            painter.setFont(self.chip_font)
+            left = rect.left() + self.PADDING
+            width = rect.width() - 2 * self.PADDING
+            for slot in range(first, last):
+                schedule, student = entries[slot]
+                self._paint_chip(painter, left, rect.top() + self.DATE_HEIGHT + slot * step, width,
+                                 schedule, student, ratio)
+        painter.restore()
+
+    def _paint_chip(self, painter: QPainter, x: int, y: int, width: int,
+                    schedule: Schedule, student: Student, ratio: float):
+        completed = schedule.is_completed
+        painter.drawPixmap(x, y, self._chip_pixmap(student.color, completed, schedule.id == self.hover_id,
+                                                   width, self.CHIP_HEIGHT, ratio))
+
+        # 가운데 글자 배경 (완료: 초록, 그 외: 흰색)
+        inner_width = width - 12
+        text, advance = self._label_text(schedule_label(schedule, student), inner_width - 12)
+        label_width = min(inner_width, advance + 12)
+        label_x = x + 6 + (inner_width - label_width) // 2
+        label_height = self.CHIP_HEIGHT - 8
+        painter.drawPixmap(label_x, y + 4, self._label_pixmap(completed, label_width, label_height, ratio))
+        painter.setPen(self.COLORS["completed_text" if completed else "chip_text"])
+        size = text.size()
+        painter.drawStaticText(int(label_x + (label_width - size.width()) / 2),
+                               int(y + 4 + (label_height - size.height()) / 2), text)
+
+    def _label_text(self, text: str, width: int) -> Tuple[QStaticText, int]:
+        """칸 너비에 맞게 줄인 문구(배치를 미리 계산한 QStaticText)와 그 너비 - 같은 문구/너비는 재사용"""
+        key = (text, width)
+        cached = self._texts.get(key)
+        if cached is None:
+            if len(self._texts) > self.CACHE_LIMIT:
+                self._texts.clear()
+            elided = self._metrics.elidedText(text, Qt.ElideRight, max(0, width))
+            static_text = QStaticText(elided)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(QTransform(), self.chip_font)
+            cached = self._texts[key] = (static_text, self._metrics.horizontalAdvance(elided))
+        return cached
+
+    def _chip_pixmap(self, color: str, is_completed: bool, hovered: bool,
+                     width: int, height: int, ratio: float) -> QPixmap:
+        """칩 배경 (그라데이션 둥근 사각형) - (색상, 완료, 호버, 크기)마다 한 번만 그림"""
+        key = (color, is_completed, hovered, width, height, ratio)
+        pixmap = self._chip_pixmaps.get(key)
+        if pixmap is None:
+            if len(self._chip_pixmaps) > self.CACHE_LIMIT:
+                self._chip_pixmaps.clear()
+            colors = self.COLORS
+            size = QSize(width, height)
+            gradient = QLinearGradient(0, 0, width, 0)
+            if is_completed:
+                gradient.setColorAt(0, QColor(color if hovered else darken_color(color)))
+                gradient.setColorAt(1, colors["completed_end_hover" if hovered else "completed_end"])
+            elif hovered:
+                gradient.setColorAt(0, QColor(lighten_color(color)))
+                gradient.setColorAt(1, QColor(color))
+            else:
+                gradient.setColorAt(0, QColor(color))
+                gradient.setColorAt(1, QColor(lighten_color(color)))
+
+            pixmap, painter = self._new_pixmap(size, ratio)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(gradient))
+            painter.drawRoundedRect(QRect(QPoint(0, 0), size), 10, 10)
+            if hovered:
+                painter.setPen(QPen(colors["completed_hover_border" if is_completed else "chip_hover_border"], 1))
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRoundedRect(QRect(0, 0, width - 1, height - 1), 10, 10)
+            painter.end()
+            self._chip_pixmaps[key] = pixmap
+        return pixmap
+
+    def _label_pixmap(self, is_completed: bool, width: int, height: int, ratio: float) -> QPixmap:
+        """글자 배경 - (완료, 크기)마다 한 번만 그림"""
+        key = (is_completed, width, height, ratio)
+        pixmap = self._label_pixmaps.get(key)
+        if pixmap is None:
+            size = QSize(width, height)
+            if len(self._label_pixmaps) > self.CACHE_LIMIT:
+                self._label_pixmaps.clear()
+            pixmap, painter = self._new_pixmap(size, ratio)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.COLORS["completed_label_background" if is_completed else "label_background"])
+            painter.drawRoundedRect(QRect(QPoint(0, 0), size), 4, 4)
+            painter.end()
+            self._label_pixmaps[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _new_pixmap(size: QSize, ratio: float) -> Tuple[QPixmap, QPainter]:
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        return pixmap, painter
+
+
+class CalendarGridView(QTableView):
+    """CalendarModel을 ScheduleChipDelegate로 그리는 달력 격자
+
+    칩을 끌어 다른 칸에 놓으면 scheduleDropped, 칩을 더블클릭하면 memoRequested를 보낸다.
+    드래그 데이터는 일정 ID 텍스트이다.
+    """
+
+    scheduleDropped = Signal(str, date)
+    memoRequested = Signal(str)
+
+    def __init__(self, model: CalendarModel, parent=None):
+        super().__init__(parent)
+        self.delegate = ScheduleChipDelegate(self)
+        self.setModel(model)
+        self.setItemDelegate(self.delegate)
+        self._press_pos = QPoint()
+        self._press_schedule: Optional[Schedule] = None
+        self._hover_date: Optional[date] = None
+
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setShowGrid(False)
+        self.setMouseTracking(True)
+        self.setAcceptDrops(True)
+        self.verticalHeader().hide()
+
+        header = self.horizontalHeader()
+        header.setMinimumSectionSize(ScheduleChipDelegate.MIN_WIDTH)
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setStyleSheet(f"""
+            QHeaderView::section {{
+                font-weight: bold;
+                font-size: 14px;
+                background-color: {CALENDAR_COLORS["header_background"]};
+                border: 1px solid {CALENDAR_COLORS["cell_border"]};
+                padding: 8px;
+            }}
+        """)
+
+        model.modelReset.connect(self.fit_rows)
+        model.dataChanged.connect(lambda top_left, bottom_right, roles=(): self.fit_rows(top_left.row(), bottom_right.row()))
+
+    def set_month(self, month_start: date):
+        self.model().set_month(month_start)
+
+    def load_schedules(self):
+        self.model().load_schedules()
+
+    def refresh_dates(self, dates: Iterable[date]):
+        self.model().refresh_dates(dates)
+
+    def fit_rows(self, first: int = 0, last: Optional[int] = None):
+        """행 높이를 일정 수에 맞추되, 적으면 화면 높이를 주 수로 나눈 만큼 채움"""
+        rows = self.model().rowCount()
+        if not rows:
+            return
+        fill = self.viewport().height() // rows
+        last = rows - 1 if last is None else min(last, rows - 1)
+        for row in range(first, last + 1):
+            self.setRowHeight(row, max(fill, self.sizeHintForRow(row)))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.fit_rows()
+
+    def entry_at(self, pos: QPoint) -> Optional[Entry]:
+        """뷰포트 좌표 pos에 있는 칩의 (일정, 수강생)"""
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None
+        entries = self.model().entries_for(self.model().date_at(index))
+        slot = self.delegate.chip_at(self.visualRect(index), pos, len(entries))
+        return entries[slot] if slot >= 0 else None
+
+    def date_at(self, pos: QPoint) -> Optional[date]:
+        index = self.indexAt(pos)
+        return self.model().date_at(index) if index.isValid() else None
+
+    def _update_date(self, cell_date: Optional[date]):
+        if cell_date is not None:
+            index = self.model().index_for_date(cell_date)
+            if index.isValid():
+                self.update(index)
+
+    def _set_hover(self, pos: Optional[QPoint]):
+        entry = self.entry_at(pos) if pos is not None else None
+        hover_id = entry[0].id if entry else None
+        if hover_id != self.delegate.hover_id:
+            self.delegate.hover_id = hover_id
+            self._update_date(self._hover_date)
+            self._hover_date = entry[0].scheduled_date if entry else None
+            self._update_date(self._hover_date)
+
+    def _set_drop_date(self, drop_date: Optional[date]):
+        if drop_date != self.delegate.drop_date:
+            previous, self.delegate.drop_date = self.delegate.drop_date, drop_date
+            self._update_date(previous)
+            self._update_date(drop_date)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._press_pos = event.position().toPoint()
+            entry = self.entry_at(self._press_pos)
+            self._press_schedule = entry[0] if entry else None
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint()
+        if not (event.buttons() & Qt.LeftButton):
+            self._set_hover(pos)
+            super().mouseMoveEvent(event)
+            return
+
+        schedule = self._press_schedule
+        if schedule is None or schedule.is_completed:
+            return
+        if (pos - self._press_pos).manhattanLength() < 10:
+            return
+
+        self._press_schedule = None
+        drag = QDrag(self)
+        mimeData = QMimeData()
+        mimeData.setText(schedule.id)
+        drag.setMimeData(mimeData)
+        drag.exec(Qt.MoveAction)
+
+    def mouseDoubleClickEvent(self, event):
+        """칩을 더블클릭하면 메모 편집 요청"""
+        if event.button() == Qt.LeftButton:
+            entry = self.entry_at(event.position().toPoint())
+            if entry:
+                self.memoRequested.emit(entry[0].id)
+                return
+        super().mouseDoubleClickEvent(event)
+
+    def leaveEvent(self, event):
+        self._set_hover(None)
+        super().leaveEvent(event)
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasText():
+            # 모든 날짜로 드래그 가능 (과거 날짜도 허용)
+            event.acceptProposedAction()
+            self._set_drop_date(self.date_at(event.position().toPoint()))
+        else:
+            event.ignore()
+
+    def dragMoveEvent(self, event):
+        drop_date = self.date_at(event.position().toPoint())
+        if event.mimeData().hasText() and drop_date is not None:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+        self._set_drop_date(drop_date)
+
+    def dragLeaveEvent(self, event):
+        self._set_drop_date(None)
+
+    def dropEvent(self, event):
+        drop_date = self.date_at(event.position().toPoint())
+        self._set_drop_date(None)
+        if drop_date is None or not event.mimeData().hasText():
+            event.ignore()
+            return
+        event.acceptProposedAction()
+        self.scheduleDropped.emit(event.mimeData().text(), drop_date)
@@ -1,274 +1,13 @@
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import date
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QGridLayout, QFrame, QScrollArea, QMessageBox, QDialog
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox, QDialog
 )
-from PySide6.QtCore import Signal, Qt, QMimeData, QPoint
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QMouseEvent, QDrag, QPainter, QColor, QFont
+from PySide6.QtCore import Signal, Qt
 
 from .data_manager import DataManager
-from .models import Schedule, Student
+from .change_events import DataChange
 from .memo_dialog import MemoDialog
-
-
-class ScheduleItem(QFrame):
-    def __init__(self, schedule: Schedule, student: Student):
-        super().__init__()
-        self.schedule = schedule
-        self.student = student
-        self.drag_start_position = QPoint()
-
-        self.setMinimumHeight(32)
-        self.setMaximumHeight(32)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 {student.color}, stop: 1 {self._lighten_color(student.color)});
-                border: none;
-                border-radius: 10px;
-                padding: 2px 4px;
-                margin: 1px;
-                box-shadow: 0 2px 6px rgba(0, 0, 0, 0.15);
-            }}
-            QFrame:hover {{
-                border: 1px solid rgba(255, 255, 255, 0.4);
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 {self._lighten_color(student.color)}, stop: 1 {student.color});
-                transform: translateY(-1px);
-                box-shadow: 0 3px 10px rgba(0, 0, 0, 0.25);
-            }}
-        """)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(6, 2, 6, 2)
-        layout.setAlignment(Qt.AlignCenter)
-
-        text = f"{student.name} {schedule.week_number}강"
-        if schedule.is_completed:
-            text += " ✓"
-        # 메모가 존재하고 비어있지 않으면 아이콘 표시
-        if schedule.memo and schedule.memo.strip():
-            text += " 📝"
-
-        label = QLabel(text)
-        label.setAlignment(Qt.AlignCenter)
-
-        # 완료된 일정은 다른 스타일 적용
-        if schedule.is_completed:
-            label.setStyleSheet("""
-                color: #FFFFFF;
-                font-weight: 700;
-                font-size: 11px;
-                background: rgba(16, 185, 129, 0.95);
-                border-radius: 4px;
-                padding: 3px 6px;
-                border: none;
-                min-height: 16px;
-            """)
-            # 완료된 일정의 부모 프레임도 스타일 변경
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                        stop: 0 {self._darken_color(student.color)}, stop: 1 rgba(16, 185, 129, 0.7));
-                    border: none;
-                    border-radius: 10px;
-                    padding: 2px 4px;
-                    margin: 1px;
-                    opacity: 0.9;
-                    box-shadow: 0 2px 6px rgba(16, 185, 129, 0.2);
-                }}
-                QFrame:hover {{
-                    border: 1px solid rgba(16, 185, 129, 0.6);
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                        stop: 0 {student.color}, stop: 1 rgba(16, 185, 129, 0.8));
-                    opacity: 1.0;
-                    box-shadow: 0 3px 10px rgba(16, 185, 129, 0.25);
-                }}
-            """)
-        else:
-            label.setStyleSheet("""
-                color: #1F2937;
-                font-weight: 700;
-                font-size: 11px;
-                background: rgba(255, 255, 255, 0.95);
-                border-radius: 4px;
-                padding: 3px 6px;
-                border: none;
-                min-height: 16px;
-            """)
-        label.setWordWrap(True)
-        layout.addWidget(label)
-
-    def mouseDoubleClickEvent(self, event):
-        """더블클릭으로 메모장 열기"""
-        if event.button() == Qt.LeftButton:
-            # 부모 달력 뷰에 메모 다이얼로그 요청
-            parent_widget = self.parent()
-            while parent_widget and not hasattr(parent_widget, 'show_memo_dialog'):
-                parent_widget = parent_widget.parent()
-
-            if parent_widget:
-                parent_widget.show_memo_dialog(self.schedule.id)
-
-    def _lighten_color(self, color: str) -> str:
-        """색상을 밝게 만들어 호버 효과에 사용"""
-        try:
-            # #RRGGBB 형식의 색상을 파싱
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-
-            # 각 채널을 20% 밝게 만들기
-            r = min(255, int(r * 1.2))
-            g = min(255, int(g * 1.2))
-            b = min(255, int(b * 1.2))
-
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except:
-            return color
-
-    def _darken_color(self, color: str) -> str:
-        """색상을 어둡게 만들어 완료된 일정에 사용"""
-        try:
-            # #RRGGBB 형식의 색상을 파싱
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-
-            # 각 채널을 30% 어둡게 만들기
-            r = int(r * 0.7)
-            g = int(g * 0.7)
-            b = int(b * 0.7)
-
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except:
-            return color
-
-    def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.LeftButton:
-            self.drag_start_position = event.pos()
-
-    def mouseMoveEvent(self, event: QMouseEvent):
-        if not (event.buttons() & Qt.LeftButton):
-            return
-
-        if (event.pos() - self.drag_start_position).manhattanLength() < 10:
-            return
-
-        if self.schedule.is_completed:
-            return
-
-        drag = QDrag(self)
-        mimeData = QMimeData()
-        mimeData.setText(self.schedule.id)
-        drag.setMimeData(mimeData)
-
-        drag.exec_(Qt.MoveAction)
-
-
-class CalendarCell(QFrame):
-    scheduleDropped = Signal(str, date)
-    scheduleClicked = Signal(str)
-
-    def __init__(self, cell_date: date):
-        super().__init__()
-        self.cell_date = cell_date
-        self.schedule_items = []
-
-        self.setAcceptDrops(True)
-        self.setMinimumHeight(100)
-        self.setMinimumWidth(140)
-
-        self.setStyleSheet("""
-            QFrame {
-                border: 1px solid #404040;
-                background-color: #2D2D2D;
-            }
-            QFrame:hover {
-                background-color: #333333;
-            }
-        """)
-
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(2, 2, 2, 2)
-        self.layout.setSpacing(1)
-
-        self.date_label = QLabel(str(cell_date.day))
-        self.date_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        self.date_label.setStyleSheet("font-weight: bold; color: #FFFFFF; margin: 2px;")
-
-        if cell_date == date.today():
-            self.date_label.setStyleSheet("font-weight: bold; color: #0078D4; margin: 2px;")
-            self.setStyleSheet("""
-                QFrame {
-                    border: 2px solid #0078D4;
-                    background-color: #2D2D2D;
-                }
-                QFrame:hover {
-                    background-color: #333333;
-                }
-            """)
-
-        self.layout.addWidget(self.date_label)
-        self.layout.addStretch()
-
-    def add_schedule(self, schedule: Schedule, student: Student):
-        item = ScheduleItem(schedule, student)
-        self.schedule_items.append(item)
-        self.layout.insertWidget(self.layout.count() - 1, item)
-
-    def clear_schedules(self):
-        for item in self.schedule_items:
-            self.layout.removeWidget(item)
-            item.deleteLater()
-        self.schedule_items.clear()
-
-    def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasText():
-            # 모든 날짜로 드래그 가능 (과거 날짜도 허용)
-            event.acceptProposedAction()
-            if self.cell_date < date.today():
-                # 과거 날짜는 주황색으로 표시
-                self.setStyleSheet("""
-                    QFrame {
-                        border: 2px solid #FF8C00;
-                        background-color: #333333;
-                    }
-                """)
-            else:
-                # 오늘 이후는 초록색으로 표시
-                self.setStyleSheet("""
-                    QFrame {
-                        border: 2px solid #107C10;
-                        background-color: #333333;
-                    }
-                """)
-
-    def dragLeaveEvent(self, event):
-        self.setStyleSheet("""
-            QFrame {
-                border: 1px solid #404040;
-                background-color: #2D2D2D;
-            }
-            QFrame:hover {
-                background-color: #333333;
-            }
-        """)
-
-    def dropEvent(self, event: QDropEvent):
-        schedule_id = event.mimeData().text()
-        self.scheduleDropped.emit(schedule_id, self.cell_date)
-        self.setStyleSheet("""
-            QFrame {
-                border: 1px solid #404040;
-                background-color: #2D2D2D;
-            }
-            QFrame:hover {
-                background-color: #333333;
-            }
-        """)
-        event.acceptProposedAction()
+from .calendar_grid import CalendarModel, CalendarGridView
 
 
 class CalendarView(QWidget):
@@ -278,7 +17,6 @@ class CalendarView(QWidget):
         super().__init__()
         self.data_manager = data_manager
         self.current_date = date.today().replace(day=1)
-        self.calendar_cells = {}
         self.setup_ui()
         self.setup_connections()
 
@@ -318,32 +56,10 @@ class CalendarView(QWidget):
 
         layout.addLayout(header_layout)
 
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-        calendar_widget = QWidget()
-        self.calendar_layout = QGridLayout(calendar_widget)
-        self.calendar_layout.setSpacing(1)
-
-        weekdays = ["월", "화", "수", "목", "금", "토", "일"]
-        for i, day in enumerate(weekdays):
-            header_label = QLabel(day)
-            header_label.setAlignment(Qt.AlignCenter)
-            header_label.setStyleSheet("""
-                QLabel {
-                    font-weight: bold;
-                    font-size: 14px;
-                    background-color: #333333;
-                    border: 1px solid #404040;
-                    padding: 8px;
-                }
-            """)
-            self.calendar_layout.addWidget(header_label, 0, i)
-
-        scroll_area.setWidget(calendar_widget)
-        layout.addWidget(scroll_area)
+        # 일정은 격자가 직접 그리고 스크롤도 격자(QTableView)가 처리
+        self.grid = CalendarGridView(CalendarModel(self.data_manager))
+        self.grid.memoRequested.connect(self.show_memo_dialog)
+        layout.addWidget(self.grid)
 
         self.update_calendar()
 
@@ -351,58 +67,22 @@ class CalendarView(QWidget):
         self.prev_button.clicked.connect(self.prev_month)
         self.next_button.clicked.connect(self.next_month)
         self.today_button.clicked.connect(self.go_to_today)
+        self.grid.scheduleDropped.connect(self.on_schedule_dropped)
+        self.data_manager.changed.connect(self.apply_change)
 
     def update_calendar(self):
         self.month_label.setText(f"{self.current_date.year}년 {self.current_date.month}월")
-
-        for cell in self.calendar_cells.values():
-            self.calendar_layout.removeWidget(cell)
-            cell.deleteLater()
-        self.calendar_cells.clear()
-
-        month_start = self.current_date
-        month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
-
-        calendar_start = month_start - timedelta(days=month_start.weekday())
-        calendar_end = month_end + timedelta(days=6 - month_end.weekday())
-
-        current_date = calendar_start
-        row = 1
-
-        while current_date <= calendar_end:
-            for col in range(7):
-                cell_date = current_date + timedelta(days=col)
-                cell = CalendarCell(cell_date)
-                cell.scheduleDropped.connect(self.on_schedule_dropped)
-
-                if cell_date.month != self.current_date.month:
-                    cell.date_label.setStyleSheet("color: #666666; margin: 2px;")
-
-                self.calendar_cells[cell_date] = cell
-                self.calendar_layout.addWidget(cell, row, col)
-
-            current_date += timedelta(days=7)
-            row += 1
-
-        self.load_schedules()
+        self.grid.set_month(self.current_date)
 
     def load_schedules(self):
-        for cell in self.calendar_cells.values():
-            cell.clear_schedules()
-
-        # 최신 스케줄 데이터를 강제로 다시 로드
-        schedules = self.data_manager.get_schedules()
-        students_dict = {s.id: s for s in self.data_manager.get_students()}
-
-        # 스케줄을 날짜순으로 정렬해서 표시
-        sorted_schedules = sorted(schedules, key=lambda s: s.scheduled_date)
+        self.grid.load_schedules()
 
-        for schedule in sorted_schedules:
-            if schedule.scheduled_date in self.calendar_cells:
-                student = students_dict.get(schedule.student_id)
-                if student:
-                    cell = self.calendar_cells[schedule.scheduled_date]
-                    cell.add_schedule(schedule, student)
+    def apply_change(self, change: DataChange):
+        """변경 이벤트 반영 - 전체 교체가 아니면 영향을 받은 날짜의 칸만 다시 채움"""
+        if change.is_bulk:
+            self.load_schedules()
+        else:
+            self.grid.refresh_dates(change.dates)
 
     def on_schedule_dropped(self, schedule_id: str, new_date: date):
         # 과거 날짜로 이동하는 경우 추가 확인
@@ -432,7 +112,6 @@ class CalendarView(QWidget):
                     self.scheduleChanged.emit("일정이 과거 날짜로 이동되었습니다.")
                 else:
                     self.scheduleChanged.emit("일정이 성공적으로 이동되었습니다.")
-                self.load_schedules()
             else:
                 QMessageBox.warning(self, "오류", "일정 이동에 실패했습니다.")
 
@@ -457,18 +136,13 @@ class CalendarView(QWidget):
 
     def toggle_schedule_completion(self, schedule_id: str):
         """일정의 완료 상태를 토글"""
-        schedule = None
-        for s in self.data_manager.get_schedules():
-            if s.id == schedule_id:
-                schedule = s
-                break
+        schedule = self.data_manager.get_schedule_by_id(schedule_id)
 
         if schedule:
             new_status = not schedule.is_completed
             if self.data_manager.mark_schedule_completed(schedule_id, new_status):
                 status_text = "완료" if new_status else "미완료"
                 self.scheduleChanged.emit(f"'{schedule.week_number}강' 일정이 {status_text}로 변경되었습니다.")
-                self.load_schedules()
 
     def show_memo_dialog(self, schedule_id: str):
         """메모 다이얼로그 표시"""
@@ -478,11 +152,7 @@ class CalendarView(QWidget):
             QMessageBox.warning(self, "오류", "스케줄을 찾을 수 없습니다.")
             return
 
-        student = None
-        for s in self.data_manager.get_students():
-            if s.id == schedule.student_id:
-                student = s
-                break
+        student = self.data_manager.get_student_by_id(schedule.student_id)
 
         if not student:
             QMessageBox.warning(self, "오류", "수강생 정보를 찾을 수 없습니다.")
@@ -501,9 +171,6 @@ class CalendarView(QWidget):
                 else:
                     self.scheduleChanged.emit(f"'{student.name} {schedule.week_number}강' 멤모가 삭제되었습니다.")
 
-                # 스케줄 다시 로드하여 메모 아이콘 업데이트
-                self.load_schedules()
-
                 # 상태 메시지 디버깅
                 updated_schedule = self.data_manager.get_schedule_by_id(schedule_id)
                 if updated_schedule:
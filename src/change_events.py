@@ -0,0 +1,40 @@
+"""데이터 변경 이벤트 - 무엇이 바뀌었는지 알려 화면이 해당 칸/행만 다시 그리도록 함"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import FrozenSet, Iterable
+
+STUDENT_ADDED = "student_added"
+STUDENT_UPDATED = "student_updated"
+STUDENT_REMOVED = "student_removed"
+SCHEDULE_MOVED = "schedule_moved"
+SCHEDULE_COMPLETED = "schedule_completed"
+SCHEDULE_MEMO_CHANGED = "schedule_memo_changed"
+BULK_REPLACED = "bulk_replaced"  # 로드/복원/동기화 병합 등 전체 교체
+
+# 수강생 목록의 행 내용(이름/요일/진도)이 바뀔 수 있는 변경
+STUDENT_ROW_KINDS = frozenset({STUDENT_ADDED, STUDENT_UPDATED, STUDENT_REMOVED, SCHEDULE_MOVED})
+
+
+@dataclass(frozen=True)
+class DataChange:
+    """변경 종류와 영향을 받은 수강생/일정 ID, 달력 날짜 (변경 전후 날짜 모두 포함)"""
+    kind: str
+    student_ids: FrozenSet[str] = frozenset()
+    schedule_ids: FrozenSet[str] = frozenset()
+    dates: FrozenSet[date] = frozenset()
+
+    @classmethod
+    def of(cls, kind: str, student_ids: Iterable[str] = (), schedule_ids: Iterable[str] = (),
+           dates: Iterable[date] = ()) -> "DataChange":
+        return cls(kind, frozenset(student_ids), frozenset(schedule_ids), frozenset(dates))
+
+    @property
+    def is_bulk(self) -> bool:
+        """전체가 교체되어 부분 갱신 대신 다시 읽어야 하는지"""
+        return self.kind == BULK_REPLACED
+
+    @property
+    def affects_students(self) -> bool:
+        """수강생 목록의 행을 다시 그려야 하는지"""
+        return self.kind in STUDENT_ROW_KINDS
@@ -0,0 +1,185 @@
+import os
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from .crypto_utils import CryptoManager
+
+
+class JournalCorruptedError(Exception):
+    """끝까지 기록된 레코드의 인증/해석에 실패 (손상 또는 다른 키) - 파일은 그대로 둠"""
+
+
+class ChangeJournal:
+    """스냅샷 이후의 변경 사항을 기록하는 암호화된 추가 전용 저널
+
+    파일 구조: 헤더(매직, 버전, 저널 ID, salt) + 레코드들
+    레코드 구조: 길이(4바이트) + nonce(12바이트) + AES-GCM 암호문
+    각 레코드는 헤더와 순번을 AAD로 인증하므로 순서 변경/삽입이 감지된다.
+    암호화 키는 CryptoManager의 세션 키에서 저널 salt로 파생한다.
+    저널 ID는 스냅샷 메타데이터의 journal_id와 짝을 이루며,
+    일치하지 않는 저널은 이미 스냅샷에 반영된 것으로 보고 무시한다.
+    백그라운드 저장 중 스냅샷만 교체되고 저널은 아직 바뀌지 않은 경우를 위해
+    스냅샷은 이전 저널 ID와 이미 반영된 레코드 수(journal_base)도 기록한다.
+    """
+
+    MAGIC = b"SMSJ"
+    VERSION = 1
+    HEADER_SIZE = 4 + 1 + 16 + 16
+    NONCE_SIZE = 12
+    KEY_LABEL = b"sms-journal"
+
+    def __init__(self, path: Path, crypto_manager: Optional[CryptoManager] = None):
+        self.path = Path(path)
+        self.crypto_manager = crypto_manager or CryptoManager()
+        self._header: Optional[bytes] = None
+        self._aesgcm: Optional[AESGCM] = None
+        self._records: List[Dict[str, Any]] = []  # 현재 저널의 모든 레코드
+        self.record_count = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._aesgcm is not None
+
+    @property
+    def journal_id(self) -> Optional[str]:
+        return self._header[5:21].hex() if self._header else None
+
+    @classmethod
+    def stored_id(cls, path: Path) -> Optional[str]:
+        """파일 헤더에 기록된 저널 ID (파일이 없거나 형식이 다르면 None)"""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(cls.HEADER_SIZE)
+        except OSError:
+            return None
+        if len(header) < cls.HEADER_SIZE or header[:4] != cls.MAGIC or header[4] != cls.VERSION:
+            return None
+        return header[5:21].hex()
+
+    def records_since(self, count: int) -> List[Dict[str, Any]]:
+        """앞의 count개 이후에 추가된 레코드"""
+        return list(self._records[count:])
+
+    def _aad(self, seq: int) -> bytes:
+        return self._header + struct.pack(">I", seq)
+
+    def _cipher(self, salt: bytes) -> AESGCM:
+        return AESGCM(self.crypto_manager.derive_subkey(self.KEY_LABEL, salt))
+
+    def reset(self, journal_id: str, records: List[Dict[str, Any]] = ()):
+        """새 저널 ID로 저널을 생성 (스냅샷 저장 직후 호출)
+
+        records는 스냅샷에 포함되지 않은 레코드로, 새 저널로 옮겨 기록한다.
+        """
+        salt = os.urandom(16)
+        self._header = self.MAGIC + bytes([self.VERSION]) + bytes.fromhex(journal_id) + salt
+        self._aesgcm = self._cipher(salt)
+        self._records = []
+        self.record_count = 0
+
+        temp_file = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(self._header)
+                for record in records:
+                    f.write(self._encrypt_record(record))
+                    self._records.append(record)
+                    self.record_count += 1
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.path)
+        except Exception:
+            # 파일과 메모리 상태가 어긋나지 않도록 닫아 두고 다음 저장에서 다시 생성
+            self.close()
+            raise
+
+    def load(self, journal_id: Optional[str], base: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """저널 ID가 일치하면 레코드를 복호화해 반환하고 이어쓰기용으로 연다
+
+        저널이 base["id"]와 일치하면 앞의 base["skip"]개는 이미 스냅샷에
+        반영된 것이므로 제외하고 반환한다.
+        마지막 레코드가 쓰는 도중 끊겼으면(길이보다 짧으면) 그 부분만 잘라낸다.
+        끝까지 기록된 레코드가 인증/해석에 실패하면 이후의 커밋된 변경을 지우지 않도록
+        파일을 그대로 두고 JournalCorruptedError를 발생시킨다.
+        """
+        self.close()
+        if not journal_id or not self.path.exists():
+            return []
+
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+
+        header = raw[:self.HEADER_SIZE]
+        if len(header) < self.HEADER_SIZE or header[:4] != self.MAGIC or header[4] != self.VERSION:
+            return []
+        skip = 0
+        if header[5:21].hex() != journal_id:
+            if not base or header[5:21].hex() != base.get("id"):
+                return []
+            skip = base.get("skip", 0)
+
+        self._header = header
+        self._aesgcm = self._cipher(header[21:37])
+
+        records = []
+        offset = self.HEADER_SIZE
+        while offset + 4 <= len(raw):
+            (length,) = struct.unpack(">I", raw[offset:offset + 4])
+            end = offset + 4 + length
+            if end > len(raw):
+                break
+            nonce = raw[offset + 4:offset + 4 + self.NONCE_SIZE]
+            try:
+                if length <= self.NONCE_SIZE:
+                    raise ValueError("invalid record length")
+                plaintext = self._aesgcm.decrypt(nonce, raw[offset + 4 + self.NONCE_SIZE:end], self._aad(len(records)))
+                records.append(json.loads(plaintext.decode('utf-8')))
+            except Exception as e:
+                self.close()
+                raise JournalCorruptedError(
+                    f"journal record {len(records)} at offset {offset} is unreadable: {e!r}") from e
+            offset = end
+
+        if offset != len(raw):
+            print(f"저널 끝부분 {len(raw) - offset}바이트가 손상되어 무시합니다.")
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+
+        self._records = records
+        self.record_count = len(records)
+        return records[skip:]
+
+    def append(self, record: Dict[str, Any]):
+        """레코드 하나를 암호화해 저널 끝에 추가"""
+        if not self.is_open:
+            raise RuntimeError("journal is not open")
+
+        with open(self.path, 'ab') as f:
+            f.write(self._encrypt_record(record))
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._records.append(record)
+        self.record_count += 1
+
+    def _encrypt_record(self, record: Dict[str, Any]) -> bytes:
+        plaintext = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        nonce = os.urandom(self.NONCE_SIZE)
+        ciphertext = self._aesgcm.encrypt(nonce, plaintext, self._aad(self.record_count))
+        return struct.pack(">I", len(nonce) + len(ciphertext)) + nonce + ciphertext
+
+    def close(self):
+        self._header = None
+        self._aesgcm = None
+        self._records = []
+        self.record_count = 0
+
+    def discard(self):
+        """저널 파일을 삭제 (백업 복원 등 스냅샷을 외부에서 교체할 때)"""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
@@ -13,11 +13,9 @@ def update_existing_student_colors(data_manager):
 
     # 모든 기존 색상을 초기화
     used_colors = set()
+    colors = {}
 
     for student in students:
-        # 기존 색상 목록에서 해당 학생 제외하고 새 색상 생성
-        original_color = student.color
-
         # 새로운 고급스럽고 세련된 색상 생성
         new_color = temp_form.generate_unique_color()
 
@@ -25,11 +23,11 @@ def update_existing_student_colors(data_manager):
         while new_color in used_colors:
             new_color = temp_form.generate_unique_color()
 
-        student.color = new_color
+        colors[student.id] = new_color
         used_colors.add(new_color)
 
-        print(f"수강생 '{student.name}' 색상 업데이트: {original_color} -> {new_color}")
+        print(f"수강생 '{student.name}' 색상 업데이트: {student.color} -> {new_color}")
 
-    # 변경사항 저장
-    data_manager.save_data()
-    print(f"총 {len(students)}명 수강생의 색상이 고급스럽고 세련된 색상으로 업데이트되었습니다.")
\ No newline at end of file
+    # 변경사항 저장 (저널/업로드 대기열 기록 및 화면 갱신 포함)
+    data_manager.update_student_colors(colors)
+    print(f"총 {len(students)}명 수강생의 색상이 고급스럽고 세련된 색상으로 업데이트되었습니다.")
@@ -1,16 +1,84 @@
+import io
 import os
+import hmac
 import json
+import hashlib
 import base64
+import struct
+import threading
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.backends import default_backend
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Iterable, Iterator, BinaryIO, Tuple, Union
+
+
+class SessionKey:
+    """잠금 해제 시 한 번 파생한 키를 세션 동안 보관하는 메모리 홀더
+
+    zeroize()는 이 홀더의 bytearray만 덮어쓰고 이후 get()이 예외를 발생시키게 한다.
+    get()이 돌려준 bytes 복사본(스냅샷 작업 키, AESGCM 객체 내부 키 등)은
+    지워지지 않으므로 메모리에서 키가 완전히 사라진다는 보장은 없다.
+    """
+
+    def __init__(self, key: bytes, salt: bytes):
+        self.salt = salt
+        self._key = bytearray(key)
+        self._lock = threading.Lock()
+        self._valid = True
+
+    @property
+    def is_valid(self) -> bool:
+        return self._valid
+
+    def get(self) -> bytes:
+        with self._lock:
+            if not self._valid:
+                raise ValueError("session key has been zeroized")
+            return bytes(self._key)
+
+    def zeroize(self):
+        with self._lock:
+            for i in range(len(self._key)):
+                self._key[i] = 0
+            self._valid = False
 
 
 class CryptoManager:
+    """데이터 파일 암호화
+
+    현재 형식(컨테이너):
+        헤더 = 매직(4) + 버전(1) + 코덱(1) + salt(32) + nonce 접두사(8) + 청크 크기(4)
+               + 키 확인값(16, 버전 2부터)
+        프레임 = 마지막 여부(1) + 길이(4) + AES-GCM 암호문(태그 포함)
+    각 프레임의 nonce는 접두사 + 프레임 번호이고, 헤더/번호/마지막 여부를 AAD로
+    인증하므로 변조, 순서 변경, 잘림이 모두 감지된다. 암복호화는 청크 단위
+    스트리밍으로 이루어진다. 키 확인값으로 본문을 복호화하지 않고도
+    비밀번호를 확인할 수 있다. 버전 3부터는 암호화 키를 직접 쓰지 않고
+    HKDF로 파생한 확인용 키로 HMAC을 만든다 (버전 2는 읽기만 지원).
+
+    이전 형식(AES-CBC, salt(32) + IV(16) + 암호문)은 읽기만 지원한다.
+    """
+
+    SALT_SIZE = 32
+    IV_SIZE = 16
+
+    CONTAINER_MAGIC = b"SMSC"
+    CONTAINER_VERSION = 3
+    CODEC_JSON = 0
+    NONCE_PREFIX_SIZE = 8
+    TAG_SIZE = 16
+    CHUNK_SIZE = 64 * 1024
+    V1_HEADER_SIZE = 4 + 1 + 1 + 32 + 8 + 4
+    KEY_CHECK_SIZE = 16
+    KEY_CHECK_LABEL = b"sms-key-check"
+    HEADER_SIZE = V1_HEADER_SIZE + KEY_CHECK_SIZE
+
     def __init__(self):
         self.backend = default_backend()
+        self._session: Optional[SessionKey] = None
 
     def _derive_key(self, password: str, salt: bytes) -> bytes:
         kdf = PBKDF2HMAC(
@@ -22,30 +90,98 @@ class CryptoManager:
         )
         return kdf.derive(password.encode())
 
-    def encrypt_data(self, data: Dict[str, Any], password: str) -> bytes:
-        json_data = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    @property
+    def is_unlocked(self) -> bool:
+        return self._session is not None and self._session.is_valid
 
-        salt = os.urandom(32)
-        key = self._derive_key(password, salt)
+    def unlock(self, password: str, salt: Optional[bytes] = None) -> SessionKey:
+        """비밀번호로 키를 한 번 파생해 세션 키로 보관 (salt가 없으면 새로 생성)"""
+        salt = salt or os.urandom(self.SALT_SIZE)
+        session = SessionKey(self._derive_key(password, salt), salt)
+        self.lock()
+        self._session = session
+        return session
 
-        iv = os.urandom(16)
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=self.backend)
-        encryptor = cipher.encryptor()
+    def unlock_for_data(self, encrypted_data: bytes, password: str) -> SessionKey:
+        """암호화된 데이터(또는 그 앞부분)의 salt로 세션 키를 파생"""
+        return self.install(self.derive_session_key(encrypted_data, password))
+
+    def install(self, session: SessionKey) -> SessionKey:
+        """미리 파생해 둔 키를 세션 키로 사용 (PBKDF2 재실행 없음)"""
+        if not session.is_valid:
+            raise ValueError("session key has been zeroized")
+        if session is not self._session:
+            self.lock()
+            self._session = session
+        return session
+
+    def derive_session_key(self, head: bytes, password: str) -> SessionKey:
+        """파일 앞부분의 salt로 키를 파생하고, 키 확인값이 있으면 비밀번호를 검증
+
+        세션에 설치하지 않은 키를 반환하므로 필요 없으면 zeroize()해야 한다.
+        """
+        salt = self.salt_of(head)
+        session = SessionKey(self._derive_key(password, salt), salt)
+        if self.has_key_check(head) and not hmac.compare_digest(
+                self._key_check(session.get(), head[4]), head[self.V1_HEADER_SIZE:self.HEADER_SIZE]):
+            session.zeroize()
+            raise ValueError("invalid password")
+        return session
 
-        padding_length = 16 - (len(json_data) % 16)
-        padded_data = json_data + bytes([padding_length] * padding_length)
+    @classmethod
+    def is_container(cls, head: bytes) -> bool:
+        return head[:4] == cls.CONTAINER_MAGIC
 
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+    @classmethod
+    def codec_of(cls, head: bytes) -> int:
+        """평문 직렬화 코덱 번호 (이전 형식은 항상 JSON)"""
+        if cls.is_container(head):
+            return head[5]
+        return cls.CODEC_JSON
 
-        result = salt + iv + encrypted_data
-        return result
+    @classmethod
+    def has_key_check(cls, head: bytes) -> bool:
+        """헤더에 키 확인값이 있는지 (버전 2 이상 컨테이너)"""
+        return cls.is_container(head) and len(head) >= cls.HEADER_SIZE and head[4] >= 2
 
-    def decrypt_data(self, encrypted_data: bytes, password: str) -> Dict[str, Any]:
-        salt = encrypted_data[:32]
-        iv = encrypted_data[32:48]
-        ciphertext = encrypted_data[48:]
+    def _key_check(self, key: bytes, version: int) -> bytes:
+        """키 확인값 - 버전 3부터는 HKDF로 파생한 별도 키 사용"""
+        if version >= 3:
+            hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                        info=self.KEY_CHECK_LABEL, backend=self.backend)
+            key = hkdf.derive(key)
+        return hmac.new(key, self.KEY_CHECK_LABEL, hashlib.sha256).digest()[:self.KEY_CHECK_SIZE]
 
-        key = self._derive_key(password, salt)
+    @classmethod
+    def salt_of(cls, head: bytes) -> bytes:
+        """파일 앞부분에서 salt 추출 (컨테이너/이전 형식 모두 지원)"""
+        if cls.is_container(head):
+            return head[6:6 + cls.SALT_SIZE]
+        return head[:cls.SALT_SIZE]
+
+    def lock(self):
+        """세션 키를 메모리에서 지움"""
+        if self._session is not None:
+            self._session.zeroize()
+            self._session = None
+
+    def session_material(self) -> Tuple[bytes, bytes]:
+        """현재 세션의 (키, salt) - 다른 스레드에서 세션 상태와 무관하게 암호화할 때 사용"""
+        if not self.is_unlocked:
+            raise ValueError("crypto session is locked")
+        return self._session.get(), self._session.salt
+
+    def derive_subkey(self, label: bytes, salt: bytes) -> bytes:
+        """세션 키에서 용도별 하위 키 파생 (PBKDF2 없이 HKDF 한 번)"""
+        if not self.is_unlocked:
+            raise ValueError("crypto session is locked")
+        hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=label, backend=self.backend)
+        return hkdf.derive(self._session.get())
+
+    def _decrypt_bytes_with_key(self, encrypted_data: bytes, key: bytes) -> bytes:
+        """이전 AES-CBC 형식(salt + IV + 암호문) 복호화 - 기존 파일을 읽을 때만 사용"""
+        iv = encrypted_data[self.SALT_SIZE:self.SALT_SIZE + self.IV_SIZE]
+        ciphertext = encrypted_data[self.SALT_SIZE + self.IV_SIZE:]
 
         cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=self.backend)
         decryptor = cipher.decryptor()
@@ -53,13 +189,147 @@ class CryptoManager:
         padded_data = decryptor.update(ciphertext) + decryptor.finalize()
 
         padding_length = padded_data[-1]
-        json_data = padded_data[:-padding_length]
+        return padded_data[:-padding_length]
+
+    def _session_key_for(self, salt: bytes) -> bytes:
+        if not self.is_unlocked:
+            raise ValueError("crypto session is locked")
+        if salt != self._session.salt:
+            raise ValueError("data was encrypted with a different key")
+        return self._session.get()
 
-        return json.loads(json_data.decode('utf-8'))
+    def _key_for(self, salt: bytes, password: Optional[str]) -> bytes:
+        if password is None:
+            return self._session_key_for(salt)
+        return self._derive_key(password, salt)
+
+    def _frame_aad(self, header: bytes, counter: int, final: bool) -> bytes:
+        return header + struct.pack(">I?", counter, final)
+
+    def encrypt_stream(self, chunks: Iterable[bytes], fileobj: BinaryIO,
+                       key: Optional[bytes] = None, salt: Optional[bytes] = None,
+                       codec: int = CODEC_JSON):
+        """평문 청크들을 컨테이너 형식으로 fileobj에 기록 (청크 크기만큼만 버퍼링)"""
+        if key is None:
+            salt = self._session.salt if self.is_unlocked else b""
+            key = self._session_key_for(salt)
+
+        nonce_prefix = os.urandom(self.NONCE_PREFIX_SIZE)
+        header = (self.CONTAINER_MAGIC + bytes([self.CONTAINER_VERSION, codec]) + salt
+                  + nonce_prefix + struct.pack(">I", self.CHUNK_SIZE) + self._key_check(key, self.CONTAINER_VERSION))
+        fileobj.write(header)
+
+        aesgcm = AESGCM(key)
+        counter = 0
+
+        def write_frame(plaintext: bytes, final: bool):
+            nonce = nonce_prefix + struct.pack(">I", counter)
+            ciphertext = aesgcm.encrypt(nonce, plaintext, self._frame_aad(header, counter, final))
+            fileobj.write(struct.pack(">?I", final, len(ciphertext)))
+            fileobj.write(ciphertext)
+
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) > self.CHUNK_SIZE:
+                write_frame(bytes(buffer[:self.CHUNK_SIZE]), False)
+                del buffer[:self.CHUNK_SIZE]
+                counter += 1
+        write_frame(bytes(buffer), True)
+
+    def _read_exact(self, fileobj: BinaryIO, size: int) -> bytes:
+        data = fileobj.read(size)
+        if len(data) != size:
+            raise ValueError("encrypted data is truncated")
+        return data
+
+    def decrypt_stream(self, fileobj: BinaryIO, password: Optional[str] = None) -> Iterator[bytes]:
+        """컨테이너 형식을 읽어 평문 청크를 순서대로 반환"""
+        header = self._read_exact(fileobj, self.V1_HEADER_SIZE)
+        if not self.is_container(header) or header[4] not in (1, 2, 3):
+            raise ValueError("unsupported container format")
+        if header[4] >= 2:
+            header += self._read_exact(fileobj, self.KEY_CHECK_SIZE)
+
+        salt = self.salt_of(header)
+        nonce_prefix = header[38:38 + self.NONCE_PREFIX_SIZE]
+        (chunk_size,) = struct.unpack(">I", header[46:50])
+        key = self._key_for(salt, password)
+        if self.has_key_check(header) and not hmac.compare_digest(
+                self._key_check(key, header[4]), header[self.V1_HEADER_SIZE:]):
+            raise ValueError("invalid password")
+        aesgcm = AESGCM(key)
+
+        counter = 0
+        while True:
+            final, length = struct.unpack(">?I", self._read_exact(fileobj, 5))
+            if length > chunk_size + self.TAG_SIZE:
+                raise ValueError("invalid frame length")
+            ciphertext = self._read_exact(fileobj, length)
+            nonce = nonce_prefix + struct.pack(">I", counter)
+            yield aesgcm.decrypt(nonce, ciphertext, self._frame_aad(header, counter, final))
+            if final:
+                break
+            counter += 1
+
+        if fileobj.read(1):
+            raise ValueError("unexpected data after final frame")
+
+    def encrypt_to_file(self, data: Dict[str, Any], fileobj: BinaryIO,
+                        key: Optional[bytes] = None, salt: Optional[bytes] = None):
+        """JSON 직렬화 결과를 통째로 만들지 않고 조각 단위로 암호화해 기록"""
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        chunks = (piece.encode('utf-8') for piece in encoder.iterencode(data))
+        self.encrypt_stream(chunks, fileobj, key, salt)
+
+    def decrypt_to_bytes(self, fileobj: BinaryIO, password: Optional[str] = None) -> Union[bytes, bytearray]:
+        """파일 객체에서 평문 전체를 복호화 (컨테이너/이전 형식 자동 판별)
+
+        컨테이너는 청크를 모은 bytearray를 복사하지 않고 그대로 반환한다.
+        """
+        start = fileobj.tell()
+        head = fileobj.read(len(self.CONTAINER_MAGIC))
+        fileobj.seek(start)
+
+        if not self.is_container(head):
+            encrypted_data = fileobj.read()
+            key = self._key_for(self.salt_of(encrypted_data), password)
+            return self._decrypt_bytes_with_key(encrypted_data, key)
+
+        plaintext = bytearray()
+        for chunk in self.decrypt_stream(fileobj, password):
+            plaintext += chunk
+        return plaintext
+
+    def decrypt_file(self, fileobj: BinaryIO, password: Optional[str] = None) -> Dict[str, Any]:
+        """파일 객체에서 JSON 데이터 복호화"""
+        return json.loads(self.decrypt_to_bytes(fileobj, password))
+
+    def encrypt_data(self, data: Dict[str, Any], password: Optional[str] = None) -> bytes:
+        """데이터 암호화 - password가 없으면 세션 키 사용"""
+        buffer = io.BytesIO()
+        if password is None:
+            self.encrypt_to_file(data, buffer)
+        else:
+            salt = os.urandom(self.SALT_SIZE)
+            self.encrypt_to_file(data, buffer, self._derive_key(password, salt), salt)
+        return buffer.getvalue()
+
+    def decrypt_data(self, encrypted_data: bytes, password: Optional[str] = None) -> Dict[str, Any]:
+        """데이터 복호화 - password가 없으면 세션 키 사용"""
+        return self.decrypt_file(io.BytesIO(encrypted_data), password)
 
     def verify_password(self, encrypted_data: bytes, password: str) -> bool:
+        """비밀번호 확인 - 키 확인값이 있으면 헤더만 검사, 없으면 전체 복호화"""
+        if self.has_key_check(encrypted_data):
+            try:
+                self.derive_session_key(encrypted_data, password).zeroize()
+                return True
+            except ValueError:
+                return False
+
         try:
             self.decrypt_data(encrypted_data, password)
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
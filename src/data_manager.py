@@ -1,28 +1,86 @@
 import os
 import sys
+import hmac
 import shutil
-from datetime import datetime, date, timedelta
+import uuid
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter
+from datetime import datetime, date
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from PySide6.QtCore import QObject, Signal
 
-from .crypto_utils import CryptoManager
-from .models import Student, Schedule, AppData
+from .crypto_utils import CryptoManager, SessionKey
+from .models import Student, Schedule, AppData, WEEKDAY_INDEX
+from .schedule_store import ScheduleStore
+from .schedule_table import ScheduleTable
+from .schedule_generator import generate_schedules, following_session_dates
+from .change_journal import ChangeJournal
+from .change_events import (
+    BULK_REPLACED, SCHEDULE_COMPLETED, SCHEDULE_MEMO_CHANGED, SCHEDULE_MOVED,
+    STUDENT_ADDED, STUDENT_REMOVED, STUDENT_UPDATED, DataChange
+)
+from .delta_sync import SYNC_TOMBSTONES, SYNC_WATERMARK, make_delta, record_tombstones, acknowledge
+from .sync_merge import MergeConflict, three_way_merge
+from .sync_outbox import DELETE, PUT, OutboxBatch, SyncOutbox
+from .serializers import BinarySerializer, get_serializer, serialize
+from .save_scheduler import SaveScheduler
 from .google_sheets_api import GoogleSheetsManager
 
 
+@dataclass
+class SnapshotJob:
+    """스냅샷 저장 작업 - 메인 스레드에서 만든 데이터 복사본과 암호화 키"""
+    seq: int
+    epoch: int
+    data: AppData
+    journal_id: str
+    journal_base: Optional[Dict[str, Any]]
+    temp_file: Path
+    key: bytes = field(repr=False)
+    salt: bytes = field(repr=False)
+
+
 class DataManager(QObject):
-    dataChanged = Signal()
+    dataChanged = Signal()           # 저장/저널 기록 시그널 (무엇이 바뀌었는지는 changed로 알림)
+    changed = Signal(object)         # DataChange - 화면은 영향을 받은 칸/행만 갱신
     syncStatusChanged = Signal(str)  # 동기화 상태 변경 시그널
+    outboxChanged = Signal(int)      # 구글 시트로 보낼 대기 작업 수
 
-    def __init__(self):
+    # 저널 레코드가 이 개수를 넘으면 전체 스냅샷으로 압축
+    JOURNAL_COMPACT_THRESHOLD = 200
+    # 대기열 업로드 한 번에 보내는 최대 레코드 수
+    OUTBOX_BATCH_SIZE = 500
+    # 스냅샷 직렬화 코덱 (표현할 수 없는 데이터가 있으면 JSON으로 대체)
+    DATA_CODEC = BinarySerializer.codec_id
+
+    def __init__(self, data_file_path: Optional[Path] = None):
         super().__init__()
         self.crypto_manager = CryptoManager()
         self.data = AppData()
+        self._schedule_store = ScheduleStore(self.data.schedules)
+        self._student_positions: Dict[str, int] = {}  # student_id -> data.students 내 위치
+        # 스냅샷 저장 순번 - 늦게 끝난 이전 저장이 최신 파일을 덮어쓰지 않도록 함
+        self._snapshot_seq = 0
+        self._applied_snapshot_seq = 0
+        # 데이터를 파일에서 다시 읽거나 잠그면 증가 - 그 이전에 시작한 저장은 버림
+        self._data_epoch = 0
+        # 백그라운드 저장 스케줄러 (없으면 request_save가 즉시 저장)
+        self.save_scheduler: Optional[SaveScheduler] = None
         self.password: Optional[str] = None
-        self._data_file_path = self._get_data_file_path()
+        # verify_password로 확인한 키 - 이어지는 load_data에서 재사용
+        self._verified_key: Optional[SessionKey] = None
+        self._verified_password: Optional[str] = None
+        self._data_file_path = Path(data_file_path) if data_file_path else self._get_data_file_path()
         self._backup_folder = self._data_file_path.parent / "backups"
         self._backup_folder.mkdir(exist_ok=True)
+        self._journal = ChangeJournal(self._data_file_path.with_suffix('.journal'), self.crypto_manager)
+        # 마지막으로 구글 시트와 맞춘 데이터 (3-way 병합의 기준)
+        self._sync_base_path = self._data_file_path.with_suffix('.syncbase')
+        # 구글 시트로 보낼 변경 작업 대기열 (오프라인일 때도 기록되어 나중에 업로드)
+        self._outbox = SyncOutbox(self._data_file_path.with_suffix('.outbox'), self.crypto_manager)
+        self._replaying = False  # 저널 재적용 중 (대기열에는 이미 기록되어 있음)
 
         # 구글 시트 매니저 초기화
         self.sheets_manager = GoogleSheetsManager()
@@ -39,76 +97,426 @@ class DataManager(QObject):
 
         return exe_dir / '.env'
 
+    @property
+    def schedule_store(self) -> ScheduleStore:
+        """스케줄 인덱스 (data.schedules가 교체되었으면 다시 생성)"""
+        if not self._schedule_store.is_bound_to(self.data.schedules):
+            self._schedule_store.rebuild(self.data.schedules)
+        return self._schedule_store
+
     def has_existing_data(self) -> bool:
         return self._data_file_path.exists()
 
     def set_password(self, password: str) -> bool:
         self.password = password
+        # 새 salt로 세션 키를 한 번만 파생하고 이후 저장에 재사용
+        self.crypto_manager.unlock(password)
+        # 이전 키로 열린 저널은 다음 저장 시 새로 생성
+        self._journal.close()
+        if len(self._outbox) or self._outbox.base:
+            self._outbox.rewrite()
+        return True
+
+    def change_password(self, new_password: str) -> bool:
+        """비밀번호 변경 - 새 키로 스냅샷을 다시 저장"""
+        if not self.crypto_manager.is_unlocked:
+            return False
+        sync_base = self._load_sync_base()
+        self.set_password(new_password)
+        if not self.save_data():
+            return False
+        if sync_base is not None:
+            self._save_sync_base(sync_base)
         return True
 
+    def lock(self):
+        """세션 키를 zeroize하고 비밀번호 참조를 해제"""
+        self._data_epoch += 1
+        self._journal.close()
+        self._outbox.close()
+        self._discard_verified_key()
+        self.crypto_manager.lock()
+        self.password = None
+
+    def _discard_verified_key(self):
+        if self._verified_key is not None:
+            self._verified_key.zeroize()
+        self._verified_key = None
+        self._verified_password = None
+
+    def _take_verified_key(self, password: str, head: bytes) -> Optional[SessionKey]:
+        """verify_password에서 파생한 키가 같은 비밀번호/파일용이면 넘겨받음"""
+        session = self._verified_key
+        matches = (session is not None and session.is_valid
+                   and session.salt == CryptoManager.salt_of(head)
+                   and hmac.compare_digest(self._verified_password.encode(), password.encode()))
+        if matches:
+            self._verified_key = None
+            self._verified_password = None
+            return session
+        self._discard_verified_key()
+        return None
+
     def verify_password(self, password: str) -> bool:
         if not self.has_existing_data():
             return False
 
         try:
             with open(self._data_file_path, 'rb') as f:
-                encrypted_data = f.read()
-            return self.crypto_manager.verify_password(encrypted_data, password)
+                head = f.read(CryptoManager.HEADER_SIZE)
+                if not CryptoManager.has_key_check(head):
+                    # 키 확인값이 없는 이전 형식은 전체 복호화로 확인
+                    f.seek(0)
+                    return self.crypto_manager.verify_password(f.read(), password)
+
+            # 헤더만으로 확인 - KDF 한 번, 본문 복호화 없음
+            session = self.crypto_manager.derive_session_key(head, password)
+            self._discard_verified_key()
+            self._verified_key = session
+            self._verified_password = password
+            return True
         except Exception:
             return False
 
     def load_data(self, password: str) -> bool:
         if not self.has_existing_data():
-            self.password = password
+            self.set_password(password)
             return True
 
+        self._data_epoch += 1
         try:
             with open(self._data_file_path, 'rb') as f:
-                encrypted_data = f.read()
+                head = f.read(CryptoManager.HEADER_SIZE)
+                f.seek(0)
+
+                # 파일의 salt로 키를 한 번 파생해 세션 키로 보관
+                # (verify_password에서 이미 파생했다면 그 키를 재사용)
+                self._journal.close()
+                session = self._take_verified_key(password, head)
+                if session is not None:
+                    self.crypto_manager.install(session)
+                else:
+                    self.crypto_manager.unlock_for_data(head, password)
+                payload = self.crypto_manager.decrypt_to_bytes(f)
+            self.data = get_serializer(CryptoManager.codec_of(head)).decode(payload)
+
+            # 스냅샷 이후 저널에 기록된 변경 사항 재적용
+            records = self._journal.load(self.data.metadata.get("journal_id"),
+                                         self.data.metadata.get("journal_base"))
+            self._replaying = True
+            try:
+                for record in records:
+                    self._apply_journal_record(record)
+            finally:
+                self._replaying = False
+            self.outboxChanged.emit(self._outbox.load())
 
-            data_dict = self.crypto_manager.decrypt_data(encrypted_data, password)
-            self.data = AppData.from_dict(data_dict)
             self.password = password
+
+            if not CryptoManager.is_container(head):
+                # 이전 AES-CBC 형식 - 원본을 백업한 뒤 새 형식으로 다시 저장
+                self.create_backup()
+                self.save_data()
+
             self.dataChanged.emit()
+            self._notify(BULK_REPLACED)
             return True
         except Exception as e:
             print(f"Failed to load data: {e}")
+            self._journal.close()
+            self.crypto_manager.lock()
+            if self.password:
+                # 기존 세션 유지 (백업 복원 실패 등)
+                self.crypto_manager.unlock(self.password)
             return False
 
     def save_data(self) -> bool:
-        if not self.password:
+        """스냅샷을 즉시 저장 (호출한 스레드에서 직렬화/암호화까지 수행)"""
+        job = self.prepare_snapshot()
+        if job is None:
             return False
 
         try:
-            encrypted_data = self.crypto_manager.encrypt_data(
-                self.data.to_dict(),
-                self.password
-            )
+            self.write_snapshot(job)
+        except Exception as e:
+            print(f"Failed to save data: {e}")
+            self.discard_snapshot(job)
+            return False
+        if not self.finish_snapshot(job):
+            return False
+        self.dataChanged.emit()
+        return True
 
-            temp_file = self._data_file_path.with_suffix('.tmp')
-            with open(temp_file, 'wb') as f:
-                f.write(encrypted_data)
+    def enable_background_save(self, delay_ms: int = SaveScheduler.DEFAULT_DELAY_MS) -> SaveScheduler:
+        """스냅샷 저장을 모아서 작업 스레드에서 수행하도록 전환"""
+        if self.save_scheduler is None:
+            self.save_scheduler = SaveScheduler(self, delay_ms, parent=self)
+        return self.save_scheduler
 
-            if self._data_file_path.exists():
-                shutil.move(str(self._data_file_path), str(temp_file.with_suffix('.bak')))
+    def request_save(self) -> bool:
+        """스냅샷 저장 요청 - 백그라운드 저장이 켜져 있으면 모아서 나중에, 아니면 즉시 저장
 
-            shutil.move(str(temp_file), str(self._data_file_path))
+        어느 경우든 dataChanged는 한 번 발생한다.
+        """
+        if self.save_scheduler is None:
+            return self.save_data()
+        if not self.crypto_manager.is_unlocked:
+            return False
+        self.save_scheduler.mark_dirty()
+        self.dataChanged.emit()
+        return True
+
+    def prepare_snapshot(self) -> Optional[SnapshotJob]:
+        """저장할 데이터의 복사본을 만듦 (메인 스레드)
+
+        현재 저널은 닫지 않는다. 저장이 끝나기 전에 추가된 레코드는
+        finish_snapshot에서 새 저널로 옮겨지고, 그 전에 중단되더라도
+        journal_base로 이전 저널에서 복구된다.
+        """
+        if not self.crypto_manager.is_unlocked:
+            return None
+
+        self._snapshot_seq += 1
+        journal_id = uuid.uuid4().hex
+        journal_base = None
+        if self._journal.is_open:
+            journal_base = {"id": self._journal.journal_id, "skip": self._journal.record_count}
+
+        data = self.data.copy()
+        data.metadata["journal_id"] = journal_id
+        data.metadata.pop("journal_base", None)
+        if journal_base:
+            data.metadata["journal_base"] = journal_base
+
+        key, salt = self.crypto_manager.session_material()
+        temp_file = self._data_file_path.with_name(f"{self._data_file_path.name}.{self._snapshot_seq}.tmp")
+        return SnapshotJob(self._snapshot_seq, self._data_epoch, data, journal_id, journal_base,
+                           temp_file, key, salt)
+
+    def write_snapshot(self, job: SnapshotJob):
+        """직렬화 + 암호화 + 임시 파일 기록 (작업 스레드에서 호출 가능)"""
+        with open(job.temp_file, 'wb') as f:
+            codec, chunks = serialize(job.data, self.DATA_CODEC)
+            self.crypto_manager.encrypt_stream(chunks, f, key=job.key, salt=job.salt, codec=codec)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def discard_snapshot(self, job: SnapshotJob):
+        try:
+            if job.temp_file.exists():
+                job.temp_file.unlink()
+        except OSError:
+            pass
 
-            if temp_file.with_suffix('.bak').exists():
-                temp_file.with_suffix('.bak').unlink()
+    def finish_snapshot(self, job: SnapshotJob) -> bool:
+        """기록된 스냅샷으로 데이터 파일과 저널을 교체 (메인 스레드)"""
+        if job.epoch != self._data_epoch or job.seq <= self._applied_snapshot_seq:
+            # 그 사이 데이터를 다시 불러왔거나 더 최신 스냅샷이 저장됨
+            self.discard_snapshot(job)
+            return False
+
+        try:
+            # 스냅샷을 만든 뒤 저널에 추가된 레코드는 새 저널로 옮김
+            carried = []
+            if job.journal_base and self._journal.journal_id == job.journal_base["id"]:
+                carried = self._journal.records_since(job.journal_base["skip"])
 
+            # 한 번에 교체하므로 중간에 종료되어도 이전 파일이나 새 파일 중 하나는 남음
+            os.replace(job.temp_file, self._data_file_path)
+
+            self._applied_snapshot_seq = job.seq
+            self._journal.reset(job.journal_id, carried)
+
+            self.data.metadata["journal_id"] = job.journal_id
+            self.data.metadata.pop("journal_base", None)
             self.data.metadata["last_backup"] = datetime.now().isoformat()
-            self.dataChanged.emit()
             return True
         except Exception as e:
             print(f"Failed to save data: {e}")
+            self.discard_snapshot(job)
+            return False
+
+    def _commit(self, record: Dict[str, Any]) -> bool:
+        """변경 사항을 저널에 추가 (저널이 없거나 가득 차면 전체 스냅샷 저장)
+
+        백그라운드 저장이 켜져 있으면 저널이 가득 차도 계속 기록하고
+        스냅샷 압축은 스케줄러에 맡긴다.
+        업로드 대기열에는 저널(또는 스냅샷) 기록이 성공한 뒤에만 추가한다.
+        """
+        if not self.crypto_manager.is_unlocked:
             return False
 
+        background = self.save_scheduler is not None
+        if self._journal.is_open and (background or self._journal.record_count < self.JOURNAL_COMPACT_THRESHOLD):
+            try:
+                self._journal.append(record)
+            except Exception as e:
+                print(f"Failed to append journal: {e}")
+            else:
+                self._queue_sync(record)
+                if background and self._journal.record_count >= self.JOURNAL_COMPACT_THRESHOLD:
+                    self.save_scheduler.mark_dirty()
+                self.dataChanged.emit()
+                return True
+
+        saved = self.request_save()
+        if saved:
+            self._queue_sync(record)
+        return saved
+
+    def _notify(self, kind: str, student_ids=(), schedule_ids=(), dates=()):
+        """변경 이벤트 발생 - 영향을 받은 수강생/일정 ID와 날짜(변경 전후)를 함께 전달"""
+        self.changed.emit(DataChange.of(kind, student_ids, schedule_ids, dates))
+
+    def _student_dates(self, student_id: str) -> set:
+        return {s.scheduled_date for s in self.schedule_store.for_student(student_id)}
+
+    def _student_record(self, student: Student) -> Dict[str, Any]:
+        return {
+            "op": "put_student",
+            "student": student.to_dict(),
+            "schedules": [s.to_dict() for s in self.schedule_store.for_student(student.id)]
+        }
+
+    def _students_record(self, students: List[Student], schedules: List[Schedule]) -> Dict[str, Any]:
+        """여러 수강생과 그 전체 일정을 레코드 하나로 기록 (일괄 등록)"""
+        return {
+            "op": "put_students",
+            "students": [s.to_dict() for s in students],
+            "schedules": [s.to_dict() for s in schedules]
+        }
+
+    def _replace_schedules_record(self, student_ids: List[str], schedules: List[Schedule]) -> Dict[str, Any]:
+        """수강생들의 일정 전체를 교체한 기록 (수강생 정보는 그대로)"""
+        return {
+            "op": "replace_schedules",
+            "student_ids": student_ids,
+            "schedules": [s.to_dict() for s in schedules]
+        }
+
+    def _schedules_record(self, schedules: List[Schedule]) -> Dict[str, Any]:
+        return {"op": "put_schedules", "schedules": [s.to_dict() for s in schedules]}
+
+    def _apply_journal_record(self, record: Dict[str, Any]):
+        """저널 레코드 하나를 현재 데이터에 적용"""
+        op = record.get("op")
+        store = self.schedule_store
+
+        if op in ("put_student", "put_students", "replace_schedules"):
+            # 레코드의 수강생들을 저장하고 그 일정 전체를 교체
+            if op == "replace_schedules":
+                student_ids = record["student_ids"]
+            else:
+                student_dicts = record["students"] if op == "put_students" else [record["student"]]
+                positions = {s.id: i for i, s in enumerate(self.data.students)}
+                student_ids = []
+                for student_dict in student_dicts:
+                    student = Student.from_dict(student_dict)
+                    position = positions.get(student.id)
+                    if position is None:
+                        positions[student.id] = len(self.data.students)
+                        self.data.students.append(student)
+                    else:
+                        self.data.students[position] = student
+                    student_ids.append(student.id)
+            schedules = [Schedule.from_dict(s) for s in record.get("schedules", [])]
+            kept_ids = {s.id for s in schedules}
+            for student_id in student_ids:
+                self._record_deleted(schedule_ids=[s.id for s in store.for_student(student_id) if s.id not in kept_ids])
+                store.remove_student(student_id)
+            store.add_many(schedules)
+        elif op == "remove_student":
+            student_id = record["student_id"]
+            self._record_deleted([student_id], [s.id for s in store.for_student(student_id)])
+            self.data.students = [s for s in self.data.students if s.id != student_id]
+            store.remove_student(student_id)
+        elif op == "put_schedules":
+            for schedule_dict in record.get("schedules", []):
+                schedule = Schedule.from_dict(schedule_dict)
+                existing = store.get(schedule.id)
+                if existing is None:
+                    store.add(schedule)
+                    continue
+                store.move(existing, schedule.scheduled_date)
+                existing.week_number = schedule.week_number
+                existing.is_completed = schedule.is_completed
+                existing.memo = schedule.memo
+                existing.updated_at = schedule.updated_at
+        else:
+            print(f"알 수 없는 저널 레코드: {op}")
+
+    def _record_deleted(self, student_ids: List[str] = (), schedule_ids: List[str] = ()):
+        """구글 시트 델타 동기화용 삭제 기록 (저널 재적용 시에도 같은 기록이 남음)"""
+        record_tombstones(self.data.metadata, "students", student_ids)
+        record_tombstones(self.data.metadata, "schedules", schedule_ids)
+        if not self._replaying:
+            self._queue_sync_ops("students", DELETE, student_ids)
+            self._queue_sync_ops("schedules", DELETE, schedule_ids)
+
+    def _queue_sync(self, record: Dict[str, Any]):
+        """저널 레코드에 해당하는 업로드 작업을 대기열에 기록 (삭제는 _record_deleted가 기록)"""
+        op = record.get("op")
+        if op == "put_student":
+            self._queue_sync_ops("students", PUT, [record["student"]["id"]])
+        elif op == "put_students":
+            self._queue_sync_ops("students", PUT, [s["id"] for s in record["students"]])
+        if op in ("put_student", "put_students", "replace_schedules", "put_schedules"):
+            self._queue_sync_ops("schedules", PUT, [s["id"] for s in record.get("schedules", [])])
+
+    def _queue_sync_ops(self, kind: str, op: str, ids: List[str]):
+        if ids and self.crypto_manager.is_unlocked:
+            self._outbox.record(kind, op, ids)
+            self.outboxChanged.emit(len(self._outbox))
+
+    @property
+    def outbox_count(self) -> int:
+        """구글 시트로 보낼 대기 작업 수"""
+        return len(self._outbox)
+
+    @property
+    def outbox_ready(self) -> bool:
+        """대기열만으로 업로드할 수 있는지 (한 번 이상 업로드했고 대기열이 그 기준과 맞음)"""
+        watermark = self.data.metadata.get(SYNC_WATERMARK)
+        return bool(len(self._outbox)) and watermark is not None and self._outbox.base == watermark
+
+    @property
+    def outbox_seq(self) -> int:
+        """업로드 스냅샷 시점 표시 (acknowledge_sync에 넘김)"""
+        return self._outbox.seq
+
+    def outbox_batch(self, limit: Optional[int] = None) -> Optional[OutboxBatch]:
+        """대기열 앞쪽 limit개 작업으로 업로드 본문 생성 (메인 스레드)
+
+        전체 레코드를 훑지 않고 대기열의 ID로 현재 레코드를 찾으므로 보낼 작업
+        수에만 비례한다. 대기열만으로 보낼 수 없으면 None (스냅샷 업로드 필요).
+        """
+        if not self.outbox_ready:
+            return None
+
+        students, schedules, keys = [], [], []
+        deleted = {"students": [], "schedules": []}
+        store = self.schedule_store
+        for kind, item_id, op in self._outbox.pending(limit or self.OUTBOX_BATCH_SIZE):
+            keys.append((kind, item_id))
+            if op == DELETE:
+                deleted[kind].append(item_id)
+                continue
+            record = self.get_student_by_id(item_id) if kind == "students" else store.get(item_id)
+            if record is not None:
+                (students if kind == "students" else schedules).append(record)
+
+        delta = make_delta(self.data.metadata[SYNC_WATERMARK], datetime.now(), students, schedules, deleted)
+        return OutboxBatch(delta, keys, self._outbox.seq)
+
     def create_backup(self) -> bool:
         if not self.has_existing_data():
             return False
 
         try:
+            # 저널에만 있는 변경 사항까지 백업되도록 먼저 압축
+            if self._journal.record_count and self.crypto_manager.is_unlocked:
+                self.save_data()
+
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = self._backup_folder / f"backup_{timestamp}.sms"
             shutil.copy2(str(self._data_file_path), str(backup_file))
@@ -138,6 +546,15 @@ class DataManager(QObject):
                 print(f"Backup file not found: {backup_file_path}")
                 return False
 
+            # 저널 내용을 스냅샷에 반영한 뒤 저널 제거 (복원된 스냅샷에 재적용되지 않도록)
+            if self._journal.record_count and self.crypto_manager.is_unlocked:
+                self.save_data()
+            self._data_epoch += 1
+            self._journal.discard()
+            # 복원한 데이터는 마지막 동기화와 무관하므로 다음 병합은 첫 동기화처럼 수행
+            self._sync_base_path.unlink(missing_ok=True)
+            self._outbox.discard()
+
             # 현재 데이터 백업 (복원 실패 시 롤백용)
             rollback_file = None
             if self._data_file_path.exists():
@@ -183,30 +600,74 @@ class DataManager(QObject):
         try:
             self.data.students.append(student)
             self._generate_schedules_for_student(student)
-            self.save_data()
+            self._commit(self._student_record(student))
+            self._notify(STUDENT_ADDED, [student.id], dates=self._student_dates(student.id))
             return True
         except Exception as e:
             print(f"Failed to add student: {e}")
             return False
 
+    def add_students(self, students: List[Student]) -> bool:
+        """여러 수강생 일괄 등록 (CSV 가져오기 등) - 스케줄을 한 번에 생성하고 저널에 한 번만 기록"""
+        try:
+            self.data.students.extend(students)
+            schedules = generate_schedules(students)
+            self.schedule_store.add_many(schedules)
+            saved = self._commit(self._students_record(students, schedules))
+            self._notify(STUDENT_ADDED, [s.id for s in students], dates={s.scheduled_date for s in schedules})
+            return saved
+        except Exception as e:
+            print(f"Failed to add students: {e}")
+            return False
+
     def update_student(self, student: Student) -> bool:
         try:
             for i, existing_student in enumerate(self.data.students):
                 if existing_student.id == student.id:
+                    student.updated_at = datetime.now()
                     self.data.students[i] = student
+                    old_dates = self._student_dates(student.id)
                     self._regenerate_schedules_for_student(student)
-                    self.save_data()
+                    self._commit(self._student_record(student))
+                    self._notify(STUDENT_UPDATED, [student.id], dates=old_dates | self._student_dates(student.id))
                     return True
             return False
         except Exception as e:
             print(f"Failed to update student: {e}")
             return False
 
+    def update_student_colors(self, colors: Dict[str, str]) -> bool:
+        """수강생 색상 일괄 변경 (student_id -> 색상)
+
+        수강생마다 저널/업로드 대기열에 기록하고, 달력에서 칩 색이 바뀌도록
+        해당 수강생들의 일정 날짜를 담아 변경 이벤트를 한 번 보낸다.
+        """
+        now = datetime.now()
+        saved = True
+        updated = []
+        dates = set()
+        for student_id, color in colors.items():
+            student = self.get_student_by_id(student_id)
+            if student is None or student.color == color:
+                continue
+            student.color = color
+            student.updated_at = now
+            saved = self._commit(self._student_record(student)) and saved
+            updated.append(student_id)
+            dates |= self._student_dates(student_id)
+        if updated:
+            self._notify(STUDENT_UPDATED, updated, dates=dates)
+        return saved
+
     def remove_student(self, student_id: str) -> bool:
         try:
+            removed = self.schedule_store.for_student(student_id)
+            self._record_deleted([student_id], [s.id for s in removed])
+            old_dates = {s.scheduled_date for s in removed}
             self.data.students = [s for s in self.data.students if s.id != student_id]
-            self.data.schedules = [s for s in self.data.schedules if s.student_id != student_id]
-            self.save_data()
+            self.schedule_store.remove_student(student_id)
+            self._commit({"op": "remove_student", "student_id": student_id})
+            self._notify(STUDENT_REMOVED, [student_id], dates=old_dates)
             return True
         except Exception as e:
             print(f"Failed to remove student: {e}")
@@ -216,149 +677,118 @@ class DataManager(QObject):
         return self.data.students
 
     def get_student_by_id(self, student_id: str) -> Optional[Student]:
-        for student in self.data.students:
-            if student.id == student_id:
-                return student
-        return None
+        students = self.data.students
+        position = self._student_positions.get(student_id)
+        if position is None or position >= len(students) or students[position].id != student_id:
+            # 목록이 교체되었거나 순서가 바뀌었으면 위치 인덱스를 다시 생성
+            self._student_positions = {s.id: i for i, s in enumerate(students)}
+            position = self._student_positions.get(student_id)
+            if position is None:
+                return None
+        return students[position]
 
     def get_schedules(self) -> List[Schedule]:
         return self.data.schedules
 
     def get_schedules_for_date(self, target_date: date) -> List[Schedule]:
-        return [s for s in self.data.schedules if s.scheduled_date == target_date]
+        return self.schedule_store.for_date(target_date)
 
     def get_schedules_for_student(self, student_id: str) -> List[Schedule]:
-        return [s for s in self.data.schedules if s.student_id == student_id]
+        return self.schedule_store.for_student(student_id)
+
+    def count_sessions_until(self, student_id: str, until: date) -> int:
+        """until(포함)까지 진행된 수강생의 수업 수 - 수강생별 인덱스로 계산"""
+        return self.schedule_store.count_for_student(student_id, until)
+
+    def get_schedules_in_range(self, start_date: date, end_date: date) -> Dict[date, List[Schedule]]:
+        """start_date ~ end_date(포함) 사이의 스케줄을 날짜별로 묶어 반환"""
+        return self.schedule_store.range_by_date(start_date, end_date)
+
+    def get_schedule_table(self) -> ScheduleTable:
+        """통계/일괄 처리용 열 기반 스냅샷 (이후 변경 사항은 반영되지 않음)"""
+        return ScheduleTable.from_schedules(self.data.schedules)
 
     def move_schedule(self, schedule_id: str, new_date: date) -> bool:
         try:
-            for i, schedule in enumerate(self.data.schedules):
-                if schedule.id == schedule_id:
-                    old_date = schedule.scheduled_date
-                    self.data.schedules[i].scheduled_date = new_date
-                    self.data.schedules[i].updated_at = datetime.now()
+            store = self.schedule_store
+            schedule = store.get(schedule_id)
+            if schedule is None:
+                return False
 
-                    student = self.get_student_by_id(schedule.student_id)
-                    if student:
-                        self._reschedule_following_schedules(student, schedule, old_date)
+            old_date = schedule.scheduled_date
+            # 뒤따르는 수업도 함께 옮겨지므로 이동 전 날짜를 기억해 두고 이벤트에 포함
+            old_dates = {s.id: s.scheduled_date for s in store.for_student(schedule.student_id)}
+            store.move(schedule, new_date)
+            schedule.updated_at = datetime.now()
 
-                    self.save_data()
-                    return True
-            return False
+            changed = [schedule]
+            student = self.get_student_by_id(schedule.student_id)
+            if student:
+                changed += self._reschedule_following_schedules(student, schedule, old_date)
+
+            self._commit(self._schedules_record(changed))
+            dates = {old_dates.get(s.id, s.scheduled_date) for s in changed} | {s.scheduled_date for s in changed}
+            self._notify(SCHEDULE_MOVED, [schedule.student_id], [s.id for s in changed], dates)
+            return True
         except Exception as e:
             print(f"Failed to move schedule: {e}")
             return False
 
     def _generate_schedules_for_student(self, student: Student):
-        weekday_map = {
-            "월요일": 0, "화요일": 1, "수요일": 2, "목요일": 3,
-            "금요일": 4, "토요일": 5, "일요일": 6
-        }
-
-        weekday_indices = [weekday_map[day] for day in student.weekdays if day in weekday_map]
-        if not weekday_indices:
-            return
-
-        # 요일들을 정렬 (월요일=0 ~ 일요일=6 순서)
-        weekday_indices.sort()
-
-        # 시작일 기준으로 첫 주의 시작 월요일 찾기
-        start_date = student.start_date
-        days_since_monday = start_date.weekday()  # 월요일=0, 일요일=6
-        week_start = start_date - timedelta(days=days_since_monday)
-
-        schedule_count = 0
-        week_num = 0
-
-        # 총 강수(total_weeks)만큼만 스케줄 생성
-        while schedule_count < student.total_weeks:
-            current_week_start = week_start + timedelta(weeks=week_num)
-
-            for weekday_idx in weekday_indices:
-                # 이미 필요한 강수를 모두 생성했으면 종료
-                if schedule_count >= student.total_weeks:
-                    break
-
-                # 해당 주의 해당 요일 날짜 계산
-                schedule_date = current_week_start + timedelta(days=weekday_idx)
-
-                # 시작일 이전의 날짜는 건너뛰기
-                if schedule_date < start_date:
-                    continue
-
-                schedule_count += 1
-                schedule = Schedule(
-                    student_id=student.id,
-                    week_number=schedule_count,
-                    scheduled_date=schedule_date
-                )
-
-                self.data.schedules.append(schedule)
-
-            week_num += 1
+        self.schedule_store.add_many(generate_schedules([student]))
 
     def _regenerate_schedules_for_student(self, student: Student):
-        self.data.schedules = [s for s in self.data.schedules if s.student_id != student.id]
+        self._record_deleted(schedule_ids=[s.id for s in self.schedule_store.for_student(student.id)])
+        self.schedule_store.remove_student(student.id)
         self._generate_schedules_for_student(student)
 
     def fix_all_student_schedules(self):
         """모든 수강생의 스케줄을 올바르게 재생성"""
         students = self.get_students()
-        for student in students:
-            self._regenerate_schedules_for_student(student)
-        self.save_data()
+        student_ids = {student.id for student in students}
+        # 수강생별 삭제/추가 대신 전체를 한 번에 생성해 목록과 인덱스를 교체
+        kept = [s for s in self.data.schedules if s.student_id not in student_ids]
+        self._record_deleted(schedule_ids=[s.id for s in self.data.schedules if s.student_id in student_ids])
+        generated = generate_schedules(students)
+        self.data.schedules[:] = kept + generated
+        self.schedule_store.rebuild(self.data.schedules)
+        self._commit(self._replace_schedules_record(list(student_ids), generated))
+        self._notify(BULK_REPLACED)
         print(f"모든 수강생({len(students)}명)의 스케줄을 재생성했습니다.")
 
-    def _reschedule_following_schedules(self, student: Student, moved_schedule: Schedule, old_date: date):
-        weekday_map = {
-            "월요일": 0, "화요일": 1, "수요일": 2, "목요일": 3,
-            "금요일": 4, "토요일": 5, "일요일": 6
-        }
-
-        weekday_indices = [weekday_map[day] for day in student.weekdays if day in weekday_map]
+    def _reschedule_following_schedules(self, student: Student, moved_schedule: Schedule,
+                                        old_date: date) -> List[Schedule]:
+        """이동한 스케줄 뒤의 수업들을 수강 요일에 맞춰 다시 배치하고 변경된 스케줄 반환"""
+        weekday_indices = [WEEKDAY_INDEX[day] for day in student.weekdays if day in WEEKDAY_INDEX]
         if not weekday_indices:
-            return
+            return []
 
-        student_schedules = sorted(
-            [s for s in self.data.schedules if s.student_id == student.id and s.week_number > moved_schedule.week_number],
-            key=lambda x: x.week_number
+        following = sorted(
+            (s for s in self.schedule_store.for_student(student.id) if s.week_number > moved_schedule.week_number),
+            key=attrgetter("week_number")
         )
+        if not following:
+            return []
 
-        if not student_schedules:
-            return
-
-        current_date = moved_schedule.scheduled_date
-        current_weekday_idx = student.weekdays.index(
-            [k for k, v in weekday_map.items() if v == moved_schedule.scheduled_date.weekday()][0]
-        ) if moved_schedule.scheduled_date.weekday() in weekday_indices else 0
-
-        for schedule in student_schedules:
-            current_weekday_idx = (current_weekday_idx + 1) % len(weekday_indices)
-            target_weekday = weekday_indices[current_weekday_idx]
-
-            days_ahead = target_weekday - current_date.weekday()
-            if days_ahead <= 0:
-                days_ahead += 7
-
-            new_date = current_date + timedelta(days=days_ahead)
-
-            for i, s in enumerate(self.data.schedules):
-                if s.id == schedule.id:
-                    self.data.schedules[i].scheduled_date = new_date
-                    self.data.schedules[i].updated_at = datetime.now()
-                    break
-
-            current_date = new_date
+        # 새 날짜를 한 번에 계산한 뒤 인덱스에 일괄 반영
+        new_dates = following_session_dates(weekday_indices, moved_schedule.scheduled_date, len(following))
+        self.schedule_store.move_many(zip(following, new_dates))
+        now = datetime.now()
+        for schedule in following:
+            schedule.updated_at = now
+        return following
 
     def mark_schedule_completed(self, schedule_id: str, completed: bool = True) -> bool:
         try:
-            for i, schedule in enumerate(self.data.schedules):
-                if schedule.id == schedule_id:
-                    self.data.schedules[i].is_completed = completed
-                    self.data.schedules[i].updated_at = datetime.now()
-                    self.save_data()
-                    return True
-            return False
+            schedule = self.schedule_store.get(schedule_id)
+            if schedule is None:
+                return False
+
+            schedule.is_completed = completed
+            schedule.updated_at = datetime.now()
+            self._commit(self._schedules_record([schedule]))
+            self._notify(SCHEDULE_COMPLETED, [schedule.student_id], [schedule.id], [schedule.scheduled_date])
+            return True
         except Exception as e:
             print(f"Failed to mark schedule as completed: {e}")
             return False
@@ -366,30 +796,162 @@ class DataManager(QObject):
     def update_schedule_memo(self, schedule_id: str, memo: str) -> bool:
         """일정의 메모를 업데이트"""
         try:
-            for i, schedule in enumerate(self.data.schedules):
-                if schedule.id == schedule_id:
-                    old_memo = self.data.schedules[i].memo
-                    self.data.schedules[i].memo = memo
-                    self.data.schedules[i].updated_at = datetime.now()
-                    print(f"메모 업데이트: {schedule_id} - '{old_memo}' -> '{memo}'")
+            schedule = self.schedule_store.get(schedule_id)
+            if schedule is None:
+                print(f"스케줄을 찾을 수 없음: {schedule_id}")
+                return False
 
-                    # 데이터 저장
-                    save_success = self.save_data()
-                    print(f"데이터 저장 성공: {save_success}")
+            old_memo = schedule.memo
+            schedule.memo = memo
+            schedule.updated_at = datetime.now()
+            print(f"메모 업데이트: {schedule_id} - '{old_memo}' -> '{memo}'")
 
-                    return True
-            print(f"스케줄을 찾을 수 없음: {schedule_id}")
-            return False
+            # 데이터 저장
+            save_success = self._commit(self._schedules_record([schedule]))
+            print(f"데이터 저장 성공: {save_success}")
+            self._notify(SCHEDULE_MEMO_CHANGED, [schedule.student_id], [schedule.id], [schedule.scheduled_date])
+
+            return True
         except Exception as e:
             print(f"Failed to update schedule memo: {e}")
             return False
 
     def get_schedule_by_id(self, schedule_id: str) -> Optional[Schedule]:
         """스케줄 ID로 스케줄 조회"""
-        for schedule in self.data.schedules:
-            if schedule.id == schedule_id:
-                return schedule
-        return None
+        return self.schedule_store.get(schedule_id)
+
+    @property
+    def data_epoch(self) -> int:
+        """데이터 세대 번호 - 다시 로드/잠금/복원될 때마다 증가"""
+        return self._data_epoch
+
+    def merge_synced_data(self, remote: AppData, message: str,
+                          epoch: Optional[int] = None) -> Tuple[bool, str, List[MergeConflict]]:
+        """구글 시트에서 가져온 데이터를 로컬 데이터와 병합 (메인 스레드에서 호출)
+
+        마지막 동기화 시점의 데이터를 기준으로 레코드마다 3-way 병합해 한쪽에서만
+        바뀐 내용은 그대로 합치고 충돌은 목록으로 돌려준다. 원격과 달라진 레코드는
+        수정 시각을 지금으로 바꾸고, 원격에만 남은 레코드는 삭제 목록에 넣어 다음
+        업로드에서 보낸다. epoch가 주어지면 가져오는 동안 데이터가 다시 로드되거나
+        잠기지 않았을 때만 적용한다. 기존 데이터를 백업한 뒤 한 번에 교체하고 저장한다.
+        """
+        if epoch is not None and epoch != self._data_epoch:
+            return False, "가져오는 동안 데이터가 다시 로드되어 적용하지 않았습니다.", []
+
+        result = three_way_merge(self._load_sync_base(), self.data, remote)
+
+        # 기존 데이터 백업 생성
+        backup_success = self.create_backup()
+        if not backup_success:
+            print("기존 데이터 백업 생성 실패 - 계속 진행")
+
+        now = datetime.now()
+        for record in chain(result.students, result.schedules):
+            if record.id in result.changed:
+                record.updated_at = now
+
+        # 원격의 워터마크를 이어받아 다음 업로드는 병합으로 달라진 부분만 전송
+        metadata = dict(self.data.metadata)
+        metadata.pop(SYNC_TOMBSTONES, None)
+        watermark = remote.metadata.get(SYNC_WATERMARK)
+        if watermark:
+            metadata[SYNC_WATERMARK] = watermark
+            deleted = {kind: ids for kind, ids in result.deleted.items() if ids}
+            if deleted:
+                metadata[SYNC_TOMBSTONES] = deleted
+        else:
+            metadata.pop(SYNC_WATERMARK, None)
+        metadata["last_sync"] = now.isoformat()
+        metadata["sync_source"] = "google_sheets"
+
+        # 병합 결과로 교체 후 로컬에 저장 - 대기열은 원격과 달라진 레코드로 다시 구성
+        self.data = AppData(result.students, result.schedules, metadata)
+        ops = [("students", s.id, PUT) for s in result.students if s.id in result.changed]
+        ops += [("schedules", s.id, PUT) for s in result.schedules if s.id in result.changed]
+        ops += [(kind, item_id, DELETE) for kind, ids in result.deleted.items() for item_id in ids]
+        self._outbox.rebase(watermark or None, ops)
+        self.outboxChanged.emit(len(self._outbox))
+        saved = self.save_data()
+        self._notify(BULK_REPLACED)
+        if not saved:
+            return False, "구글 시트에서 가져왔지만 로컬 저장에 실패했습니다.", result.conflicts
+        self._save_sync_base(remote)
+
+        summary = f"원격 변경 {result.pulled}건 반영, 업로드할 로컬 변경 {len(result.changed)}건"
+        if result.conflicts:
+            summary += f", 충돌 {len(result.conflicts)}건"
+        return True, f"{message} ({summary}, 로컬 저장 완료)", result.conflicts
+
+    def acknowledge_sync(self, ack: Dict[str, Any], epoch: Optional[int] = None,
+                         uploaded: Optional[AppData] = None, batch: Optional[OutboxBatch] = None,
+                         outbox_seq: Optional[int] = None) -> bool:
+        """서버가 확인한 업로드 워터마크 기록 (메인 스레드에서 호출)
+
+        다음 업로드부터는 이 시각 이후에 변경된 레코드만 보낸다. uploaded는 업로드한
+        스냅샷으로, 이제 시트와 같은 내용이므로 다음 병합의 기준이 된다. batch(대기열
+        업로드)면 보낸 작업만 대기열에서 지우고 병합 기준에 반영한다. 스냅샷 업로드면
+        outbox_seq(스냅샷 시점, 없으면 지금)까지 기록된 작업을 모두 지운다.
+        업로드하는 동안 데이터가 다시 로드되었으면 기록하지 않는다.
+        """
+        if epoch is not None and epoch != self._data_epoch:
+            return False
+        acknowledge(self.data.metadata, ack["watermark"], ack.get("deleted"))
+        if batch is not None:
+            self._outbox.acknowledge(batch.keys, batch.seq, ack["watermark"])
+            self._advance_sync_base(batch.delta)
+        else:
+            self._outbox.acknowledge_all(self._outbox.seq if outbox_seq is None else outbox_seq,
+                                         ack["watermark"])
+            if uploaded is not None:
+                self._save_sync_base(uploaded)
+        self.outboxChanged.emit(len(self._outbox))
+        return self.request_save()
+
+    def _advance_sync_base(self, delta: Dict[str, Any]):
+        """병합 기준 데이터에 업로드한 변경분을 적용 (서버가 하는 upsert/삭제와 같게)"""
+        base = self._load_sync_base()
+        if base is None:
+            return
+        for kind, parse in (("students", Student.from_dict), ("schedules", Schedule.from_dict)):
+            records = {record.id: record for record in getattr(base, kind)}
+            for item_id in delta["deleted"].get(kind, []):
+                records.pop(item_id, None)
+            for row in delta[kind]:
+                records[row["id"]] = parse(row)
+            setattr(base, kind, list(records.values()))
+        self._save_sync_base(base)
+
+    def _load_sync_base(self) -> Optional[AppData]:
+        """병합 기준 데이터 - 없거나 읽을 수 없으면 None (첫 동기화처럼 병합)"""
+        if not self._sync_base_path.exists():
+            return None
+        try:
+            with open(self._sync_base_path, 'rb') as f:
+                head = f.read(CryptoManager.HEADER_SIZE)
+                f.seek(0)
+                payload = self.crypto_manager.decrypt_to_bytes(f)
+            return get_serializer(CryptoManager.codec_of(head)).decode(payload)
+        except Exception as e:
+            print(f"Failed to load sync base: {e}")
+            return None
+
+    def _save_sync_base(self, app_data: AppData) -> bool:
+        """병합 기준 데이터 저장 (데이터 파일과 같은 키로 암호화, 임시 파일에 쓴 뒤 교체)"""
+        if not self.crypto_manager.is_unlocked:
+            return False
+
+        temp_file = self._sync_base_path.with_name(f"{self._sync_base_path.name}.tmp")
+        try:
+            with open(temp_file, 'wb') as f:
+                codec, chunks = serialize(app_data, self.DATA_CODEC)
+                self.crypto_manager.encrypt_stream(chunks, f, codec=codec)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self._sync_base_path)
+            return True
+        except Exception as e:
+            print(f"Failed to save sync base: {e}")
+            return False
 
     def _initialize_google_sheets(self):
         """구글 시트 초기화"""
@@ -422,7 +984,7 @@ class DataManager(QObject):
             if not api:
                 return False, "API 인스턴스를 가져올 수 없습니다."
 
-            success, message = api.sync_from_local_to_sheets(self.data)
+            success, message, ack = self._upload_with_merge(api)
 
             if success:
                 self.syncStatusChanged.emit("동기화 완료")
@@ -436,6 +998,24 @@ class DataManager(QObject):
             self.syncStatusChanged.emit("동기화 실패")
             return False, error_message
 
+    def _upload_with_merge(self, api) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """변경분 업로드 - 다른 곳에서 먼저 업로드했으면 시트를 받아 병합한 뒤 한 번 더 업로드"""
+        uploaded = self.data.copy()
+        success, message, ack = api.upload_changes(uploaded, datetime.now())
+        if not success and ack and ack.get("resync"):
+            success, message, remote = api.sync_from_sheets_to_local()
+            if not success:
+                return False, message, None
+            success, message, _ = self.merge_synced_data(remote, message)
+            if not success:
+                return False, message, None
+            uploaded = self.data.copy()
+            success, message, ack = api.upload_changes(uploaded, datetime.now())
+
+        if success:
+            self.acknowledge_sync(ack, uploaded=uploaded)
+        return success, message, ack
+
     def sync_from_google_sheets(self) -> tuple[bool, str]:
         """구글 시트에서 로컬로 데이터 동기화"""
         if not self.is_google_sheets_available():
@@ -451,23 +1031,9 @@ class DataManager(QObject):
             success, message, app_data = api.sync_from_sheets_to_local()
 
             if success and app_data:
-                # 기존 데이터 백업 생성
-                backup_success = self.create_backup()
-                if not backup_success:
-                    print("기존 데이터 백업 생성 실패 - 계속 진행")
-
-                # 새 데이터로 교체
-                self.data = app_data
-
-                # 로컬에 저장
-                save_success = self.save_data()
-                if save_success:
-                    self.dataChanged.emit()
-                    self.syncStatusChanged.emit("동기화 완료")
-                    return True, f"{message} (로컬 저장 완료)"
-                else:
-                    self.syncStatusChanged.emit("로컬 저장 실패")
-                    return False, "구글 시트에서 가져왔지만 로컬 저장에 실패했습니다."
+                success, message, _ = self.merge_synced_data(app_data, message)
+                self.syncStatusChanged.emit("동기화 완료" if success else "로컬 저장 실패")
+                return success, message
             else:
                 self.syncStatusChanged.emit("동기화 실패")
                 return False, message
@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from .models import AppData
+
+# AppData.metadata 키
+SYNC_WATERMARK = "sync_watermark"    # 서버가 마지막으로 확인한 업로드 기준 시각
+SYNC_TOMBSTONES = "sync_tombstones"  # 마지막 업로드 이후 삭제된 ID {"students": [...], "schedules": [...]}
+
+
+def format_watermark(value: datetime) -> str:
+    """워터마크 문자열 (항상 마이크로초까지 기록해 문자열 비교 결과가 시각 순서와 같도록)"""
+    return value.isoformat(timespec='microseconds')
+
+
+def record_tombstones(metadata: Dict[str, Any], kind: str, ids: Iterable[str]):
+    """삭제된 레코드 ID 기록 - 한 번도 업로드하지 않았다면 전체 업로드가 되므로 기록하지 않음"""
+    if not metadata.get(SYNC_WATERMARK):
+        return
+    tombstones = metadata.setdefault(SYNC_TOMBSTONES, {})
+    pending = tombstones.setdefault(kind, [])
+    known = set(pending)
+    for item_id in ids:
+        if item_id not in known:
+            known.add(item_id)
+            pending.append(item_id)
+
+
+def build_delta(app_data: AppData, until: datetime, full: bool = False) -> Dict[str, Any]:
+    """마지막 워터마크 이후 변경된 레코드와 삭제 목록으로 업로드 본문 생성
+
+    워터마크가 없거나 full이면 모든 레코드를 보내고 서버는 시트를 새로 쓴다.
+    그 외에는 since < updated_at <= until 인 레코드만 보내고 서버가 ID로 upsert 한다.
+    삭제 목록은 항상 포함하며 (전체 업로드에서는 서버가 무시), 확인 후 비운다.
+    """
+    since_text = None if full else app_data.metadata.get(SYNC_WATERMARK)
+    tombstones = app_data.metadata.get(SYNC_TOMBSTONES, {})
+
+    if since_text is None:
+        students = app_data.students
+        schedules = app_data.schedules
+    else:
+        since = datetime.fromisoformat(since_text)
+        students = [s for s in app_data.students if since < s.updated_at <= until]
+        schedules = [s for s in app_data.schedules if since < s.updated_at <= until]
+    deleted = {
+        "students": list(tombstones.get("students", [])),
+        "schedules": list(tombstones.get("schedules", [])),
+    }
+    return make_delta(since_text, until, students, schedules, deleted)
+
+
+def make_delta(since_text: Optional[str], until: datetime, students: Iterable, schedules: Iterable,
+               deleted: Dict[str, List[str]]) -> Dict[str, Any]:
+    """delta_sync 요청 본문 (since_text가 없으면 전체 업로드)"""
+    return {
+        "full": since_text is None,
+        "since": since_text,
+        "until": format_watermark(until),
+        "students": [s.to_dict() for s in students],
+        "schedules": [s.to_dict() for s in schedules],
+        "deleted": deleted,
+    }
+
+
+def acknowledge(metadata: Dict[str, Any], watermark: str, sent: Optional[Dict[str, List[str]]] = None):
+    """서버가 확인한 워터마크를 기록하고, 전송된 삭제 ID를 대기 목록에서 제거"""
+    metadata[SYNC_WATERMARK] = watermark
+    tombstones = metadata.get(SYNC_TOMBSTONES)
+    if not tombstones:
+        return
+    for kind, ids in (sent or {}).items():
+        if kind in tombstones:
+            done = set(ids)
+            tombstones[kind] = [i for i in tombstones[kind] if i not in done]
+    if not any(tombstones.values()):
+        metadata.pop(SYNC_TOMBSTONES, None)
@@ -1,19 +1,62 @@
 import requests
-import json
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 from .models import Student, Schedule, AppData
+from .delta_sync import SYNC_WATERMARK, build_delta
+from .sheets_transport import (
+    CircuitOpenError, HTTPStatusError, ProgressCallback, SheetsTransport, SyncCancelled
+)
+
+
+class SheetsRequestError(Exception):
+    """페이지 단위 다운로드 중 요청이 실패함"""
+
+
+SHEET_CHANGED_MESSAGE = "다운로드 중에 구글 시트가 변경되었습니다. 다시 시도하세요."
 
 
 class GoogleSheetsAPI:
     """구글 시트와 연동하기 위한 API 클래스"""
 
-    def __init__(self, webapp_url: str):
+    # 다시 보내도 결과가 같은 action (재시도 대상). delete_student는 두 번째 요청이
+    # "학생을 찾을 수 없습니다"로 실패하므로 제외
+    IDEMPOTENT_ACTIONS = frozenset({
+        'get_students', 'get_schedules', 'update_student', 'update_schedule',
+        'sync_students', 'sync_schedules', 'full_sync', 'delta_sync', 'get_metadata'
+    })
+
+    DOWNLOAD_PAGE_SIZE = 2000  # 다운로드 페이지당 행 수 (앱스 스크립트 응답 크기/실행 시간 제한 이내)
+
+    def __init__(self, webapp_url: str, transport: Optional[SheetsTransport] = None):
         self.webapp_url = webapp_url
         self.timeout = 30  # 30초 타임아웃
-
-    def _make_request(self, action: str, data: Optional[Dict] = None) -> Dict[str, Any]:
-        """구글 앱스 스크립트로 HTTP 요청 전송"""
+        self.transport = transport or SheetsTransport()
+
+    def close(self):
+        """연결 풀 정리"""
+        self.transport.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """요청 수, 재시도/실패 횟수, 지연 시간(ms), 압축 전후 전송량"""
+        metrics = self.transport.metrics.snapshot()
+        metrics['circuit'] = self.transport.breaker.state
+        return metrics
+
+    def _is_idempotent(self, action: str, data: Any) -> bool:
+        if action == 'batch':
+            return all(op.get('action') in self.IDEMPOTENT_ACTIONS for op in data or [])
+        return action in self.IDEMPOTENT_ACTIONS
+
+    def _make_request(self, action: str, data: Optional[Dict] = None,
+                      progress: Optional[ProgressCallback] = None,
+                      cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """구글 앱스 스크립트로 HTTP 요청 전송
+
+        progress가 주어지면 보낸/받은 바이트 수를 알리고, cancel_event가 설정되면
+        본문을 주고받는 도중에 중단한다 (결과의 'cancelled'가 True).
+        멱등 action은 일시적인 오류에서 SheetsTransport가 재시도한다.
+        """
         try:
             payload = {
                 'action': action,
@@ -23,26 +66,32 @@ class GoogleSheetsAPI:
             if data:
                 payload['data'] = data
 
-            response = requests.post(
-                self.webapp_url,
-                json=payload,
-                timeout=self.timeout,
-                headers={'Content-Type': 'application/json'}
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {
-                    'success': False,
-                    'message': f'HTTP 오류: {response.status_code}',
-                    'timestamp': datetime.now().isoformat()
-                }
+            return self.transport.post(self.webapp_url, payload, self.timeout,
+                                       self._is_idempotent(action, data), progress, cancel_event)
 
+        except SyncCancelled:
+            return {
+                'success': False,
+                'cancelled': True,
+                'message': '사용자가 동기화를 취소했습니다.',
+                'timestamp': datetime.now().isoformat()
+            }
+        except CircuitOpenError as e:
+            return {
+                'success': False,
+                'message': f'연속된 오류로 요청을 잠시 중단했습니다. {e.retry_after:.0f}초 후 다시 시도하세요.',
+                'timestamp': datetime.now().isoformat()
+            }
+        except HTTPStatusError as e:
+            return {
+                'success': False,
+                'message': f'HTTP 오류: {e.status}',
+                'timestamp': datetime.now().isoformat()
+            }
         except requests.exceptions.Timeout:
             return {
                 'success': False,
-                'message': '요청 시간 초과 (30초)',
+                'message': f'요청 시간 초과 ({self.timeout}초)',
                 'timestamp': datetime.now().isoformat()
             }
         except requests.exceptions.RequestException as e:
@@ -97,11 +146,12 @@ class GoogleSheetsAPI:
         except Exception as e:
             return False, f"스케줄 동기화 실패: {str(e)}"
 
-    def full_sync(self, app_data: AppData) -> Tuple[bool, str]:
+    def full_sync(self, app_data: AppData, progress: Optional[ProgressCallback] = None,
+                  cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
         """전체 데이터 동기화"""
         try:
             data = app_data.to_dict()
-            result = self._make_request('full_sync', data)
+            result = self._make_request('full_sync', data, progress, cancel_event)
 
             if result['success']:
                 return True, result['message']
@@ -111,53 +161,225 @@ class GoogleSheetsAPI:
         except Exception as e:
             return False, f"전체 동기화 실패: {str(e)}"
 
-    def get_students_from_sheets(self) -> Tuple[bool, str, List[Student]]:
-        """구글 시트에서 학생 데이터 가져오기"""
+    def upload_changes(self, app_data: AppData, until: datetime, progress: Optional[ProgressCallback] = None,
+                       cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """마지막 업로드 이후 변경분만 전송 (델타 동기화)
+
+        변경/추가된 레코드는 서버가 ID로 upsert 하고, 삭제 목록의 행은 지운다.
+        서버의 워터마크가 since와 다를 때 시트가 초기화되어 워터마크가 없으면 전체
+        업로드로 한 번 더 시도한다. 다른 곳에서 먼저 업로드한 경우에는 그 내용을 덮어쓰지
+        않도록 실패와 함께 {"resync": True, "watermark": ...}를 반환하므로, 시트를 받아
+        병합한 뒤 다시 업로드해야 한다. 성공하면 DataManager.acknowledge_sync에
+        넘길 확인 정보 {"watermark": ..., "deleted": ...}를 함께 반환한다.
+        """
         try:
-            result = self._make_request('get_students')
+            delta = build_delta(app_data, until)
+            result = self._make_request('delta_sync', delta, progress, cancel_event)
+            data = result.get('data') or {}
+            if not result['success'] and not delta['full'] and data.get('resync'):
+                if data.get('watermark'):
+                    message = "다른 곳에서 구글 시트를 먼저 수정했습니다. 시트를 받아 병합한 뒤 다시 업로드합니다."
+                    return False, message, {"resync": True, "watermark": data['watermark']}
+                delta = build_delta(app_data, until, full=True)
+                result = self._make_request('delta_sync', delta, progress, cancel_event)
+
+            return self._delta_result(delta, result)
 
-            if result['success']:
-                students_data = result.get('data', [])
-                students = []
-
-                for student_dict in students_data:
-                    try:
-                        student = Student.from_dict(student_dict, from_google_sheets=True)
-                        students.append(student)
-                    except Exception as e:
-                        print(f"학생 데이터 파싱 오류: {e}")
-                        continue
-
-                return True, result['message'], students
-            else:
-                return False, result['message'], []
+        except Exception as e:
+            return False, f"변경분 동기화 실패: {str(e)}", None
+
+    def send_delta(self, delta: Dict[str, Any], progress: Optional[ProgressCallback] = None,
+                   cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """미리 만든 변경분 본문을 그대로 전송 (대기열 업로드)
+
+        서버의 워터마크가 since와 다르면 upload_changes처럼 resync 확인 정보와 함께
+        실패하며, 전체 업로드로 다시 시도하지는 않는다.
+        """
+        try:
+            result = self._make_request('delta_sync', delta, progress, cancel_event)
+            data = result.get('data') or {}
+            if not result['success'] and data.get('resync'):
+                return False, result['message'], {"resync": True, "watermark": data.get('watermark')}
+            return self._delta_result(delta, result)
 
+        except Exception as e:
+            return False, f"변경분 동기화 실패: {str(e)}", None
+
+    @staticmethod
+    def _delta_result(delta: Dict[str, Any], result: Dict[str, Any]) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        if not result['success']:
+            return False, result['message'], None
+        watermark = (result.get('data') or {}).get('watermark', delta['until'])
+        return True, result['message'], {"watermark": watermark, "deleted": delta['deleted']}
+
+    def get_students_from_sheets(self, progress: Optional[ProgressCallback] = None,
+                              cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str, List[Student]]:
+        """구글 시트에서 학생 데이터 가져오기"""
+        try:
+            students = []
+            for page in self.iter_students(progress=progress, cancel_event=cancel_event):
+                students.extend(page)
+            return True, f"{len(students)}명의 학생 데이터를 가져왔습니다.", students
+
+        except SyncCancelled:
+            return False, "사용자가 동기화를 취소했습니다.", []
         except Exception as e:
             return False, f"학생 데이터 가져오기 실패: {str(e)}", []
 
-    def get_schedules_from_sheets(self) -> Tuple[bool, str, List[Schedule]]:
+    def get_schedules_from_sheets(self, progress: Optional[ProgressCallback] = None,
+                               cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str, List[Schedule]]:
         """구글 시트에서 스케줄 데이터 가져오기"""
         try:
-            result = self._make_request('get_schedules')
+            schedules = []
+            for page in self.iter_schedules(progress=progress, cancel_event=cancel_event):
+                schedules.extend(page)
+            return True, f"{len(schedules)}개의 스케줄을 가져왔습니다.", schedules
+
+        except SyncCancelled:
+            return False, "사용자가 동기화를 취소했습니다.", []
+        except Exception as e:
+            return False, f"스케줄 데이터 가져오기 실패: {str(e)}", []
 
+    def iter_pages(self, action: str, page_size: Optional[int] = None,
+                   progress: Optional[ProgressCallback] = None,
+                   cancel_event: Optional[threading.Event] = None,
+                   first_result: Optional[Dict[str, Any]] = None
+                   ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """get_students/get_schedules 결과를 페이지 단위로 가져오는 제너레이터 (순차 요청)
+
+        (행 목록, 페이지 정보)를 yield 한다. 다음 페이지는 앞 페이지를 처리한 뒤에
+        요청하므로 메모리에는 한 페이지의 응답만 남는다. 앱의 다운로드(SyncQueue)는
+        AsyncGoogleSheetsAPI로 페이지를 동시에 요청하며, 이 제너레이터는 동기 API의
+        다운로드와 한 페이지씩 처리하려는 호출 측에서 쓴다. 페이지를 모르는 이전
+        앱스 스크립트는 전체 행을 한 페이지로 준다. first_result는 배치로 미리 받은
+        첫 페이지이다. 요청이 실패하면 SheetsRequestError, 취소되면 SyncCancelled.
+        """
+        page_size = page_size or self.DOWNLOAD_PAGE_SIZE
+        result, first_result = first_result, None
+        offset = 0
+        watermark = None
+
+        while True:
+            if result is None:
+                result = self._make_request(action, {'offset': offset, 'limit': page_size},
+                                            progress, cancel_event)
+            self._check_result(result)
+
+            paging = result.get('paging')
+            rows = result.get('data') or []
+            result = None
+            if paging is not None:
+                # 페이지 사이에 다른 곳에서 업로드하면 행 위치가 바뀌므로 중단
+                if offset and paging.get('watermark') != watermark:
+                    raise SheetsRequestError(SHEET_CHANGED_MESSAGE)
+                watermark = paging.get('watermark')
+            yield rows, paging
+
+            offset = paging.get('next_offset') if paging else None
+            if offset is None:
+                return
+
+    @staticmethod
+    def _check_result(result: Dict[str, Any]):
+        """취소된 요청이면 SyncCancelled, 실패한 요청이면 SheetsRequestError 발생"""
+        if result.get('cancelled'):
+            raise SyncCancelled()
+        if not result['success']:
+            raise SheetsRequestError(result['message'])
+
+    def iter_students(self, page_size: Optional[int] = None, progress: Optional[ProgressCallback] = None,
+                      cancel_event: Optional[threading.Event] = None,
+                      first_result: Optional[Dict[str, Any]] = None) -> Iterator[List[Student]]:
+        """학생 데이터를 페이지마다 Student 목록으로 변환해 yield"""
+        for rows, _ in self.iter_pages('get_students', page_size, progress, cancel_event, first_result):
+            yield self._parse_students(rows)
+
+    def iter_schedules(self, page_size: Optional[int] = None, progress: Optional[ProgressCallback] = None,
+                       cancel_event: Optional[threading.Event] = None,
+                       first_result: Optional[Dict[str, Any]] = None) -> Iterator[List[Schedule]]:
+        """스케줄 데이터를 페이지마다 Schedule 목록으로 변환해 yield"""
+        for rows, _ in self.iter_pages('get_schedules', page_size, progress, cancel_event, first_result):
+            yield self._parse_schedules(rows)
+
+    def fetch_page(self, action: str, offset: int, cancel_event: Optional[threading.Event] = None
+                   ) -> Tuple[list, Optional[Dict[str, Any]]]:
+        """get_students/get_schedules 페이지 하나를 요청해 (모델 객체 목록, 페이지 정보) 반환
+
+        AsyncGoogleSheetsAPI가 작업 스레드에서 여러 페이지를 동시에 요청할 때 쓴다.
+        요청이 실패하면 SheetsRequestError, 취소되면 SyncCancelled.
+        """
+        result = self._make_request(action, {'offset': offset, 'limit': self.DOWNLOAD_PAGE_SIZE},
+                                    None, cancel_event)
+        self._check_result(result)
+        rows = result.get('data') or []
+        parse = self._parse_students if action == 'get_students' else self._parse_schedules
+        return parse(rows), result.get('paging')
+
+    def fetch_metadata(self, cancel_event: Optional[threading.Event] = None) -> Optional[Dict[str, str]]:
+        """메타데이터 요청 - get_metadata가 없는 이전 앱스 스크립트면 None
+
+        요청이 실패하면 SheetsRequestError, 취소되면 SyncCancelled.
+        """
+        result = self._make_request('get_metadata', None, None, cancel_event)
+        if not result.get('success') and result.get('message') == 'Unknown action':
+            return None
+        self._check_result(result)
+        return result.get('data') or {}
+
+    def _parse_students(self, rows: List[Dict[str, Any]]) -> List[Student]:
+        students = []
+        for student_dict in rows:
+            try:
+                students.append(Student.from_dict(student_dict, from_google_sheets=True))
+            except Exception as e:
+                print(f"학생 데이터 파싱 오류: {e}")
+        return students
+
+    def _parse_schedules(self, rows: List[Dict[str, Any]]) -> List[Schedule]:
+        schedules = []
+        for schedule_dict in rows:
+            try:
+                schedules.append(Schedule.from_dict(schedule_dict, from_google_sheets=True))
+            except Exception as e:
+                print(f"스케줄 데이터 파싱 오류: {e}")
+        return schedules
+
+    def get_metadata(self, cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str, Dict[str, str]]:
+        """구글 시트의 메타데이터 시트 내용 (키 -> 값 문자열)"""
+        try:
+            result = self._make_request('get_metadata', None, None, cancel_event)
             if result['success']:
-                schedules_data = result.get('data', [])
-                schedules = []
-
-                for schedule_dict in schedules_data:
-                    try:
-                        schedule = Schedule.from_dict(schedule_dict, from_google_sheets=True)
-                        schedules.append(schedule)
-                    except Exception as e:
-                        print(f"스케줄 데이터 파싱 오류: {e}")
-                        continue
-
-                return True, result['message'], schedules
-            else:
-                return False, result['message'], []
+                return True, result['message'], result.get('data') or {}
+            return False, result['message'], {}
 
         except Exception as e:
-            return False, f"스케줄 데이터 가져오기 실패: {str(e)}", []
+            return False, f"메타데이터 가져오기 실패: {str(e)}", {}
+
+    def batch(self, operations: List[Tuple[str, Any]], progress: Optional[ProgressCallback] = None,
+              cancel_event: Optional[threading.Event] = None) -> List[Dict[str, Any]]:
+        """여러 action을 한 번의 요청으로 보내고 action별 결과를 같은 순서로 반환
+
+        operations는 (action, data) 목록이다. 요청 자체가 실패하면 모든 action의
+        결과가 같은 실패가 된다. 배치를 지원하지 않는 이전 앱스 스크립트면
+        action을 하나씩 보낸다.
+        """
+        if not operations:
+            return []
+
+        result = self._make_request(
+            'batch', [{'action': action, 'data': data} for action, data in operations], progress, cancel_event)
+        data = result.get('data')
+        results = data.get('results') if isinstance(data, dict) else None
+
+        if results is None or len(results) != len(operations):
+            if result.get('message') == 'Unknown action':
+                return [self._make_request(action, data, progress, cancel_event) for action, data in operations]
+            return [dict(result) for _ in operations]
+        return results
+
+    def batch_client(self) -> 'SheetsBatch':
+        """요청을 모았다가 flush()에서 한 번에 보내는 배치 클라이언트"""
+        return SheetsBatch(self)
 
     def update_student(self, student: Student) -> Tuple[bool, str]:
         """개별 학생 업데이트"""
@@ -201,40 +423,130 @@ class GoogleSheetsAPI:
             return False, f"학생 삭제 실패: {str(e)}"
 
 
-    def sync_from_local_to_sheets(self, app_data: AppData) -> Tuple[bool, str]:
+    def sync_from_local_to_sheets(self, app_data: AppData, progress: Optional[ProgressCallback] = None,
+                                  cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
         """로컬 데이터를 구글 시트로 업로드"""
-        success, message = self.full_sync(app_data)
+        success, message = self.full_sync(app_data, progress, cancel_event)
         return success, f"로컬 → 구글 시트: {message}"
 
-    def sync_from_sheets_to_local(self) -> Tuple[bool, str, Optional[AppData]]:
-        """구글 시트에서 로컬로 데이터 다운로드"""
+    def sync_from_sheets_to_local(self, progress: Optional[ProgressCallback] = None,
+                                  cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str, Optional[AppData]]:
+        """구글 시트에서 로컬로 데이터 다운로드
+
+        페이지마다 모델 객체로 변환해 바로 AppData에 쌓으므로 응답 JSON은 한 페이지씩만
+        메모리에 둔다. 변환한 레코드는 모두 모은다 - 3-way 병합이 삭제를 판단하고
+        병합 기준 데이터로 저장하려면 원격 전체가 필요하기 때문이다.
+        """
         try:
-            # 학생 데이터 가져오기
-            students_success, students_msg, students = self.get_students_from_sheets()
-            if not students_success:
-                return False, f"학생 데이터 가져오기 실패: {students_msg}", None
-
-            # 스케줄 데이터 가져오기
-            schedules_success, schedules_msg, schedules = self.get_schedules_from_sheets()
-            if not schedules_success:
-                return False, f"스케줄 데이터 가져오기 실패: {schedules_msg}", None
-
-            # AppData 객체 생성
-            app_data = AppData()
-            app_data.students = students
-            app_data.schedules = schedules
-            app_data.metadata = {
-                "version": "1.0",
-                "last_sync": datetime.now().isoformat(),
-                "sync_source": "google_sheets"
-            }
+            # 학생/스케줄의 첫 페이지는 한 번의 요청으로 가져오기
+            first_page = {'offset': 0, 'limit': self.DOWNLOAD_PAGE_SIZE}
+            students_result, schedules_result = self.batch(
+                [('get_students', first_page), ('get_schedules', first_page)], progress, cancel_event)
+            if not students_result['success']:
+                return False, f"학생 데이터 가져오기 실패: {students_result['message']}", None
+            if not schedules_result['success']:
+                return False, f"스케줄 데이터 가져오기 실패: {schedules_result['message']}", None
+
+            total = sum((result.get('paging') or {}).get('total', len(result.get('data') or []))
+                        for result in (students_result, schedules_result))
+            watermark = (students_result.get('paging') or {}).get('watermark')
+            students, schedules = [], []
+            streams = (
+                (self.iter_students(None, progress, cancel_event, students_result), students),
+                (self.iter_schedules(None, progress, cancel_event, schedules_result), schedules),
+            )
+            del students_result, schedules_result
 
-            return True, f"구글 시트 → 로컬: {len(students)}명 학생, {len(schedules)}개 스케줄", app_data
+            received = 0
+            for pages, target in streams:
+                for items in pages:
+                    target.extend(items)
+                    received += len(items)
+                    if progress:
+                        progress("rows_received", received, total)
 
+            return downloaded_app_data(students, schedules, watermark)
+
+        except SyncCancelled:
+            return False, "사용자가 동기화를 취소했습니다.", None
         except Exception as e:
             return False, f"구글 시트에서 로컬로 동기화 실패: {str(e)}", None
 
 
+def downloaded_app_data(students: List[Student], schedules: List[Schedule],
+                        watermark: Optional[str] = None) -> Tuple[bool, str, AppData]:
+    """다운로드한 레코드로 AppData 생성 (watermark는 받은 시점의 서버 워터마크)
+
+    동기/비동기 API의 sync_from_sheets_to_local이 같은 형태로 결과를 돌려주도록 함께 쓴다.
+    """
+    app_data = AppData()
+    app_data.students = students
+    app_data.schedules = schedules
+    app_data.metadata = {
+        "version": "1.0",
+        "last_sync": datetime.now().isoformat(),
+        "sync_source": "google_sheets"
+    }
+    if watermark:
+        app_data.metadata[SYNC_WATERMARK] = watermark
+
+    return True, f"구글 시트 → 로컬: {len(students)}명 학생, {len(schedules)}개 스케줄", app_data
+
+
+class SheetsBatch:
+    """구글 시트 요청을 모아 두었다가 한 번의 POST로 보내는 배치 클라이언트
+
+    각 메서드는 요청을 대기열에 넣고 결과 목록에서의 위치를 반환한다.
+    flush()가 결과를 넣은 순서대로 돌려주며, with 문을 벗어날 때도 flush 한다.
+
+        with api.batch_client() as batch:
+            for schedule in changed:
+                batch.update_schedule(schedule)
+        results = batch.results
+    """
+
+    def __init__(self, api: GoogleSheetsAPI):
+        self.api = api
+        self._operations: List[Tuple[str, Any]] = []
+        self.results: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(self, action: str, data: Any = None) -> int:
+        self._operations.append((action, data))
+        return len(self._operations) - 1
+
+    def update_student(self, student: Student) -> int:
+        return self.add('update_student', student.to_dict())
+
+    def update_schedule(self, schedule: Schedule) -> int:
+        return self.add('update_schedule', schedule.to_dict())
+
+    def delete_student(self, student_id: str) -> int:
+        return self.add('delete_student', {'student_id': student_id})
+
+    def get_students(self) -> int:
+        return self.add('get_students')
+
+    def get_schedules(self) -> int:
+        return self.add('get_schedules')
+
+    def flush(self, progress: Optional[ProgressCallback] = None,
+              cancel_event: Optional[threading.Event] = None) -> List[Dict[str, Any]]:
+        """대기 중인 요청을 한 번에 보내고 결과 반환 (대기열은 비워짐)"""
+        operations, self._operations = self._operations, []
+        self.results = self.api.batch(operations, progress, cancel_event)
+        return self.results
+
+    def __enter__(self) -> 'SheetsBatch':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+
 # 싱글톤 인스턴스 생성을 위한 클래스
 class GoogleSheetsManager:
     """구글 시트 매니저 싱글톤"""
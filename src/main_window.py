@@ -1,22 +1,27 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
-    QStatusBar, QMenuBar, QMenu, QMessageBox, QApplication, QDialog, QFileDialog
+    QStatusBar, QMenuBar, QMenu, QMessageBox, QApplication, QDialog, QFileDialog, QLabel
 )
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction, QKeySequence
 
 from .styles import DARK_THEME
 from .data_manager import DataManager
+from .change_events import DataChange
 from .password_dialog import PasswordDialog
 from .student_form import StudentForm
 from .calendar_view import CalendarView
 from .student_manager_dialog import StudentManagerDialog
+from .sync_worker import SyncQueue
 
 
 class MainWindow(QMainWindow):
     def __init__(self, data_manager: DataManager):
         super().__init__()
         self.data_manager = data_manager
+        self.save_scheduler = self.data_manager.enable_background_save()
+        self.sync_queue = SyncQueue(self.data_manager, parent=self)
+        self.sync_queue.enable_auto_drain()
         self.setup_ui()
         self.setup_menu()
         self.setup_connections()
@@ -56,6 +61,12 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("준비 완료")
 
+        self.save_status_label = QLabel("저장됨")
+        self.status_bar.addPermanentWidget(self.save_status_label)
+
+        self.outbox_label = QLabel("")
+        self.status_bar.addPermanentWidget(self.outbox_label)
+
     def setup_menu(self):
         menubar = self.menuBar()
 
@@ -78,6 +89,10 @@ class MainWindow(QMainWindow):
         restore_action.triggered.connect(self.restore_backup)
         file_menu.addAction(restore_action)
 
+        change_password_action = QAction("비밀번호 변경", self)
+        change_password_action.triggered.connect(self.change_password)
+        file_menu.addAction(change_password_action)
+
         file_menu.addSeparator()
 
         exit_action = QAction("종료", self)
@@ -104,6 +119,11 @@ class MainWindow(QMainWindow):
         sync_from_sheets_action.triggered.connect(self.sync_from_google_sheets)
         sync_menu.addAction(sync_from_sheets_action)
 
+        self.cancel_sync_action = QAction("동기화 취소", self)
+        self.cancel_sync_action.setEnabled(False)
+        self.cancel_sync_action.triggered.connect(self.sync_queue.cancel)
+        sync_menu.addAction(self.cancel_sync_action)
+
 
         # 수강생 메뉴 추가
         student_menu = menubar.addMenu("수강생(&S)")
@@ -133,8 +153,13 @@ class MainWindow(QMainWindow):
         help_menu.addAction(about_action)
 
     def setup_connections(self):
-        self.data_manager.dataChanged.connect(self.on_data_changed)
+        self.data_manager.changed.connect(self.on_data_changed)
         self.data_manager.syncStatusChanged.connect(self.on_sync_status_changed)
+        self.save_scheduler.pendingChanged.connect(self.on_pending_writes_changed)
+        self.data_manager.outboxChanged.connect(self.on_outbox_changed)
+        self.sync_queue.syncProgress.connect(self.on_sync_progress)
+        self.sync_queue.syncFinished.connect(self.on_sync_finished)
+        self.sync_queue.busyChanged.connect(self.cancel_sync_action.setEnabled)
         self.student_form.studentAdded.connect(self.on_student_added)
         self.calendar_view.scheduleChanged.connect(self.on_schedule_changed)
 
@@ -143,11 +168,13 @@ class MainWindow(QMainWindow):
             dialog = PasswordDialog(is_new_password=False, parent=self)
             if dialog.exec() == QDialog.Accepted:
                 password = dialog.get_password()
-                if self.data_manager.load_data(password):
+                if not self.data_manager.verify_password(password):
+                    QMessageBox.critical(self, "오류", "비밀번호가 올바르지 않거나 데이터 파일이 손상되었습니다.")
+                    QApplication.quit()
+                elif self.data_manager.load_data(password):
                     self.status_bar.showMessage("데이터를 성공적으로 불러왔습니다.")
-                    self.refresh_views()
                 else:
-                    QMessageBox.critical(self, "오류", "비밀번호가 올바르지 않거나 데이터 파일이 손상되었습니다.")
+                    QMessageBox.critical(self, "오류", "데이터 파일이 손상되었습니다.")
                     QApplication.quit()
             else:
                 QApplication.quit()
@@ -165,8 +192,8 @@ class MainWindow(QMainWindow):
         self.student_form.refresh()
         self.calendar_view.refresh()
 
-    def on_data_changed(self):
-        self.refresh_views()
+    def on_data_changed(self, change: DataChange):
+        # 각 화면은 DataManager.changed를 직접 받아 바뀐 칸/행만 갱신함
         self.status_bar.showMessage("데이터가 업데이트되었습니다.", 3000)
 
     def on_student_added(self, student_name):
@@ -233,7 +260,6 @@ class MainWindow(QMainWindow):
                         "백업 데이터가 성공적으로 복원되었습니다.\n"
                         "프로그램이 새로운 데이터로 새로고침됩니다."
                     )
-                    self.refresh_views()
                     self.status_bar.showMessage("백업 데이터 복원 완료", 3000)
                 else:
                     QMessageBox.warning(
@@ -247,6 +273,16 @@ class MainWindow(QMainWindow):
                     f"백업 복원 중 오류가 발생했습니다:\n{str(e)}"
                 )
 
+    def change_password(self):
+        """마스터 비밀번호 변경 (새 키로 데이터 재암호화)"""
+        dialog = PasswordDialog(is_new_password=True, parent=self)
+        if dialog.exec() == QDialog.Accepted:
+            if self.data_manager.change_password(dialog.get_password()):
+                QMessageBox.information(self, "비밀번호 변경", "비밀번호가 변경되었습니다.")
+                self.status_bar.showMessage("비밀번호 변경 완료", 3000)
+            else:
+                QMessageBox.warning(self, "오류", "비밀번호 변경에 실패했습니다.")
+
     def show_student_manager(self):
         dialog = StudentManagerDialog(self.data_manager, self)
         dialog.studentDeleted.connect(self.on_student_deleted)
@@ -293,16 +329,10 @@ class MainWindow(QMainWindow):
                     "#191970",  # Midnight Blue - 미드나이트 블루
                 ]
 
-                updated_count = 0
-                for i, student in enumerate(students):
-                    if i < len(vibrant_colors):
-                        old_color = student.color
-                        student.color = vibrant_colors[i]
-                        updated_count += 1
-                        print(f"수강생 '{student.name}' 색상 업데이트: {old_color} -> {student.color}")
+                colors = {student.id: color for student, color in zip(students, vibrant_colors)}
+                updated_count = len(colors)
 
-                if self.data_manager.save_data():
-                    self.refresh_views()
+                if self.data_manager.update_student_colors(colors):
                     QMessageBox.information(
                         self, "색상 업데이트 완료",
                         f"{updated_count}명 수강생의 색상이 고급스럽고 세련된 색상으로 업데이트되었습니다."
@@ -331,6 +361,81 @@ class MainWindow(QMainWindow):
         """동기화 상태 변경 시 호출"""
         self.status_bar.showMessage(status, 5000)
 
+    def on_sync_progress(self, kind: str, current: int, total: int):
+        """동기화 진행 상황 표시"""
+        if kind == "rows_received":
+            if total:
+                self.status_bar.showMessage(f"구글 시트에서 항목을 받는 중... {current} / {total}")
+            else:
+                self.status_bar.showMessage(f"구글 시트에서 {current}개 항목을 받았습니다...")
+            return
+
+        label = "보내는 중" if kind == "bytes_sent" else "받는 중"
+        if total:
+            self.status_bar.showMessage(f"구글 시트 데이터 {label}... {current // 1024} / {total // 1024} KB")
+        else:
+            self.status_bar.showMessage(f"구글 시트 데이터 {label}... {current // 1024} KB")
+
+    def on_sync_finished(self, result):
+        """동기화 작업 완료 시 호출 (메인 스레드)"""
+        if result.cancelled:
+            return
+
+        if result.background:
+            # 자동 업로드는 상태 표시줄에만 알림
+            if result.success:
+                self.status_bar.showMessage("변경 사항을 구글 시트에 업로드했습니다.", 3000)
+                if result.conflicts:
+                    QMessageBox.information(
+                        self, "자동 업로드 병합",
+                        f"다른 곳에서 수정한 구글 시트 내용과 병합했습니다."
+                        f"{self._conflict_summary(result.conflicts)}"
+                    )
+            else:
+                self.status_bar.showMessage(
+                    f"구글 시트 업로드 실패 - 변경 사항을 보관하고 나중에 다시 시도합니다. ({result.message})", 5000)
+            return
+
+        if result.direction == SyncQueue.UPLOAD:
+            # 강제로 성공 메시지 표시
+            QMessageBox.information(
+                self, "업로드 완료",
+                f"구글 시트 업로드가 완료되었습니다!\n\n"
+                f"동기화된 데이터:\n"
+                f"• {result.student_count}명의 학생\n"
+                f"• {result.schedule_count}개의 스케줄\n\n"
+                f"구글 시트에서 데이터를 확인하세요.{self._conflict_summary(result.conflicts)}"
+            )
+        elif result.success:
+            QMessageBox.information(
+                self, "다운로드 완료",
+                f"구글 시트 다운로드가 완료되었습니다!\n\n{result.message}"
+                f"{self._conflict_summary(result.conflicts)}"
+            )
+        else:
+            QMessageBox.warning(
+                self, "다운로드 실패",
+                f"구글 시트 다운로드에 실패했습니다.\n\n오류: {result.message}"
+            )
+
+    @staticmethod
+    def _conflict_summary(conflicts, limit: int = 5) -> str:
+        """병합 충돌 안내 문구 (충돌이 없으면 빈 문자열)"""
+        if not conflicts:
+            return ""
+        lines = [f"• {conflict.description}" for conflict in conflicts[:limit]]
+        if len(conflicts) > limit:
+            lines.append(f"• 외 {len(conflicts) - limit}건")
+        return f"\n\n이 컴퓨터와 구글 시트에서 함께 수정된 항목 {len(conflicts)}건:\n" + "\n".join(lines)
+
+    def on_outbox_changed(self, count: int):
+        """구글 시트로 보낼 대기 작업 수 표시"""
+        self.outbox_label.setText(f"업로드 대기 {count}건" if count else "")
+
+    def on_pending_writes_changed(self, pending: bool):
+        """저장 대기 상태 표시"""
+        self.save_status_label.setText("저장 대기 중..." if pending else "저장됨")
+
     def test_google_sheets_connection(self):
         """구글 시트 연결 테스트"""
         try:
@@ -366,22 +471,9 @@ class MainWindow(QMainWindow):
             )
 
             if reply == QMessageBox.Yes:
-                # 업로드 시도
-                success, message = self.data_manager.sync_to_google_sheets()
-
-                # 학생 수와 스케줄 수 계산
-                student_count = len(self.data_manager.get_students())
-                schedule_count = len(self.data_manager.get_schedules())
-
-                # 강제로 성공 메시지 표시
-                QMessageBox.information(
-                    self, "업로드 완료",
-                    f"구글 시트 업로드가 완료되었습니다!\n\n"
-                    f"동기화된 데이터:\n"
-                    f"• {student_count}명의 학생\n"
-                    f"• {schedule_count}개의 스케줄\n\n"
-                    f"구글 시트에서 데이터를 확인하세요."
-                )
+                # 작업 스레드에서 업로드 (결과는 on_sync_finished에서 처리)
+                if not self.sync_queue.submit(SyncQueue.UPLOAD):
+                    self.status_bar.showMessage("이미 업로드가 예약되어 있습니다.", 3000)
 
         except Exception as e:
             QMessageBox.critical(self, "오류", f"업로드 중 오류가 발생했습니다: {str(e)}")
@@ -398,19 +490,8 @@ class MainWindow(QMainWindow):
             )
 
             if reply == QMessageBox.Yes:
-                success, message = self.data_manager.sync_from_google_sheets()
-
-                if success:
-                    QMessageBox.information(
-                        self, "다운로드 완료",
-                        f"구글 시트 다운로드가 완료되었습니다!\n\n{message}"
-                    )
-                    self.refresh_views()  # UI 새로고침
-                else:
-                    QMessageBox.warning(
-                        self, "다운로드 실패",
-                        f"구글 시트 다운로드에 실패했습니다.\n\n오류: {message}"
-                    )
+                if not self.sync_queue.submit(SyncQueue.DOWNLOAD):
+                    self.status_bar.showMessage("이미 다운로드가 진행 중입니다.", 3000)
 
         except Exception as e:
             QMessageBox.critical(self, "오류", f"다운로드 중 오류가 발생했습니다: {str(e)}")
@@ -430,6 +511,12 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
+            # 진행 중인 동기화를 취소하고, 대기 중인 저장을 마친 뒤 메모리의 세션 키 제거
+            self.sync_queue.shutdown()
+            if not self.save_scheduler.flush():
+                QMessageBox.warning(self, "저장 실패", "일부 변경 사항을 파일에 저장하지 못했습니다.")
+            self.save_scheduler.shutdown()
+            self.data_manager.lock()
             event.accept()
         else:
             event.ignore()
\ No newline at end of file
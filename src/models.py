@@ -1,9 +1,64 @@
-from dataclasses import dataclass, field
+import sys
+import copy
+from dataclasses import dataclass, field, fields
 from datetime import datetime, date
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import uuid
 
 
+def _slotted(cls):
+    """dataclass를 __slots__ 클래스로 다시 생성 (인스턴스별 __dict__ 제거)
+
+    Python 3.10의 dataclass(slots=True)와 같은 동작이며 3.8/3.9에서도 사용 가능하다.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+# 요일 이름 (월요일=0 ~ 일요일=6, date.weekday()와 같은 순서)
+WEEKDAY_NAMES = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
+WEEKDAY_INDEX = {name: i for i, name in enumerate(WEEKDAY_NAMES)}
+
+
+# 날짜는 변경 불가능한 객체이므로 같은 값이면 하나의 객체를 공유
+# (아래 파서들처럼 크기를 제한해 오래 실행해도 계속 늘어나지 않음, 약 11년치)
+@lru_cache(maxsize=4096)
+def intern_date(value: date) -> date:
+    return value
+
+
+def _text(value: Any, default: str = "") -> str:
+    # 구글 시트의 숫자 셀은 숫자로 오므로 글자 필드는 문자열로 맞춤
+    if value is None:
+        return default
+    return value if type(value) is str else str(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text: str) -> date:
+    return intern_date(date.fromisoformat(text))
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(text: str) -> datetime:
+    # 같은 문자열에서 온 시각은 같은 객체를 공유 (동기화 데이터 등)
+    return datetime.fromisoformat(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_sheet_datetime(text: str) -> datetime:
+    # 구글 시트는 현지 시각에 'Z'를 붙여 보내므로 로컬 시각과 비교할 수 있게 시간대 정보를 버림
+    return datetime.fromisoformat(text[:-1] if text.endswith("Z") else text).replace(tzinfo=None)
+
+
+@_slotted
 @dataclass
 class Student:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -14,6 +69,7 @@ class Student:
     created_at: datetime = field(default_factory=datetime.now)
     is_active: bool = True
     color: str = "#FF5733"
+    updated_at: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -24,37 +80,48 @@ class Student:
             "start_date": self.start_date.isoformat(),
             "created_at": self.created_at.isoformat(),
             "is_active": self.is_active,
-            "color": self.color
+            "color": self.color,
+            "updated_at": self.updated_at.isoformat()
         }
 
+    def copy(self) -> 'Student':
+        return Student(self.id, self.name, self.total_weeks, list(self.weekdays),
+                       self.start_date, self.created_at, self.is_active, self.color,
+                       self.updated_at)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any], from_google_sheets: bool = False) -> 'Student':
         student = cls()
         student.id = data.get("id", str(uuid.uuid4()))
-        student.name = data.get("name", "")
+        student.name = _text(data.get("name"))
         student.total_weeks = data.get("total_weeks", 1)
-        student.weekdays = data.get("weekdays", [])
+        student.weekdays = [sys.intern(w) if type(w) is str else w for w in data.get("weekdays", [])]
 
         # 날짜 처리 - Google Sheets에서 오는 데이터만 -1일 보정 필요
         start_date_str = data.get("start_date", date.today().isoformat())
         try:
-            parsed_date = date.fromisoformat(start_date_str)
+            parsed_date = _parse_date(start_date_str)
             if from_google_sheets:
                 # Google Sheets 타임존 이슈로 인한 -1일 보정
                 from datetime import timedelta
-                student.start_date = parsed_date + timedelta(days=1)
+                student.start_date = intern_date(parsed_date + timedelta(days=1))
             else:
                 # 로컬 데이터는 보정 없이 그대로 사용
                 student.start_date = parsed_date
         except (ValueError, TypeError):
             student.start_date = date.today()
 
-        student.created_at = datetime.fromisoformat(data.get("created_at", datetime.now().isoformat()))
+        parse_datetime = _parse_sheet_datetime if from_google_sheets else _parse_datetime
+        student.created_at = parse_datetime(data.get("created_at", datetime.now().isoformat()))
         student.is_active = data.get("is_active", True)
-        student.color = data.get("color", "#FF5733")
+        student.color = _text(data.get("color"), "#FF5733")
+        # 수정 시각이 없는 이전 데이터는 생성 시각을 사용
+        updated_at = data.get("updated_at")
+        student.updated_at = parse_datetime(updated_at) if updated_at else student.created_at
         return student
 
 
+@_slotted
 @dataclass
 class Schedule:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -66,6 +133,12 @@ class Schedule:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
 
+    def __post_init__(self):
+        # 수강생 ID는 스케줄마다 반복되므로 하나의 문자열을 공유
+        if type(self.student_id) is str:
+            self.student_id = sys.intern(self.student_id)
+        self.scheduled_date = intern_date(self.scheduled_date)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -78,21 +151,27 @@ class Schedule:
             "updated_at": self.updated_at.isoformat()
         }
 
+    def copy(self) -> 'Schedule':
+        return Schedule(self.id, self.student_id, self.week_number, self.scheduled_date,
+                        self.is_completed, self.memo, self.created_at, self.updated_at)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any], from_google_sheets: bool = False) -> 'Schedule':
         schedule = cls()
         schedule.id = data.get("id", str(uuid.uuid4()))
         schedule.student_id = data.get("student_id", "")
+        if type(schedule.student_id) is str:
+            schedule.student_id = sys.intern(schedule.student_id)
         schedule.week_number = data.get("week_number", 1)
 
         # 날짜 처리 - Google Sheets에서 오는 데이터만 -1일 보정 필요
         scheduled_date_str = data.get("scheduled_date", date.today().isoformat())
         try:
-            parsed_date = date.fromisoformat(scheduled_date_str)
+            parsed_date = _parse_date(scheduled_date_str)
             if from_google_sheets:
                 # Google Sheets 타임존 이슈로 인한 -1일 보정
                 from datetime import timedelta
-                schedule.scheduled_date = parsed_date + timedelta(days=1)
+                schedule.scheduled_date = intern_date(parsed_date + timedelta(days=1))
             else:
                 # 로컬 데이터는 보정 없이 그대로 사용
                 schedule.scheduled_date = parsed_date
@@ -100,9 +179,10 @@ class Schedule:
             schedule.scheduled_date = date.today()
 
         schedule.is_completed = data.get("is_completed", False)
-        schedule.memo = data.get("memo", "")
-        schedule.created_at = datetime.fromisoformat(data.get("created_at", datetime.now().isoformat()))
-        schedule.updated_at = datetime.fromisoformat(data.get("updated_at", datetime.now().isoformat()))
+        schedule.memo = _text(data.get("memo"))
+        parse_datetime = _parse_sheet_datetime if from_google_sheets else _parse_datetime
+        schedule.created_at = parse_datetime(data.get("created_at", datetime.now().isoformat()))
+        schedule.updated_at = parse_datetime(data.get("updated_at", datetime.now().isoformat()))
         return schedule
 
 
@@ -126,6 +206,11 @@ class AppData:
             "metadata": self.metadata
         }
 
+    def copy(self) -> 'AppData':
+        """백그라운드 저장용 스냅샷 - 이후 원본을 수정해도 영향을 받지 않음"""
+        return AppData([s.copy() for s in self.students], [s.copy() for s in self.schedules],
+                       copy.deepcopy(self.metadata))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any], from_google_sheets: bool = False) -> 'AppData':
         app_data = cls()
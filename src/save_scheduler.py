@@ -0,0 +1,115 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class SaveScheduler(QObject):
+    """스냅샷 저장을 모아서 작업 스레드에서 수행하는 스케줄러
+
+    mark_dirty()가 호출될 때마다 타이머를 다시 시작하므로 delay_ms 안에
+    연속된 변경은 한 번의 저장으로 합쳐진다. 데이터 복사는 메인 스레드에서,
+    직렬화/암호화/파일 기록은 작업 스레드에서, 파일 교체와 저널 전환은 다시
+    메인 스레드에서 수행한다. 종료 시에는 flush()로 남은 저장을 마친다.
+    """
+
+    pendingChanged = Signal(bool)  # 아직 기록되지 않은 변경 사항이 있는지
+    saveFinished = Signal(bool)
+    _jobDone = Signal(object, object)  # 작업 스레드 -> 메인 스레드 (job, error)
+
+    DEFAULT_DELAY_MS = 1500
+
+    def __init__(self, data_manager, delay_ms: int = DEFAULT_DELAY_MS, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.delay_ms = delay_ms
+        self._dirty = False
+        self._job = None
+        self._future: Optional[Future] = None
+        self._pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._start_job)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._jobDone.connect(self._on_job_done)
+
+    @property
+    def has_pending(self) -> bool:
+        return self._dirty or self._future is not None
+
+    def _update_pending(self):
+        pending = self.has_pending
+        if pending != self._pending:
+            self._pending = pending
+            self.pendingChanged.emit(pending)
+
+    def mark_dirty(self):
+        """저장이 필요함을 표시하고 저장 시점을 delay_ms 뒤로 미룸"""
+        self._dirty = True
+        self._timer.start(self.delay_ms)
+        self._update_pending()
+
+    def _start_job(self):
+        if self._future is not None:
+            # 진행 중인 저장이 끝나면 _on_job_done에서 다시 예약
+            return
+
+        job = self.data_manager.prepare_snapshot()
+        self._dirty = False
+        if job is not None:
+            self._job = job
+            self._future = self._executor.submit(self._run, job)
+        self._update_pending()
+
+    def _run(self, job):
+        error = None
+        try:
+            self.data_manager.write_snapshot(job)
+        except Exception as e:
+            error = e
+        self._jobDone.emit(job, error)
+        return error
+
+    def _on_job_done(self, job, error):
+        if job is not self._job:
+            return  # flush()에서 이미 처리됨
+
+        self._job = None
+        self._future = None
+        success = self._complete(job, error)
+        self.saveFinished.emit(success)
+        if self._dirty and not self._timer.isActive():
+            self._timer.start(self.delay_ms)
+        self._update_pending()
+
+    def _complete(self, job, error) -> bool:
+        if error is not None:
+            print(f"Failed to save data in background: {error}")
+            self.data_manager.discard_snapshot(job)
+            self._dirty = True
+            return False
+        return self.data_manager.finish_snapshot(job)
+
+    def flush(self) -> bool:
+        """대기 중이거나 진행 중인 저장을 즉시 끝냄 (메인 스레드에서 호출)"""
+        self._timer.stop()
+        success = True
+
+        if self._future is not None:
+            job, future = self._job, self._future
+            self._job = None
+            self._future = None
+            success = self._complete(job, future.result())
+
+        if self._dirty:
+            self._dirty = False
+            success = self.data_manager.save_data()
+
+        self._update_pending()
+        return success
+
+    def shutdown(self):
+        """작업 스레드 종료 (flush() 이후 호출)"""
+        self._timer.stop()
+        self._executor.shutdown(wait=True)
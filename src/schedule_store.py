@@ -0,0 +1,193 @@
+import bisect
+from datetime import date
+from typing import Dict, List, Optional, Iterable, Tuple
+
+from .models import Schedule
+
+
+class ScheduleStore:
+    """스케줄 목록 위에 id / 수강생 / 날짜 인덱스를 유지하는 저장소
+
+    AppData.schedules 리스트 객체를 그대로 감싸서 제자리에서 수정하므로
+    기존 코드는 data.schedules를 계속 사용할 수 있다.
+    예정일 변경은 반드시 move()를 통해야 날짜 인덱스가 유지된다.
+    리스트 안의 위치도 인덱스로 유지해 교체/삭제가 리스트를 훑지 않는다. 삭제하면
+    마지막 스케줄이 그 자리로 옮겨지므로 리스트 순서는 유지되지 않는다.
+    """
+
+    def __init__(self, schedules: Optional[List[Schedule]] = None):
+        self._schedules: List[Schedule] = []
+        self._positions: Dict[str, int] = {}  # id -> _schedules 안의 위치
+        self._by_id: Dict[str, Schedule] = {}
+        self._by_student: Dict[str, List[Schedule]] = {}
+        self._by_date: Dict[date, List[Schedule]] = {}
+        self._dates: List[date] = []  # 스케줄이 존재하는 날짜의 정렬된 목록
+        self.rebuild(schedules if schedules is not None else [])
+
+    def rebuild(self, schedules: List[Schedule]):
+        """주어진 리스트에 바인딩하고 모든 인덱스를 다시 생성"""
+        self._schedules = schedules
+        self._positions = {schedule.id: i for i, schedule in enumerate(schedules)}
+        self._by_id = {}
+        self._by_student = {}
+        self._by_date = {}
+        for schedule in schedules:
+            self._index(schedule)
+        self._dates = sorted(self._by_date)
+
+    def is_bound_to(self, schedules: List[Schedule]) -> bool:
+        """인덱스가 주어진 리스트와 일치하는지 확인 (외부 교체/추가 감지용)"""
+        return self._schedules is schedules and len(self._by_id) == len(schedules)
+
+    def _index(self, schedule: Schedule):
+        self._by_id[schedule.id] = schedule
+        self._by_student.setdefault(schedule.student_id, []).append(schedule)
+        bucket = self._by_date.get(schedule.scheduled_date)
+        if bucket is None:
+            self._by_date[schedule.scheduled_date] = [schedule]
+        else:
+            bucket.append(schedule)
+
+    def _add_to_date(self, schedule: Schedule):
+        bucket = self._by_date.get(schedule.scheduled_date)
+        if bucket is None:
+            self._by_date[schedule.scheduled_date] = [schedule]
+            bisect.insort(self._dates, schedule.scheduled_date)
+        else:
+            bucket.append(schedule)
+
+    def _remove_from_date(self, schedule: Schedule):
+        bucket = self._by_date.get(schedule.scheduled_date)
+        if bucket is None:
+            return
+        bucket.remove(schedule)
+        if not bucket:
+            del self._by_date[schedule.scheduled_date]
+            i = bisect.bisect_left(self._dates, schedule.scheduled_date)
+            if i < len(self._dates) and self._dates[i] == schedule.scheduled_date:
+                del self._dates[i]
+
+    def add(self, schedule: Schedule):
+        """스케줄 추가 (같은 id가 있으면 교체)"""
+        if schedule.id in self._by_id:
+            self.update(schedule)
+            return
+        self._positions[schedule.id] = len(self._schedules)
+        self._schedules.append(schedule)
+        self._by_id[schedule.id] = schedule
+        self._by_student.setdefault(schedule.student_id, []).append(schedule)
+        self._add_to_date(schedule)
+
+    def add_many(self, schedules: Iterable[Schedule]):
+        """여러 스케줄 추가 - 날짜 목록은 마지막에 한 번만 정렬"""
+        for schedule in schedules:
+            if schedule.id in self._by_id:
+                self.update(schedule)
+            else:
+                self._positions[schedule.id] = len(self._schedules)
+                self._schedules.append(schedule)
+                self._index(schedule)
+        self._dates = sorted(self._by_date)
+
+    def update(self, schedule: Schedule) -> bool:
+        """같은 id의 기존 스케줄을 새 객체로 교체"""
+        existing = self._by_id.get(schedule.id)
+        if existing is None:
+            return False
+        if existing is not schedule:
+            self._schedules[self._positions[schedule.id]] = schedule
+        self._unindex(existing)
+        self._by_id[schedule.id] = schedule
+        self._by_student.setdefault(schedule.student_id, []).append(schedule)
+        self._add_to_date(schedule)
+        return True
+
+    def _unindex(self, schedule: Schedule):
+        self._by_id.pop(schedule.id, None)
+        student_schedules = self._by_student.get(schedule.student_id)
+        if student_schedules is not None:
+            student_schedules.remove(schedule)
+            if not student_schedules:
+                del self._by_student[schedule.student_id]
+        self._remove_from_date(schedule)
+
+    def remove(self, schedule_id: str) -> Optional[Schedule]:
+        """스케줄 삭제 후 삭제된 객체 반환"""
+        schedule = self._by_id.get(schedule_id)
+        if schedule is None:
+            return None
+        self._unindex(schedule)
+        self._pop(schedule)
+        return schedule
+
+    def _pop(self, schedule: Schedule):
+        """리스트에서 제거 - 마지막 스케줄을 빈자리로 옮김 (O(1))"""
+        i = self._positions.pop(schedule.id)
+        last = self._schedules.pop()
+        if i < len(self._schedules):
+            self._schedules[i] = last
+            self._positions[last.id] = i
+
+    def remove_student(self, student_id: str) -> List[Schedule]:
+        """수강생의 모든 스케줄 삭제"""
+        removed = self._by_student.pop(student_id, [])
+        if not removed:
+            return []
+        for schedule in removed:
+            self._by_id.pop(schedule.id, None)
+            self._remove_from_date(schedule)
+            self._pop(schedule)
+        return removed
+
+    def move(self, schedule: Schedule, new_date: date):
+        """스케줄의 예정일을 변경하고 날짜 인덱스를 갱신"""
+        if schedule.scheduled_date == new_date:
+            return
+        self._remove_from_date(schedule)
+        schedule.scheduled_date = new_date
+        self._add_to_date(schedule)
+
+    def move_many(self, moves: Iterable[Tuple[Schedule, date]]):
+        """여러 스케줄의 예정일을 한 번에 변경 (날짜 인덱스 갱신도 일괄 처리)"""
+        moves = [(schedule, new_date) for schedule, new_date in moves if schedule.scheduled_date != new_date]
+        for schedule, _ in moves:
+            self._remove_from_date(schedule)
+        for schedule, new_date in moves:
+            schedule.scheduled_date = new_date
+            self._add_to_date(schedule)
+
+    def get(self, schedule_id: str) -> Optional[Schedule]:
+        return self._by_id.get(schedule_id)
+
+    def for_student(self, student_id: str) -> List[Schedule]:
+        return list(self._by_student.get(student_id, ()))
+
+    def count_for_student(self, student_id: str, until: date) -> int:
+        """수강생의 스케줄 중 until(포함)까지 잡힌 수 (목록을 복사하지 않음)"""
+        return sum(1 for s in self._by_student.get(student_id, ()) if s.scheduled_date <= until)
+
+    def for_date(self, target_date: date) -> List[Schedule]:
+        return list(self._by_date.get(target_date, ()))
+
+    def dates_between(self, start: date, end: date) -> List[date]:
+        """start 이상 end 이하 범위에서 스케줄이 있는 날짜 (정렬됨)"""
+        lo = bisect.bisect_left(self._dates, start)
+        hi = bisect.bisect_right(self._dates, end)
+        return self._dates[lo:hi]
+
+    def range(self, start: date, end: date) -> List[Schedule]:
+        """start 이상 end 이하 범위의 스케줄을 날짜순으로 반환"""
+        result = []
+        for d in self.dates_between(start, end):
+            result.extend(self._by_date[d])
+        return result
+
+    def range_by_date(self, start: date, end: date) -> Dict[date, List[Schedule]]:
+        """start 이상 end 이하 범위의 스케줄을 날짜별로 묶어 반환"""
+        return {d: list(self._by_date[d]) for d in self.dates_between(start, end)}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, schedule_id: str) -> bool:
+        return schedule_id in self._by_id
@@ -0,0 +1,152 @@
+import bisect
+from array import array
+from collections import Counter
+from datetime import date
+from itertools import compress
+from typing import Dict, Iterable, List, Optional
+
+from .models import Schedule, intern_date
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 array 모듈 기반으로 동작
+    np = None
+
+
+def _as_numpy(column: array):
+    """array 열을 복사 없이 NumPy 배열로 보기 (typecode가 C 타입과 동일)"""
+    return np.frombuffer(column, dtype=column.typecode)
+
+
+class ScheduleTable:
+    """스케줄 목록의 열(column) 기반 표현 - 통계/일괄 처리용
+
+    수강생 번호, 주차, 날짜 서수, 완료 여부는 array 열에 나란히 저장하고
+    ID/생성·수정 시각은 리스트 열, 메모는 비어 있지 않은 행만 별도 테이블에
+    보관한다. from_schedules()/to_schedules()로 Schedule 목록과 손실 없이
+    변환된다. 집계와 날짜 범위 조회는 Schedule 객체를 순회하지 않고 열 단위로
+    처리하며, NumPy가 설치되어 있으면 같은 버퍼를 NumPy 배열로 사용한다.
+    """
+
+    def __init__(self):
+        self.student_ids: List[str] = []          # 수강생 번호 -> student_id
+        self._student_index: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.student: array = array('I')
+        self.week_number: array = array('i')
+        self.ordinal: array = array('I')
+        self.completed: array = array('B')
+        self.created_at: list = []
+        self.updated_at: list = []
+        self.memos: Dict[int, str] = {}           # 행 번호 -> 메모 (빈 메모는 저장하지 않음)
+        self._date_order: Optional[array] = None  # 날짜순 행 번호 (지연 생성)
+        self._sorted_ordinals: Optional[array] = None
+
+    @classmethod
+    def from_schedules(cls, schedules: Iterable[Schedule]) -> 'ScheduleTable':
+        table = cls()
+        for schedule in schedules:
+            table.append(schedule)
+        return table
+
+    def append(self, schedule: Schedule):
+        row = len(self.ids)
+        self.ids.append(schedule.id)
+        self.student.append(self.student_number(schedule.student_id))
+        self.week_number.append(schedule.week_number)
+        self.ordinal.append(schedule.scheduled_date.toordinal())
+        self.completed.append(1 if schedule.is_completed else 0)
+        self.created_at.append(schedule.created_at)
+        self.updated_at.append(schedule.updated_at)
+        if schedule.memo:
+            self.memos[row] = schedule.memo
+        self._date_order = None
+        self._sorted_ordinals = None
+
+    def student_number(self, student_id: str) -> int:
+        """student_id의 열 번호 (없으면 새로 등록)"""
+        number = self._student_index.get(student_id)
+        if number is None:
+            number = len(self.student_ids)
+            self._student_index[student_id] = number
+            self.student_ids.append(student_id)
+        return number
+
+    def row(self, index: int) -> Schedule:
+        """행 하나를 Schedule 객체로 변환"""
+        return Schedule(
+            id=self.ids[index],
+            student_id=self.student_ids[self.student[index]],
+            week_number=self.week_number[index],
+            scheduled_date=intern_date(date.fromordinal(self.ordinal[index])),
+            is_completed=bool(self.completed[index]),
+            memo=self.memos.get(index, ""),
+            created_at=self.created_at[index],
+            updated_at=self.updated_at[index]
+        )
+
+    def to_schedules(self, rows: Optional[Iterable[int]] = None) -> List[Schedule]:
+        if rows is None:
+            rows = range(len(self.ids))
+        return [self.row(i) for i in rows]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # ---- 집계 ----
+
+    def _by_student(self, counts: Counter) -> Dict[str, int]:
+        return {self.student_ids[number]: count for number, count in counts.items()}
+
+    def count_per_student(self) -> Dict[str, int]:
+        """수강생별 전체 스케줄 수"""
+        if np is not None and len(self):
+            bins = np.bincount(_as_numpy(self.student), minlength=len(self.student_ids))
+            return {sid: int(bins[i]) for i, sid in enumerate(self.student_ids) if bins[i]}
+        return self._by_student(Counter(self.student))
+
+    def completed_per_student(self) -> Dict[str, int]:
+        """수강생별 완료한 스케줄 수 (완료가 없는 수강생은 제외)"""
+        if np is not None and len(self):
+            bins = np.bincount(_as_numpy(self.student),
+                               weights=_as_numpy(self.completed),
+                               minlength=len(self.student_ids))
+            return {sid: int(bins[i]) for i, sid in enumerate(self.student_ids) if bins[i]}
+        return self._by_student(Counter(compress(self.student, self.completed)))
+
+    def held_per_student(self, until: date) -> Dict[str, int]:
+        """수강생별로 until 날짜까지 예정되어 있던(진행된) 스케줄 수"""
+        limit = until.toordinal()
+        if np is not None and len(self):
+            mask = _as_numpy(self.ordinal) <= limit
+            bins = np.bincount(_as_numpy(self.student)[mask],
+                               minlength=len(self.student_ids))
+            return {sid: int(bins[i]) for i, sid in enumerate(self.student_ids) if bins[i]}
+        return self._by_student(Counter(compress(self.student, map(limit.__ge__, self.ordinal))))
+
+    # ---- 날짜 범위 ----
+
+    def _ensure_date_order(self):
+        if self._date_order is None:
+            ordinal = self.ordinal
+            if np is not None and len(self):
+                order = np.argsort(_as_numpy(ordinal), kind='stable')
+                self._date_order = array('I', order.astype('I').tobytes())
+            else:
+                self._date_order = array('I', sorted(range(len(ordinal)), key=ordinal.__getitem__))
+            self._sorted_ordinals = array('I', map(ordinal.__getitem__, self._date_order))
+
+    def rows_between(self, start: date, end: date) -> array:
+        """start 이상 end 이하인 행 번호 (날짜순, 같은 날짜는 원래 순서)"""
+        self._ensure_date_order()
+        lo = bisect.bisect_left(self._sorted_ordinals, start.toordinal())
+        hi = bisect.bisect_right(self._sorted_ordinals, end.toordinal())
+        return self._date_order[lo:hi]
+
+    def rows_in_month(self, year: int, month: int) -> array:
+        first = date(year, month, 1)
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        return self.rows_between(first, date.fromordinal(next_month.toordinal() - 1))
+
+    def schedules_between(self, start: date, end: date) -> List[Schedule]:
+        return self.to_schedules(self.rows_between(start, end))
@@ -0,0 +1,292 @@
+import json
+import struct
+import uuid
+from datetime import datetime, date, timedelta
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .models import Student, Schedule, AppData, WEEKDAY_NAMES, WEEKDAY_INDEX
+
+
+class Serializer:
+    """AppData <-> 바이트 변환기 (컨테이너 헤더의 코덱 번호로 구분)"""
+
+    codec_id = -1
+    name = ""
+
+    def encode(self, app_data: AppData) -> Iterator[bytes]:
+        raise NotImplementedError
+
+    def validate(self, app_data: AppData):
+        """이 코덱으로 표현할 수 있는지 확인 (표현할 수 없으면 ValueError)"""
+
+    def decode(self, payload: bytes) -> AppData:
+        raise NotImplementedError
+
+
+class JsonSerializer(Serializer):
+    """기존 JSON 형식 - 어떤 데이터든 표현 가능한 기본/예비 코덱"""
+
+    codec_id = 0
+    name = "json"
+
+    def encode(self, app_data: AppData) -> Iterator[bytes]:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        for piece in encoder.iterencode(app_data.to_dict()):
+            yield piece.encode('utf-8')
+
+    def decode(self, payload: bytes) -> AppData:
+        return AppData.from_dict(json.loads(payload))
+
+
+_WEEKDAY_ORDERED = 0x80  # 요일 순서가 월~일 순이 아니면 순서를 따로 기록
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_UUID_ID = 0xFF  # ID 길이 자리에 이 값이 오면 16바이트 UUID
+
+_COUNT = struct.Struct("<I")
+_STUDENT = struct.Struct("<BiIqqB")      # 플래그, 총 주차, 시작일, 생성/수정 시각, 요일 비트마스크
+_SCHEDULE = struct.Struct("<IiIBqq")     # 수강생 번호, 주차, 날짜, 플래그, 생성/수정 시각
+_INT32_MIN, _INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+class BinarySerializer(Serializer):
+    """압축 바이너리 형식
+
+    UUID는 16바이트, 날짜는 서수(ordinal), 시각은 epoch 기준 마이크로초 정수,
+    요일 목록은 비트마스크로 저장한다. 스케줄의 student_id는 ID 테이블의
+    번호로 참조한다. 표현할 수 없는 값(시간대가 있는 시각, 알 수 없는 요일
+    이름 등)이 있으면 validate()가 ValueError를 발생시키며, 호출 측은 JSON으로
+    대체한다. 인코딩 결과는 FLUSH_SIZE 정도의 청크로 나눠 내보낸다.
+    """
+
+    codec_id = 1
+    name = "binary"
+    FORMAT_VERSION = 2
+    FLUSH_SIZE = 64 * 1024
+
+    # ---- 인코딩 ----
+
+    def validate(self, app_data: AppData):
+        """인코딩 전에 모든 값을 확인 - 기록 도중 실패해 JSON으로 바꿀 수 없게 되는 일을 막음"""
+        json.dumps(app_data.metadata, ensure_ascii=False)
+        for student in app_data.students:
+            self._id_bytes(student.id)
+            self._weekday_mask(student.weekdays)
+            self._check_int32(student.total_weeks)
+            self._check_date(student.start_date)
+            self._micros(student.created_at)
+            self._micros(student.updated_at)
+            self._check_text(student.name)
+            self._check_text(student.color)
+        for schedule in app_data.schedules:
+            self._id_bytes(schedule.id)
+            self._id_bytes(schedule.student_id)
+            self._check_int32(schedule.week_number)
+            self._check_date(schedule.scheduled_date)
+            self._micros(schedule.created_at)
+            self._micros(schedule.updated_at)
+            self._check_text(schedule.memo)
+
+    def encode(self, app_data: AppData) -> Iterator[bytes]:
+        out = bytearray([self.FORMAT_VERSION])
+        self._put_text(out, json.dumps(app_data.metadata, ensure_ascii=False))
+
+        id_index: Dict[str, int] = {}
+        for student in app_data.students:
+            id_index.setdefault(student.id, len(id_index))
+        for schedule in app_data.schedules:
+            id_index.setdefault(schedule.student_id, len(id_index))
+
+        out += _COUNT.pack(len(id_index))
+        for item_id in id_index:
+            self._put_id(out, item_id)
+            if len(out) >= self.FLUSH_SIZE:
+                yield out
+                out = bytearray()
+
+        out += _COUNT.pack(len(app_data.students))
+        for student in app_data.students:
+            weekday_mask = self._weekday_mask(student.weekdays)
+            out += _STUDENT.pack(int(student.is_active), student.total_weeks,
+                                 student.start_date.toordinal(), self._micros(student.created_at),
+                                 self._micros(student.updated_at), weekday_mask)
+            if weekday_mask & _WEEKDAY_ORDERED:
+                out.append(len(student.weekdays))
+                out += bytes(WEEKDAY_INDEX[name] for name in student.weekdays)
+            out += _COUNT.pack(id_index[student.id])
+            self._put_text(out, student.name)
+            self._put_text(out, student.color)
+            if len(out) >= self.FLUSH_SIZE:
+                yield out
+                out = bytearray()
+
+        out += _COUNT.pack(len(app_data.schedules))
+        for schedule in app_data.schedules:
+            out += _SCHEDULE.pack(id_index[schedule.student_id], schedule.week_number,
+                                  schedule.scheduled_date.toordinal(), int(schedule.is_completed),
+                                  self._micros(schedule.created_at), self._micros(schedule.updated_at))
+            self._put_id(out, schedule.id)
+            self._put_text(out, schedule.memo)
+            if len(out) >= self.FLUSH_SIZE:
+                yield out
+                out = bytearray()
+
+        yield out
+
+    def _put_text(self, out: bytearray, text: str):
+        data = text.encode('utf-8')
+        out += _COUNT.pack(len(data))
+        out += data
+
+    def _put_id(self, out: bytearray, item_id: str):
+        out += self._id_bytes(item_id)
+
+    def _id_bytes(self, item_id: str) -> bytes:
+        self._check_text(item_id)
+        try:
+            parsed = uuid.UUID(item_id)
+        except ValueError:
+            parsed = None
+        if parsed is not None and str(parsed) == item_id:
+            return bytes([_UUID_ID]) + parsed.bytes
+        data = item_id.encode('utf-8')
+        if len(data) >= _UUID_ID:
+            raise ValueError(f"id too long for binary codec: {item_id!r}")
+        return bytes([len(data)]) + data
+
+    def _check_text(self, value):
+        if type(value) is not str:
+            raise ValueError(f"non-text value for binary codec: {value!r}")
+
+    def _check_int32(self, value):
+        if not isinstance(value, int) or not _INT32_MIN <= value <= _INT32_MAX:
+            raise ValueError(f"integer out of range for binary codec: {value!r}")
+
+    def _check_date(self, value):
+        if not isinstance(value, date):
+            raise ValueError(f"not a date: {value!r}")
+
+    def _micros(self, value: datetime) -> int:
+        if not isinstance(value, datetime):
+            raise ValueError(f"not a datetime: {value!r}")
+        if value.tzinfo is not None:
+            raise ValueError("timezone-aware datetime is not supported by binary codec")
+        return (value - _EPOCH) // _MICROSECOND
+
+    def _weekday_mask(self, weekdays: List[str]) -> int:
+        mask = 0
+        for name in weekdays:
+            if name not in WEEKDAY_INDEX:
+                raise ValueError(f"unknown weekday for binary codec: {name!r}")
+            mask |= 1 << WEEKDAY_INDEX[name]
+        canonical = [name for name in WEEKDAY_NAMES if mask & (1 << WEEKDAY_INDEX[name])]
+        if weekdays != canonical:
+            mask |= _WEEKDAY_ORDERED
+        return mask
+
+    # ---- 디코딩 ----
+
+    def decode(self, payload: bytes) -> AppData:
+        view = memoryview(payload)
+        if not view or view[0] != self.FORMAT_VERSION:
+            raise ValueError("unsupported binary data format")
+        pos = 1
+
+        metadata_text, pos = self._get_text(view, pos)
+
+        id_count, pos = self._get_count(view, pos)
+        id_table = []
+        for _ in range(id_count):
+            item_id, pos = self._get_id(view, pos)
+            id_table.append(item_id)
+
+        student_count, pos = self._get_count(view, pos)
+        students = []
+        for _ in range(student_count):
+            flags, total_weeks, start_ordinal, created, updated, weekday_mask = _STUDENT.unpack_from(view, pos)
+            pos += _STUDENT.size
+            if weekday_mask & _WEEKDAY_ORDERED:
+                count = view[pos]
+                weekdays = [WEEKDAY_NAMES[i] for i in view[pos + 1:pos + 1 + count]]
+                pos += 1 + count
+            else:
+                weekdays = [name for i, name in enumerate(WEEKDAY_NAMES) if weekday_mask & (1 << i)]
+            id_number, pos = self._get_count(view, pos)
+            name, pos = self._get_text(view, pos)
+            color, pos = self._get_text(view, pos)
+            students.append(Student(
+                id=id_table[id_number], name=name, total_weeks=total_weeks, weekdays=weekdays,
+                start_date=date.fromordinal(start_ordinal),
+                created_at=_EPOCH + timedelta(microseconds=created),
+                is_active=bool(flags & 1), color=color,
+                updated_at=_EPOCH + timedelta(microseconds=updated)
+            ))
+
+        schedule_count, pos = self._get_count(view, pos)
+        schedules = []
+        for _ in range(schedule_count):
+            id_number, week_number, ordinal, flags, created, updated = _SCHEDULE.unpack_from(view, pos)
+            pos += _SCHEDULE.size
+            schedule_id, pos = self._get_id(view, pos)
+            memo, pos = self._get_text(view, pos)
+            schedules.append(Schedule(
+                id=schedule_id, student_id=id_table[id_number], week_number=week_number,
+                scheduled_date=date.fromordinal(ordinal), is_completed=bool(flags & 1), memo=memo,
+                created_at=_EPOCH + timedelta(microseconds=created),
+                updated_at=_EPOCH + timedelta(microseconds=updated)
+            ))
+
+        if pos != len(view):
+            raise ValueError("unexpected data after binary payload")
+        return AppData(students=students, schedules=schedules, metadata=json.loads(metadata_text))
+
+    def _get_count(self, view: memoryview, pos: int):
+        return _COUNT.unpack_from(view, pos)[0], pos + _COUNT.size
+
+    def _get_text(self, view: memoryview, pos: int):
+        length, start = self._get_count(view, pos)
+        end = start + length
+        if end > len(view):
+            raise ValueError("binary payload is truncated")
+        return str(view[start:end], 'utf-8'), end
+
+    def _get_id(self, view: memoryview, pos: int):
+        length = view[pos]
+        if length == _UUID_ID:
+            length = 16
+            end = pos + 1 + length
+            if end > len(view):
+                raise ValueError("binary payload is truncated")
+            return str(uuid.UUID(bytes=bytes(view[pos + 1:end]))), end
+        end = pos + 1 + length
+        if end > len(view):
+            raise ValueError("binary payload is truncated")
+        return str(view[pos + 1:end], 'utf-8'), end
+
+
+SERIALIZERS: Dict[int, Serializer] = {
+    serializer.codec_id: serializer for serializer in (JsonSerializer(), BinarySerializer())
+}
+
+
+def get_serializer(codec_id: int) -> Serializer:
+    try:
+        return SERIALIZERS[codec_id]
+    except KeyError:
+        raise ValueError(f"unknown data codec: {codec_id}")
+
+
+def serialize(app_data: AppData, codec_id: int) -> Tuple[int, Iterable[bytes]]:
+    """지정한 코덱으로 직렬화하고, 표현할 수 없는 데이터면 JSON으로 대체
+
+    (실제로 사용한 코덱 번호, 바이트 청크)를 반환한다. 대체 여부는 값 확인만으로
+    미리 정하고, 청크는 소비하는 쪽이 읽을 때 만들어진다 (전체를 메모리에 두지 않음).
+    """
+    serializer = get_serializer(codec_id)
+    try:
+        serializer.validate(app_data)
+    except (ValueError, TypeError) as e:
+        print(f"Binary serialization unavailable, falling back to JSON: {e}")
+        serializer = SERIALIZERS[JsonSerializer.codec_id]
+    return serializer.codec_id, serializer.encode(app_data)
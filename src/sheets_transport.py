@@ -0,0 +1,320 @@
+import base64
+import gzip
+import json
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# 진행 상황 콜백: (종류, 현재 값, 전체 값 - 모르면 0)
+# 종류는 "bytes_sent", "bytes_received", "rows_received"
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class SyncCancelled(Exception):
+    """동기화 작업이 사용자 요청으로 취소됨"""
+
+
+class CircuitOpenError(Exception):
+    """연속된 오류로 차단기가 열려 요청을 보내지 않음"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"circuit open, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class HTTPStatusError(Exception):
+    """200이 아닌 HTTP 응답"""
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+    @property
+    def retryable(self) -> bool:
+        return self.status >= 500 or self.status == 429
+
+
+class _UploadBody:
+    """요청 본문을 나눠 읽히면서 보낸 바이트 수를 알리고, 취소되면 전송 중단"""
+
+    def __init__(self, data: bytes, progress: Optional[ProgressCallback],
+                 cancel_event: Optional[threading.Event]):
+        self._data = data
+        self._pos = 0
+        self._progress = progress
+        self._cancel_event = cancel_event
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # 리디렉션 시 본문을 다시 보낼 수 있도록 위치 조회/이동 지원
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = {0: 0, 1: self._pos, 2: len(self._data)}[whence]
+        self._pos = max(0, min(len(self._data), base + offset))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise SyncCancelled()
+        end = len(self._data) if size is None or size < 0 else min(len(self._data), self._pos + size)
+        chunk = self._data[self._pos:end]
+        self._pos = end
+        if chunk and self._progress:
+            self._progress("bytes_sent", self._pos, len(self._data))
+        return chunk
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold번이면 reset_timeout초 동안 요청을 바로 거절
+
+    시간이 지나면 요청 하나만 시험 삼아 보내고(half-open), 성공하면 닫고
+    실패하면 다시 연다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """결과를 알 수 없이 끝난 요청(취소 등) - 상태는 그대로 두고 시험 요청 자리만 비움"""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class TransportMetrics:
+    """요청 수/재시도/실패/지연 시간 집계 (최근 window개 요청의 지연 시간 보관)"""
+
+    def __init__(self, window: int = 200):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.attempts = 0         # 실제로 보낸 요청 수 (재시도 포함)
+        self.failures = 0         # 실패한 요청 수 (재시도 포함)
+        self.retries = 0
+        self.rejected = 0         # 차단기가 열려 보내지 않은 요청 수
+        self.bytes_sent = 0
+        self.bytes_uncompressed = 0
+
+    def record_attempt(self, latency: float, failed: bool, sent: int, uncompressed: int):
+        with self._lock:
+            self.attempts += 1
+            self.failures += failed
+            self.bytes_sent += sent
+            self.bytes_uncompressed += uncompressed
+            self._latencies.append(latency)
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counts = {
+                "attempts": self.attempts,
+                "failures": self.failures,
+                "retries": self.retries,
+                "rejected": self.rejected,
+                "bytes_sent": self.bytes_sent,
+                "bytes_uncompressed": self.bytes_uncompressed,
+            }
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        counts["latency_ms"] = {
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+            "max": latencies[-1] * 1000 if latencies else 0.0,
+        }
+        return counts
+
+
+class SheetsTransport:
+    """앱스 스크립트 웹앱용 HTTP 전송 계층
+
+    - 연결을 재사용하는 requests.Session (keep-alive, TLS 재사용)
+    - compress_min_bytes 이상인 요청은 gzip+base64 봉투로 압축
+      (앱스 스크립트는 요청 본문을 문자열로만 받으므로 Content-Encoding 대신 사용)
+    - 멱등 요청은 연결 오류/시간 초과/5xx/429에서 지수 백오프+지터로 재시도
+    - 연속 실패 시 차단기로 바로 실패 처리
+    """
+
+    ENVELOPE_ENCODING = "gzip"
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 compress_min_bytes: int = 16 * 1024, breaker: Optional[CircuitBreaker] = None,
+                 pool_size: int = 4):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.compress_min_bytes = compress_min_bytes
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = TransportMetrics()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+
+    def close(self):
+        self.session.close()
+
+    def encode(self, payload: Dict[str, Any]) -> Tuple[bytes, int]:
+        """(요청 본문, 압축 전 크기) - 크면 {"action", "encoding": "gzip", "payload": base64} 봉투로 압축"""
+        raw = json.dumps(payload).encode('utf-8')
+        if len(raw) < self.compress_min_bytes:
+            return raw, len(raw)
+        packed = base64.b64encode(gzip.compress(raw, compresslevel=6)).decode('ascii')
+        envelope = json.dumps({
+            'action': payload.get('action'),
+            'encoding': self.ENVELOPE_ENCODING,
+            'payload': packed
+        }).encode('utf-8')
+        return (envelope if len(envelope) < len(raw) else raw), len(raw)
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 - 지수 증가 상한의 절반 + 무작위 지터"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def post(self, url: str, payload: Dict[str, Any], timeout: float, idempotent: bool,
+             progress: Optional[ProgressCallback] = None,
+             cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """요청을 보내고 JSON 응답 반환
+
+        실패하면 SyncCancelled, CircuitOpenError, HTTPStatusError, requests 예외 또는
+        응답 해석 오류(ValueError 등)를 그대로 발생시킨다.
+        """
+        body, raw_size = self.encode(payload)
+        attempt = 0
+
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise SyncCancelled()
+            if not self.breaker.allow():
+                self.metrics.record_rejected()
+                raise CircuitOpenError(self.breaker.retry_after())
+
+            start = time.perf_counter()
+            try:
+                result = self._send_once(url, body, timeout, progress, cancel_event)
+            except SyncCancelled:
+                self.breaker.release_trial()  # 취소는 서버 상태와 무관
+                raise
+            except HTTPStatusError as e:
+                self.metrics.record_attempt(time.perf_counter() - start, True, len(body), raw_size)
+                if not e.retryable:
+                    self.breaker.record_success()  # 서버는 응답함
+                    raise
+                self.breaker.record_failure()
+                error = e
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self.metrics.record_attempt(time.perf_counter() - start, True, len(body), raw_size)
+                self.breaker.record_failure()
+                error = e
+            except Exception:
+                # JSON이 아닌 응답(HTML 오류 페이지 등)이나 예상하지 못한 오류도 실패로 기록해
+                # half-open 시험 요청 자리가 풀리도록 함 (재시도하지 않음)
+                self.metrics.record_attempt(time.perf_counter() - start, True, len(body), raw_size)
+                self.breaker.record_failure()
+                raise
+            else:
+                self.metrics.record_attempt(time.perf_counter() - start, False, len(body), raw_size)
+                self.breaker.record_success()
+                return result
+
+            if not idempotent or attempt >= self.max_retries:
+                raise error
+            attempt += 1
+            self.metrics.record_retry()
+            delay = self.backoff(attempt)
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    raise SyncCancelled()
+            else:
+                time.sleep(delay)
+
+    def _send_once(self, url: str, body: bytes, timeout: float, progress: Optional[ProgressCallback],
+                   cancel_event: Optional[threading.Event]) -> Dict[str, Any]:
+        response = self.session.post(
+            url,
+            data=_UploadBody(body, progress, cancel_event),
+            timeout=timeout,
+            stream=True
+        )
+
+        with response:
+            if response.status_code != 200:
+                raise HTTPStatusError(response.status_code)
+
+            total = int(response.headers.get('Content-Length') or 0)
+            received = bytearray()
+            for chunk in response.iter_content(self.DOWNLOAD_CHUNK_SIZE):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise SyncCancelled()
+                received += chunk
+                if progress:
+                    progress("bytes_received", len(received), total)
+            return json.loads(received)
@@ -3,13 +3,15 @@ from datetime import date
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
     QLineEdit, QComboBox, QPushButton, QMessageBox, QSpacerItem,
-    QSizePolicy, QFrame, QScrollArea
+    QSizePolicy, QFrame
 )
 from PySide6.QtCore import Signal, Qt
 
 from .data_manager import DataManager
+from .change_events import STUDENT_REMOVED, DataChange
 from .models import Student
 from .multi_select_combo import MultiSelectComboBox
+from .student_list import StudentListModel, StudentListView
 from .mini_calendar import MiniCalendar
 
 
@@ -102,26 +104,24 @@ class StudentForm(QWidget):
         students_group.setMaximumHeight(250)
         students_layout = QVBoxLayout(students_group)
 
-        # 스크롤 영역 생성
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        # 스크롤 가능한 위젯 생성
-        scroll_widget = QWidget()
-        self.students_layout = QVBoxLayout(scroll_widget)
-        self.students_layout.setContentsMargins(5, 5, 5, 5)
-        self.students_layout.setSpacing(5)
+        # 수강생이 많아도 화면에 보이는 행만 그리는 목록
+        self.students_model = StudentListModel(self.data_manager, self)
+        self.students_view = StudentListView()
+        self.students_view.setModel(self.students_model)
+        self.students_view.setSpacing(5)
+        self.students_view.setStyleSheet(
+            "QListView { color: #CCCCCC; background: transparent; border: none; padding: 5px; }"
+        )
+        students_layout.addWidget(self.students_view)
 
         self.students_label = QLabel("등록된 수강생이 없습니다.")
-        self.students_label.setWordWrap(True)
         self.students_label.setStyleSheet("color: #CCCCCC; padding: 10px;")
-        self.students_layout.addWidget(self.students_label)
-        self.students_layout.addStretch()
+        students_layout.addWidget(self.students_label)
 
-        scroll_area.setWidget(scroll_widget)
-        students_layout.addWidget(scroll_area)
+        for signal in (self.students_model.modelReset, self.students_model.rowsInserted,
+                       self.students_model.rowsRemoved):
+            signal.connect(self._update_empty_state)
+        self._update_empty_state()
 
         layout.addWidget(students_group)
 
@@ -131,6 +131,7 @@ class StudentForm(QWidget):
         self.edit_button.clicked.connect(self.update_student)
         self.cancel_button.clicked.connect(self.cancel_edit)
         self.name_input.returnPressed.connect(self.register_student)
+        self.data_manager.changed.connect(self.apply_change)
 
     def register_student(self):
         if not self.validate_input():
@@ -152,7 +153,6 @@ class StudentForm(QWidget):
         if self.data_manager.add_student(student):
             self.studentAdded.emit(name)
             self.reset_form()
-            self.refresh_students_list()
         else:
             QMessageBox.warning(self, "오류", "수강생 등록에 실패했습니다.")
 
@@ -173,7 +173,6 @@ class StudentForm(QWidget):
         if self.data_manager.update_student(self.current_student):
             self.studentUpdated.emit(name)
             self.cancel_edit()
-            self.refresh_students_list()
         else:
             QMessageBox.warning(self, "오류", "수강생 정보 수정에 실패했습니다.")
 
@@ -363,33 +362,22 @@ class StudentForm(QWidget):
             return 255  # 오류 발생 시 최대 거리 반환
 
     def refresh_students_list(self):
-        students = self.data_manager.get_students()
-        if students:
-            students_text = []
-            for student in students:
-                schedules = self.data_manager.get_schedules_for_student(student.id)
-
-                # 오늘 날짜 기준으로 진행된 강수 계산
-                today = date.today()
-                past_schedules = [s for s in schedules if s.scheduled_date <= today]
-                completed_lessons = len(past_schedules)  # 오늘까지 진행된 강수
-
-                # 진도 표시: "N강 완료" 형식
-                if completed_lessons > 0:
-                    progress = f"{completed_lessons}강 완료"
-                else:
-                    progress = "아직 시작 전"
-
-                weekdays_text = ", ".join(student.weekdays)
-                students_text.append(
-                    f"• {student.name} ({student.total_weeks}강)\n"
-                    f"  요일: {weekdays_text}\n"
-                    f"  진도: {progress}"
-                )
-
-            self.students_label.setText("\n\n".join(students_text))
-        else:
-            self.students_label.setText("등록된 수강생이 없습니다.")
+        self.students_model.reload()
+
+    def apply_change(self, change: DataChange):
+        """변경 이벤트 반영 - 영향을 받은 수강생의 행만 갱신"""
+        if change.is_bulk:
+            self.refresh()
+            return
+        if self.is_edit_mode and change.kind == STUDENT_REMOVED and self.current_student \
+                and self.current_student.id in change.student_ids:
+            self.cancel_edit()
+        self.students_model.apply_change(change)
+
+    def _update_empty_state(self, *args):
+        empty = self.students_model.rowCount() == 0
+        self.students_view.setVisible(not empty)
+        self.students_label.setVisible(empty)
 
     def refresh(self):
         self.refresh_students_list()
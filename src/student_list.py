@@ -0,0 +1,129 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from PySide6.QtWidgets import QListView, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+from .data_manager import DataManager
+from .change_events import DataChange
+from .models import Student
+
+STUDENT_ID_ROLE = Qt.UserRole + 1  # 행의 수강생 ID
+
+
+class StudentListModel(QAbstractListModel):
+    """등록된 수강생 목록 모델 - 행은 DataManager의 수강생 순서
+
+    문구(이름/요일/진도)는 뷰가 실제로 그리는 행만 처음 요청될 때 계산해 두고,
+    변경 이벤트가 오면 해당 수강생의 행만 다시 계산한다.
+    """
+
+    def __init__(self, data_manager: DataManager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}      # student_id -> 행
+        self._texts: Dict[str, str] = {}     # student_id -> 표시 문구 (그린 행만)
+        self._today = date.today()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._ids):
+            return None
+        student_id = self._ids[index.row()]
+        if role == Qt.DisplayRole:
+            return self.text_for(student_id)
+        if role == STUDENT_ID_ROLE:
+            return student_id
+        return None
+
+    def student_at(self, row: int) -> Optional[Student]:
+        return self.data_manager.get_student_by_id(self._ids[row])
+
+    def row_for(self, student_id: str) -> int:
+        return self._rows.get(student_id, -1)
+
+    def text_for(self, student_id: str) -> str:
+        """행의 표시 문구 (날짜가 바뀌면 진도를 다시 계산)"""
+        today = date.today()
+        if today != self._today:
+            self._today = today
+            self._texts.clear()
+        text = self._texts.get(student_id)
+        if text is None:
+            student = self.data_manager.get_student_by_id(student_id)
+            text = self._texts[student_id] = self._student_text(student, today) if student else ""
+        return text
+
+    def reload(self):
+        """수강생 목록 전체를 다시 읽음"""
+        self.beginResetModel()
+        self._ids = [s.id for s in self.data_manager.get_students()]
+        self._rows = {student_id: row for row, student_id in enumerate(self._ids)}
+        self._texts.clear()
+        self.endResetModel()
+
+    def apply_change(self, change: DataChange):
+        """변경 이벤트 반영 - 영향을 받은 수강생의 행만 추가/갱신/삭제"""
+        if change.is_bulk:
+            self.reload()
+            return
+        if not change.affects_students:
+            return
+        for student_id in change.student_ids:
+            self._texts.pop(student_id, None)
+            row = self._rows.get(student_id)
+            exists = self.data_manager.get_student_by_id(student_id) is not None
+            if row is None and exists:
+                # 새 수강생은 DataManager와 같이 맨 뒤에 추가
+                row = len(self._ids)
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._ids.append(student_id)
+                self._rows[student_id] = row
+                self.endInsertRows()
+            elif row is not None and not exists:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._ids[row]
+                del self._rows[student_id]
+                for following in self._ids[row:]:
+                    self._rows[following] -= 1
+                self.endRemoveRows()
+            elif row is not None:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def _student_text(self, student: Student, today: date) -> str:
+        # 오늘 날짜 기준으로 진행된 강수 (수강생별 인덱스에서 셈)
+        completed_lessons = self.data_manager.count_sessions_until(student.id, today)
+
+        # 진도 표시: "N강 완료" 형식
+        if completed_lessons > 0:
+            progress = f"{completed_lessons}강 완료"
+        else:
+            progress = "아직 시작 전"
+
+        weekdays_text = ", ".join(student.weekdays)
+        return (
+            f"• {student.name} ({student.total_weeks}강)\n"
+            f"  요일: {weekdays_text}\n"
+            f"  진도: {progress}"
+        )
+
+
+class StudentListView(QListView):
+    """수강생 목록 뷰 - 모든 행의 높이가 같으므로 화면에 보이는 행만 배치하고 그림"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+    def dataChanged(self, top_left, bottom_right, roles=()):
+        # QListView는 행 하나가 바뀌어도 전체 행을 다시 배치하므로(수강생 수에 비례),
+        # 높이가 같은 행이라 배치는 그대로 두고 바뀐 행만 다시 그림
+        QAbstractItemView.dataChanged(self, top_left, bottom_right, roles)
@@ -1,3 +1,6 @@
+from datetime import date
+from typing import Dict, List
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTableWidget, QTableWidgetItem, QMessageBox, QHeaderView,
@@ -7,6 +10,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 
 from .data_manager import DataManager
+from .change_events import DataChange
 from .models import Student
 
 
@@ -17,6 +21,9 @@ class StudentManagerDialog(QDialog):
     def __init__(self, data_manager: DataManager, parent=None):
         super().__init__(parent)
         self.data_manager = data_manager
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}  # student_id -> 행
+        self._listening = False
         self.setup_ui()
         self.setup_connections()
         self.refresh_students()
@@ -114,12 +121,55 @@ class StudentManagerDialog(QDialog):
         self.deselect_all_button.clicked.connect(self.deselect_all_students)
         self.delete_selected_button.clicked.connect(self.delete_selected_students)
         self.close_button.clicked.connect(self.accept)
+        self.data_manager.changed.connect(self.apply_change)
+        self._listening = True
+
+    def done(self, result):
+        # 닫힌 뒤에는 변경 이벤트를 받지 않음 (done이 여러 번 불려도 한 번만 해제)
+        if self._listening:
+            self._listening = False
+            self.data_manager.changed.disconnect(self.apply_change)
+        super().done(result)
 
     def refresh_students(self):
         students = self.data_manager.get_students()
         self.table.setRowCount(len(students))
+        self._ids = [s.id for s in students]
+        self._rows = {student_id: row for row, student_id in enumerate(self._ids)}
 
         for row, student in enumerate(students):
+            self._fill_row(row, student)
+        self.on_checkbox_changed()
+
+    def apply_change(self, change: DataChange):
+        """변경 이벤트 반영 - 영향을 받은 수강생의 행만 추가/수정/삭제"""
+        if change.is_bulk:
+            self.refresh_students()
+            return
+        if not change.affects_students:
+            return
+        for student_id in change.student_ids:
+            row = self._rows.get(student_id)
+            student = self.data_manager.get_student_by_id(student_id)
+            if student is None:
+                if row is not None:
+                    self.table.removeRow(row)
+                    del self._ids[row]
+                    del self._rows[student_id]
+                    for following in self._ids[row:]:
+                        self._rows[following] -= 1
+            elif row is not None:
+                self._fill_row(row, student, keep_checkbox=True)
+            else:
+                row = self.table.rowCount()
+                self.table.insertRow(row)
+                self._ids.append(student_id)
+                self._rows[student_id] = row
+                self._fill_row(row, student)
+        self.on_checkbox_changed()
+
+    def _fill_row(self, row: int, student: Student, keep_checkbox: bool = False):
+        if not keep_checkbox:
             # 체크박스
             checkbox_widget = QWidget()
             checkbox_layout = QHBoxLayout(checkbox_widget)
@@ -133,56 +183,55 @@ class StudentManagerDialog(QDialog):
 
             self.table.setCellWidget(row, 0, checkbox_widget)
 
-            # 이름
-            name_item = QTableWidgetItem(student.name)
-            name_item.setData(Qt.UserRole, student.id)
-            self.table.setItem(row, 1, name_item)
-
-            # 총 과정
-            course_item = QTableWidgetItem(f"{student.total_weeks}강")
-            self.table.setItem(row, 2, course_item)
-
-            # 수강 요일
-            weekdays_text = ", ".join(student.weekdays)
-            weekdays_item = QTableWidgetItem(weekdays_text)
-            self.table.setItem(row, 3, weekdays_item)
-
-            # 시작일
-            start_date_item = QTableWidgetItem(student.start_date.strftime("%Y-%m-%d"))
-            self.table.setItem(row, 4, start_date_item)
-
-            # 진도 (오늘 날짜 기준 주차 / 총 주차)
-            from datetime import date
-            today = date.today()
-
-            if student.start_date <= today:
-                # 시작일부터 오늘까지의 경과 일수
-                days_passed = (today - student.start_date).days
-
-                # 경과 강수 계산 (1강부터 시작하므로 +1)
-                current_week = min(days_passed // 7 + 1, student.total_weeks)
-
-                # 진도율 계산
-                if student.total_weeks > 0:
-                    progress_percentage = round((current_week / student.total_weeks) * 100)
-                    progress_text = f"{current_week}/{student.total_weeks} ({progress_percentage}%)"
-                else:
-                    progress_text = "0/0 (0%)"
-            else:
-                # 아직 시작하지 않은 경우
-                progress_text = f"0/{student.total_weeks} (시작 예정)"
+        # 이름
+        name_item = QTableWidgetItem(student.name)
+        name_item.setData(Qt.UserRole, student.id)
+        self.table.setItem(row, 1, name_item)
+
+        # 총 과정
+        course_item = QTableWidgetItem(f"{student.total_weeks}강")
+        self.table.setItem(row, 2, course_item)
+
+        # 수강 요일
+        weekdays_text = ", ".join(student.weekdays)
+        weekdays_item = QTableWidgetItem(weekdays_text)
+        self.table.setItem(row, 3, weekdays_item)
+
+        # 시작일
+        start_date_item = QTableWidgetItem(student.start_date.strftime("%Y-%m-%d"))
+        self.table.setItem(row, 4, start_date_item)
+
+        # 진도 (오늘 날짜 기준 주차 / 총 주차)
+        today = date.today()
+
+        if student.start_date <= today:
+            # 시작일부터 오늘까지의 경과 일수
+            days_passed = (today - student.start_date).days
 
-            progress_item = QTableWidgetItem(progress_text)
-            self.table.setItem(row, 5, progress_item)
+            # 경과 강수 계산 (1강부터 시작하므로 +1)
+            current_week = min(days_passed // 7 + 1, student.total_weeks)
 
-            # 상태
-            status = "활성" if student.is_active else "비활성"
-            status_item = QTableWidgetItem(status)
-            if student.is_active:
-                status_item.setForeground(Qt.green)
+            # 진도율 계산
+            if student.total_weeks > 0:
+                progress_percentage = round((current_week / student.total_weeks) * 100)
+                progress_text = f"{current_week}/{student.total_weeks} ({progress_percentage}%)"
             else:
-                status_item.setForeground(Qt.red)
-            self.table.setItem(row, 6, status_item)
+                progress_text = "0/0 (0%)"
+        else:
+            # 아직 시작하지 않은 경우
+            progress_text = f"0/{student.total_weeks} (시작 예정)"
+
+        progress_item = QTableWidgetItem(progress_text)
+        self.table.setItem(row, 5, progress_item)
+
+        # 상태
+        status = "활성" if student.is_active else "비활성"
+        status_item = QTableWidgetItem(status)
+        if student.is_active:
+            status_item.setForeground(Qt.green)
+        else:
+            status_item.setForeground(Qt.red)
+        self.table.setItem(row, 6, status_item)
 
     def on_checkbox_changed(self):
         """체크박스 상태 변경 시 삭제 버튼 활성화/비활성화"""
@@ -255,7 +304,6 @@ class StudentManagerDialog(QDialog):
 
             if deleted_count > 0:
                 self.studentDeleted.emit(f"{deleted_count}명의 수강생")
-                self.refresh_students()
                 QMessageBox.information(
                     self, "삭제 완료",
                     f"{deleted_count}명의 수강생이 삭제되었습니다."
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 DARK_THEME = """
 QMainWindow {
     background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
@@ -441,4 +443,52 @@ QPushButton#navigationArrow:pressed {
     box-shadow: 0 1px 4px rgba(139, 92, 246, 0.5);
     transform: translateY(1px);
 }
-"""
\ No newline at end of file
+"""
+
+
+@lru_cache(maxsize=None)
+def lighten_color(color: str) -> str:
+    """색상을 밝게 만들어 호버 효과에 사용 (각 채널 20%, 색상마다 한 번만 계산)"""
+    try:
+        # #RRGGBB 형식의 색상을 파싱
+        r = min(255, int(int(color[1:3], 16) * 1.2))
+        g = min(255, int(int(color[3:5], 16) * 1.2))
+        b = min(255, int(int(color[5:7], 16) * 1.2))
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except (ValueError, TypeError):
+        return color
+
+
+@lru_cache(maxsize=None)
+def darken_color(color: str) -> str:
+    """색상을 어둡게 만들어 완료된 일정에 사용 (각 채널 30%, 색상마다 한 번만 계산)"""
+    try:
+        r = int(int(color[1:3], 16) * 0.7)
+        g = int(int(color[3:5], 16) * 0.7)
+        b = int(int(color[5:7], 16) * 0.7)
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except (ValueError, TypeError):
+        return color
+
+
+# 직접 그리는 달력(calendar_grid.ScheduleChipDelegate)의 색상 - 달력 색은 여기서만 정함
+# 투명도가 있는 색은 QColor가 읽는 #AARRGGBB 형식
+CALENDAR_COLORS = {
+    "cell_background": "#2D2D2D",
+    "cell_hover": "#333333",
+    "cell_border": "#404040",
+    "today": "#0078D4",
+    "drop_past": "#FF8C00",          # 과거 날짜로 끌어 놓을 때
+    "drop_future": "#107C10",        # 오늘 이후로 끌어 놓을 때
+    "date_text": "#FFFFFF",
+    "other_month_date": "#666666",
+    "header_background": "#333333",
+    "chip_text": "#1F2937",
+    "chip_hover_border": "#66FFFFFF",
+    "label_background": "#F2FFFFFF",
+    "completed_text": "#FFFFFF",
+    "completed_end": "#B210B981",    # 완료된 일정 그라데이션 끝 색
+    "completed_end_hover": "#CC10B981",
+    "completed_hover_border": "#9910B981",
+    "completed_label_background": "#F210B981",
+}
@@ -0,0 +1,170 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from .models import AppData, Schedule, Student
+
+# 병합에서 비교하는 필드 (id와 생성/수정 시각 제외 - 시트를 거치면 시각의 정밀도가 달라짐)
+STUDENT_FIELDS = ("name", "total_weeks", "weekdays", "start_date", "is_active", "color")
+SCHEDULE_FIELDS = ("student_id", "week_number", "scheduled_date", "is_completed", "memo")
+
+LOCAL = "local"
+REMOTE = "remote"
+
+
+@dataclass
+class MergeConflict:
+    """양쪽에서 같은 레코드를 다르게 바꾼 경우
+
+    fields가 비어 있으면 한쪽은 삭제하고 다른 쪽은 수정한 충돌이며 수정한 쪽을
+    남긴다. 그 외에는 fields의 값을 수정 시각이 늦은 쪽(resolution)으로 정한다.
+    """
+    kind: str          # "student" / "schedule"
+    record_id: str
+    fields: List[str]
+    local: Optional[Any]
+    remote: Optional[Any]
+    resolution: str    # LOCAL / REMOTE
+
+    @property
+    def description(self) -> str:
+        record = self.local or self.remote
+        if self.kind == "student":
+            label = f"학생 '{record.name}'"
+        else:
+            label = f"{record.scheduled_date} {record.week_number}회차 수업"
+        side = "이 컴퓨터" if self.resolution == LOCAL else "구글 시트"
+        if not self.fields:
+            return f"{label}: 한쪽에서 삭제, 다른 쪽에서 수정 - {side}의 수정 내용 유지"
+        return f"{label}: {', '.join(self.fields)} 충돌 - {side}의 값 사용"
+
+
+@dataclass
+class MergeResult:
+    students: List[Student]
+    schedules: List[Schedule]
+    conflicts: List[MergeConflict] = field(default_factory=list)
+    # 원격과 내용이 다른 레코드 ID (다음 업로드에서 보낼 것)
+    changed: Set[str] = field(default_factory=set)
+    # 원격에는 있지만 병합 결과에는 없는 ID (다음 업로드에서 삭제할 것)
+    deleted: Dict[str, List[str]] = field(default_factory=lambda: {"students": [], "schedules": []})
+    pulled: int = 0    # 원격 변경을 반영한 레코드 수
+
+
+def _same(a, b, names: Sequence[str]) -> bool:
+    return all(getattr(a, name) == getattr(b, name) for name in names)
+
+
+class _RecordMerger:
+    """한 종류(학생/스케줄) 레코드의 3-way 병합 - ID로 찾은 사전으로 레코드마다 한 번씩만 비교"""
+
+    def __init__(self, kind: str, names: Sequence[str], conflicts: List[MergeConflict]):
+        self.kind = kind
+        self.names = names
+        self.conflicts = conflicts
+        self.pulled = 0
+
+    def merge(self, base: Dict[str, Any], local: Dict[str, Any], remote: Dict[str, Any]) -> Dict[str, Any]:
+        """병합 결과 (로컬 순서 뒤에 원격에서 추가된 레코드)"""
+        merged = {}
+        for record_id in local:
+            record = self._merge_one(base.get(record_id), local[record_id], remote.get(record_id))
+            if record is not None:
+                merged[record_id] = record
+        for record_id, record in remote.items():
+            if record_id not in local:
+                record = self._merge_one(base.get(record_id), None, record)
+                if record is not None:
+                    merged[record_id] = record
+        return merged
+
+    def _merge_one(self, base, local, remote):
+        if local is not None and remote is not None and _same(local, remote, self.names):
+            return local
+        if base is None:
+            if local is None:
+                self.pulled += 1
+                return remote   # 원격에서 추가
+            if remote is None:
+                return local    # 로컬에서 추가
+            return self._merge_fields(None, local, remote)
+
+        local_changed = local is None or not _same(local, base, self.names)
+        remote_changed = remote is None or not _same(remote, base, self.names)
+        if not local_changed:
+            self.pulled += 1
+            return remote       # 원격에서만 수정/삭제
+        if not remote_changed:
+            return local        # 로컬에서만 수정/삭제
+        if local is None and remote is None:
+            return None         # 양쪽 모두 삭제
+        if local is None or remote is None:
+            # 삭제-수정 충돌 - 수정 내용을 잃지 않도록 수정한 쪽을 남김
+            kept = local if remote is None else remote
+            self.conflicts.append(MergeConflict(self.kind, kept.id, [], local, remote,
+                                                LOCAL if kept is local else REMOTE))
+            if kept is remote:
+                self.pulled += 1
+            return kept
+        return self._merge_fields(base, local, remote)
+
+    def _merge_fields(self, base, local, remote):
+        """양쪽 모두 수정 - 한쪽만 바꾼 필드는 그대로 합치고, 둘 다 바꾼 필드는 늦게 수정한 쪽 값 사용"""
+        merged = local.copy()
+        conflicting = []
+        pulled = False
+        for name in self.names:
+            local_value, remote_value = getattr(local, name), getattr(remote, name)
+            if local_value == remote_value:
+                continue
+            if base is not None and local_value == getattr(base, name):
+                setattr(merged, name, remote_value)
+                pulled = True
+            elif base is None or remote_value != getattr(base, name):
+                conflicting.append(name)
+
+        if conflicting:
+            winner = REMOTE if remote.updated_at > local.updated_at else LOCAL
+            if winner == REMOTE:
+                for name in conflicting:
+                    setattr(merged, name, getattr(remote, name))
+                pulled = True
+            self.conflicts.append(MergeConflict(self.kind, local.id, conflicting, local, remote, winner))
+        self.pulled += pulled
+        return merged
+
+
+def three_way_merge(base: Optional[AppData], local: AppData, remote: AppData) -> MergeResult:
+    """마지막 동기화 시점(base), 로컬, 원격 데이터를 레코드 단위로 병합
+
+    레코드마다 base와 비교해 한쪽에서만 바뀐 것은 그대로 반영하고, 양쪽에서 다르게
+    바뀐 것은 MergeConflict로 알린다. base가 없으면 (첫 동기화) 양쪽 모두에 있는
+    레코드의 다른 필드는 모두 충돌로 보고, 한쪽에만 있는 레코드는 남긴다.
+    전체 시간은 레코드 수에 비례한다.
+    """
+    base = base or AppData()
+    conflicts: List[MergeConflict] = []
+
+    students = _RecordMerger("student", STUDENT_FIELDS, conflicts)
+    schedules = _RecordMerger("schedule", SCHEDULE_FIELDS, conflicts)
+    remote_students = {s.id: s for s in remote.students}
+    remote_schedules = {s.id: s for s in remote.schedules}
+    merged_students = students.merge({s.id: s for s in base.students},
+                                     {s.id: s for s in local.students}, remote_students)
+    merged_schedules = schedules.merge({s.id: s for s in base.schedules},
+                                       {s.id: s for s in local.schedules}, remote_schedules)
+
+    # 병합 결과에서 학생이 없어진 스케줄은 제거
+    merged_schedules = {schedule_id: schedule for schedule_id, schedule in merged_schedules.items()
+                        if schedule.student_id in merged_students}
+
+    result = MergeResult(list(merged_students.values()), list(merged_schedules.values()), conflicts,
+                         pulled=students.pulled + schedules.pulled)
+    for merged, remote_records, names, kind in (
+            (merged_students, remote_students, STUDENT_FIELDS, "students"),
+            (merged_schedules, remote_schedules, SCHEDULE_FIELDS, "schedules")):
+        for record_id, record in merged.items():
+            remote_record = remote_records.get(record_id)
+            if remote_record is None or not _same(record, remote_record, names):
+                result.changed.add(record_id)
+        result.deleted[kind] = [record_id for record_id in remote_records if record_id not in merged]
+    return result
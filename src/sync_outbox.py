@@ -0,0 +1,152 @@
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .crypto_utils import CryptoManager
+from .change_journal import ChangeJournal, JournalCorruptedError
+
+PUT = "put"
+DELETE = "delete"
+KINDS = ("students", "schedules")
+
+
+@dataclass
+class OutboxBatch:
+    """한 번에 업로드할 대기 작업 묶음 (DataManager.outbox_batch가 생성)"""
+    delta: Dict                         # delta_sync 요청 본문
+    keys: List[Tuple[str, str]]         # 보낸 (종류, ID)
+    seq: int                            # 묶음을 만든 시점의 작업 순번
+
+    @property
+    def size(self) -> int:
+        return len(self.keys)
+
+
+class SyncOutbox:
+    """구글 시트로 보낼 변경 작업을 기록하는 암호화된 대기열
+
+    DataManager의 변경마다 (종류, ID)별 작업(put/delete)을 저널 형식(ChangeJournal)으로
+    파일에 추가하므로 종료되거나 네트워크가 끊겨도 남는다. 같은 레코드의 작업은
+    마지막 것만 남기고(중복 제거), 순서는 마지막으로 바뀐 순서를 따른다.
+    base는 대기열이 기준으로 삼는 서버 워터마크로, 데이터의 워터마크와 같을 때만
+    대기열만으로 변경분을 보낼 수 있다. 확인된 작업을 지울 때마다 파일을 다시 써서
+    크기를 대기 작업 수에 비례하게 유지한다.
+    """
+
+    # 파일의 레코드 수가 대기 작업 수보다 이만큼 많아지면 다시 씀
+    COMPACT_SLACK = 256
+
+    def __init__(self, path: Path, crypto_manager: Optional[CryptoManager] = None):
+        self._journal = ChangeJournal(path, crypto_manager)
+        self._ops: Dict[Tuple[str, str], Tuple[str, int]] = {}  # (종류, ID) -> (작업, 순번)
+        self._seq = 0
+        self.base: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    @property
+    def seq(self) -> int:
+        """마지막으로 기록한 작업 순번 (업로드 스냅샷 시점 표시용)"""
+        return self._seq
+
+    def pending(self, limit: Optional[int] = None) -> List[Tuple[str, str, str]]:
+        """대기 중인 (종류, ID, 작업) - 오래된 것부터"""
+        items = []
+        for (kind, item_id), (op, _) in self._ops.items():
+            if limit is not None and len(items) >= limit:
+                break
+            items.append((kind, item_id, op))
+        return items
+
+    def load(self) -> int:
+        """파일에서 대기 작업을 읽어 이어쓰기용으로 열고 대기 작업 수 반환"""
+        self.close()
+        journal_id = ChangeJournal.stored_id(self._journal.path)
+        try:
+            records = self._journal.load(journal_id)
+        except JournalCorruptedError as e:
+            # 기준 시점 없이 두면 다음 업로드는 전체 스냅샷으로 올라가 빠진 작업이 없음
+            print(f"Failed to read sync outbox, next upload sends everything: {e}")
+            return 0
+        if records and "base" in records[0]:
+            self.base = records[0]["base"]
+            for record in records[1:]:
+                self._apply(record)
+        return len(self._ops)
+
+    def record(self, kind: str, op: str, ids: Iterable[str]):
+        """작업 기록 - ids 전체를 레코드 하나로 추가 (파일 쓰기는 한 번)"""
+        ids = list(ids)
+        if not ids:
+            return
+        record = {"kind": kind, "op": op, "ids": ids}
+        try:
+            if not self._journal.is_open:
+                self._rewrite()
+            self._journal.append(record)
+        except Exception as e:
+            print(f"Failed to write sync outbox: {e}")
+        self._apply(record)
+        if self._journal.record_count > len(self._ops) + self.COMPACT_SLACK:
+            self._rewrite()
+
+    def acknowledge(self, keys: Iterable[Tuple[str, str]], seq: int, base: Optional[str]):
+        """서버가 확인한 작업 제거 - seq 이후에 다시 바뀐 레코드는 남김"""
+        for key in keys:
+            entry = self._ops.get(key)
+            if entry is not None and entry[1] <= seq:
+                del self._ops[key]
+        self.base = base
+        self._rewrite()
+
+    def acknowledge_all(self, seq: int, base: Optional[str]):
+        """전체/스캔 업로드 확인 - seq까지 기록된 작업을 모두 제거"""
+        self.acknowledge(list(self._ops), seq, base)
+
+    def rebase(self, base: Optional[str], ops: Iterable[Tuple[str, str, str]] = ()):
+        """대기열을 ops로 교체 (구글 시트에서 받아 병합한 직후)"""
+        self._ops.clear()
+        for kind, item_id, op in ops:
+            self._seq += 1
+            self._ops[(kind, item_id)] = (op, self._seq)
+        self.base = base
+        self._rewrite()
+
+    def rewrite(self):
+        """현재 세션 키로 파일을 다시 씀 (비밀번호 변경 후)"""
+        self._rewrite()
+
+    def close(self):
+        self._journal.close()
+        self._ops.clear()
+        self.base = None
+
+    def discard(self):
+        """파일을 지우고 비움 (백업 복원 등 데이터가 외부에서 교체될 때)"""
+        self._journal.discard()
+        self._ops.clear()
+        self.base = None
+
+    def _apply(self, record: Dict):
+        kind, op = record["kind"], record["op"]
+        self._seq += 1
+        for item_id in record["ids"]:
+            # 같은 레코드의 이전 작업은 지우고 맨 뒤로
+            self._ops.pop((kind, item_id), None)
+            self._ops[(kind, item_id)] = (op, self._seq)
+
+    def _rewrite(self):
+        """대기 작업만으로 새 파일 작성 (작업 종류별로 묶어 레코드 수를 줄임)"""
+        records = [{"base": self.base}]
+        for (kind, item_id), (op, _) in self._ops.items():
+            last = records[-1]
+            if last.get("kind") == kind and last.get("op") == op:
+                last["ids"].append(item_id)
+            else:
+                records.append({"kind": kind, "op": op, "ids": [item_id]})
+        try:
+            self._journal.reset(uuid.uuid4().hex, records)
+        except Exception as e:
+            print(f"Failed to write sync outbox: {e}")
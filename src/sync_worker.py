@@ -0,0 +1,369 @@
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from .models import AppData
+from .async_sheets_api import AsyncGoogleSheetsAPI, AsyncLoopThread
+from .sync_outbox import OutboxBatch
+
+
+@dataclass
+class SyncResult:
+    """동기화 작업 결과 (메인 스레드로 전달)"""
+    direction: str
+    success: bool
+    message: str
+    cancelled: bool = False
+    student_count: int = 0
+    schedule_count: int = 0
+    app_data: Optional[AppData] = None  # 다운로드한 데이터 (적용 전) / 업로드한 스냅샷
+    ack: Optional[Dict[str, Any]] = None  # 업로드 확인 정보 (워터마크, 전송한 삭제 목록)
+    epoch: int = 0                      # 작업 시작 시점의 데이터 세대
+    needs_merge: bool = False           # 업로드 전에 app_data(시트 데이터)와 병합해야 함
+    conflicts: List = field(default_factory=list)  # 병합 중 생긴 MergeConflict
+    batch: Optional[OutboxBatch] = None  # 대기열 업로드로 보낸 작업
+    outbox_seq: Optional[int] = None    # 스냅샷 업로드 시점의 대기열 순번
+    background: bool = False            # 대기열 자동 업로드 결과 (사용자 요청 아님)
+
+
+class SyncTaskSignals(QObject):
+    """작업 스레드 -> 메인 스레드 신호 (메인 스레드에서 생성되어 큐 연결로 전달)"""
+    progress = Signal(str, int, int)
+    finished = Signal(object)
+
+
+class SyncTask(QRunnable):
+    """구글 시트 업로드/다운로드 한 건을 작업 스레드에서 수행
+
+    네트워크 요청과 JSON 변환만 작업 스레드에서 하고, 다운로드한 데이터를
+    DataManager에 적용하는 일은 SyncQueue가 메인 스레드에서 처리한다.
+    async_api와 loop가 있으면 다운로드는 루프 스레드에서 동시 요청으로 수행한다.
+    merge가 참이면 다른 곳에서 먼저 업로드해 거부된 업로드는 시트를 받아
+    병합하도록 needs_merge로 돌려준다. batch가 있으면 스냅샷 대신 대기열에서
+    만든 변경분만 보낸다.
+    """
+
+    def __init__(self, api, direction: str, app_data: Optional[AppData], epoch: int,
+                 until: Optional[datetime] = None, async_api: Optional[AsyncGoogleSheetsAPI] = None,
+                 loop: Optional[AsyncLoopThread] = None, merge: bool = True,
+                 batch: Optional[OutboxBatch] = None):
+        super().__init__()
+        self.setAutoDelete(False)  # SyncQueue가 참조를 관리
+        self.api = api
+        self.direction = direction
+        self.app_data = app_data
+        self.epoch = epoch
+        self.until = until  # 업로드 스냅샷 시각 (이 시각까지의 변경분을 전송)
+        self.async_api = async_api
+        self.loop = loop
+        self.merge = merge
+        self.batch = batch
+        self.outbox_seq: Optional[int] = None  # 업로드 시작 시점의 대기열 순번
+        self.signals = SyncTaskSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _progress(self, kind: str, current: int, total: int):
+        self.signals.progress.emit(kind, current, total)
+
+    def run(self):
+        try:
+            result = self._sync()
+        except Exception as e:
+            result = SyncResult(self.direction, False, f"동기화 중 오류 발생: {str(e)}")
+        result.epoch = self.epoch
+        result.outbox_seq = self.outbox_seq
+        if self.is_cancelled:
+            result.success = False
+            result.cancelled = True
+            result.app_data = None
+            result.ack = None
+            result.message = "사용자가 동기화를 취소했습니다."
+        self.signals.finished.emit(result)
+
+    def _sync(self) -> SyncResult:
+        if self.direction == SyncQueue.UPLOAD:
+            if self.batch is not None:
+                success, message, ack = self.api.send_delta(self.batch.delta, self._progress, self._cancel_event)
+            else:
+                success, message, ack = self.api.upload_changes(
+                    self.app_data, self.until, self._progress, self._cancel_event)
+            if not success and self.merge and ack and ack.get("resync"):
+                # 다른 곳에서 먼저 업로드함 - 덮어쓰지 않고 시트를 받아 병합한 뒤 다시 업로드
+                result = self._download()
+                result.direction = self.direction
+                result.needs_merge = result.success
+                return result
+            if self.batch is not None:
+                return SyncResult(self.direction, success, message,
+                                  student_count=len(self.batch.delta["students"]),
+                                  schedule_count=len(self.batch.delta["schedules"]),
+                                  ack=ack, batch=self.batch if success else None)
+            return SyncResult(self.direction, success, message,
+                              student_count=len(self.app_data.students),
+                              schedule_count=len(self.app_data.schedules),
+                              app_data=self.app_data if success else None,
+                              ack=ack)
+
+        return self._download()
+
+    def _download(self) -> SyncResult:
+        if self.async_api is not None and self.loop is not None:
+            success, message, app_data = self.loop.run(
+                self.async_api.sync_from_sheets_to_local(self._progress, self._cancel_event))
+        else:
+            success, message, app_data = self.api.sync_from_sheets_to_local(self._progress, self._cancel_event)
+        if not success or app_data is None:
+            return SyncResult(self.direction, False, message)
+        return SyncResult(self.direction, True, message,
+                          student_count=len(app_data.students),
+                          schedule_count=len(app_data.schedules),
+                          app_data=app_data)
+
+
+class SyncQueue(QObject):
+    """구글 시트 동기화 작업 대기열
+
+    작업은 한 번에 하나씩 QThreadPool에서 실행된다. 이미 대기 중인 작업과
+    같은 방향의 요청, 진행 중인 다운로드와 같은 다운로드 요청은 무시하므로
+    반복 클릭해도 작업이 쌓이지 않는다. 업로드할 데이터는 작업이 시작될 때
+    메인 스레드에서 복사하고, 다운로드 결과는 메인 스레드에서 로컬 데이터와
+    3-way 병합한다. 다른 곳에서 먼저 업로드해 업로드가 거부되면 시트를 받아
+    병합한 뒤 한 번만 다시 업로드한다.
+    다운로드는 전용 asyncio 루프 스레드에서 AsyncGoogleSheetsAPI로 동시 요청한다.
+
+    업로드는 가능하면 DataManager의 대기열에서 OUTBOX_BATCH_SIZE개씩 변경분을 만들어
+    보내고, 대기열이 빌 때까지 이어서 보낸다. enable_auto_drain()을 호출하면 변경이
+    생길 때마다 잠시 뒤 자동으로 업로드하고, 실패하면 (오프라인 등) 간격을 늘려 가며
+    다시 시도한다.
+    """
+
+    DRAIN_DELAY_MS = 2000        # 마지막 변경 후 자동 업로드까지 대기
+    RETRY_MIN_MS = 5000          # 자동 업로드 실패 후 첫 재시도 간격
+    RETRY_MAX_MS = 5 * 60 * 1000
+
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+
+    syncStarted = Signal(str)          # 방향
+    syncProgress = Signal(str, int, int)  # 종류, 현재 값, 전체 값 (모르면 0)
+    syncFinished = Signal(object)      # SyncResult
+    busyChanged = Signal(bool)
+
+    def __init__(self, data_manager, api=None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self._api = api
+        self._queue = deque()
+        self._task: Optional[SyncTask] = None
+        self._closed = False
+        self._busy = False
+        self._merge_retry = False  # 다음 업로드는 병합 후 재시도 (다시 거부되면 실패)
+        self._conflicts: List = []  # 재시도 업로드 결과에 넘길 병합 충돌
+        self._sent = [0, 0]         # 이어서 보낸 대기열 묶음의 학생/스케줄 수 합계
+        self._background = False    # 대기 중이거나 진행 중인 업로드가 자동 업로드인지
+        self._retry_ms = 0
+        self._drain_timer: Optional[QTimer] = None
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._loop = AsyncLoopThread()
+        self._async_api: Optional[AsyncGoogleSheetsAPI] = None
+
+    @property
+    def api(self):
+        return self._api or self.data_manager.sheets_manager.get_api()
+
+    def _async_api_for(self, api) -> AsyncGoogleSheetsAPI:
+        """api를 감싼 비동기 API (api가 바뀌면 새로 생성 - 작업은 한 번에 하나라 안전)"""
+        if self._async_api is None or self._async_api.api is not api:
+            if self._async_api is not None:
+                self._async_api.close()
+            self._async_api = AsyncGoogleSheetsAPI(api)
+        return self._async_api
+
+    @property
+    def is_busy(self) -> bool:
+        return self._task is not None or bool(self._queue)
+
+    @property
+    def current_direction(self) -> Optional[str]:
+        return self._task.direction if self._task is not None else None
+
+    def _update_busy(self):
+        busy = self.is_busy
+        if busy != self._busy:
+            self._busy = busy
+            self.busyChanged.emit(busy)
+
+    def enable_auto_drain(self):
+        """대기열에 작업이 생기면 자동으로 업로드"""
+        if self._drain_timer is not None:
+            return
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setSingleShot(True)
+        self._drain_timer.timeout.connect(self._drain)
+        self.data_manager.outboxChanged.connect(self._on_outbox_changed)
+        self._on_outbox_changed(self.data_manager.outbox_count)
+
+    def _on_outbox_changed(self, count: int):
+        # 재시도 대기 중이면 그 간격을 유지
+        if count and not self._retry_ms and self.data_manager.outbox_ready:
+            self._drain_timer.start(self.DRAIN_DELAY_MS)
+
+    def _drain(self):
+        if not self.data_manager.outbox_ready:
+            return
+        if self.is_busy:
+            self._drain_timer.start(self.DRAIN_DELAY_MS)
+            return
+        self.submit(self.UPLOAD, background=True)
+
+    def submit(self, direction: str, background: bool = False) -> bool:
+        """동기화 작업 예약 (중복 요청이면 False)"""
+        if self._closed or direction not in (self.UPLOAD, self.DOWNLOAD):
+            return False
+        if direction == self.UPLOAD and not background:
+            # 사용자가 요청한 업로드 - 자동 업로드 재시도 간격 초기화
+            self._background = False
+            self._retry_ms = 0
+        if direction in self._queue:
+            return False
+        if (direction == self.DOWNLOAD and self.current_direction == self.DOWNLOAD
+                and not self._task.is_cancelled):
+            return False
+
+        if direction == self.UPLOAD and background:
+            self._background = True
+        self._queue.append(direction)
+        self._start_next()
+        self._update_busy()
+        return True
+
+    def _start_next(self):
+        if self._task is not None or not self._queue:
+            return
+
+        direction = self._queue.popleft()
+        api = self.api
+        if api is None:
+            self.syncFinished.emit(SyncResult(direction, False, "구글 시트가 초기화되지 않았습니다."))
+            self._start_next()
+            return
+
+        # 업로드할 데이터는 시작 시점의 대기열 묶음이나 스냅샷 (이후 편집과 독립)
+        app_data, until, merge, batch = None, None, True, None
+        if direction == self.UPLOAD:
+            batch = self.data_manager.outbox_batch()
+            if batch is None:
+                app_data, until = self.data_manager.data.copy(), datetime.now()
+            merge, self._merge_retry = not self._merge_retry, False
+        task = SyncTask(api, direction, app_data, self.data_manager.data_epoch, until,
+                        self._async_api_for(api), self._loop, merge, batch)
+        task.outbox_seq = self.data_manager.outbox_seq if direction == self.UPLOAD else None
+        task.signals.progress.connect(self.syncProgress)
+        task.signals.finished.connect(self._on_task_finished)
+        self._task = task
+
+        if direction == self.UPLOAD:
+            self.data_manager.syncStatusChanged.emit("구글 시트로 동기화 중...")
+        else:
+            self.data_manager.syncStatusChanged.emit("구글 시트에서 데이터 가져오는 중...")
+        self.syncStarted.emit(direction)
+        self._pool.start(task)
+
+    def _on_task_finished(self, result: SyncResult):
+        self._task = None
+        if self._closed:
+            return
+
+        if result.success and (result.direction == self.DOWNLOAD or result.needs_merge):
+            result.success, result.message, result.conflicts = self.data_manager.merge_synced_data(
+                result.app_data, result.message, result.epoch)
+            if result.success and result.needs_merge:
+                # 병합한 데이터로 업로드를 맨 앞에 다시 예약 (결과는 그 업로드가 끝날 때 알림)
+                self._conflicts += result.conflicts
+                self._merge_retry = True
+                self._continue_upload("시트 변경 사항을 병합한 뒤 다시 업로드하는 중...")
+                return
+        elif result.direction == self.UPLOAD and result.success and result.ack:
+            self.data_manager.acknowledge_sync(result.ack, result.epoch, result.app_data,
+                                               result.batch, result.outbox_seq)
+            if result.batch is not None:
+                self._sent[0] += result.student_count
+                self._sent[1] += result.schedule_count
+                if self.data_manager.outbox_ready:
+                    # 남은 대기 작업을 이어서 전송
+                    self._continue_upload(f"구글 시트로 변경 사항 업로드 중... "
+                                          f"(남은 작업 {self.data_manager.outbox_count}건)")
+                    return
+                result.student_count, result.schedule_count = self._sent
+        if result.direction == self.UPLOAD:
+            result.conflicts, self._conflicts = self._conflicts + result.conflicts, []
+            result.background, self._background = self._background, False
+            self._sent = [0, 0]
+            self._schedule_retry(result)
+        result.app_data = None
+
+        if result.cancelled:
+            self.data_manager.syncStatusChanged.emit("동기화 취소됨")
+        elif result.success:
+            self.data_manager.syncStatusChanged.emit("동기화 완료")
+        else:
+            self.data_manager.syncStatusChanged.emit("동기화 실패")
+
+        self.syncFinished.emit(result)
+        self._start_next()
+        self._update_busy()
+
+    def _continue_upload(self, status: str):
+        """업로드를 대기열 맨 앞에 다시 예약하고 바로 시작"""
+        if self.UPLOAD in self._queue:
+            self._queue.remove(self.UPLOAD)
+        self._queue.appendleft(self.UPLOAD)
+        self.data_manager.syncStatusChanged.emit(status)
+        self._start_next()
+
+    def _schedule_retry(self, result: SyncResult):
+        """자동 업로드가 실패하면 간격을 늘려 가며 다시 시도, 성공하면 간격 초기화"""
+        if self._drain_timer is None or result.cancelled:
+            return
+        if result.success:
+            self._retry_ms = 0
+            if self.data_manager.outbox_ready:
+                self._drain_timer.start(self.DRAIN_DELAY_MS)
+        elif result.background:
+            self._retry_ms = min(max(self._retry_ms * 2, self.RETRY_MIN_MS), self.RETRY_MAX_MS)
+            self._drain_timer.start(self._retry_ms)
+
+    def cancel(self):
+        """대기 중인 작업을 비우고 진행 중인 작업 취소"""
+        self._queue.clear()
+        self._merge_retry = False
+        self._background = False
+        if self._drain_timer is not None:
+            self._drain_timer.stop()
+        if self._task is not None:
+            self._task.cancel()
+        self._update_busy()
+
+    def shutdown(self, timeout_ms: int = 5000) -> bool:
+        """작업을 취소하고 스레드 종료를 기다림 (이후 결과는 적용하지 않음)"""
+        self._closed = True
+        self.cancel()
+        self._retry_ms = 0
+        done = self._pool.waitForDone(timeout_ms)
+        self._loop.stop()
+        if self._async_api is not None:
+            self._async_api.close()
+        return done
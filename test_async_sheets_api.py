@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+비동기 구글 시트 API 테스트 - 동시 요청, 동시 요청 수 제한, 루프 스레드 (로컬 스텁 서버 사용)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import inspect
+import threading
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, Schedule
+from src.google_sheets_api import GoogleSheetsAPI
+from src.async_sheets_api import AsyncGoogleSheetsAPI, AsyncLoopThread
+from sheets_stub_server import SheetsStubServer
+
+
+def _fill(server, student_count, schedule_count):
+    students = [Student(name=f"수강생{i}", weekdays=["월요일"], start_date=date(2024, 1, 1))
+                for i in range(student_count)]
+    for student in students:
+        server.state.students[student.id] = student.to_dict()
+    for i in range(schedule_count):
+        schedule = Schedule(student_id=students[i % student_count].id, week_number=i + 1,
+                            scheduled_date=date(2024, 1, 1))
+        server.state.schedules[schedule.id] = schedule.to_dict()
+
+
+def _async_api(server, page_size=10, max_concurrency=4) -> AsyncGoogleSheetsAPI:
+    api = GoogleSheetsAPI(server.url)
+    api.DOWNLOAD_PAGE_SIZE = page_size
+    return AsyncGoogleSheetsAPI(api, max_concurrency)
+
+
+def test_same_methods_as_coroutines():
+    """GoogleSheetsAPI의 요청 메서드를 같은 이름의 코루틴으로 제공"""
+    skip = {"close", "get_metrics", "batch_client", "iter_pages", "iter_students", "iter_schedules",
+            "fetch_page", "fetch_metadata"}
+    names = [name for name, _ in inspect.getmembers(GoogleSheetsAPI, inspect.isfunction)
+             if not name.startswith("_") and name not in skip]
+    assert "sync_from_sheets_to_local" in names
+    for name in names:
+        assert inspect.iscoroutinefunction(getattr(AsyncGoogleSheetsAPI, name)), name
+
+
+def test_download_costs_slowest_request():
+    """학생/스케줄/메타데이터와 나머지 페이지를 동시에 요청해 왕복 두 번 정도에 끝남"""
+    with SheetsStubServer() as server:
+        _fill(server, 5, 35)
+        server.state.delay = 0.3
+        async_api = _async_api(server)
+        progress = []
+        start = time.perf_counter()
+        success, message, app_data = asyncio.run(async_api.sync_from_sheets_to_local(
+            lambda kind, current, total: progress.append((current, total))))
+        elapsed = time.perf_counter() - start
+        async_api.close()
+
+        assert success, message
+        # 순차로 보내면 요청 6번 x 0.3초
+        assert len(server.state.requests) == 6 and elapsed < 1.2
+        assert [s.id for s in app_data.students] == list(server.state.students)
+        assert [s.id for s in app_data.schedules] == list(server.state.schedules)
+        assert progress[0] == (15, 40) and progress[-1] == (40, 40)
+
+
+def test_concurrency_is_bounded():
+    """동시에 처리되는 요청 수는 max_concurrency를 넘지 않음"""
+    with SheetsStubServer() as server:
+        _fill(server, 1, 75)
+        server.state.delay = 0.05
+        async_api = _async_api(server, max_concurrency=2)
+        success, message, schedules = asyncio.run(async_api.get_schedules_from_sheets())
+        async_api.close()
+
+        assert success, message
+        assert [s.id for s in schedules] == list(server.state.schedules)
+        assert server.state.actions == ["get_schedules"] * 8
+        assert server.state.max_active == 2
+
+
+def test_pending_pages_are_bounded():
+    """요청했지만 아직 합치지 않은 페이지는 max_pending_pages개까지만 둠"""
+    with SheetsStubServer() as server:
+        _fill(server, 1, 95)
+        server.state.delay = 0.02
+        async_api = AsyncGoogleSheetsAPI(GoogleSheetsAPI(server.url), max_concurrency=2, max_pending_pages=3)
+        async_api.api.DOWNLOAD_PAGE_SIZE = 10
+        started, merged, pending = [0], [0], []
+        call = async_api._call
+
+        def counted_call(func, *args):
+            # 작업 스레드에서 실행되는 시점은 부하에 따라 달라지므로 요청을 만드는 시점에 셈
+            if func == async_api.api.fetch_page:
+                started[0] += 1
+                pending.append(started[0] - merged[0])
+            return call(func, *args)
+
+        async_api._call = counted_call
+        success, message, schedules = asyncio.run(async_api.get_schedules_from_sheets(
+            lambda kind, current, total: merged.__setitem__(0, merged[0] + 1)))
+        async_api.close()
+
+        assert success, message
+        assert [s.id for s in schedules] == list(server.state.schedules)
+        assert started[0] == 10 and max(pending) == 3
+
+
+def test_sheet_changed_during_download():
+    """메타데이터와 페이지의 워터마크가 다르면 다운로드 실패"""
+    with SheetsStubServer() as server:
+        _fill(server, 2, 5)
+        server.state.metadata["sync_watermark"] = "2024-01-01T00:00:00.000000"
+        original = server.state._action_get_metadata
+        server.state._action_get_metadata = lambda data: dict(
+            original(data), data={"sync_watermark": "2024-01-02T00:00:00.000000"})
+        async_api = _async_api(server)
+        success, message, app_data = asyncio.run(async_api.sync_from_sheets_to_local())
+        async_api.close()
+
+        assert not success and app_data is None and "변경" in message
+
+
+def test_script_without_metadata_or_paging():
+    """get_metadata/페이지를 모르는 이전 앱스 스크립트와도 동작"""
+    with SheetsStubServer() as server:
+        _fill(server, 3, 25)
+        server.state.supports_paging = False
+        server.state.disabled_actions = {"get_metadata"}
+        async_api = _async_api(server)
+        success, message, app_data = asyncio.run(async_api.sync_from_sheets_to_local())
+        async_api.close()
+
+        assert success, message
+        assert (len(app_data.students), len(app_data.schedules)) == (3, 25)
+
+
+def test_loop_thread_runs_coroutines_from_other_threads():
+    """전용 루프 스레드에 코루틴을 넘기고 결과를 기다림, 취소된 다운로드는 바로 끝남"""
+    with SheetsStubServer() as server:
+        _fill(server, 1, 5)
+        async_api = _async_api(server)
+        loop = AsyncLoopThread()
+        try:
+            success, message, students = loop.run(async_api.get_students_from_sheets(), timeout=5)
+            assert success and len(students) == 1
+            assert loop.is_running
+
+            cancel = threading.Event()
+            cancel.set()
+            success, message, app_data = loop.run(async_api.sync_from_sheets_to_local(None, cancel), timeout=5)
+            assert not success and app_data is None
+            assert len(server.state.requests) == 1
+        finally:
+            loop.stop()
+            async_api.close()
+        assert not loop.is_running
+
+
+if __name__ == "__main__":
+    try:
+        test_same_methods_as_coroutines()
+        test_download_costs_slowest_request()
+        test_concurrency_is_bounded()
+        test_pending_pages_are_bounded()
+        test_sheet_changed_during_download()
+        test_script_without_metadata_or_paging()
+        test_loop_thread_runs_coroutines_from_other_threads()
+        print("[OK] 비동기 구글 시트 API 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
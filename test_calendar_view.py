@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+달력 화면 테스트 - 달 넘기기, 직접 그리는 달력의 모델/칩 위치/드래그/더블클릭
+"""
+
+import sys
+import os
+from datetime import date
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import Qt, QMimeData, QPoint, QPointF
+from PySide6.QtGui import QDropEvent
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QWidget
+
+from src.models import Student
+from src.calendar_view import CalendarView
+from src.calendar_grid import CalendarModel, CalendarGridView, ScheduleChipDelegate
+
+
+@pytest.fixture
+def students():
+    return [Student(name="김철수", total_weeks=8, weekdays=["월요일", "목요일"], start_date=date(2024, 1, 1)),
+            Student(name="이영희", total_weeks=8, weekdays=["목요일"], start_date=date(2024, 1, 4))]
+
+
+@pytest.fixture
+def data_manager(qapp, make_data_manager, students):
+    return make_data_manager(students)
+
+
+def _shown(view):
+    """표시 중인 날짜 -> [(수강생 이름, 회차)]"""
+    model = view.grid.model()
+    shown = {}
+    for row in range(model.rowCount()):
+        for column in range(model.columnCount()):
+            cell_date = model.date_at(model.index(row, column))
+            entries = model.entries_for(cell_date)
+            if entries:
+                shown[cell_date] = [(student.name, schedule.week_number) for schedule, student in entries]
+    return shown
+
+
+def test_month_flip_keeps_widgets(data_manager, students):
+    """달을 넘겨도 위젯을 새로 만들지 않고 모델만 다시 채움"""
+    view = CalendarView(data_manager)
+    view.current_date = date(2024, 1, 1)
+    view.update_calendar()
+    january = _shown(view)
+    assert january[date(2024, 1, 4)] == [("김철수", 2), ("이영희", 1)]
+
+    widgets = {id(widget) for widget in view.findChildren(QWidget)}
+    view.next_month()
+    view.next_month()
+    # 2024년 3월은 5주
+    assert view.grid.model().rowCount() == 5
+    assert view.grid.model().date_range[0] == date(2024, 2, 26)
+    view.prev_month()
+    view.prev_month()
+    assert _shown(view) == january
+    assert {id(widget) for widget in view.findChildren(QWidget)} == widgets
+
+    moved = data_manager.get_schedules_for_student(students[1].id)[0]
+    assert data_manager.move_schedule(moved.id, date(2024, 1, 5))
+    shown = _shown(view)
+    assert shown[date(2024, 1, 4)] == [("김철수", 2)]
+    assert ("이영희", 1) in shown[date(2024, 1, 5)]
+
+
+def test_painted_calendar_model(data_manager):
+    """직접 그리는 달력 - 달마다 주 수만큼 행, 칸마다 그 날짜의 일정"""
+    model = CalendarModel(data_manager)
+    model.set_month(date(2024, 1, 1))
+    assert (model.rowCount(), model.columnCount()) == (5, 7)
+    assert [(st.name, s.week_number) for s, st in model.entries_for(date(2024, 1, 4))] == [("김철수", 2), ("이영희", 1)]
+    assert model.date_at(model.index_for_date(date(2024, 1, 31))) == date(2024, 1, 31)
+    assert not model.index_for_date(date(2024, 2, 5)).isValid()
+
+    # 2024년 9월은 일요일에 시작해 6주
+    model.set_month(date(2024, 9, 1))
+    assert model.rowCount() == 6
+    assert model.date_range == (date(2024, 8, 26), date(2024, 10, 6))
+
+
+def test_painted_calendar_chips_drag_and_double_click(data_manager, students):
+    """칩 위치 계산으로 더블클릭/드래그 대상을 찾고, 일정이 많은 칸은 높이가 늘어남"""
+    grid = CalendarGridView(CalendarModel(data_manager))
+    grid.resize(1100, 700)
+    grid.show()
+    grid.set_month(date(2024, 1, 1))
+    model = grid.model()
+
+    rect = grid.visualRect(model.index_for_date(date(2024, 1, 4)))
+    chip = ScheduleChipDelegate.chip_rect(rect, 1)
+    schedule, student = grid.entry_at(chip.center())
+    assert (student.name, schedule.week_number) == ("이영희", 1)
+    # 날짜 숫자 영역은 칩이 아님
+    assert grid.entry_at(rect.topLeft() + QPoint(10, 5)) is None
+
+    requested = []
+    grid.memoRequested.connect(requested.append)
+    QTest.mouseDClick(grid.viewport(), Qt.LeftButton, Qt.NoModifier, chip.center())
+    assert requested == [schedule.id]
+
+    dropped = []
+    grid.scheduleDropped.connect(lambda schedule_id, new_date: dropped.append((schedule_id, new_date)))
+    target = grid.visualRect(model.index_for_date(date(2024, 1, 10))).center()
+    mime = QMimeData()
+    mime.setText(schedule.id)
+    grid.dropEvent(QDropEvent(QPointF(target), Qt.MoveAction, mime, Qt.LeftButton, Qt.NoModifier))
+    assert dropped == [(schedule.id, date(2024, 1, 10))]
+
+    # 한 날짜에 일정이 몰리면 그 주의 행이 모두 보이도록 늘어남
+    for other in data_manager.get_schedules_for_student(students[0].id)[2:]:
+        data_manager.move_schedule(other.id, date(2024, 1, 17))
+    grid.load_schedules()
+    count = len(model.entries_for(date(2024, 1, 17)))
+    row = model.index_for_date(date(2024, 1, 17)).row()
+    assert count >= 6
+    assert grid.rowHeight(row) >= ScheduleChipDelegate.cell_height(count)
+    assert not grid.grab().isNull()
+
+
+if __name__ == "__main__":
+    # fixture를 쓰므로 pytest로 실행
+    if pytest.main([__file__, "-q"]) == 0:
+        print("[OK] 달력 화면 테스트 통과")
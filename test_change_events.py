@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+변경 이벤트 테스트 - DataManager가 바뀐 수강생/일정/날짜를 알리고, 달력/수강생 목록/관리 창이 해당 칸과 행만 갱신
+"""
+
+import sys
+import os
+import warnings
+from datetime import date
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QCheckBox
+
+from src.models import Student
+from src.change_events import (
+    BULK_REPLACED, SCHEDULE_COMPLETED, SCHEDULE_MEMO_CHANGED, SCHEDULE_MOVED,
+    STUDENT_REMOVED, STUDENT_UPDATED
+)
+from src.calendar_view import CalendarView
+from src.student_form import StudentForm
+from src.student_manager_dialog import StudentManagerDialog
+
+PASSWORD = "events-password"
+
+
+@pytest.fixture
+def data_manager(qapp, make_data_manager):
+    return make_data_manager([
+        Student(name="김철수", total_weeks=4, weekdays=["월요일"], start_date=date(2024, 1, 1)),
+        Student(name="이영희", total_weeks=4, weekdays=["목요일"], start_date=date(2024, 1, 4))
+    ], password=PASSWORD)
+
+
+def test_mutations_emit_typed_changes(data_manager):
+    """변경마다 종류, 영향을 받은 ID, 변경 전후 날짜를 알림"""
+    changes = []
+    data_manager.changed.connect(changes.append)
+    chulsoo, younghee = data_manager.get_students()
+
+    first, second = sorted(data_manager.get_schedules_for_student(chulsoo.id), key=lambda s: s.week_number)[:2]
+    assert data_manager.update_schedule_memo(first.id, "메모")
+    assert data_manager.mark_schedule_completed(first.id)
+    assert data_manager.move_schedule(first.id, date(2024, 1, 3))
+    memo, completed, moved = changes
+    assert (memo.kind, memo.schedule_ids, memo.dates) == (SCHEDULE_MEMO_CHANGED, {first.id}, {date(2024, 1, 1)})
+    assert (completed.kind, completed.student_ids) == (SCHEDULE_COMPLETED, {chulsoo.id})
+    # 뒤따르는 수업도 옮겨지므로 이동 전후 날짜가 모두 포함됨
+    assert moved.kind == SCHEDULE_MOVED and {first.id, second.id} <= moved.schedule_ids
+    assert {date(2024, 1, 1), date(2024, 1, 3), date(2024, 1, 8)} <= moved.dates
+    assert not memo.affects_students and moved.affects_students
+
+    changes.clear()
+    younghee_dates = {s.scheduled_date for s in data_manager.get_schedules_for_student(younghee.id)}
+    younghee.weekdays = ["금요일"]
+    assert data_manager.update_student(younghee)
+    assert data_manager.remove_student(chulsoo.id)
+    updated, removed = changes
+    assert updated.kind == STUDENT_UPDATED and younghee_dates < updated.dates
+    assert date(2024, 1, 5) in updated.dates
+    assert (removed.kind, removed.student_ids) == (STUDENT_REMOVED, {chulsoo.id})
+    assert date(2024, 1, 3) in removed.dates
+
+    changes.clear()
+    data_manager.fix_all_student_schedules()
+    assert [change.kind for change in changes] == [BULK_REPLACED]
+
+
+def test_calendar_patches_only_changed_cells(data_manager):
+    """메모를 바꾸면 달력은 그 날짜의 칸만 다시 채움"""
+    view = CalendarView(data_manager)
+    view.current_date = date(2024, 1, 1)
+    view.update_calendar()
+
+    model = view.grid.model()
+    patched = []
+    model.dataChanged.connect(lambda top_left, bottom_right, roles=(): patched.append(
+        (model.date_at(top_left), model.date_at(bottom_right))))
+
+    schedule = data_manager.get_schedules_for_date(date(2024, 1, 4))[0]
+    assert data_manager.update_schedule_memo(schedule.id, "숙제 확인")
+    assert patched == [(date(2024, 1, 4), date(2024, 1, 4))]
+    assert model.entries_for(date(2024, 1, 4))[0][0].memo == "숙제 확인"
+
+    # 화면 밖 날짜만 바뀌면 아무 칸도 갱신하지 않음
+    patched.clear()
+    data_manager.add_student(Student(name="박민수", total_weeks=2, weekdays=["화요일"], start_date=date(2024, 6, 4)))
+    assert patched == []
+
+
+def _listed(form):
+    """수강생 목록에 표시되는 문구 (뷰가 그릴 때처럼 행마다 요청)"""
+    model = form.students_model
+    return [model.data(model.index(row)) for row in range(model.rowCount())]
+
+
+def test_student_lists_patch_single_rows(data_manager):
+    """수강생 목록은 바뀐 수강생의 진도만 다시 계산하고, 관리 창은 해당 행만 추가/수정/삭제"""
+    form = StudentForm(data_manager)
+    form.refresh_students_list()
+    _listed(form)
+    dialog = StudentManagerDialog(data_manager)
+    chulsoo, younghee = data_manager.get_students()
+
+    scanned = []
+    original = data_manager.count_sessions_until
+    data_manager.count_sessions_until = lambda student_id, until: (scanned.append(student_id),
+                                                                   original(student_id, until))[1]
+
+    # 메모 변경은 목록 내용과 무관하므로 다시 계산하지 않음
+    schedule = data_manager.get_schedules_for_student(chulsoo.id)[0]
+    assert data_manager.update_schedule_memo(schedule.id, "메모")
+    _listed(form)
+    assert scanned == []
+
+    # 수정된 행은 체크 상태를 유지
+    dialog.table.cellWidget(1, 0).findChild(QCheckBox).setChecked(True)
+    younghee.name = "이영희2"
+    assert data_manager.update_student(younghee)
+    assert "이영희2" in _listed(form)[1]
+    assert scanned == [younghee.id]
+    assert dialog.table.item(1, 1).text() == "이영희2"
+    assert dialog.get_selected_students() == [younghee.id]
+
+    assert data_manager.remove_student(chulsoo.id)
+    assert len(_listed(form)) == 1 and "김철수" not in _listed(form)[0]
+    assert dialog.table.rowCount() == 1
+    assert dialog.table.item(0, 1).data(Qt.UserRole) == younghee.id
+
+    data_manager.add_student(Student(name="박민수", total_weeks=2, weekdays=["화요일"], start_date=date(2024, 1, 2)))
+    assert dialog.table.rowCount() == 2 and dialog.table.item(1, 1).text() == "박민수"
+    assert "박민수" in _listed(form)[1]
+
+    # 삭제 후에도 행 번호가 맞게 유지됨
+    minsu = data_manager.get_students()[1]
+    minsu.name = "박민수2"
+    assert data_manager.update_student(minsu)
+    assert dialog.table.item(1, 1).text() == "박민수2"
+    assert dialog.table.item(0, 1).text() == "이영희2"
+
+    # 닫힌 관리 창은 더 이상 갱신하지 않음 (두 번 닫아도 오류 없음)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dialog.accept()
+        dialog.reject()
+    data_manager.add_student(Student(name="최지우", total_weeks=2, weekdays=["화요일"], start_date=date(2024, 1, 2)))
+    assert dialog.table.rowCount() == 2
+
+
+if __name__ == "__main__":
+    # fixture를 쓰므로 pytest로 실행
+    if pytest.main([__file__, "-q"]) == 0:
+        print("[OK] 변경 이벤트 테스트 통과")
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+변경 저널 영속화 테스트
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student
+from src.change_journal import ChangeJournal, JournalCorruptedError
+from src.crypto_utils import CryptoManager
+from src.data_manager import DataManager
+
+PASSWORD = "test-password"
+
+
+def test_journal_roundtrip_and_torn_tail():
+    """레코드 재생 및 끊긴 마지막 레코드 무시"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ".env.journal"
+        crypto_manager = CryptoManager()
+        crypto_manager.unlock(PASSWORD)
+        journal = ChangeJournal(path, crypto_manager)
+        journal_id = "ab" * 16
+        journal.reset(journal_id)
+        journal.append({"op": "put_schedules", "schedules": []})
+        journal.append({"op": "remove_student", "student_id": "s1"})
+
+        # 쓰기 도중 중단된 레코드 흉내
+        with open(path, 'ab') as f:
+            f.write(b"\x00\x00\x01\x00partial")
+
+        reader = ChangeJournal(path, crypto_manager)
+        records = reader.load(journal_id)
+        assert [r["op"] for r in records] == ["put_schedules", "remove_student"]
+        assert reader.record_count == 2
+
+        # 잘라낸 뒤 이어쓰기가 가능해야 함
+        reader.append({"op": "remove_student", "student_id": "s2"})
+        assert len(ChangeJournal(path, crypto_manager).load(journal_id)) == 3
+
+        # 스냅샷과 짝이 맞지 않는 저널은 무시
+        assert ChangeJournal(path, crypto_manager).load("cd" * 16) == []
+
+
+
+def test_corrupted_record_keeps_journal():
+    """끝까지 기록된 레코드가 인증에 실패하면 뒤의 레코드를 지우지 않고 오류로 알림"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".env"
+        data_manager = DataManager(data_file)
+        data_manager.set_password(PASSWORD)
+        data_manager.save_data()
+        for i in range(3):
+            data_manager.add_student(Student(name=f"수강생{i}", total_weeks=1, weekdays=["월요일"],
+                                             start_date=date(2024, 1, 1)))
+        journal_path = data_manager._journal.path
+
+        # 첫 레코드의 암호문 한 바이트 변조
+        raw = bytearray(journal_path.read_bytes())
+        raw[ChangeJournal.HEADER_SIZE + 4 + ChangeJournal.NONCE_SIZE] ^= 0x01
+        journal_path.write_bytes(bytes(raw))
+
+        crypto_manager = CryptoManager()
+        crypto_manager.unlock_for_data(data_file.read_bytes()[:CryptoManager.HEADER_SIZE], PASSWORD)
+        reader = ChangeJournal(journal_path, crypto_manager)
+        try:
+            reader.load(ChangeJournal.stored_id(journal_path))
+            assert False, "JournalCorruptedError가 발생해야 함"
+        except JournalCorruptedError:
+            pass
+        assert not reader.is_open
+
+        reloaded = DataManager(data_file)
+        assert not reloaded.load_data(PASSWORD)
+        assert journal_path.read_bytes() == bytes(raw)
+
+def test_data_manager_replays_journal():
+    """개별 수정은 저널에 기록되고 다시 불러올 때 재적용됨"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".env"
+        data_manager = DataManager(data_file)
+        data_manager.set_password(PASSWORD)
+        data_manager.save_data()
+        snapshot_size = data_file.stat().st_size
+
+        student = Student(name="저널테스트", total_weeks=3,
+                          weekdays=["화요일"], start_date=date(2024, 1, 2))
+        assert data_manager.add_student(student)
+        schedules = data_manager.get_schedules_for_student(student.id)
+        assert data_manager.mark_schedule_completed(schedules[0].id)
+        assert data_manager.update_schedule_memo(schedules[1].id, "숙제 확인")
+        assert data_manager.move_schedule(schedules[2].id, date(2024, 1, 30))
+
+        # 스냅샷은 그대로이고 저널에만 기록되어야 함
+        assert data_file.stat().st_size == snapshot_size
+        assert data_manager._journal.record_count == 4
+
+        reloaded = DataManager(data_file)
+        assert reloaded.load_data(PASSWORD)
+        assert [s.name for s in reloaded.get_students()] == ["저널테스트"]
+        assert reloaded.get_schedule_by_id(schedules[0].id).is_completed
+        assert reloaded.get_schedule_by_id(schedules[1].id).memo == "숙제 확인"
+        assert reloaded.get_schedule_by_id(schedules[2].id).scheduled_date == date(2024, 1, 30)
+
+        assert reloaded.remove_student(student.id)
+        again = DataManager(data_file)
+        assert again.load_data(PASSWORD)
+        assert again.get_students() == [] and again.get_schedules() == []
+
+
+def test_compaction_folds_journal_into_snapshot():
+    """저널이 가득 차면 스냅샷으로 압축"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".env"
+        data_manager = DataManager(data_file)
+        data_manager.JOURNAL_COMPACT_THRESHOLD = 2
+        data_manager.set_password(PASSWORD)
+        data_manager.save_data()
+
+        student = Student(name="압축테스트", total_weeks=1,
+                          weekdays=["월요일"], start_date=date(2024, 1, 1))
+        data_manager.add_student(student)
+        schedule_id = data_manager.get_schedules_for_student(student.id)[0].id
+        data_manager.update_schedule_memo(schedule_id, "1")
+        assert data_manager._journal.record_count == 2
+
+        data_manager.update_schedule_memo(schedule_id, "2")
+        assert data_manager._journal.record_count == 0
+
+        reloaded = DataManager(data_file)
+        assert reloaded.load_data(PASSWORD)
+        assert reloaded.get_schedule_by_id(schedule_id).memo == "2"
+
+
+def test_outbox_waits_for_journal_append():
+    """저널(또는 스냅샷) 기록이 실패한 변경은 업로드 대기열에 넣지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / ".env")
+        data_manager.set_password(PASSWORD)
+        data_manager.save_data()
+        data_manager.add_student(Student(name="대기열", total_weeks=1, weekdays=["월요일"],
+                                         start_date=date(2024, 1, 1)))
+        schedule_id = data_manager.get_schedules()[0].id
+        queued = data_manager.outbox_seq
+
+        def failing_append(record):
+            raise OSError("disk full")
+
+        data_manager._journal.append = failing_append
+        data_manager.save_data = lambda: False
+        assert not data_manager._commit(data_manager._schedules_record([data_manager.get_schedule_by_id(schedule_id)]))
+        assert data_manager.outbox_seq == queued
+
+        del data_manager._journal.append
+        assert data_manager.update_schedule_memo(schedule_id, "메모")
+        assert data_manager.outbox_seq > queued
+
+
+if __name__ == "__main__":
+    try:
+        test_journal_roundtrip_and_torn_tail()
+        test_corrupted_record_keeps_journal()
+        test_data_manager_replays_journal()
+        test_compaction_folds_journal_into_snapshot()
+        test_outbox_waits_for_journal_append()
+        print("[OK] 변경 저널 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
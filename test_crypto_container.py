@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+AES-GCM 컨테이너 형식 테스트
+"""
+
+import sys
+import os
+import io
+import json
+import hmac
+import hashlib
+import tempfile
+from pathlib import Path
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.backends import default_backend
+
+from src.crypto_utils import CryptoManager
+from src.models import AppData, Student
+from src.data_manager import DataManager
+
+PASSWORD = "container-password"
+
+
+def _small_chunk_manager() -> CryptoManager:
+    crypto_manager = CryptoManager()
+    crypto_manager.CHUNK_SIZE = 64  # 여러 프레임으로 나뉘도록 작은 청크 사용
+    crypto_manager.unlock(PASSWORD)
+    return crypto_manager
+
+
+def test_streaming_roundtrip():
+    """여러 프레임에 걸친 스트리밍 암복호화"""
+    crypto_manager = _small_chunk_manager()
+    data = {"items": [f"항목 {i}" for i in range(100)]}
+
+    buffer = io.BytesIO()
+    crypto_manager.encrypt_to_file(data, buffer)
+    encrypted = buffer.getvalue()
+    assert CryptoManager.is_container(encrypted)
+
+    chunks = list(crypto_manager.decrypt_stream(io.BytesIO(encrypted)))
+    assert len(chunks) > 10
+    assert all(len(chunk) <= crypto_manager.CHUNK_SIZE for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == data
+    assert CryptoManager().decrypt_data(encrypted, PASSWORD) == data
+
+    # 모은 평문은 다시 복사하지 않고 그대로 반환
+    plaintext = crypto_manager.decrypt_to_bytes(io.BytesIO(encrypted))
+    assert type(plaintext) is bytearray and plaintext == b"".join(chunks)
+
+
+def test_tamper_and_truncation_detected():
+    """변조되거나 잘린 데이터는 복호화 실패"""
+    crypto_manager = _small_chunk_manager()
+    encrypted = crypto_manager.encrypt_data({"items": list(range(200))})
+
+    tampered = bytearray(encrypted)
+    tampered[CryptoManager.HEADER_SIZE + 10] ^= 0x01
+    truncated = encrypted[:CryptoManager.HEADER_SIZE + 5 + 64 + 16]
+
+    for broken in (bytes(tampered), truncated):
+        try:
+            crypto_manager.decrypt_data(broken)
+            assert False, "손상된 데이터가 복호화되면 안 됨"
+        except Exception:
+            pass
+
+
+def test_key_check_verifies_header_only():
+    """키 확인값으로 본문 복호화 없이 비밀번호 확인"""
+    crypto_manager = _small_chunk_manager()
+    encrypted = crypto_manager.encrypt_data({"items": list(range(200))})
+    header = encrypted[:CryptoManager.HEADER_SIZE]
+    assert CryptoManager.has_key_check(header)
+
+    checker = CryptoManager()
+    assert checker.verify_password(header, PASSWORD)
+    assert not checker.verify_password(header, "wrong-password")
+    try:
+        checker.decrypt_data(encrypted, "wrong-password")
+        assert False, "틀린 비밀번호로 복호화되면 안 됨"
+    except ValueError as e:
+        assert "invalid password" in str(e)
+
+
+def test_key_check_uses_separate_key():
+    """키 확인값은 암호화 키가 아닌 HKDF로 파생한 키로 만들고, 버전 2 헤더도 읽음"""
+    crypto_manager = _small_chunk_manager()
+    key = crypto_manager._session.get()
+    encrypted = crypto_manager.encrypt_data({"items": list(range(200))})
+    check = encrypted[CryptoManager.V1_HEADER_SIZE:CryptoManager.HEADER_SIZE]
+    assert encrypted[4] == CryptoManager.CONTAINER_VERSION == 3
+    assert check != hmac.new(key, CryptoManager.KEY_CHECK_LABEL, hashlib.sha256).digest()[:CryptoManager.KEY_CHECK_SIZE]
+
+    # 이전 버전 2 파일 (암호화 키로 직접 만든 키 확인값)
+    crypto_manager.CONTAINER_VERSION = 2
+    legacy = crypto_manager.encrypt_data({"items": [1, 2, 3]})
+    assert legacy[4] == 2
+    assert CryptoManager().verify_password(legacy[:CryptoManager.HEADER_SIZE], PASSWORD)
+    assert CryptoManager().decrypt_data(legacy, PASSWORD) == {"items": [1, 2, 3]}
+
+
+def test_verify_then_load_derives_key_once():
+    """verify_password로 파생한 키를 load_data에서 재사용"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".env"
+        writer = DataManager(data_file)
+        writer.set_password(PASSWORD)
+        assert writer.save_data()
+
+        data_manager = DataManager(data_file)
+        derive_calls = []
+        original = data_manager.crypto_manager._derive_key
+
+        def counting_derive(password, salt):
+            derive_calls.append(password)
+            return original(password, salt)
+
+        data_manager.crypto_manager._derive_key = counting_derive
+        assert not data_manager.verify_password("wrong-password")
+        assert data_manager.verify_password(PASSWORD)
+        assert data_manager.load_data(PASSWORD)
+        assert derive_calls == ["wrong-password", PASSWORD]
+
+        # 다른 비밀번호로 불러오면 확인해 둔 키를 쓰지 않음
+        assert data_manager.verify_password(PASSWORD)
+        assert not data_manager.load_data("wrong-password")
+
+
+def _legacy_cbc_file(json_data: bytes, key: bytes, salt: bytes) -> bytes:
+    """이전 형식 파일 내용 (salt + IV + PKCS7 패딩한 AES-CBC 암호문)"""
+    iv = os.urandom(CryptoManager.IV_SIZE)
+    padding_length = 16 - (len(json_data) % 16)
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend()).encryptor()
+    return salt + iv + encryptor.update(json_data + bytes([padding_length] * padding_length)) + encryptor.finalize()
+
+def test_legacy_cbc_file_is_migrated():
+    """이전 AES-CBC 파일을 읽고 새 형식으로 변환"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".env"
+
+        app_data = AppData()
+        app_data.students = [Student(name="이전형식", weekdays=["월요일"], start_date=date(2024, 1, 1))]
+        salt = os.urandom(CryptoManager.SALT_SIZE)
+        json_data = json.dumps(app_data.to_dict(), ensure_ascii=False, indent=2).encode('utf-8')
+        data_file.write_bytes(_legacy_cbc_file(json_data, CryptoManager()._derive_key(PASSWORD, salt), salt))
+
+        data_manager = DataManager(data_file)
+        assert data_manager.load_data(PASSWORD)
+        assert [s.name for s in data_manager.get_students()] == ["이전형식"]
+        assert CryptoManager.is_container(data_file.read_bytes())
+        assert list((Path(tmp) / "backups").glob("backup_*.sms"))
+
+        reloaded = DataManager(data_file)
+        assert reloaded.load_data(PASSWORD)
+        assert [s.name for s in reloaded.get_students()] == ["이전형식"]
+
+
+if __name__ == "__main__":
+    try:
+        test_streaming_roundtrip()
+        test_tamper_and_truncation_detected()
+        test_key_check_verifies_header_only()
+        test_key_check_uses_separate_key()
+        test_verify_then_load_derives_key_once()
+        test_legacy_cbc_file_is_migrated()
+        print("[OK] 컨테이너 형식 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
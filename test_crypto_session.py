@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+세션 키 암호화 테스트
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.crypto_utils import CryptoManager
+from src.data_manager import DataManager
+
+PASSWORD = "session-password"
+
+
+def test_session_key_reused_with_fresh_iv():
+    """세션 키로 저장할 때마다 salt는 유지되고 nonce는 새로 생성"""
+    crypto_manager = CryptoManager()
+    session = crypto_manager.unlock(PASSWORD)
+
+    first = crypto_manager.encrypt_data({"value": 1})
+    second = crypto_manager.encrypt_data({"value": 1})
+    assert CryptoManager.salt_of(first) == CryptoManager.salt_of(second) == session.salt
+    assert first[38:46] != second[38:46]
+
+    # 세션 키로 암호화한 데이터는 비밀번호로도 복호화 가능 (기존 형식 호환)
+    assert CryptoManager().decrypt_data(first, PASSWORD) == {"value": 1}
+    assert crypto_manager.decrypt_data(second) == {"value": 1}
+
+
+def test_lock_zeroizes_key():
+    """잠금 시 키가 0으로 덮어써지고 더 이상 사용할 수 없음"""
+    crypto_manager = CryptoManager()
+    session = crypto_manager.unlock(PASSWORD)
+    crypto_manager.lock()
+
+    assert not session.is_valid
+    assert bytes(session._key) == bytes(32)
+    try:
+        crypto_manager.encrypt_data({"value": 1})
+        assert False, "잠긴 상태에서 암호화가 성공하면 안 됨"
+    except ValueError:
+        pass
+
+
+def test_data_manager_change_password():
+    """비밀번호 변경 후 새 비밀번호로만 열림"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".env"
+        data_manager = DataManager(data_file)
+        data_manager.set_password(PASSWORD)
+        assert data_manager.save_data()
+
+        assert data_manager.change_password("new-password")
+        data_manager.lock()
+        assert not data_manager.save_data()
+
+        assert not DataManager(data_file).load_data(PASSWORD)
+        assert DataManager(data_file).load_data("new-password")
+
+
+if __name__ == "__main__":
+    try:
+        test_session_key_reused_with_fresh_iv()
+        test_lock_zeroizes_key()
+        test_data_manager_change_password()
+        print("[OK] 세션 키 암호화 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+구글 시트 델타 동기화 테스트 (로컬 스텁 서버 사용)
+"""
+
+import sys
+import os
+from datetime import date, datetime
+
+import pytest
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student
+from src.data_manager import DataManager
+from src.delta_sync import SYNC_WATERMARK, SYNC_TOMBSTONES, build_delta
+from src.google_sheets_api import GoogleSheetsAPI
+from sheets_stub_server import SheetsStubServer
+
+PASSWORD = "delta-password"
+
+
+@pytest.fixture
+def data_manager(make_data_manager):
+    return make_data_manager([Student(name=name, total_weeks=4, weekdays=[weekday], start_date=date(2024, 1, 1))
+                              for name, weekday in (("김철수", "월요일"), ("이영희", "수요일"))],
+                             password=PASSWORD, save=True)
+
+
+def _upload(api: GoogleSheetsAPI, data_manager: DataManager):
+    success, message, ack = api.upload_changes(data_manager.data, datetime.now())
+    assert success, message
+    assert data_manager.acknowledge_sync(ack)
+
+
+def _assert_server_matches(server, data_manager):
+    assert set(server.state.students) == {s.id for s in data_manager.get_students()}
+    assert server.state.schedules == {s.id: s.to_dict() for s in data_manager.get_schedules()}
+
+
+def test_only_changes_are_sent_after_first_upload(data_manager):
+    """첫 업로드는 전체, 이후에는 변경된 레코드만 전송"""
+    with SheetsStubServer() as server:
+        api = GoogleSheetsAPI(server.url)
+
+        _upload(api, data_manager)
+        first = server.state.requests[-1]["request_bytes"]
+        assert data_manager.data.metadata[SYNC_WATERMARK] == server.state.metadata["sync_watermark"]
+
+        schedule = data_manager.get_schedules()[0]
+        assert data_manager.update_schedule_memo(schedule.id, "숙제 확인")
+        delta = build_delta(data_manager.data, datetime.now())
+        assert not delta["full"] and [s["id"] for s in delta["schedules"]] == [schedule.id]
+        assert delta["students"] == []
+
+        _upload(api, data_manager)
+        assert server.state.requests[-1]["request_bytes"] < first / 5
+        assert server.state.schedules[schedule.id]["memo"] == "숙제 확인"
+        _assert_server_matches(server, data_manager)
+
+
+def test_deletes_are_sent_as_tombstones(data_manager, tmp_path):
+    """삭제/재생성된 레코드는 삭제 목록으로 전송되고 확인 후 비워짐"""
+    with SheetsStubServer() as server:
+        api = GoogleSheetsAPI(server.url)
+        _upload(api, data_manager)
+
+        removed, edited = data_manager.get_students()
+        assert data_manager.remove_student(removed.id)
+        edited.total_weeks = 2
+        assert data_manager.update_student(edited)
+
+        tombstones = data_manager.data.metadata[SYNC_TOMBSTONES]
+        assert removed.id in tombstones["students"]
+        assert len(tombstones["schedules"]) == 8  # 삭제된 4개 + 재생성 전 4개
+
+        # 저널만 남은 상태에서 다시 열어도 삭제 기록이 유지됨
+        reloaded = DataManager(tmp_path / ".env")
+        assert reloaded.load_data(PASSWORD)
+        assert reloaded.data.metadata[SYNC_TOMBSTONES] == tombstones
+
+        _upload(api, data_manager)
+        assert SYNC_TOMBSTONES not in data_manager.data.metadata
+        _assert_server_matches(server, data_manager)
+
+
+def test_watermark_mismatch_falls_back_to_full_upload(data_manager):
+    """서버 기준 시각이 다르면 (시트 초기화 등) 전체 업로드로 다시 맞춤"""
+    with SheetsStubServer() as server:
+        api = GoogleSheetsAPI(server.url)
+        _upload(api, data_manager)
+
+        server.state.metadata.clear()
+        server.state.schedules.clear()
+        data_manager.mark_schedule_completed(data_manager.get_schedules()[0].id)
+
+        _upload(api, data_manager)
+        assert server.state.actions[-2:] == ["delta_sync", "delta_sync"]
+        _assert_server_matches(server, data_manager)
+
+
+def test_edits_after_snapshot_go_in_next_upload(data_manager):
+    """업로드 스냅샷 이후의 변경은 다음 업로드에 포함"""
+    with SheetsStubServer() as server:
+        api = GoogleSheetsAPI(server.url)
+
+        snapshot, until = data_manager.data.copy(), datetime.now()
+        schedule = data_manager.get_schedules()[-1]
+        assert data_manager.update_schedule_memo(schedule.id, "업로드 중 수정")
+
+        success, message, ack = api.upload_changes(snapshot, until)
+        assert success, message
+        assert data_manager.acknowledge_sync(ack)
+        assert server.state.schedules[schedule.id]["memo"] == ""
+
+        _upload(api, data_manager)
+        assert server.state.schedules[schedule.id]["memo"] == "업로드 중 수정"
+
+
+if __name__ == "__main__":
+    # fixture를 쓰므로 pytest로 실행
+    if pytest.main([__file__, "-q"]) == 0:
+        print("[OK] 델타 동기화 테스트 통과")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+__slots__ 모델 테스트
+"""
+
+import sys
+import os
+from datetime import date, datetime
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, Schedule, intern_date
+
+
+def test_models_have_no_instance_dict():
+    """인스턴스별 __dict__ 없음"""
+    for obj in (Student(), Schedule()):
+        assert not hasattr(obj, "__dict__")
+        try:
+            obj.unknown_field = 1
+            assert False, "정의되지 않은 속성은 추가할 수 없어야 함"
+        except AttributeError:
+            pass
+
+
+def test_dict_contract_unchanged():
+    """to_dict/from_dict 형식은 그대로 유지"""
+    student = Student(name="홍길동", total_weeks=3, weekdays=["화요일"], start_date=date(2024, 5, 7),
+                      created_at=datetime(2024, 5, 1, 10, 0, 0, 5))
+    assert Student.from_dict(student.to_dict()) == student
+    assert list(student.to_dict()) == ["id", "name", "total_weeks", "weekdays",
+                                       "start_date", "created_at", "is_active", "color", "updated_at"]
+
+    # 수정 시각이 없는 이전 데이터는 생성 시각으로 채움
+    legacy = student.to_dict()
+    del legacy["updated_at"]
+    assert Student.from_dict(legacy).updated_at == student.created_at
+
+    schedule = Schedule(student_id=student.id, week_number=2, scheduled_date=date(2024, 5, 14), memo="메모")
+    assert Schedule.from_dict(schedule.to_dict()) == schedule
+
+
+def test_student_id_and_dates_are_shared():
+    """student_id 문자열과 날짜 객체를 스케줄끼리 공유"""
+    student_id = "0f8fad5b-d9cb-469f-a165-70867728950e"
+    first = Schedule.from_dict({"student_id": "".join(student_id), "scheduled_date": "2024-05-14"})
+    second = Schedule.from_dict({"student_id": "".join(student_id), "scheduled_date": "2024-05-14"})
+    third = Schedule(student_id="".join(student_id), scheduled_date=date(2024, 5, 14))
+
+    assert first.student_id is second.student_id is third.student_id
+    assert first.scheduled_date is second.scheduled_date is third.scheduled_date
+
+
+def test_date_pool_is_bounded():
+    """공유 날짜 풀은 크기가 제한되어 오래 실행해도 계속 늘어나지 않음"""
+    start = date(2000, 1, 1).toordinal()
+    for ordinal in range(start, start + 10_000):
+        intern_date(date.fromordinal(ordinal))
+    info = intern_date.cache_info()
+    assert info.currsize <= info.maxsize
+
+
+if __name__ == "__main__":
+    try:
+        test_models_have_no_instance_dict()
+        test_dict_contract_unchanged()
+        test_student_id_and_dates_are_shared()
+        test_date_pool_is_bounded()
+        print("[OK] 모델 __slots__ 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+드래그 이동 후 이후 수업 재배치 테스트
+"""
+
+import sys
+import os
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, WEEKDAY_INDEX
+from src.data_manager import DataManager
+
+
+def _expected_dates(weekdays, anchor, count):
+    """이전 구현과 같은 방식 - 하루씩 요일을 계산"""
+    indices = [WEEKDAY_INDEX[d] for d in weekdays]
+    position = indices.index(anchor.weekday()) if anchor.weekday() in indices else 0
+    current = anchor
+    result = []
+    for _ in range(count):
+        position = (position + 1) % len(indices)
+        days_ahead = indices[position] - current.weekday()
+        if days_ahead <= 0:
+            days_ahead += 7
+        current = current + timedelta(days=days_ahead)
+        result.append(current)
+    return result
+
+
+def test_following_sessions_shift_in_one_batch():
+    """이동한 수업 뒤의 수업만 수강 요일 순서대로 재배치"""
+    data_manager = DataManager()
+    data_manager.data.students = []
+    data_manager.data.schedules = []
+
+    student = Student(name="재배치", total_weeks=8, weekdays=["목요일", "월요일"], start_date=date(2024, 1, 1))
+    other = Student(name="다른 수강생", total_weeks=8, weekdays=["월요일"], start_date=date(2024, 1, 1))
+    for s in (other, student):
+        data_manager.data.students.append(s)
+        data_manager._generate_schedules_for_student(s)
+    other_dates = [s.scheduled_date for s in data_manager.get_schedules_for_student(other.id)]
+
+    sessions = sorted(data_manager.get_schedules_for_student(student.id), key=lambda s: s.week_number)
+    before = [s.scheduled_date for s in sessions[:3]]
+    for anchor in (date(2024, 1, 18), date(2024, 1, 20)):  # 수강 요일 / 수강 요일이 아닌 날
+        assert data_manager.move_schedule(sessions[3].id, anchor)
+        assert [s.scheduled_date for s in sessions[:3]] == before
+        assert sessions[3].scheduled_date == anchor
+        assert [s.scheduled_date for s in sessions[4:]] == _expected_dates(student.weekdays, anchor, 4)
+
+    # 날짜 인덱스와 다른 수강생의 스케줄도 일관되게 유지
+    for s in sessions:
+        assert s in data_manager.get_schedules_for_date(s.scheduled_date)
+    assert [s.scheduled_date for s in data_manager.get_schedules_for_student(other.id)] == other_dates
+
+
+if __name__ == "__main__":
+    try:
+        test_following_sessions_shift_in_one_batch()
+        print("[OK] 재배치 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+백그라운드 저장 스케줄러 테스트
+"""
+
+import sys
+import os
+import shutil
+from datetime import date
+
+import pytest
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student
+from src.data_manager import DataManager
+
+PASSWORD = "scheduler-password"
+
+
+@pytest.fixture
+def data_manager(make_data_manager):
+    return make_data_manager([Student(name="스케줄러", total_weeks=4, weekdays=["월요일"],
+                                      start_date=date(2024, 1, 1))], password=PASSWORD, save=True)
+
+
+def test_burst_is_coalesced_into_one_background_write(data_manager, wait_until):
+    """연속된 저장 요청은 작업 스레드에서 한 번만 기록"""
+    scheduler = data_manager.enable_background_save(delay_ms=50)
+
+    writes = []
+    original = data_manager.write_snapshot
+    data_manager.write_snapshot = lambda job: (writes.append(job.seq), original(job))
+    states = []
+    scheduler.pendingChanged.connect(states.append)
+
+    for _ in range(5):
+        assert data_manager.request_save()
+    assert scheduler.has_pending
+    assert wait_until(lambda: not scheduler.has_pending)
+    assert len(writes) == 1 and states == [True, False]
+
+    scheduler.shutdown()
+
+
+def test_edits_during_write_survive(data_manager, tmp_path):
+    """저장 중에 추가된 변경은 새 저널로 옮겨지고, 중간에 멈춰도 복구됨"""
+    schedule_ids = [s.id for s in data_manager.get_schedules()]
+
+    job = data_manager.prepare_snapshot()
+    assert data_manager.update_schedule_memo(schedule_ids[0], "저장 중 수정")
+    data_manager.write_snapshot(job)
+
+    # 스냅샷만 교체되고 저널은 아직 바뀌기 전에 중단된 상황
+    crashed = tmp_path / "crashed"
+    crashed.mkdir()
+    shutil.copy2(job.temp_file, crashed / ".env")
+    shutil.copy2(tmp_path / ".env.journal", crashed / ".env.journal")
+    recovered = DataManager(crashed / ".env")
+    assert recovered.load_data(PASSWORD)
+    assert recovered.get_schedule_by_id(schedule_ids[0]).memo == "저장 중 수정"
+
+    assert data_manager.finish_snapshot(job)
+    assert data_manager._journal.record_count == 1
+    # 임시 파일이 그대로 데이터 파일로 교체됨 (.bak을 거치지 않음)
+    assert not job.temp_file.exists()
+    assert not list(tmp_path.glob("*.bak")) and not list(tmp_path.glob("*.tmp"))
+    reloaded = DataManager(tmp_path / ".env")
+    assert reloaded.load_data(PASSWORD)
+    assert reloaded.get_schedule_by_id(schedule_ids[0]).memo == "저장 중 수정"
+
+
+def test_stale_snapshot_is_discarded_and_flush_writes_now(qapp, data_manager, tmp_path):
+    """늦게 끝난 이전 스냅샷은 버리고, flush는 즉시 저장"""
+    stale = data_manager.prepare_snapshot()
+    data_manager.get_students()[0].name = "최신"
+    assert data_manager.save_data()
+    data_manager.write_snapshot(stale)
+    assert not data_manager.finish_snapshot(stale)
+    assert not stale.temp_file.exists()
+
+    scheduler = data_manager.enable_background_save(delay_ms=60_000)
+    data_manager.get_students()[0].name = "종료 전 저장"
+    data_manager.request_save()
+    assert scheduler.has_pending
+    assert scheduler.flush() and not scheduler.has_pending
+    scheduler.shutdown()
+
+    reloaded = DataManager(tmp_path / ".env")
+    assert reloaded.load_data(PASSWORD)
+    assert reloaded.get_students()[0].name == "종료 전 저장"
+
+
+if __name__ == "__main__":
+    # fixture를 쓰므로 pytest로 실행
+    if pytest.main([__file__, "-q"]) == 0:
+        print("[OK] 백그라운드 저장 테스트 통과")
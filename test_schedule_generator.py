@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+스케줄 일괄 생성 테스트
+"""
+
+import sys
+import os
+import random
+import tempfile
+from pathlib import Path
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, WEEKDAY_NAMES, WEEKDAY_INDEX
+from src.schedule_generator import generate_schedules
+from src.data_manager import DataManager
+
+
+def _loop_dates(student):
+    """이전 주 단위 반복문 방식으로 계산한 수업 날짜"""
+    weekday_indices = sorted(WEEKDAY_INDEX[d] for d in student.weekdays if d in WEEKDAY_INDEX)
+    if not weekday_indices:
+        return []
+    week_start = student.start_date - timedelta(days=student.start_date.weekday())
+    dates = []
+    week_num = 0
+    while len(dates) < student.total_weeks:
+        for idx in weekday_indices:
+            if len(dates) >= student.total_weeks:
+                break
+            d = week_start + timedelta(weeks=week_num, days=idx)
+            if d >= student.start_date:
+                dates.append(d)
+        week_num += 1
+    return dates
+
+
+def test_matches_weekly_loop():
+    """일괄 생성 결과가 기존 반복문 결과와 동일"""
+    rng = random.Random(7)
+    students = []
+    for _ in range(300):
+        weekdays = rng.sample(WEEKDAY_NAMES, rng.randint(0, 4))
+        if weekdays and rng.random() < 0.1:
+            weekdays.append(weekdays[0])  # 중복 요일
+        students.append(Student(name="s", total_weeks=rng.randint(0, 30), weekdays=weekdays,
+                                start_date=date(2024, 1, 1) + timedelta(days=rng.randint(0, 400))))
+
+    schedules = generate_schedules(students)
+    for student in students:
+        mine = [s for s in schedules if s.student_id == student.id]
+        assert [s.week_number for s in mine] == list(range(1, len(mine) + 1))
+        assert [s.scheduled_date for s in mine] == _loop_dates(student)
+    assert len({s.id for s in schedules}) == len(schedules)
+
+
+def test_bulk_enrollment_and_fix_all():
+    """일괄 등록 후 전체 재생성 시 스케줄 수와 인덱스 유지"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / ".env")
+        data_manager.set_password("bulk")
+        assert data_manager.save_data()
+        students = [Student(name=f"수강생{i}", total_weeks=5, weekdays=["화요일", "금요일"],
+                            start_date=date(2024, 3, 1)) for i in range(20)]
+        assert data_manager.add_students(students)
+        assert len(data_manager.get_schedules()) == 100
+        assert data_manager._journal.record_count == 1
+        assert len(data_manager.get_schedules_for_date(date(2024, 3, 1))) == 20
+
+        data_manager.fix_all_student_schedules()
+        assert len(data_manager.get_schedules()) == 100
+        assert len(data_manager.get_schedules_for_student(students[0].id)) == 5
+        assert data_manager._journal.record_count == 2
+
+        # 전체 스냅샷 저장 없이 저널 재적용만으로 같은 일정이 복원됨
+        reloaded = DataManager(Path(tmp) / ".env")
+        assert reloaded.load_data("bulk")
+        assert len(reloaded.get_schedules()) == 100
+        assert {s.id for s in reloaded.get_schedules()} == {s.id for s in data_manager.get_schedules()}
+        assert [s.name for s in reloaded.get_students()] == [s.name for s in students]
+
+
+if __name__ == "__main__":
+    try:
+        test_matches_weekly_loop()
+        test_bulk_enrollment_and_fix_all()
+        print("[OK] 스케줄 일괄 생성 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+스케줄 인덱스 저장소 테스트
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, Schedule
+from src.schedule_store import ScheduleStore
+from src.data_manager import DataManager
+
+
+def _make_schedules():
+    base = date(2024, 1, 1)
+    return [
+        Schedule(student_id=f"student-{i % 3}", week_number=i // 3 + 1,
+                 scheduled_date=base + timedelta(days=i % 5))
+        for i in range(15)
+    ]
+
+
+def _assert_consistent(store: ScheduleStore, schedules):
+    """인덱스가 리스트 전체 스캔 결과와 일치하는지 확인"""
+    assert len(store) == len(schedules)
+    for i, schedule in enumerate(schedules):
+        assert store.get(schedule.id) is schedule
+        assert store._positions[schedule.id] == i
+    for student_id in {s.student_id for s in schedules}:
+        expected = [s for s in schedules if s.student_id == student_id]
+        assert sorted(s.id for s in store.for_student(student_id)) == sorted(s.id for s in expected)
+    for d in {s.scheduled_date for s in schedules}:
+        expected = [s for s in schedules if s.scheduled_date == d]
+        assert sorted(s.id for s in store.for_date(d)) == sorted(s.id for s in expected)
+    assert store.dates_between(date.min, date.max) == sorted({s.scheduled_date for s in schedules})
+
+
+def test_store_add_move_remove():
+    """추가/이동/교체/삭제 후 인덱스 일관성"""
+    schedules = _make_schedules()
+    store = ScheduleStore(schedules)
+    _assert_consistent(store, schedules)
+
+    extra = Schedule(student_id="student-9", scheduled_date=date(2024, 2, 1))
+    store.add(extra)
+    assert schedules[-1] is extra
+    _assert_consistent(store, schedules)
+
+    store.move(schedules[0], date(2024, 3, 1))
+    assert schedules[0].scheduled_date == date(2024, 3, 1)
+    _assert_consistent(store, schedules)
+
+    replacement = Schedule(id=schedules[1].id, student_id="student-1", scheduled_date=date(2024, 4, 1))
+    assert store.update(replacement)
+    assert schedules[1] is replacement
+    _assert_consistent(store, schedules)
+
+    assert store.remove(extra.id) is extra
+    assert store.get(extra.id) is None
+    _assert_consistent(store, schedules)
+
+    removed = store.remove_student("student-0")
+    assert removed and all(s.student_id == "student-0" for s in removed)
+    assert store.for_student("student-0") == []
+    _assert_consistent(store, schedules)
+
+
+class _ScanCountingList(list):
+    """리스트 전체를 훑는 연산 횟수를 세는 리스트"""
+    scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+    def remove(self, value):
+        self.scans += 1
+        super().remove(value)
+
+
+def test_mutations_do_not_scan_list():
+    """교체/삭제는 위치 인덱스로 처리해 스케줄 리스트를 훑지 않음"""
+    schedules = _ScanCountingList(_make_schedules())
+    store = ScheduleStore(schedules)
+    schedules.scans = 0
+
+    replacement = Schedule(id=schedules[4].id, student_id=schedules[4].student_id, scheduled_date=date(2024, 4, 1))
+    assert store.update(replacement) and schedules[4] is replacement
+    assert store.remove(schedules[0].id) is not None
+    assert len(store.remove_student("student-1")) == 5
+    assert schedules.scans == 0
+
+    _assert_consistent(store, schedules)
+    assert all(s.student_id != "student-1" for s in schedules)
+
+
+def test_store_range():
+    """정렬된 날짜 인덱스 범위 조회"""
+    schedules = _make_schedules()
+    store = ScheduleStore(schedules)
+
+    in_range = store.range(date(2024, 1, 2), date(2024, 1, 3))
+    assert {s.scheduled_date for s in in_range} == {date(2024, 1, 2), date(2024, 1, 3)}
+    assert [s.scheduled_date for s in in_range] == sorted(s.scheduled_date for s in in_range)
+    assert store.range(date(2025, 1, 1), date(2025, 12, 31)) == []
+
+
+def test_data_manager_getters_use_index():
+    """DataManager 조회 함수가 인덱스를 통해 일관된 결과를 반환"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / ".env")
+
+        student = Student(name="인덱스테스트", total_weeks=4,
+                          weekdays=["월요일", "수요일"], start_date=date(2024, 1, 1))
+        data_manager.data.students.append(student)
+        data_manager._generate_schedules_for_student(student)
+
+        schedules = data_manager.get_schedules_for_student(student.id)
+        assert len(schedules) == 4
+        assert data_manager.get_schedule_by_id(schedules[0].id) is schedules[0]
+        assert data_manager.get_schedules_for_date(date(2024, 1, 3)) == [schedules[1]]
+
+        by_date = data_manager.get_schedules_in_range(date(2024, 1, 1), date(2024, 1, 7))
+        assert list(by_date) == [date(2024, 1, 1), date(2024, 1, 3)]
+        assert by_date[date(2024, 1, 1)] == [schedules[0]]
+
+        # data.schedules를 통째로 교체해도 인덱스가 다시 생성되어야 함
+        data_manager.data.schedules = []
+        assert data_manager.get_schedules_for_student(student.id) == []
+
+
+if __name__ == "__main__":
+    try:
+        test_store_add_move_remove()
+        test_mutations_do_not_scan_list()
+        test_store_range()
+        test_data_manager_getters_use_index()
+        print("[OK] 스케줄 인덱스 저장소 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+열 기반 스케줄 테이블 테스트
+"""
+
+import sys
+import os
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Schedule
+from src.schedule_table import ScheduleTable
+
+
+def _sample_schedules():
+    base = date(2024, 2, 20)
+    schedules = []
+    for i in range(30):
+        schedules.append(Schedule(
+            student_id=f"student-{i % 3}", week_number=i // 3 + 1,
+            scheduled_date=base + timedelta(days=(i * 7) % 40),
+            is_completed=i % 4 == 0, memo="메모" if i % 5 == 0 else ""
+        ))
+    return schedules
+
+
+def test_roundtrip_is_lossless():
+    """Schedule 목록 <-> 테이블 변환 시 순서와 모든 필드 보존"""
+    schedules = _sample_schedules()
+    table = ScheduleTable.from_schedules(schedules)
+    assert len(table) == len(schedules)
+    assert table.to_schedules() == schedules
+    assert len(table.memos) == sum(1 for s in schedules if s.memo)
+
+
+def test_aggregates_match_object_scan():
+    """열 단위 집계가 객체 순회 결과와 동일"""
+    schedules = _sample_schedules()
+    table = ScheduleTable.from_schedules(schedules)
+    today = date(2024, 3, 10)
+
+    for student_id in ("student-0", "student-1", "student-2"):
+        mine = [s for s in schedules if s.student_id == student_id]
+        assert table.count_per_student()[student_id] == len(mine)
+        assert table.completed_per_student().get(student_id, 0) == sum(s.is_completed for s in mine)
+        assert table.held_per_student(today).get(student_id, 0) == sum(s.scheduled_date <= today for s in mine)
+
+
+def test_month_query_sorted_by_date():
+    """월 단위 조회는 날짜순으로, 범위 밖 스케줄은 제외"""
+    schedules = _sample_schedules()
+    table = ScheduleTable.from_schedules(schedules)
+
+    march = table.to_schedules(table.rows_in_month(2024, 3))
+    expected = sorted((s for s in schedules if s.scheduled_date.month == 3), key=lambda s: s.scheduled_date)
+    assert march == expected
+    assert table.schedules_between(date(2025, 1, 1), date(2025, 12, 31)) == []
+
+
+if __name__ == "__main__":
+    try:
+        test_roundtrip_is_lossless()
+        test_aggregates_match_object_scan()
+        test_month_query_sorted_by_date()
+        print("[OK] 스케줄 테이블 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
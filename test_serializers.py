@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+데이터 직렬화 코덱 테스트
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+from datetime import date, datetime, timezone
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import AppData, Student, Schedule
+from src.serializers import BinarySerializer, JsonSerializer, serialize
+from src.crypto_utils import CryptoManager
+from src.data_manager import DataManager
+
+PASSWORD = "codec-password"
+
+
+def _sample_data() -> AppData:
+    app_data = AppData()
+    regular = Student(name="김철수", total_weeks=4, weekdays=["월요일", "수요일"],
+                      start_date=date(2024, 3, 4), created_at=datetime(2024, 3, 1, 9, 30, 15, 123456))
+    unordered = Student(id="legacy-student", name="순서유지", weekdays=["금요일", "화요일"],
+                        is_active=False, color="#00AAFF")
+    app_data.students = [regular, unordered]
+    app_data.schedules = [
+        Schedule(student_id=regular.id, week_number=1, scheduled_date=date(2024, 3, 4),
+                 is_completed=True, memo="첫 수업 ✓"),
+        Schedule(id="custom-id", student_id=unordered.id, week_number=2, scheduled_date=date(2024, 3, 8)),
+        Schedule(student_id="", week_number=-1, scheduled_date=date(1, 1, 1)),
+    ]
+    app_data.metadata["journal_id"] = "ab" * 16
+    return app_data
+
+
+def test_binary_roundtrip_is_lossless():
+    """바이너리 코덱 왕복 변환 시 모든 필드 보존"""
+    app_data = _sample_data()
+    codec = BinarySerializer()
+    payload = b"".join(codec.encode(app_data))
+    decoded = codec.decode(payload)
+
+    assert decoded.students == app_data.students
+    assert decoded.schedules == app_data.schedules
+    assert decoded.metadata == app_data.metadata
+    assert decoded.students[1].weekdays == ["금요일", "화요일"]
+    assert len(payload) < len(b"".join(JsonSerializer().encode(app_data))) / 3
+
+
+def test_encodes_in_bounded_chunks():
+    """바이너리 인코딩은 전체를 한 번에 만들지 않고 FLUSH_SIZE 정도의 청크로 나눠 내보냄"""
+    app_data = _sample_data()
+    student_id = app_data.students[0].id
+    app_data.schedules = [Schedule(student_id=student_id, week_number=i, scheduled_date=date(2024, 3, 4),
+                                   memo="메모" * 10) for i in range(5000)]
+    codec_id, chunks = serialize(app_data, BinarySerializer.codec_id)
+    assert codec_id == BinarySerializer.codec_id
+    assert not isinstance(chunks, list)
+
+    chunks = list(chunks)
+    assert len(chunks) > 3
+    assert max(len(chunk) for chunk in chunks) < BinarySerializer.FLUSH_SIZE + 1024
+    assert BinarySerializer().decode(b"".join(chunks)).schedules == app_data.schedules
+
+
+def test_falls_back_to_json():
+    """바이너리로 표현할 수 없는 데이터는 JSON으로 대체"""
+    app_data = _sample_data()
+    app_data.schedules[0].updated_at = datetime(2024, 3, 4, tzinfo=timezone.utc)
+    codec_id, chunks = serialize(app_data, BinarySerializer.codec_id)
+    assert codec_id == JsonSerializer.codec_id
+    assert JsonSerializer().decode(b"".join(chunks)).schedules[0].updated_at == app_data.schedules[0].updated_at
+
+    # 범위를 벗어난 주차도 기록 전에 확인해 JSON으로 대체
+    app_data = _sample_data()
+    app_data.schedules[1].week_number = 2 ** 40
+    assert serialize(app_data, BinarySerializer.codec_id)[0] == JsonSerializer.codec_id
+
+
+
+def test_numeric_sheet_text_is_saved():
+    """구글 시트의 숫자 셀(메모/이름/색상)은 문자열로 읽고, 문자열이 아닌 값이 남아 있어도 JSON으로 대체"""
+    schedule = Schedule.from_dict({"id": "s1", "student_id": "st1", "scheduled_date": "2024-03-04", "memo": 123})
+    student = Student.from_dict({"id": "st1", "name": 2024, "color": None})
+    assert schedule.memo == "123" and student.name == "2024" and student.color == "#FF5733"
+
+    app_data = AppData(students=[student], schedules=[schedule])
+    codec_id, chunks = serialize(app_data, BinarySerializer.codec_id)
+    assert codec_id == BinarySerializer.codec_id
+    assert BinarySerializer().decode(b"".join(chunks)).schedules[0].memo == "123"
+
+    schedule.memo = 123
+    codec_id, chunks = serialize(app_data, BinarySerializer.codec_id)
+    assert codec_id == JsonSerializer.codec_id
+    assert JsonSerializer().decode(b"".join(chunks)).schedules[0].memo == "123"
+
+
+def test_data_manager_reads_both_codecs():
+    """JSON으로 저장된 파일도 읽고, 다음 저장부터 바이너리로 기록"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".env"
+        writer = DataManager(data_file)
+        writer.DATA_CODEC = JsonSerializer.codec_id
+        writer.set_password(PASSWORD)
+        writer.data = _sample_data()
+        assert writer.save_data()
+        assert CryptoManager.codec_of(data_file.read_bytes()) == JsonSerializer.codec_id
+
+        data_manager = DataManager(data_file)
+        assert data_manager.load_data(PASSWORD)
+        assert data_manager.get_students() == writer.data.students
+        assert data_manager.save_data()
+        assert CryptoManager.codec_of(data_file.read_bytes()) == BinarySerializer.codec_id
+
+        reloaded = DataManager(data_file)
+        assert reloaded.load_data(PASSWORD)
+        assert reloaded.get_schedules() == writer.data.schedules
+
+
+if __name__ == "__main__":
+    try:
+        test_binary_roundtrip_is_lossless()
+        test_encodes_in_bounded_chunks()
+        test_falls_back_to_json()
+        test_numeric_sheet_text_is_saved()
+        test_data_manager_reads_both_codecs()
+        print("[OK] 직렬화 코덱 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+구글 시트 배치 요청 테스트 (로컬 스텁 서버 사용)
+"""
+
+import sys
+import os
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, Schedule
+from src.google_sheets_api import GoogleSheetsAPI
+from sheets_stub_server import SheetsStubServer
+
+
+def _students(count):
+    return [Student(name=f"수강생{i}", weekdays=["월요일"], start_date=date(2024, 1, 1)) for i in range(count)]
+
+
+def test_queued_edits_cost_one_round_trip():
+    """여러 수정/삭제를 한 번의 요청으로 보내고 결과는 넣은 순서대로 받음"""
+    with SheetsStubServer() as server:
+        api = GoogleSheetsAPI(server.url)
+        students = _students(3)
+        schedule = Schedule(student_id=students[0].id, scheduled_date=date(2024, 1, 1), memo="메모")
+
+        with api.batch_client() as batch:
+            for student in students:
+                batch.update_student(student)
+            batch.update_schedule(schedule)
+            missing = batch.delete_student("missing-id")
+            deleted = batch.delete_student(students[1].id)
+            assert len(batch) == 6
+
+        assert server.state.actions == ["batch"]
+        assert [r["success"] for r in batch.results] == [True, True, True, True, False, True]
+        assert batch.results[missing]["message"] == "학생을 찾을 수 없습니다."
+        assert batch.results[deleted]["success"]
+        assert set(server.state.students) == {students[0].id, students[2].id}
+        assert server.state.schedules[schedule.id]["memo"] == "메모"
+        assert len(batch) == 0 and batch.flush() == []
+
+
+def test_download_uses_single_request():
+    """구글 시트 → 로컬 다운로드는 학생/스케줄을 한 번에 가져옴"""
+    with SheetsStubServer() as server:
+        api = GoogleSheetsAPI(server.url)
+        with api.batch_client() as batch:
+            for student in _students(2):
+                batch.update_student(student)
+
+        success, message, app_data = api.sync_from_sheets_to_local()
+        assert success, message
+        assert server.state.actions == ["batch", "batch"]
+        assert len(app_data.students) == 2
+
+
+def test_falls_back_when_batch_is_unsupported():
+    """batch를 모르는 이전 앱스 스크립트면 action을 하나씩 보냄"""
+    with SheetsStubServer() as server:
+        server.state.supports_batch = False
+        api = GoogleSheetsAPI(server.url)
+        results = api.batch([("update_student", s.to_dict()) for s in _students(2)] + [("get_students", None)])
+
+        assert server.state.actions == ["batch", "update_student", "update_student", "get_students"]
+        assert all(r["success"] for r in results) and len(results[-1]["data"]) == 2
+
+
+if __name__ == "__main__":
+    try:
+        test_queued_edits_cost_one_round_trip()
+        test_download_uses_single_request()
+        test_falls_back_when_batch_is_unsupported()
+        print("[OK] 배치 요청 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+구글 시트 페이지 단위 다운로드 테스트 (로컬 스텁 서버 사용)
+"""
+
+import sys
+import os
+import threading
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student, Schedule
+from src.google_sheets_api import GoogleSheetsAPI
+from sheets_stub_server import SheetsStubServer
+
+
+def _fill(server, student_count, schedule_count):
+    students = [Student(name=f"수강생{i}", weekdays=["월요일"], start_date=date(2024, 1, 1))
+                for i in range(student_count)]
+    for student in students:
+        server.state.students[student.id] = student.to_dict()
+    for i in range(schedule_count):
+        schedule = Schedule(student_id=students[i % student_count].id, week_number=i + 1,
+                            scheduled_date=date(2024, 1, 1))
+        server.state.schedules[schedule.id] = schedule.to_dict()
+
+
+def _api(server, page_size=10) -> GoogleSheetsAPI:
+    api = GoogleSheetsAPI(server.url)
+    api.DOWNLOAD_PAGE_SIZE = page_size
+    return api
+
+
+def test_download_is_paged():
+    """첫 페이지는 배치로, 나머지는 페이지마다 요청하고 진행률은 전체 행 수 기준"""
+    with SheetsStubServer() as server:
+        _fill(server, 5, 23)
+        api = _api(server)
+        progress = []
+        success, message, app_data = api.sync_from_sheets_to_local(
+            lambda kind, current, total: kind == "rows_received" and progress.append((current, total)))
+
+        assert success, message
+        assert server.state.actions == ["batch", "get_schedules", "get_schedules"]
+        assert [s.id for s in app_data.students] == list(server.state.students)
+        assert [s.id for s in app_data.schedules] == list(server.state.schedules)
+        assert app_data.schedules[0].scheduled_date == date(2024, 1, 1)
+        assert progress == [(5, 28), (15, 28), (25, 28), (28, 28)]
+
+
+def test_pages_are_fetched_lazily():
+    """다음 페이지는 앞 페이지를 소비한 뒤에 요청 (메모리에는 한 페이지만)"""
+    with SheetsStubServer() as server:
+        _fill(server, 1, 25)
+        api = _api(server)
+        pages = api.iter_schedules()
+
+        assert len(next(pages)) == 10
+        assert len(server.state.requests) == 1
+        assert [len(page) for page in pages] == [10, 5]
+        assert len(server.state.requests) == 3
+
+
+def test_sheet_changed_between_pages():
+    """페이지 사이에 다른 곳에서 업로드되면 섞인 데이터 대신 실패 반환"""
+    with SheetsStubServer() as server:
+        _fill(server, 1, 25)
+        api = _api(server)
+
+        def on_progress(kind, current, total):
+            if kind == "rows_received":
+                server.state.metadata["sync_watermark"] = "2024-01-01T00:00:00.000000"
+
+        success, message, app_data = api.sync_from_sheets_to_local(on_progress)
+        assert not success and app_data is None
+        assert "변경" in message
+
+
+def test_cancel_between_pages():
+    """페이지 사이에 취소하면 남은 페이지를 요청하지 않음"""
+    with SheetsStubServer() as server:
+        _fill(server, 1, 25)
+        api = _api(server)
+        cancel = threading.Event()
+
+        def on_progress(kind, current, total):
+            if kind == "rows_received":
+                cancel.set()
+
+        success, message, app_data = api.sync_from_sheets_to_local(on_progress, cancel)
+        assert not success and app_data is None
+        assert server.state.actions == ["batch"]
+
+
+def test_script_without_paging():
+    """페이지를 모르는 이전 앱스 스크립트는 전체 행을 한 번에 받음"""
+    with SheetsStubServer() as server:
+        _fill(server, 5, 23)
+        server.state.supports_paging = False
+        api = _api(server)
+        success, message, app_data = api.sync_from_sheets_to_local()
+
+        assert success, message
+        assert server.state.actions == ["batch"]
+        assert (len(app_data.students), len(app_data.schedules)) == (5, 23)
+
+        success, message, schedules = api.get_schedules_from_sheets()
+        assert success and len(schedules) == 23
+
+
+if __name__ == "__main__":
+    try:
+        test_download_is_paged()
+        test_pages_are_fetched_lazily()
+        test_sheet_changed_between_pages()
+        test_cancel_between_pages()
+        test_script_without_paging()
+        print("[OK] 페이지 단위 다운로드 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+구글 시트 전송 계층 테스트 - 연결 재사용, 압축, 재시도, 차단기 (로컬 스텁 서버 사용)
+"""
+
+import sys
+import os
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from src.models import Student, AppData
+from src.google_sheets_api import GoogleSheetsAPI
+from src.sheets_transport import SheetsTransport, CircuitBreaker, SyncCancelled
+from sheets_stub_server import SheetsStubServer
+
+
+def _api(server, **kwargs) -> GoogleSheetsAPI:
+    """테스트가 빨리 끝나도록 백오프를 짧게 줄인 API"""
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("backoff_max", 0.02)
+    return GoogleSheetsAPI(server.url, SheetsTransport(**kwargs))
+
+
+def _students(count):
+    return [Student(name=f"수강생{i}", weekdays=["월요일", "수요일"], start_date=date(2024, 1, 1))
+            for i in range(count)]
+
+
+def test_connection_is_reused():
+    """여러 요청이 하나의 keep-alive 연결로 전송됨"""
+    with SheetsStubServer() as server:
+        api = _api(server)
+        for _ in range(5):
+            assert api._make_request("get_students")["success"]
+
+        assert len(set(server.state.client_ports)) == 1
+        assert api.get_metrics()["attempts"] == 5
+
+
+def test_large_payload_is_compressed():
+    """큰 요청은 gzip 봉투로 보내고 서버에서 원래 내용으로 복원됨"""
+    with SheetsStubServer() as server:
+        api = _api(server)
+        app_data = AppData(students=_students(300))
+        success, message = api.full_sync(app_data)
+        assert success, message
+
+        entry = server.state.requests[0]
+        metrics = api.get_metrics()
+        assert entry["encoding"] == "gzip"
+        assert metrics["bytes_sent"] == entry["request_bytes"]
+        assert metrics["bytes_sent"] * 3 < metrics["bytes_uncompressed"]
+        assert len(server.state.students) == 300
+
+        # 작은 요청은 그대로 전송
+        api._make_request("get_students")
+        assert server.state.requests[1]["encoding"] is None
+
+
+def test_idempotent_request_is_retried():
+    """일시적인 5xx/429는 재시도하고 결과와 횟수를 지표에 남김"""
+    with SheetsStubServer() as server:
+        server.state.fail_statuses = [503, 429]
+        api = _api(server)
+        result = api._make_request("get_students")
+
+        assert result["success"], result["message"]
+        assert server.state.actions == ["get_students"] * 3
+        metrics = api.get_metrics()
+        assert (metrics["attempts"], metrics["failures"], metrics["retries"]) == (3, 2, 2)
+        assert metrics["circuit"] == "closed"
+
+
+def test_non_idempotent_request_is_not_retried():
+    """다시 보내면 결과가 달라지는 요청(삭제, 삭제가 섞인 배치)은 재시도하지 않음"""
+    with SheetsStubServer() as server:
+        server.state.fail_statuses = [503, 503]
+        api = _api(server)
+        success, message = api.delete_student("some-id")
+        assert not success and "503" in message
+
+        results = api.batch([("get_students", None), ("delete_student", {"student_id": "some-id"})])
+        assert not results[0]["success"]
+        assert server.state.actions == ["delete_student", "batch"]
+        assert api.get_metrics()["retries"] == 0
+
+
+def test_client_errors_are_not_retried():
+    """4xx는 서버가 응답한 것이므로 재시도하지 않고 차단기도 열지 않음"""
+    with SheetsStubServer() as server:
+        server.state.fail_statuses = [404]
+        api = _api(server)
+        result = api._make_request("get_students")
+
+        assert result["message"] == "HTTP 오류: 404"
+        assert server.state.actions == ["get_students"]
+        assert api.get_metrics()["circuit"] == "closed"
+
+
+def test_circuit_breaker_fails_fast():
+    """연속 실패로 차단기가 열리면 서버에 보내지 않고 바로 실패, 시간이 지나면 다시 시도"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0, clock=lambda: now[0])
+    with SheetsStubServer() as server:
+        server.state.fail_statuses = [500] * 4
+        api = _api(server, max_retries=5, breaker=breaker)
+
+        result = api._make_request("get_students")
+        assert not result["success"] and "30초" in result["message"]
+        assert server.state.actions == ["get_students"] * 3
+        assert breaker.state == CircuitBreaker.OPEN
+
+        assert not api._make_request("get_students")["success"]
+        assert len(server.state.requests) == 3
+        assert api.get_metrics()["rejected"] == 2
+
+        # 대기 시간이 지나면 한 번 시험 요청 - 실패하면 다시 열림
+        now[0] = 31.0
+        assert not api._make_request("get_students")["success"]
+        assert len(server.state.requests) == 4 and breaker.state == CircuitBreaker.OPEN
+
+        # 다시 시험 요청이 성공하면 닫힘
+        now[0] = 62.0
+        assert api._make_request("get_students")["success"]
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_unexpected_response_releases_half_open_trial():
+    """시험 요청 중 JSON이 아닌 응답 등 예상하지 못한 오류가 나도 실패로 기록하고 이후 다시 시험"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=lambda: now[0])
+    transport = SheetsTransport(max_retries=0, breaker=breaker)
+    errors = [requests.exceptions.ConnectionError("offline"), ValueError("Expecting value")]
+
+    def send_once(*args):
+        if errors:
+            raise errors.pop(0)
+        return {"success": True}
+
+    transport._send_once = send_once
+    for expected in (requests.exceptions.ConnectionError, ValueError):
+        try:
+            transport.post("http://sheets.invalid", {"action": "get_students"}, 1.0, idempotent=True)
+            assert False, "예외가 발생해야 함"
+        except expected:
+            pass
+        assert breaker.state == CircuitBreaker.OPEN
+        now[0] += 100.0
+
+    assert transport.post("http://sheets.invalid", {"action": "get_students"}, 1.0, idempotent=True)["success"]
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert transport.metrics.snapshot()["rejected"] == 0
+
+
+def test_cancelled_trial_keeps_circuit_half_open():
+    """시험 요청이 취소되면 차단기를 닫지 않고 다음 요청이 다시 시험함"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=lambda: now[0])
+    transport = SheetsTransport(max_retries=0, breaker=breaker)
+    outcomes = [requests.exceptions.ConnectionError("offline"), SyncCancelled()]
+
+    def send_once(*args):
+        if outcomes:
+            raise outcomes.pop(0)
+        return {"success": True}
+
+    transport._send_once = send_once
+    for expected in (requests.exceptions.ConnectionError, SyncCancelled):
+        try:
+            transport.post("http://sheets.invalid", {"action": "get_students"}, 1.0, idempotent=True)
+            assert False, "예외가 발생해야 함"
+        except expected:
+            pass
+        if expected is requests.exceptions.ConnectionError:
+            now[0] += 100.0
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker._failures == 1
+    assert transport.post("http://sheets.invalid", {"action": "get_students"}, 1.0, idempotent=True)["success"]
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert transport.metrics.snapshot()["rejected"] == 0
+
+
+if __name__ == "__main__":
+    try:
+        test_connection_is_reused()
+        test_large_payload_is_compressed()
+        test_idempotent_request_is_retried()
+        test_non_idempotent_request_is_not_retried()
+        test_client_errors_are_not_retried()
+        test_circuit_breaker_fails_fast()
+        test_unexpected_response_releases_half_open_trial()
+        test_cancelled_trial_keeps_circuit_half_open()
+        print("[OK] 전송 계층 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+수강생 목록 테스트 - 모델 기반 목록의 진도 계산, 보이는 행만 계산, 빈 목록 표시, 단일 행 갱신
+"""
+
+import sys
+import os
+from datetime import date, timedelta
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student
+from src.schedule_generator import generate_schedules
+from src.student_form import StudentForm
+from src.student_list import STUDENT_ID_ROLE, StudentListModel
+
+
+def _students(count):
+    start = date.today() - timedelta(days=14)
+    return [Student(name=f"수강생{i}", total_weeks=8, weekdays=["월요일"], start_date=start)
+            for i in range(count)]
+
+
+def test_model_rows_and_progress(make_data_manager):
+    """행은 수강생 순서, 진도는 오늘까지 잡힌 수업 수"""
+    data_manager = make_data_manager(_students(3))
+    student = data_manager.get_students()[1]
+    future = Student(name="예정", total_weeks=4, weekdays=["월요일"], start_date=date.today() + timedelta(days=7))
+    data_manager.data.students.append(future)
+    data_manager.schedule_store.add_many(generate_schedules([future]))
+
+    model = StudentListModel(data_manager)
+    model.reload()
+    assert model.rowCount() == 4
+    assert model.data(model.index(1), STUDENT_ID_ROLE) == student.id
+    assert model.row_for(student.id) == 1 and model.student_at(1) is student
+
+    expected = sum(1 for s in data_manager.get_schedules_for_student(student.id)
+                   if s.scheduled_date <= date.today())
+    assert data_manager.count_sessions_until(student.id, date.today()) == expected
+    assert model.data(model.index(1)) == f"• 수강생1 (8강)\n  요일: 월요일\n  진도: {expected}강 완료"
+    assert model.data(model.index(3)).endswith("진도: 아직 시작 전")
+
+
+def test_view_computes_only_visible_rows(qapp, make_data_manager):
+    """수강생이 많아도 화면에 보이는 행의 문구만 계산"""
+    data_manager = make_data_manager(_students(2000))
+    form = StudentForm(data_manager)
+    form.resize(400, 900)
+    form.show()
+    form.refresh_students_list()
+    qapp.processEvents()
+
+    assert form.students_model.rowCount() == 2000
+    assert 0 < len(form.students_model._texts) < 100
+    assert form.students_label.isHidden() and not form.students_view.isHidden()
+
+    form.students_view.scrollToBottom()
+    qapp.processEvents()
+    assert "수강생1999" in form.students_model._texts.get(data_manager.get_students()[-1].id, "")
+    form.close()
+
+
+def test_empty_state_and_single_row_updates(qapp, make_data_manager):
+    """수강생이 없으면 안내 문구, 변경 이벤트는 해당 행만 추가/삭제"""
+    data_manager = make_data_manager(password="student-list")
+    form = StudentForm(data_manager)
+    form.refresh_students_list()
+    assert not form.students_label.isHidden() and form.students_view.isHidden()
+
+    model = form.students_model
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+
+    assert data_manager.add_student(Student(name="김철수", total_weeks=4, weekdays=["화요일"],
+                                            start_date=date.today()))
+    assert data_manager.add_student(Student(name="이영희", total_weeks=4, weekdays=["수요일"],
+                                            start_date=date.today()))
+    assert inserted == [(0, 0), (1, 1)] and not resets
+    assert form.students_label.isHidden() and not form.students_view.isHidden()
+
+    first = data_manager.get_students()[0]
+    assert data_manager.remove_student(first.id)
+    assert model.rowCount() == 1 and model.row_for(data_manager.get_students()[0].id) == 0
+    assert model.row_for(first.id) == -1
+    assert "이영희" in model.data(model.index(0)) and not resets
+
+
+if __name__ == "__main__":
+    # fixture를 쓰므로 pytest로 실행
+    if pytest.main([__file__, "-q"]) == 0:
+        print("[OK] 수강생 목록 테스트 통과")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+구글 시트 ↔ 로컬 3-way 병합 테스트 - 병합 규칙과 두 컴퓨터에서의 동시 수정 (로컬 스텁 서버 사용)
+"""
+
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import QCoreApplication
+
+from src.models import Student, Schedule, AppData
+from src.data_manager import DataManager
+from src.delta_sync import SYNC_WATERMARK
+from src.google_sheets_api import GoogleSheetsAPI
+from src.sync_merge import LOCAL, REMOTE, three_way_merge
+from src.sync_worker import SyncQueue
+from sheets_stub_server import SheetsStubServer
+
+PASSWORD = "merge-password"
+
+
+def _base() -> AppData:
+    student = Student(name="김철수", total_weeks=2, weekdays=["월요일"], start_date=date(2024, 1, 1))
+    schedules = [Schedule(student_id=student.id, week_number=i + 1,
+                          scheduled_date=date(2024, 1, 1) + timedelta(weeks=i)) for i in range(2)]
+    return AppData([student], schedules)
+
+
+def _edit(record, **changes):
+    """수정한 복사본 (수정 시각은 base보다 늦게)"""
+    delay = changes.pop("_delay", 1)
+    edited = record.copy()
+    for name, value in changes.items():
+        setattr(edited, name, value)
+    edited.updated_at = record.updated_at + timedelta(seconds=delay)
+    return edited
+
+
+def test_non_conflicting_changes_are_combined():
+    """한쪽에서만 바꾼 필드와 레코드는 양쪽 모두 반영"""
+    base = _base()
+    local, remote = base.copy(), base.copy()
+    local.schedules[0] = _edit(base.schedules[0], memo="로컬 메모")
+    remote.schedules[0] = _edit(base.schedules[0], is_completed=True)
+    remote.schedules[1] = _edit(base.schedules[1], memo="원격 메모")
+    added = Student(name="이영희", weekdays=["수요일"])
+    remote.students.append(added)
+
+    result = three_way_merge(base, local, remote)
+    assert not result.conflicts
+    first, second = result.schedules
+    assert (first.memo, first.is_completed) == ("로컬 메모", True)
+    assert second.memo == "원격 메모"
+    assert [s.name for s in result.students] == ["김철수", "이영희"]
+    # 원격과 달라진 것은 병합한 첫 수업뿐
+    assert result.changed == {first.id}
+    assert result.pulled == 3
+
+
+def test_deletes_on_either_side():
+    """한쪽에서 삭제한 레코드는 삭제, 학생이 없어진 스케줄도 제거"""
+    base = _base()
+    local, remote = base.copy(), base.copy()
+    del local.schedules[1]
+    remote.students = []
+
+    result = three_way_merge(base, local, remote)
+    assert result.students == [] and result.schedules == []
+    # 원격에 남아 있는 스케줄은 다음 업로드에서 삭제
+    assert result.deleted == {"students": [], "schedules": [s.id for s in base.schedules]}
+
+    local, remote = base.copy(), base.copy()
+    del local.schedules[1]
+    result = three_way_merge(base, local, remote)
+    assert [s.id for s in result.schedules] == [base.schedules[0].id]
+    assert result.deleted["schedules"] == [base.schedules[1].id]
+
+
+def test_conflicts_are_reported():
+    """같은 필드를 양쪽에서 바꾸면 늦게 수정한 쪽, 삭제-수정이면 수정한 쪽을 남기고 알림"""
+    base = _base()
+    local, remote = base.copy(), base.copy()
+    local.schedules[0] = _edit(base.schedules[0], memo="로컬", _delay=5)
+    remote.schedules[0] = _edit(base.schedules[0], memo="원격", _delay=1)
+    del local.schedules[1]
+    remote.schedules[1] = _edit(base.schedules[1], is_completed=True)
+
+    result = three_way_merge(base, local, remote)
+    assert [s.memo for s in result.schedules] == ["로컬", ""]
+    assert result.schedules[1].is_completed
+    field_conflict, delete_conflict = result.conflicts
+    assert field_conflict.fields == ["memo"] and field_conflict.resolution == LOCAL
+    assert delete_conflict.fields == [] and delete_conflict.resolution == REMOTE
+    assert "memo" in field_conflict.description and "삭제" in delete_conflict.description
+
+
+def test_first_sync_keeps_both_sides():
+    """기준 데이터가 없으면 양쪽에만 있는 레코드를 모두 남김"""
+    local, remote = _base(), _base()
+    result = three_way_merge(None, local, remote)
+    assert len(result.students) == 2 and len(result.schedules) == 4
+    assert not result.conflicts
+    assert result.changed == {local.students[0].id} | {s.id for s in local.schedules}
+
+
+def _app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _wait_until(condition, timeout=10.0):
+    app = _app()
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def _sync(queue: SyncQueue, direction: str):
+    results = []
+    queue.syncFinished.connect(results.append)
+    assert queue.submit(direction)
+    assert _wait_until(lambda: results)
+    queue.syncFinished.disconnect()
+    assert results[0].success, results[0].message
+    return results[0]
+
+
+def test_concurrent_edits_are_merged_not_overwritten():
+    """다른 컴퓨터가 먼저 업로드하면 시트를 받아 병합한 뒤 업로드해 양쪽 수정이 모두 남음"""
+    _app()
+    with SheetsStubServer() as server, tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "first").mkdir()
+        (Path(tmp) / "second").mkdir()
+        first = DataManager(Path(tmp) / "first" / ".env")
+        first.set_password(PASSWORD)
+        first.add_student(Student(name="김철수", total_weeks=3, weekdays=["월요일"],
+                                  start_date=date(2024, 1, 1)))
+        second = DataManager(Path(tmp) / "second" / ".env")
+        second.set_password(PASSWORD)
+        queues = [SyncQueue(first, GoogleSheetsAPI(server.url)), SyncQueue(second, GoogleSheetsAPI(server.url))]
+        try:
+            _sync(queues[0], SyncQueue.UPLOAD)
+            _sync(queues[1], SyncQueue.DOWNLOAD)
+            assert second.data.metadata[SYNC_WATERMARK] == server.state.metadata["sync_watermark"]
+
+            schedules = first.get_schedules()
+            assert second.update_schedule_memo(schedules[0].id, "두 번째 컴퓨터")
+            _sync(queues[1], SyncQueue.UPLOAD)
+            assert first.update_schedule_memo(schedules[1].id, "첫 번째 컴퓨터")
+            added = Student(name="이영희", total_weeks=1, weekdays=["수요일"], start_date=date(2024, 1, 3))
+            assert first.add_student(added)
+
+            server.state.requests.clear()
+            result = _sync(queues[0], SyncQueue.UPLOAD)
+            assert server.state.actions[0] == "delta_sync" and server.state.actions[-1] == "delta_sync"
+            assert server.state.actions.count("delta_sync") == 2
+            assert not result.conflicts
+
+            memos = {row["id"]: row["memo"] for row in server.state.schedules.values()}
+            assert memos[schedules[0].id] == "두 번째 컴퓨터"
+            assert memos[schedules[1].id] == "첫 번째 컴퓨터"
+            assert added.id in server.state.students
+            assert first.get_schedule_by_id(schedules[0].id).memo == "두 번째 컴퓨터"
+
+            # 두 번째 컴퓨터는 다운로드만으로 같아짐 (보낼 로컬 변경 없음)
+            _sync(queues[1], SyncQueue.DOWNLOAD)
+            assert {s.id: s.memo for s in second.get_schedules()} == memos
+        finally:
+            for queue in queues:
+                queue.shutdown()
+
+
+def test_sync_base_survives_reload_and_password_change():
+    """병합 기준 데이터는 암호화되어 저장되고 다시 열거나 비밀번호를 바꿔도 유지"""
+    with SheetsStubServer() as server, tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / ".env")
+        data_manager.set_password(PASSWORD)
+        for name, weekday in (("김철수", "월요일"), ("이영희", "수요일")):
+            data_manager.add_student(Student(name=name, total_weeks=2, weekdays=[weekday],
+                                             start_date=date(2024, 1, 1)))
+        data_manager.sheets_manager.initialize(server.url)
+        success, message = data_manager.sync_to_google_sheets()
+        assert success, message
+        assert data_manager.change_password("new-password")
+
+        reopened = DataManager(Path(tmp) / ".env")
+        assert reopened.load_data("new-password")
+        kept, removed = reopened.get_students()
+        schedule = reopened.get_schedules_for_student(kept.id)[0]
+        server.state.schedules[schedule.id]["memo"] = "시트에서 수정"
+        server.state.metadata["sync_watermark"] = datetime.now().isoformat()
+        assert reopened.remove_student(removed.id)
+
+        reopened.sheets_manager.initialize(server.url)
+        success, message = reopened.sync_to_google_sheets()
+        assert success, message
+        # 기준 데이터가 있으므로 로컬 삭제와 시트 수정이 충돌 없이 합쳐짐
+        assert [s.name for s in reopened.get_students()] == ["김철수"]
+        assert reopened.get_schedule_by_id(schedule.id).memo == "시트에서 수정"
+        assert list(server.state.students) == [kept.id]
+        assert server.state.schedules == {s.id: s.to_dict() for s in reopened.get_schedules()}
+
+
+if __name__ == "__main__":
+    try:
+        test_non_conflicting_changes_are_combined()
+        test_deletes_on_either_side()
+        test_conflicts_are_reported()
+        test_first_sync_keeps_both_sides()
+        test_concurrent_edits_are_merged_not_overwritten()
+        test_sync_base_survives_reload_and_password_change()
+        print("[OK] 3-way 병합 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+구글 시트 업로드 대기열 테스트 - 중복 제거, 암호화된 파일 유지, 묶음 업로드, 오프라인 후 자동 업로드
+"""
+
+import sys
+import os
+from datetime import date
+
+import pytest
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.models import Student
+from src.crypto_utils import CryptoManager
+from src.data_manager import DataManager
+from src.google_sheets_api import GoogleSheetsAPI
+from src.sheets_transport import SheetsTransport
+from src.sync_outbox import DELETE, PUT, SyncOutbox
+from src.sync_worker import SyncQueue
+from src.change_events import STUDENT_UPDATED
+from sheets_stub_server import SheetsStubServer
+
+PASSWORD = "outbox-password"
+
+
+@pytest.fixture
+def data_manager(make_data_manager):
+    return make_data_manager([Student(name="김철수", total_weeks=12, weekdays=["월요일"],
+                                      start_date=date(2024, 1, 1))], password=PASSWORD)
+
+
+def _assert_server_matches(server, data_manager):
+    assert set(server.state.students) == {s.id for s in data_manager.get_students()}
+    assert server.state.schedules == {s.id: s.to_dict() for s in data_manager.get_schedules()}
+
+
+def test_outbox_deduplicates_and_survives_reopen(tmp_path):
+    """같은 레코드의 작업은 마지막 것만 남고, 파일은 암호화되어 다시 열어도 유지"""
+    crypto = CryptoManager()
+    crypto.unlock(PASSWORD)
+    path = tmp_path / "test.outbox"
+    outbox = SyncOutbox(path, crypto)
+    outbox.rebase("2024-01-01T00:00:00.000000")
+    outbox.record("schedules", PUT, ["a", "b"])
+    outbox.record("schedules", PUT, ["a"])
+    outbox.record("students", DELETE, ["s"])
+    outbox.record("schedules", DELETE, ["b"])
+
+    assert outbox.pending() == [("schedules", "a", PUT), ("students", "s", DELETE), ("schedules", "b", DELETE)]
+    assert b"schedules" not in path.read_bytes()
+
+    reopened = SyncOutbox(path, crypto)
+    assert reopened.load() == 3
+    assert reopened.pending() == outbox.pending()
+    assert reopened.base == "2024-01-01T00:00:00.000000"
+
+    # 보낸 뒤 다시 바뀐 레코드는 확인되어도 남음
+    seq = reopened.seq
+    reopened.record("schedules", PUT, ["a"])
+    reopened.acknowledge([("schedules", "a"), ("students", "s")], seq, "2024-01-02T00:00:00.000000")
+    assert reopened.pending() == [("schedules", "b", DELETE), ("schedules", "a", PUT)]
+
+
+def test_data_manager_records_mutations(data_manager, tmp_path):
+    """DataManager의 변경은 대기열에 기록되고 저장/비밀번호 변경 뒤에도 남음"""
+    with SheetsStubServer() as server:
+        data_manager.sheets_manager.initialize(server.url)
+        success, message = data_manager.sync_to_google_sheets()
+        assert success, message
+        assert data_manager.outbox_count == 0
+
+        schedule = data_manager.get_schedules()[0]
+        for memo in ("하나", "둘", "셋"):
+            assert data_manager.update_schedule_memo(schedule.id, memo)
+        assert data_manager.outbox_count == 1
+        assert data_manager.change_password("new-password")
+
+        reopened = DataManager(tmp_path / ".env")
+        assert reopened.load_data("new-password")
+        assert reopened.outbox_count == 1 and reopened.outbox_ready
+
+        batch = reopened.outbox_batch()
+        assert [row["memo"] for row in batch.delta["schedules"]] == ["셋"]
+        assert batch.delta["students"] == [] and not batch.delta["full"]
+
+
+def test_outbox_is_drained_in_batches(data_manager, wait_until):
+    """대기 작업은 묶음 크기만큼씩 이어서 보내고, 끝나면 결과를 한 번 알림"""
+    with SheetsStubServer() as server:
+        data_manager.OUTBOX_BATCH_SIZE = 5
+        queue = SyncQueue(data_manager, GoogleSheetsAPI(server.url))
+        results = []
+        queue.syncFinished.connect(results.append)
+        try:
+            assert queue.submit(SyncQueue.UPLOAD)
+            assert wait_until(lambda: results)
+
+            for schedule in data_manager.get_schedules():
+                assert data_manager.mark_schedule_completed(schedule.id)
+            assert data_manager.outbox_count == 12
+
+            server.state.requests.clear()
+            assert queue.submit(SyncQueue.UPLOAD)
+            assert wait_until(lambda: len(results) == 2)
+            result = results[1]
+            assert result.success, result.message
+            assert server.state.actions == ["delta_sync"] * 3
+            assert result.schedule_count == 12
+            assert data_manager.outbox_count == 0
+            _assert_server_matches(server, data_manager)
+        finally:
+            queue.shutdown()
+
+
+
+def test_recolored_students_are_uploaded(data_manager, wait_until):
+    """색상 일괄 변경도 대기열에 기록되어, 다른 작업이 남아 있을 때의 묶음 업로드에 함께 올라감"""
+    with SheetsStubServer() as server:
+        queue = SyncQueue(data_manager, GoogleSheetsAPI(server.url))
+        results = []
+        queue.syncFinished.connect(results.append)
+        changes = []
+        data_manager.changed.connect(changes.append)
+        try:
+            assert queue.submit(SyncQueue.UPLOAD)
+            assert wait_until(lambda: results)
+
+            student = data_manager.get_students()[0]
+            assert data_manager.mark_schedule_completed(data_manager.get_schedules()[0].id)
+            assert data_manager.update_student_colors({student.id: "#123456"})
+            assert ("students", student.id, PUT) in data_manager._outbox.pending()
+            assert changes[-1].kind == STUDENT_UPDATED and changes[-1].student_ids == {student.id}
+
+            assert queue.submit(SyncQueue.UPLOAD)
+            assert wait_until(lambda: len(results) == 2)
+            assert results[1].success, results[1].message
+            assert server.state.actions[-1] == "delta_sync"
+            assert server.state.students[student.id]["color"] == "#123456"
+            _assert_server_matches(server, data_manager)
+        finally:
+            queue.shutdown()
+
+def test_offline_changes_are_uploaded_when_connection_returns(data_manager, wait_until):
+    """자동 업로드가 실패하면 작업을 보관했다가 다시 시도해 올림"""
+    with SheetsStubServer() as server:
+        transport = SheetsTransport(max_retries=1, backoff_base=0.01, backoff_max=0.01)
+        queue = SyncQueue(data_manager, GoogleSheetsAPI(server.url, transport))
+        queue.DRAIN_DELAY_MS = 20
+        queue.RETRY_MIN_MS = 100
+        results = []
+        queue.syncFinished.connect(results.append)
+        try:
+            assert queue.submit(SyncQueue.UPLOAD)
+            assert wait_until(lambda: results)
+            queue.enable_auto_drain()
+
+            # 재시도까지 모두 실패 (오프라인)
+            server.state.fail_statuses = [503, 503]
+            removed = data_manager.get_schedules()[0].student_id
+            added = Student(name="이영희", total_weeks=2, weekdays=["수요일"], start_date=date(2024, 1, 3))
+            assert data_manager.add_student(added)
+            assert data_manager.remove_student(removed)
+
+            assert wait_until(lambda: len(results) == 3)
+            failed, drained = results[1:]
+            assert failed.background and not failed.success
+            assert drained.background and drained.success, drained.message
+            assert data_manager.outbox_count == 0
+            _assert_server_matches(server, data_manager)
+        finally:
+            queue.shutdown()
+
+
+if __name__ == "__main__":
+    # fixture를 쓰므로 pytest로 실행
+    if pytest.main([__file__, "-q"]) == 0:
+        print("[OK] 업로드 대기열 테스트 통과")
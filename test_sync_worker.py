@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+구글 시트 동기화 작업 스레드 테스트 (로컬 HTTP 스텁 서버 사용)
+"""
+
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+from datetime import date
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import QCoreApplication, QThread
+
+from src.models import Student
+from src.data_manager import DataManager
+from src.google_sheets_api import GoogleSheetsAPI
+from src.sync_worker import SyncQueue
+from sheets_stub_server import SheetsStubServer
+
+PASSWORD = "sync-password"
+
+
+def _app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _wait_until(condition, timeout=10.0):
+    app = _app()
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def _run(test):
+    """스텁 서버와 임시 데이터 파일을 준비해 test(data_manager, queue, state) 실행"""
+    _app()
+    with SheetsStubServer() as server, tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / ".env")
+        data_manager.set_password(PASSWORD)
+        data_manager.add_student(Student(name="업로드", total_weeks=2, weekdays=["월요일"],
+                                         start_date=date(2024, 1, 1)))
+        queue = SyncQueue(data_manager, GoogleSheetsAPI(server.url))
+        try:
+            test(data_manager, queue, server.state)
+        finally:
+            queue.shutdown()
+
+
+def test_upload_runs_off_main_thread_with_progress():
+    """업로드는 작업 스레드에서 실행되고 보낸 바이트 수를 알림"""
+    def check(data_manager, queue, state):
+        progress, results = [], []
+        queue.syncProgress.connect(lambda *args: progress.append(args))
+        queue.syncFinished.connect(results.append)
+
+        assert queue.submit(SyncQueue.UPLOAD)
+        assert queue.is_busy
+        assert _wait_until(lambda: results)
+
+        result = results[0]
+        assert result.success and result.student_count == 1 and result.schedule_count == 2
+        assert [row['name'] for row in state.students.values()] == ["업로드"]
+        sent = [p for p in progress if p[0] == "bytes_sent"]
+        assert sent and sent[-1][1] == sent[-1][2]
+        assert not queue.is_busy
+
+    _run(check)
+
+
+def test_download_applied_on_main_thread_and_deduplicated():
+    """다운로드 결과는 메인 스레드에서 로컬 데이터와 병합되고, 반복 요청은 쌓이지 않음"""
+    def check(data_manager, queue, state):
+        remote = Student(name="원격", total_weeks=1, weekdays=["화요일"], start_date=date(2024, 2, 6))
+        state.students = {remote.id: remote.to_dict()}
+        state.delay = 0.2
+
+        applied_threads, results = [], []
+        data_manager.dataChanged.connect(lambda: applied_threads.append(QThread.currentThread()))
+        queue.syncFinished.connect(results.append)
+
+        assert queue.submit(SyncQueue.DOWNLOAD)
+        assert not queue.submit(SyncQueue.DOWNLOAD)
+        assert queue.submit(SyncQueue.UPLOAD)
+        assert not queue.submit(SyncQueue.UPLOAD)
+        assert _wait_until(lambda: len(results) == 2)
+
+        assert [r.direction for r in results] == [SyncQueue.DOWNLOAD, SyncQueue.UPLOAD]
+        assert results[0].success, results[0].message
+        # 동기화한 적이 없으므로 로컬에서 추가한 학생도 남음
+        assert [s.name for s in data_manager.get_students()] == ["업로드", "원격"]
+        assert sorted(row['name'] for row in state.students.values()) == ["업로드", "원격"]
+        assert applied_threads and all(t is _app().thread() for t in applied_threads)
+        # 다운로드는 학생/스케줄/메타데이터를 동시에 요청
+        assert sorted(state.actions[:3]) == ['get_metadata', 'get_schedules', 'get_students']
+        assert state.actions[3:] == ['delta_sync']
+
+    _run(check)
+
+
+def test_download_merges_every_page():
+    """앱의 다운로드 경로(SyncQueue -> 비동기 API)는 여러 페이지를 모두 받아 병합"""
+    def check(data_manager, queue, state):
+        queue.api.DOWNLOAD_PAGE_SIZE = 4
+        remote = [Student(name=f"원격{i}", total_weeks=1, weekdays=["화요일"], start_date=date(2024, 2, 6))
+                  for i in range(10)]
+        state.students = {student.id: student.to_dict() for student in remote}
+
+        results = []
+        queue.syncFinished.connect(results.append)
+        assert queue.submit(SyncQueue.DOWNLOAD)
+        assert _wait_until(lambda: results)
+
+        assert results[0].success, results[0].message
+        assert state.actions.count('get_students') == 3
+        assert [s.name for s in data_manager.get_students()] == ["업로드"] + [s.name for s in remote]
+
+    _run(check)
+
+
+def test_cancel_keeps_local_data():
+    """취소한 다운로드는 적용되지 않음"""
+    def check(data_manager, queue, state):
+        remote = Student(name="원격")
+        state.students = {remote.id: remote.to_dict()}
+        state.delay = 0.3
+        results = []
+        queue.syncFinished.connect(results.append)
+
+        assert queue.submit(SyncQueue.DOWNLOAD)
+        assert _wait_until(lambda: state.actions)  # 요청이 전송된 뒤 취소
+        queue.cancel()
+        assert _wait_until(lambda: results)
+        assert results[0].cancelled and not results[0].success
+        assert [s.name for s in data_manager.get_students()] == ["업로드"]
+        assert set(state.actions) <= {'get_metadata', 'get_schedules', 'get_students'}
+        assert len(state.actions) <= 3
+
+    _run(check)
+
+
+if __name__ == "__main__":
+    try:
+        test_upload_runs_off_main_thread_with_progress()
+        test_download_applied_on_main_thread_and_deduplicated()
+        test_download_merges_every_page()
+        test_cancel_keeps_local_data()
+        print("[OK] 동기화 작업 스레드 테스트 통과")
+    except Exception as e:
+        print(f"테스트 실행 중 오류: {e}")
+        import traceback
+        traceback.print_exc()